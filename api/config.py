@@ -36,3 +36,14 @@ JOB_TIMEOUT_SECONDS = 3600  # 1 hour timeout for ETL jobs
 # Supabase Configuration (optional - can be set via environment)
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY", "")
+
+# ML Configuration
+# ETL output tables read by the ML layer (cached in memory, reloaded when the file changes)
+ML_DATA_DIR = Path(os.getenv("ML_DATA_DIR", str(PROJECT_ROOT / "data" / "output")))
+# Precomputed ML artifacts (similarity index, etc.) written by the ETL
+ML_INDEX_DIR = Path(os.getenv("ML_INDEX_DIR", str(PROJECT_ROOT / "data" / "output" / "ml")))
+# Monte Carlo simulations per playoff-probability run
+ML_PLAYOFF_SIMULATIONS = int(os.getenv("ML_PLAYOFF_SIMULATIONS", "100000"))
+# Models to load in the background at startup ("all", or comma-separated names);
+# everything else is loaded on first use
+ML_PRELOAD_MODELS = [m.strip() for m in os.getenv("ML_PRELOAD_MODELS", "").split(",") if m.strip()]
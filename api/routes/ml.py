@@ -39,6 +39,16 @@ class PredictPlayerStatsResponse(BaseModel):
     points_upper_bound: float
 
 
+class PredictPlayerStatsBatchRequest(BaseModel):
+    player_ids: List[str]
+    season_id: str
+    games_remaining: Optional[int] = None
+
+
+class PredictPlayerStatsBatchResponse(BaseModel):
+    predictions: List[PredictPlayerStatsResponse]
+
+
 class PredictGameOutcomeRequest(BaseModel):
     home_team_id: str
     away_team_id: str
@@ -62,11 +72,21 @@ class PredictGameOutcomeResponse(BaseModel):
     model_version: str
 
 
+class PredictGameOutcomeBatchRequest(BaseModel):
+    games: List[PredictGameOutcomeRequest]
+
+
+class PredictGameOutcomeBatchResponse(BaseModel):
+    predictions: List[PredictGameOutcomeResponse]
+
+
 class FindSimilarPlayersRequest(BaseModel):
     player_id: str
     season_id: str
     limit: Optional[int] = 10
     min_similarity: Optional[float] = 70.0
+    position: Optional[str] = None
+    compare_season_id: Optional[str] = None
 
 
 class SimilarPlayer(BaseModel):
@@ -169,6 +189,25 @@ async def predict_player_stats(request: PredictPlayerStatsRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/predict/player-stats:batch", response_model=PredictPlayerStatsBatchResponse)
+async def predict_player_stats_batch(request: PredictPlayerStatsBatchRequest):
+    """
+    Predict remainder-of-season stats for many players in one call.
+    
+    Features are built for all players at once and each model runs once per batch.
+    """
+    try:
+        predictions = ml_service.predict_player_stats_batch(
+            player_ids=request.player_ids,
+            season_id=request.season_id,
+            games_remaining=request.games_remaining
+        )
+        return {"predictions": predictions}
+    except Exception as e:
+        logger.error(f"Error predicting player stats batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/predict/player-next-game", response_model=PredictPlayerStatsResponse)
 async def predict_player_next_game(
     player_id: str = Query(..., description="Player ID"),
@@ -216,6 +255,23 @@ async def predict_game_outcome(request: PredictGameOutcomeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/predict/game-outcome:batch", response_model=PredictGameOutcomeBatchResponse)
+async def predict_game_outcome_batch(request: PredictGameOutcomeBatchRequest):
+    """
+    Predict winner and score for many games in one call.
+    
+    Each model runs once over the whole slate of games.
+    """
+    try:
+        predictions = ml_service.predict_game_outcome_batch(
+            [game.dict() for game in request.games]
+        )
+        return {"predictions": predictions}
+    except Exception as e:
+        logger.error(f"Error predicting game outcome batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/predict/real-time-win-probability", response_model=PredictRealTimeWinProbabilityResponse)
 async def predict_real_time_win_probability(request: PredictRealTimeWinProbabilityRequest):
     """
@@ -266,14 +322,17 @@ async def find_similar_players(request: FindSimilarPlayersRequest):
     """
     Find players with similar play styles.
     
-    Uses ML clustering/embeddings to find similar players.
+    Uses the precomputed player similarity index (built during ETL).
+    Optionally restrict candidates by position and/or season.
     """
     try:
         similar_players = ml_service.find_similar_players(
             player_id=request.player_id,
             season_id=request.season_id,
             limit=request.limit,
-            min_similarity=request.min_similarity
+            min_similarity=request.min_similarity,
+            position=request.position,
+            compare_season_id=request.compare_season_id
         )
         return similar_players
     except Exception as e:
@@ -334,7 +393,10 @@ async def optimize_lineup(
     team_id: str = Query(..., description="Team ID"),
     season_id: str = Query(..., description="Season ID"),
     opponent_team_id: Optional[str] = Query(None, description="Opponent team ID"),
-    game_state: Optional[str] = Query(None, description="'Leading', 'Trailing', 'Tied'")
+    game_state: Optional[str] = Query(None, description="'Leading', 'Trailing', 'Tied'"),
+    metric: str = Query("cf_pct", description="Objective: 'cf_pct', 'ff_pct' or 'gf_pct'"),
+    available_player_ids: Optional[List[str]] = Query(None, description="Restrict to these players"),
+    excluded_player_ids: Optional[List[str]] = Query(None, description="Unavailable players")
 ):
     """
     Generate optimal line combinations.
@@ -346,9 +408,14 @@ async def optimize_lineup(
             team_id=team_id,
             season_id=season_id,
             opponent_team_id=opponent_team_id,
-            game_state=game_state
+            game_state=game_state,
+            metric=metric,
+            available_player_ids=available_player_ids,
+            excluded_player_ids=excluded_player_ids
         )
         return optimal_lineup
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error optimizing lineup: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,5 +1,6 @@
 """Staging endpoints for data ingestion."""
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import List
 from ..models.staging import (
     UploadBLBTableRequest,
@@ -28,7 +29,8 @@ async def upload_blb_table(request: UploadBLBTableRequest):
     - `fact_gameroster`, `fact_leadership`, `fact_registration`, `fact_draft`
     """
     try:
-        result = staging_service.upload_blb_table(
+        result = await run_in_threadpool(
+            staging_service.upload_blb_table,
             table_name=request.table_name,
             data=request.data,
             replace=request.replace
@@ -50,7 +52,8 @@ async def update_blb_table(request: UpdateBLBTableRequest):
     Updates rows matching the filter criteria.
     """
     try:
-        result = staging_service.update_blb_table(
+        result = await run_in_threadpool(
+            staging_service.update_blb_table,
             table_name=request.table_name,
             filter_column=request.filter_column,
             filter_value=request.filter_value,
@@ -87,7 +90,8 @@ async def upload_tracking(request: UploadTrackingRequest):
     This data can then be processed by ETL.
     """
     try:
-        result = staging_service.upload_tracking_data(
+        result = await run_in_threadpool(
+            staging_service.upload_tracking_data,
             game_id=request.game_id,
             events=request.events,
             shifts=request.shifts
@@ -117,7 +121,8 @@ async def clear_blb_table(table_name: str, confirm: bool = False):
     
     try:
         # Upload empty data with replace=True (clears table)
-        result = staging_service.upload_blb_table(
+        result = await run_in_threadpool(
+            staging_service.upload_blb_table,
             table_name=table_name,
             data=[],
             replace=True
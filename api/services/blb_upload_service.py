@@ -41,17 +41,14 @@ def upload_blb_table_from_excel(
         # Read Excel sheet
         df = pd.read_excel(excel_path, sheet_name=table_name, dtype=str)
         
-        # Convert to records
-        data = df.to_dict(orient='records')
-        
-        # Upload to staging
+        # Upload to staging (records are cleaned column-wise by the service)
         result = staging_service.upload_blb_table(
             table_name=table_name,
-            data=data,
+            data=df,
             replace=replace
         )
         
-        logger.info(f"Uploaded {len(data)} rows from Excel to {result['staging_table']}")
+        logger.info(f"Uploaded {result['rows_uploaded']} rows from Excel to {result['staging_table']}")
         return result
         
     except Exception as e:
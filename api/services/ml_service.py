@@ -3,14 +3,173 @@ ML Service
 Handles ML model loading, inference, and predictions
 """
 import os
+import time
+import threading
 import joblib
 import numpy as np
+import pandas as pd
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from ..config import ML_DATA_DIR, ML_INDEX_DIR, ML_PLAYOFF_SIMULATIONS, ML_PRELOAD_MODELS
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Model name -> pickle file in api/models
+MODEL_FILES = {
+    # Player prediction models
+    "player_goals": "player_goals_model.pkl",
+    "player_assists": "player_assists_model.pkl",
+    "player_points": "player_points_model.pkl",
+    "player_war": "player_war_model.pkl",
+    # Game outcome models
+    "game_outcome": "game_outcome_model.pkl",
+    "game_score": "game_score_model.pkl",
+    # Similarity models
+    "player_similarity": "player_similarity_model.pkl",
+    # Line chemistry models
+    "line_chemistry": "line_chemistry_model.pkl",
+}
+
+# Per-game player features (fact_player_season_stats, game_type 'All')
+PLAYER_FEATURE_COLUMNS = [
+    "goals", "assists", "points", "shots", "sog",
+    "pass_attempts", "pass_completed", "giveaways", "takeaways", "blocks",
+    "hits", "toi_seconds", "corsi_for", "corsi_against", "fenwick_for",
+    "fenwick_against", "xg_for", "war", "game_score", "plus_minus_total",
+]
+
+# Per-game team features (fact_team_game_stats), taken for home and away team
+TEAM_FEATURE_COLUMNS = [
+    "goals", "sog", "corsi_for", "corsi_against", "xg_for", "giveaways", "takeaways",
+]
+
+
+class ModelRegistry:
+    """
+    Lazily loaded ML models.
+    
+    Each model is joblib-loaded on first use with mmap_mode='r', so large numpy
+    arrays inside the pickle are memory-mapped and shared between workers
+    through the OS page cache instead of copied into each process.
+    Load time and memory are recorded per model for the health endpoint.
+    """
+    
+    def __init__(self, model_dir: Path, model_files: Dict[str, str]):
+        self.model_dir = model_dir
+        self.model_files = model_files
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def path(self, name: str) -> Optional[Path]:
+        """Pickle path for a model name, or None if unknown / not on disk."""
+        filename = self.model_files.get(name)
+        if filename is None:
+            return None
+        path = self.model_dir / filename
+        return path if path.exists() else None
+    
+    def available(self) -> List[str]:
+        """Models with a pickle on disk (loaded or not)."""
+        return [name for name in self.model_files if self.path(name) is not None]
+    
+    def loaded(self) -> List[str]:
+        """Models currently in memory."""
+        return list(self._models.keys())
+    
+    def __contains__(self, name: str) -> bool:
+        return self.path(name) is not None or name in self._models
+    
+    def get(self, name: str) -> Optional[Any]:
+        """Return a model, loading it on first use (None if unavailable or failed)."""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        with self._lock:
+            if name in self._models:
+                return self._models[name]
+            if name in self._stats and self._stats[name].get("error"):
+                return None
+            path = self.path(name)
+            if path is None:
+                return None
+            return self._load(name, path)
+    
+    def warm(self, names: Optional[List[str]] = None):
+        """Load models ahead of first use (all available models if names is None)."""
+        for name in (names or self.available()):
+            self.get(name)
+        logger.info(f"Warmed {len(self._models)} ML models")
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-model load stats: load_seconds, heap_bytes (numpy arrays copied into
+        memory), mmap_bytes (memory-mapped arrays), file_bytes (or error).
+        """
+        return {name: dict(stat) for name, stat in self._stats.items()}
+    
+    def _load(self, name: str, path: Path) -> Optional[Any]:
+        """Load one pickle, recording time and in-memory vs memory-mapped array bytes."""
+        started = time.perf_counter()
+        try:
+            model = joblib.load(path, mmap_mode="r")
+        except Exception as e:
+            logger.warning(f"Error loading ML model {name}: {e}. Predictions fall back to defaults.")
+            self._stats[name] = {"error": str(e)}
+            return None
+        load_seconds = time.perf_counter() - started
+        
+        heap_bytes, mmap_bytes = _array_bytes(model)
+        self._models[name] = model
+        self._stats[name] = {
+            "load_seconds": round(load_seconds, 4),
+            "heap_bytes": int(heap_bytes),
+            "mmap_bytes": int(mmap_bytes),
+            "file_bytes": path.stat().st_size,
+        }
+        logger.info(f"Loaded ML model {name} in {self._stats[name]['load_seconds']}s")
+        return model
+
+
+def _array_bytes(obj: Any, _seen: Optional[Dict[int, Any]] = None) -> Tuple[int, int]:
+    """
+    (in-memory, memory-mapped) bytes of the numpy arrays reachable from a loaded model.
+    
+    Walks the object graph instead of tracing allocations, so loading a model
+    never touches process-global state (e.g. tracemalloc) on a live server.
+    Extension types without a __dict__ (sklearn's Cython Tree holds node and
+    value arrays in C buffers) are measured through their pickled state.
+    """
+    # Keeps visited objects (including temporary pickled states) alive so ids stay unique
+    seen = _seen if _seen is not None else {}
+    if id(obj) in seen or isinstance(obj, (str, bytes, int, float, type(None))):
+        return 0, 0
+    seen[id(obj)] = obj
+    if isinstance(obj, np.ndarray):
+        if isinstance(obj, np.memmap) or isinstance(obj.base, np.memmap):
+            return 0, obj.nbytes
+        return (obj.nbytes, 0) if obj.dtype != object else _array_bytes(list(obj.ravel()), seen)
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    elif hasattr(obj, "__dict__"):
+        children = [vars(obj)]
+    elif hasattr(obj, "__getstate__"):
+        try:
+            children = [obj.__getstate__()]
+        except Exception:
+            return 0, 0
+    else:
+        return 0, 0
+    heap = mmap = 0
+    for child in children:
+        child_heap, child_mmap = _array_bytes(child, seen)
+        heap += child_heap
+        mmap += child_mmap
+    return heap, mmap
+
 
 class MLService:
     """Service for ML model inference and predictions."""
@@ -23,48 +182,57 @@ class MLService:
         # Model versions
         self.model_version = os.getenv("ML_MODEL_VERSION", "1.0.0")
         
-        # Load models (lazy loading - models loaded on first use)
-        self._models = {}
-        self._load_models()
+        # Models are loaded lazily on first use (memory-mapped); optionally warmed in the background
+        self._models = ModelRegistry(self.model_dir, MODEL_FILES)
+        self._warm_models()
+        
+        # Precomputed similarity index (built by the ETL, loaded once here)
+        self._similarity_index = None
+        self._load_similarity_index()
+        
+        # ETL tables cached by (name) -> (mtime, DataFrame)
+        self._tables: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        
+        # Playoff simulations cached per (season, standings-hash)
+        self._season_simulations = None
+        
+        # Feature frames per season: key -> (table version, DataFrame indexed by entity id)
+        self._feature_frames: Dict[Tuple[str, Optional[str]], Tuple[Any, pd.DataFrame]] = {}
+        
+        # Lineup models (precomputed pair/trio scores) per (team, season, metric)
+        self._lineup_models: Dict[Tuple[str, str, str], Tuple[tuple, Any]] = {}
     
-    def _load_models(self):
-        """Load all ML models."""
+    def _warm_models(self):
+        """Start loading ML_PRELOAD_MODELS in a background thread (no-op if unset)."""
+        if not ML_PRELOAD_MODELS:
+            logger.info(f"{len(self._models.available())} ML models available (loaded on first use)")
+            return
+        names = None if ML_PRELOAD_MODELS == ["all"] else ML_PRELOAD_MODELS
+        threading.Thread(target=self._models.warm, args=(names,), daemon=True, name="ml-model-warm").start()
+    
+    def _load_similarity_index(self):
+        """Load the player similarity index produced by the ETL (memory-mapped)."""
         try:
-            # Player prediction models
-            if (self.model_dir / "player_goals_model.pkl").exists():
-                self._models["player_goals"] = joblib.load(self.model_dir / "player_goals_model.pkl")
-            if (self.model_dir / "player_assists_model.pkl").exists():
-                self._models["player_assists"] = joblib.load(self.model_dir / "player_assists_model.pkl")
-            if (self.model_dir / "player_points_model.pkl").exists():
-                self._models["player_points"] = joblib.load(self.model_dir / "player_points_model.pkl")
-            if (self.model_dir / "player_war_model.pkl").exists():
-                self._models["player_war"] = joblib.load(self.model_dir / "player_war_model.pkl")
-            
-            # Game outcome models
-            if (self.model_dir / "game_outcome_model.pkl").exists():
-                self._models["game_outcome"] = joblib.load(self.model_dir / "game_outcome_model.pkl")
-            if (self.model_dir / "game_score_model.pkl").exists():
-                self._models["game_score"] = joblib.load(self.model_dir / "game_score_model.pkl")
-            
-            # Similarity models
-            if (self.model_dir / "player_similarity_model.pkl").exists():
-                self._models["player_similarity"] = joblib.load(self.model_dir / "player_similarity_model.pkl")
-            
-            # Line chemistry models
-            if (self.model_dir / "line_chemistry_model.pkl").exists():
-                self._models["line_chemistry"] = joblib.load(self.model_dir / "line_chemistry_model.pkl")
-            
-            logger.info(f"Loaded {len(self._models)} ML models")
+            from src.ml.similarity_index import PlayerSimilarityIndex
+            self._similarity_index = PlayerSimilarityIndex.load(ML_INDEX_DIR)
+            if self._similarity_index is None:
+                logger.info(f"No similarity index found in {ML_INDEX_DIR}")
+            else:
+                logger.info(f"Loaded similarity index: {len(self._similarity_index)} player-seasons")
         except Exception as e:
-            logger.warning(f"Error loading ML models: {e}. Some predictions may not be available.")
+            logger.warning(f"Error loading similarity index: {e}. Similar-player search unavailable.")
+            self._similarity_index = None
     
     def get_health(self) -> Dict[str, Any]:
         """Get ML service health status."""
         return {
-            "status": "healthy" if len(self._models) > 0 else "degraded",
-            "models_loaded": len(self._models),
+            "status": "healthy" if self._models.available() else "degraded",
+            "models_loaded": len(self._models.loaded()),
             "model_version": self.model_version,
-            "available_models": list(self._models.keys())
+            "available_models": self._models.available(),
+            "loaded_models": self._models.loaded(),
+            "model_stats": self._models.stats(),
+            "similarity_index_rows": len(self._similarity_index) if self._similarity_index is not None else 0
         }
     
     def predict_player_stats(
@@ -84,15 +252,26 @@ class MLService:
         Returns:
             Dictionary with predictions
         """
-        # TODO: Fetch player features from database
-        # For now, return placeholder structure
-        features = self._get_player_features(player_id, season_id)
+        return self.predict_player_stats_batch([player_id], season_id, games_remaining)[0]
+    
+    def predict_player_stats_batch(
+        self,
+        player_ids: List[str],
+        season_id: str,
+        games_remaining: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict season stats for many players at once.
+        
+        Builds one feature matrix for all players and calls each model once.
+        """
+        features = self._get_player_features_batch(player_ids, season_id)
         
         # Make predictions
-        predicted_goals = self._predict_with_model("player_goals", features, default=20.0)
-        predicted_assists = self._predict_with_model("player_assists", features, default=30.0)
+        predicted_goals = self._predict_with_model_batch("player_goals", features, default=20.0)
+        predicted_assists = self._predict_with_model_batch("player_assists", features, default=30.0)
         predicted_points = predicted_goals + predicted_assists
-        predicted_war = self._predict_with_model("player_war", features, default=2.0)
+        predicted_war = self._predict_with_model_batch("player_war", features, default=2.0)
         
         # Calculate confidence intervals (simplified)
         goals_lower = predicted_goals * 0.85
@@ -100,21 +279,24 @@ class MLService:
         points_lower = predicted_points * 0.85
         points_upper = predicted_points * 1.15
         
-        return {
-            "player_id": player_id,
-            "season_id": season_id,
-            "games_remaining": games_remaining or 20,
-            "predicted_goals": float(predicted_goals),
-            "predicted_assists": float(predicted_assists),
-            "predicted_points": float(predicted_points),
-            "predicted_war": float(predicted_war),
-            "confidence": 0.75,
-            "model_version": self.model_version,
-            "goals_lower_bound": float(goals_lower),
-            "goals_upper_bound": float(goals_upper),
-            "points_lower_bound": float(points_lower),
-            "points_upper_bound": float(points_upper)
-        }
+        return [
+            {
+                "player_id": player_id,
+                "season_id": season_id,
+                "games_remaining": games_remaining or 20,
+                "predicted_goals": float(predicted_goals[i]),
+                "predicted_assists": float(predicted_assists[i]),
+                "predicted_points": float(predicted_points[i]),
+                "predicted_war": float(predicted_war[i]),
+                "confidence": 0.75,
+                "model_version": self.model_version,
+                "goals_lower_bound": float(goals_lower[i]),
+                "goals_upper_bound": float(goals_upper[i]),
+                "points_lower_bound": float(points_lower[i]),
+                "points_upper_bound": float(points_upper[i])
+            }
+            for i, player_id in enumerate(player_ids)
+        ]
     
     def predict_player_next_game(
         self,
@@ -155,42 +337,69 @@ class MLService:
         game_date: Optional[str] = None
     ) -> Dict[str, Any]:
         """Predict game winner and score."""
-        # TODO: Fetch team features from database
-        features = self._get_team_features(home_team_id, away_team_id, season_id)
+        return self.predict_game_outcome_batch([{
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "season_id": season_id,
+            "game_date": game_date
+        }])[0]
+    
+    def predict_game_outcome_batch(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Predict winner and score for many games at once.
+        
+        Args:
+            games: Dicts with home_team_id, away_team_id, season_id (and optional game_date)
+        
+        Returns:
+            One prediction dict per game, in input order
+        """
+        home_ids = [g["home_team_id"] for g in games]
+        away_ids = [g["away_team_id"] for g in games]
+        season_ids = [g["season_id"] for g in games]
+        features = self._get_team_features_batch(home_ids, away_ids, season_ids)
+        # Same layout with the teams swapped, for the away team's goals
+        swapped = self._get_team_features_batch(away_ids, home_ids, season_ids)
         
         # Predict outcome
-        home_win_prob = self._predict_with_model("game_outcome", features, default=0.55)
+        home_win_prob = self._predict_with_model_batch("game_outcome", features, default=0.55)
         away_win_prob = 1.0 - home_win_prob
         
-        # Predict score
-        predicted_home_goals = self._predict_with_model("game_score", features, default=3.2)
-        predicted_away_goals = self._predict_with_model("game_score", features, default=2.8)
+        # Predict score: home rows then swapped rows, in one model pass
+        n_games = len(games)
+        goals = self._predict_with_model_batch(
+            "game_score", np.vstack([features, swapped]), default=np.repeat([3.2, 2.8], n_games)
+        )
+        predicted_home_goals, predicted_away_goals = goals[:n_games], goals[n_games:]
         predicted_total = predicted_home_goals + predicted_away_goals
         
         # Over/under
         over_under_line = 5.5
-        over_prob = 0.5 if predicted_total > over_under_line else 0.3
+        over_prob = np.where(predicted_total > over_under_line, 0.5, 0.3)
         under_prob = 1.0 - over_prob
         
-        return {
-            "home_team_id": home_team_id,
-            "away_team_id": away_team_id,
-            "home_win_probability": float(home_win_prob),
-            "away_win_probability": float(away_win_prob),
-            "predicted_home_goals": float(predicted_home_goals),
-            "predicted_away_goals": float(predicted_away_goals),
-            "predicted_total_goals": float(predicted_total),
-            "over_under_line": float(over_under_line),
-            "over_probability": float(over_prob),
-            "under_probability": float(under_prob),
-            "confidence": 0.70,
-            "key_factors": [
-                "Home ice advantage",
-                "Recent form",
-                "Head-to-head record"
-            ],
-            "model_version": self.model_version
-        }
+        return [
+            {
+                "home_team_id": home_team_id,
+                "away_team_id": away_ids[i],
+                "home_win_probability": float(home_win_prob[i]),
+                "away_win_probability": float(away_win_prob[i]),
+                "predicted_home_goals": float(predicted_home_goals[i]),
+                "predicted_away_goals": float(predicted_away_goals[i]),
+                "predicted_total_goals": float(predicted_total[i]),
+                "over_under_line": float(over_under_line),
+                "over_probability": float(over_prob[i]),
+                "under_probability": float(under_prob[i]),
+                "confidence": 0.70,
+                "key_factors": [
+                    "Home ice advantage",
+                    "Recent form",
+                    "Head-to-head record"
+                ],
+                "model_version": self.model_version
+            }
+            for i, home_team_id in enumerate(home_ids)
+        ]
     
     def predict_real_time_win_probability(
         self,
@@ -267,32 +476,61 @@ class MLService:
         player_id: str,
         season_id: str,
         limit: int = 10,
-        min_similarity: float = 70.0
+        min_similarity: float = 70.0,
+        position: Optional[str] = None,
+        compare_season_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Find players with similar play styles."""
-        # TODO: Use similarity model or embeddings
-        # For now, return placeholder
+        """
+        Find players with similar play styles.
+        
+        Uses the precomputed similarity index (cosine over normalized
+        per-game feature vectors). similarity_score is cosine * 100.
+        
+        Args:
+            player_id: Player ID
+            season_id: Season of the query player (falls back to latest season)
+            limit: Max number of similar players
+            min_similarity: Minimum similarity score (0-100)
+            position: Only compare against players at this position
+            compare_season_id: Only compare against this season
+        """
+        index = self._similarity_index
+        matches = None
+        if index is not None:
+            matches = index.query(
+                player_id,
+                season_id,
+                k=limit,
+                position=position,
+                candidate_season_id=compare_season_id
+            )
+        
+        if matches is None:
+            logger.debug(f"Player {player_id} not in similarity index")
+            return {
+                "player_id": player_id,
+                "player_name": "",
+                "similar_players": [],
+                "model_version": self.model_version
+            }
+        
+        row = index.row_for(player_id, season_id)
         similar_players = [
             {
-                "player_id": "P100010",
-                "player_name": "Similar Player 1",
-                "similarity_score": 85.5,
-                "similar_stats": ["goals", "shooting_pct", "cf_pct"],
-                "different_stats": ["assists", "passing"]
-            },
-            {
-                "player_id": "P100011",
-                "player_name": "Similar Player 2",
-                "similarity_score": 78.2,
-                "similar_stats": ["war", "gar", "points"],
-                "different_stats": ["goals", "physical_play"]
+                "player_id": m["player_id"],
+                "player_name": m["player_name"],
+                "similarity_score": round(max(m["cosine"], 0.0) * 100, 1),
+                "similar_stats": m["similar_stats"],
+                "different_stats": m["different_stats"]
             }
+            for m in matches
+            if m["cosine"] * 100 >= min_similarity
         ]
         
         return {
             "player_id": player_id,
-            "player_name": "Player Name",  # TODO: Fetch from DB
-            "similar_players": similar_players[:limit],
+            "player_name": str(index.player_names[row]),
+            "similar_players": similar_players,
             "model_version": self.model_version
         }
     
@@ -344,25 +582,50 @@ class MLService:
         team_id: str,
         season_id: str,
         opponent_team_id: Optional[str] = None,
-        game_state: Optional[str] = None
+        game_state: Optional[str] = None,
+        metric: str = "cf_pct",
+        available_player_ids: Optional[List[str]] = None,
+        excluded_player_ids: Optional[List[str]] = None
     ) -> Dict[str, Any]:
-        """Generate optimal line combinations."""
-        # TODO: Implement lineup optimization
+        """
+        Generate optimal line combinations.
+        
+        Maximizes expected on-ice share (cf_pct, ff_pct or gf_pct) from
+        fact_line_combos and fact_h2h/fact_wowy pair history. Score matrices
+        are precomputed once per (team, season, metric) and reused until the
+        ETL tables change; each request is a branch-and-bound search.
+        """
+        model = self._get_lineup_model(team_id, season_id, metric)
+        lineup = model.optimize(
+            available_player_ids=available_player_ids,
+            excluded_player_ids=excluded_player_ids
+        )
+        
         return {
             "team_id": team_id,
-            "optimal_forward_lines": [
-                {"player1": "P100001", "player2": "P100002", "player3": "P100003"},
-                {"player1": "P100004", "player2": "P100005", "player3": "P100006"},
-            ],
-            "optimal_defense_pairs": [
-                {"player1": "P100007", "player2": "P100008"},
-            ],
+            "metric": metric,
+            "optimal_forward_lines": lineup["forward_lines"],
+            "optimal_defense_pairs": lineup["defense_pairs"],
             "optimal_pp_units": [],
             "optimal_pk_units": [],
-            "expected_performance": 85.0,
+            "expected_performance": lineup["expected_performance"],
             "model_version": self.model_version
         }
     
+    def _get_lineup_model(self, team_id: str, season_id: str, metric: str):
+        """Get (or build) the cached lineup model for a team-season."""
+        from src.ml.lineup_optimizer import LineupModel
+        
+        tables = [self._get_table(name) for name in ("fact_line_combos", "fact_h2h", "fact_wowy")]
+        version = tuple(self._tables[name][0] if name in self._tables else None
+                        for name in ("fact_line_combos", "fact_h2h", "fact_wowy"))
+        key = (str(team_id), str(season_id), metric)
+        cached = self._lineup_models.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, LineupModel.build(*tables, team_id=team_id, season_id=season_id, metric=metric))
+            self._lineup_models[key] = cached
+        return cached[1]
+    
     def predict_goalie_stats(
         self,
         goalie_id: str,
@@ -385,18 +648,43 @@ class MLService:
         team_id: str,
         season_id: str
     ) -> Dict[str, Any]:
-        """Predict playoff probability."""
-        # TODO: Implement playoff prediction
+        """
+        Predict playoff probability.
+        
+        Runs a vectorized Monte Carlo simulation of the remaining dim_schedule
+        games. Results are cached per (season, standings-hash), so repeated
+        requests are free until a result or schedule change lands.
+        """
+        if self._season_simulations is None:
+            from src.ml.season_simulator import SeasonSimulatorCache
+            self._season_simulations = SeasonSimulatorCache()
+        
+        simulation = self._season_simulations.get(
+            self._get_table("dim_schedule"),
+            self._get_table("fact_team_game_stats"),
+            season_id,
+            n_sims=ML_PLAYOFF_SIMULATIONS
+        )
+        team = simulation["teams"].get(str(team_id))
+        if team is None:
+            logger.debug(f"Team {team_id} not in {season_id} schedule")
+            team = {
+                "playoff_probability": 0.0,
+                "seed_probabilities": {},
+                "championship_probability": 0.0,
+                "current_points": 0.0,
+                "projected_points": 0.0
+            }
+        
         return {
             "team_id": team_id,
-            "playoff_probability": 0.75,
-            "seed_probabilities": {
-                "1": 0.10,
-                "2": 0.20,
-                "3": 0.25,
-                "4": 0.20
-            },
-            "championship_probability": 0.15,
+            "playoff_probability": team["playoff_probability"],
+            "seed_probabilities": team["seed_probabilities"],
+            "championship_probability": team["championship_probability"],
+            "current_points": team["current_points"],
+            "projected_points": team["projected_points"],
+            "remaining_games": simulation["remaining_games"],
+            "simulations": simulation["n_sims"],
             "model_version": self.model_version
         }
     
@@ -438,30 +726,157 @@ class MLService:
     # Helper Methods
     # ============================================================================
     
+    def _get_table(self, name: str) -> pd.DataFrame:
+        """
+        Get an ETL output table, cached in memory.
+        
+        The CSV is re-read only when its modification time changes
+        (i.e. after an ETL run), never per request.
+        """
+        path = ML_DATA_DIR / f"{name}.csv"
+        if not path.exists():
+            self._tables.pop(name, None)
+            return pd.DataFrame()
+        mtime = path.stat().st_mtime
+        cached = self._tables.get(name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, pd.read_csv(path, low_memory=False))
+            self._tables[name] = cached
+        return cached[1]
+    
     def _predict_with_model(self, model_name: str, features: np.ndarray, default: float = 0.0) -> float:
         """Predict using a model, with fallback to default."""
-        if model_name in self._models:
+        return float(self._predict_with_model_batch(model_name, features.reshape(1, -1), default)[0])
+    
+    def _predict_with_model_batch(self, model_name: str, features: np.ndarray, default=0.0) -> np.ndarray:
+        """
+        Predict for a [n_rows x n_features] matrix with one model call.
+        
+        Falls back to `default` (a scalar or one value per row) if the model
+        is missing or fails.
+        """
+        model = self._models.get(model_name)
+        if model is not None:
             try:
-                prediction = self._models[model_name].predict(features.reshape(1, -1))[0]
-                return float(prediction)
+                return np.asarray(model.predict(features), dtype=float).reshape(-1)
             except Exception as e:
                 logger.warning(f"Error using model {model_name}: {e}")
-                return default
         else:
-            logger.debug(f"Model {model_name} not loaded, using default")
-            return default
+            logger.debug(f"Model {model_name} unavailable, using default")
+        return np.full(len(features), default, dtype=float)
     
     def _get_player_features(self, player_id: str, season_id: Optional[str]) -> np.ndarray:
         """Get player features for prediction."""
-        # TODO: Fetch from database and engineer features
-        # For now, return placeholder features
-        return np.array([0.5] * 20)  # 20 features placeholder
+        return self._get_player_features_batch([player_id], season_id)[0]
+    
+    def _get_player_features_batch(self, player_ids: List[str], season_id: Optional[str]) -> np.ndarray:
+        """
+        Feature matrix [n_players x len(PLAYER_FEATURE_COLUMNS)] for many players.
+        
+        Per-game rates from the cached fact_player_season_stats frame;
+        season_id None uses each player's latest season. Unknown players get zeros.
+        """
+        frame = self._get_feature_frame("fact_player_season_stats", season_id)
+        return (
+            frame.reindex([str(p) for p in player_ids])
+            .fillna(0.0)
+            .to_numpy(dtype=np.float32)
+        )
     
     def _get_team_features(self, home_team_id: str, away_team_id: str, season_id: str) -> np.ndarray:
         """Get team features for prediction."""
-        # TODO: Fetch from database and engineer features
-        # For now, return placeholder features
-        return np.array([0.5] * 15)  # 15 features placeholder
+        return self._get_team_features_batch([home_team_id], [away_team_id], [season_id])[0]
+    
+    def _get_team_features_batch(
+        self,
+        home_team_ids: List[str],
+        away_team_ids: List[str],
+        season_ids: List[str]
+    ) -> np.ndarray:
+        """
+        Feature matrix [n_games x 15]: home team rates, away team rates, home - away goals.
+        
+        Per-game team rates come from the cached fact_team_game_stats frame.
+        """
+        n_cols = len(TEAM_FEATURE_COLUMNS)
+        home = np.zeros((len(home_team_ids), n_cols), dtype=np.float32)
+        away = np.zeros((len(away_team_ids), n_cols), dtype=np.float32)
+        season_arr = np.asarray([str(s) for s in season_ids], dtype=object)
+        for season_id in pd.unique(season_arr):
+            rows = np.flatnonzero(season_arr == season_id)
+            frame = self._get_feature_frame("fact_team_game_stats", season_id)
+            home[rows] = frame.reindex([str(home_team_ids[i]) for i in rows]).fillna(0.0).to_numpy()
+            away[rows] = frame.reindex([str(away_team_ids[i]) for i in rows]).fillna(0.0).to_numpy()
+        goal_diff = (home[:, :1] - away[:, :1])
+        return np.hstack([home, away, goal_diff])
+    
+    def _get_feature_frame(self, table: str, season_id: Optional[str]) -> pd.DataFrame:
+        """
+        Per-game feature frame indexed by player_id / team_id for one season.
+        
+        Built once per (table, season) from the cached ETL tables and reused
+        until any table it is built from changes on disk (team frames also
+        depend on dim_schedule, which maps games to seasons).
+        """
+        sources = [table] + (["dim_schedule"] if table == "fact_team_game_stats" else [])
+        source = self._get_table(table)
+        for name in sources[1:]:
+            self._get_table(name)
+        version = tuple(self._tables[name][0] if name in self._tables else None for name in sources)
+        key = (table, season_id)
+        cached = self._feature_frames.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        if table == "fact_player_season_stats":
+            frame = self._build_player_feature_frame(source, season_id)
+        else:
+            frame = self._build_team_feature_frame(source, season_id)
+        self._feature_frames[key] = (version, frame)
+        return frame
+    
+    @staticmethod
+    def _per_game(df: pd.DataFrame, columns: List[str], games: pd.Series) -> pd.DataFrame:
+        """Divide the available feature columns by games played (missing columns -> 0)."""
+        values = df.reindex(columns=columns).apply(pd.to_numeric, errors="coerce").fillna(0.0)
+        return values.div(games.clip(lower=1).to_numpy(), axis=0).astype(np.float32)
+    
+    def _build_player_feature_frame(self, season_stats: pd.DataFrame, season_id: Optional[str]) -> pd.DataFrame:
+        """Player per-game features for a season (or latest season per player)."""
+        if len(season_stats) == 0 or "player_id" not in season_stats.columns:
+            return pd.DataFrame(columns=PLAYER_FEATURE_COLUMNS, dtype=np.float32)
+        
+        stats = season_stats
+        if "game_type" in stats.columns:
+            stats = stats[stats["game_type"] == "All"]
+        if "season_id" in stats.columns:
+            if season_id is not None:
+                stats = stats[stats["season_id"].astype(str) == str(season_id)]
+            else:
+                stats = stats.sort_values("season_id").drop_duplicates("player_id", keep="last")
+        
+        games = pd.to_numeric(stats.get("games_played", pd.Series(1, index=stats.index)), errors="coerce").fillna(1)
+        frame = self._per_game(stats, PLAYER_FEATURE_COLUMNS, games)
+        frame.index = stats["player_id"].astype(str)
+        return frame[~frame.index.duplicated()]
+    
+    def _build_team_feature_frame(self, team_game_stats: pd.DataFrame, season_id: Optional[str]) -> pd.DataFrame:
+        """Team per-game features for a season from fact_team_game_stats."""
+        if len(team_game_stats) == 0 or "team_id" not in team_game_stats.columns:
+            return pd.DataFrame(columns=TEAM_FEATURE_COLUMNS, dtype=np.float32)
+        
+        stats = team_game_stats
+        schedule = self._get_table("dim_schedule")
+        if season_id is not None and {"game_id", "season_id"} <= set(schedule.columns):
+            season_games = schedule.loc[schedule["season_id"].astype(str) == str(season_id), "game_id"].astype(str)
+            stats = stats[stats["game_id"].astype(str).isin(set(season_games))]
+        
+        cols = [c for c in TEAM_FEATURE_COLUMNS if c in stats.columns]
+        totals = stats[["team_id"] + cols].copy()
+        totals[cols] = totals[cols].apply(pd.to_numeric, errors="coerce")
+        grouped = totals.groupby(totals["team_id"].astype(str))
+        frame = self._per_game(grouped[cols].sum(), TEAM_FEATURE_COLUMNS, grouped.size())
+        return frame
 
 
 # Singleton instance
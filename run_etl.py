@@ -89,6 +89,9 @@ def run_full_etl():
     # Ensure output dir exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
+    from src.core.table_writer import reset_write_report, get_write_report
+    reset_write_report()
+    
     errors = []
     
     # =========================================================================
@@ -280,7 +283,19 @@ def run_full_etl():
     except Exception as e:
         errors.append(f"Macro stats: {e}")
         log(f"Macro stats FAILED: {e}", "WARN")
-    
+
+    # =========================================================================
+    # PHASE 12: ML FEATURE INDEXES (served by the API ML layer)
+    # =========================================================================
+    log_phase("12", "ML FEATURE INDEXES")
+    try:
+        from src.ml.similarity_index import build_player_similarity_index
+        result = build_player_similarity_index()
+        log(f"Player similarity index: {result['rows']} player-seasons")
+    except Exception as e:
+        errors.append(f"ML indexes: {e}")
+        log(f"ML indexes FAILED: {e}", "WARN")
+
     # =========================================================================
     # SUMMARY
     # =========================================================================
@@ -294,6 +309,10 @@ def run_full_etl():
     print("=" * 70)
     print(f"Duration: {duration:.1f} seconds")
     print(f"Tables created: {final_count}")
+    writes = get_write_report()
+    print(f"Table writes: {writes['writes']} ({writes['avoided']} redundant rewrites avoided)")
+    for table_name, avoided in sorted(writes['avoided_by_table'].items()):
+        print(f"  {table_name}: {avoided} deferred")
     print(f"Errors: {len(errors)}")
     
     if errors:
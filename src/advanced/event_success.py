@@ -8,6 +8,10 @@ This module handles:
 4. Auto-deriving opposing player play_details
 5. Managing play_detail slots (2 max, human input supreme)
 
+All derivations are column rules over the whole frame: s/u values go through
+a lookup table, context uses the next primary event of the same game and
+period, and derived play_details are written by masked slot assignment.
+
 See docs/reference/EVENT_SUCCESS_LOGIC.md for full specification.
 """
 
@@ -17,6 +21,11 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
+from src.advanced.play_detail_automation import (
+    SLOT_COLUMNS, _assign_to_empty_slots, _event_codes, _first_rows, _set_values
+)
+from src.chains.chain_materializer import EventChainIndex
+
 
 def load_thresholds(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load threshold configuration from JSON file."""
@@ -64,6 +73,32 @@ def standardize_success_flag(value, config: Optional[Dict] = None) -> Optional[s
         return None  # Invalid value
 
 
+def _success_lookup(config: Optional[Dict] = None) -> Dict[str, str]:
+    """Normalized text → 's'/'u' (the mappings standardize_success_flag uses)."""
+    if config is None:
+        successful = ['s', 'true', '1', 'success', 'successful']
+        unsuccessful = ['u', 'false', '0', 'unsuccessful', 'fail', 'failed']
+    else:
+        mappings = config.get('success_value_mappings', {})
+        successful = mappings.get('successful', ['s', 'true', '1'])
+        unsuccessful = mappings.get('unsuccessful', ['u', 'false', '0'])
+
+    lookup = {value: 'u' for value in unsuccessful}
+    lookup.update({value: 's' for value in successful})
+    return lookup
+
+
+def standardize_success_values(values: pd.Series, config: Optional[Dict] = None) -> pd.Series:
+    """Vectorized standardize_success_flag over a column ('s', 'u' or None)."""
+    out = pd.Series(None, index=values.index, dtype=object)
+    present = values.notna().to_numpy()
+    if present.any():
+        text = values[present].astype(str).str.lower().str.strip()
+        flags = text.map(_success_lookup(config))
+        out[present] = flags.where(flags.notna(), None).to_numpy(dtype=object)
+    return out
+
+
 def standardize_success_columns(df: pd.DataFrame, config: Optional[Dict] = None) -> pd.DataFrame:
     """
     Standardize all success-related columns in dataframe.
@@ -76,7 +111,7 @@ def standardize_success_columns(df: pd.DataFrame, config: Optional[Dict] = None)
 
     for col in success_columns:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: standardize_success_flag(x, config))
+            df[col] = standardize_success_values(df[col], config)
 
     return df
 
@@ -172,68 +207,47 @@ def derive_event_success(df: pd.DataFrame, config: Optional[Dict] = None, log=No
 def _derive_context_based_success(df: pd.DataFrame, config: Dict) -> pd.DataFrame:
     """
     Derive success for context-dependent events by looking at subsequent events.
+
+    The next event is the first event_player_1 row of the same game and
+    period with a higher event_index: same team and no turnover → 's',
+    otherwise 'u'.
     """
     context_window = config.get('time_windows', {}).get('context_window_seconds', 3)
 
-    # Get unique games for processing
     if 'game_id' not in df.columns:
         return df
 
-    # Process each game separately to maintain context
-    for game_id in df['game_id'].unique():
-        game_mask = df['game_id'] == game_id
-
-        for period in df.loc[game_mask, 'period'].unique():
-            period_mask = game_mask & (df['period'] == period)
-            period_df = df.loc[period_mask].copy()
-
-            # Get primary event rows (event_player_1) for next-event lookup
-            primary_rows = period_df[period_df['player_role'] == 'event_player_1']
-
-            for idx in period_df.index:
-                row = period_df.loc[idx]
-
-                # Skip if already has value or not a context event
-                if pd.notna(row.get('event_successful')):
-                    continue
-
-                event_type = row.get('event_type', '')
-                event_detail = row.get('event_detail', '')
-
-                # Check if this needs context evaluation
-                rule = EVENT_SUCCESS_RULES.get((event_type, event_detail))
-                if rule != 'context':
-                    continue
-
-                # Find next event
-                current_event_idx = row.get('event_index', 0)
-                current_team = row.get('team_', '')
-                current_time = row.get('time_start_total_seconds', 0)
-
-                next_events = primary_rows[
-                    (primary_rows['event_index'] > current_event_idx)
-                ]
-
-                if len(next_events) == 0:
-                    continue  # End of period, can't determine
-
-                next_event = next_events.iloc[0]
-                next_team = next_event.get('team_', '')
-                next_event_type = next_event.get('event_type', '')
-                next_time = next_event.get('time_start_total_seconds', 0)
+    context_rules = [key for key, flag in EVENT_SUCCESS_RULES.items() if flag == 'context']
+    is_context = pd.MultiIndex.from_frame(df[['event_type', 'event_detail']]).isin(context_rules)
+    period_key = df.groupby(['game_id', 'period'], sort=False).ngroup()
+    pending = np.flatnonzero(
+        df['event_successful'].isna().to_numpy() & is_context &
+        period_key.notna().to_numpy() & df['event_index'].notna().to_numpy()
+    )
+    if len(pending) == 0:
+        return df
 
-                # Time check (within context window)
-                time_diff = abs(next_time - current_time) if current_time and next_time else 0
+    # Primary event rows of every game-period, ordered by event_index
+    primary = df[(df['player_role'] == 'event_player_1') & period_key.notna()].assign(_period_key=period_key)
+    index = EventChainIndex(primary, key='event_index', game_col='_period_key')
+    keys = period_key.to_numpy()[pending]
+    current_index = df['event_index'].to_numpy()[pending]
+    _, next_pos = index.locate(keys, current_index, current_index)
+    codes = index.games.get_indexer(pd.Index(keys))
+    found = (codes >= 0) & (next_pos < index.offsets[codes + 1])
+    pending, next_pos = pending[found], next_pos[found]
+    if len(pending) == 0:
+        return df
 
-                # Success logic: same team maintained possession, no turnover
-                same_team = next_team == current_team
-                not_turnover = next_event_type != 'Turnover'
-                within_window = time_diff <= context_window or time_diff == 0
+    def team(frame: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+        if 'team_' not in frame.columns:
+            return np.full(len(rows), '', dtype=object)
+        return frame['team_'].to_numpy(dtype=object)[rows]
 
-                if same_team and not_turnover:
-                    df.at[idx, 'event_successful'] = 's'
-                elif not same_team or next_event_type == 'Turnover':
-                    df.at[idx, 'event_successful'] = 'u'
+    # Success logic: same team maintained possession, no turnover
+    same_team = team(index.events, next_pos) == team(df, pending)
+    not_turnover = index.values('event_type').to_numpy(dtype=object)[next_pos] != 'Turnover'
+    _set_values(df, 'event_successful', pending, np.where(same_team & not_turnover, 's', 'u'))
 
     return df
 
@@ -306,38 +320,36 @@ def derive_play_detail_success(df: pd.DataFrame, config: Optional[Dict] = None,
         if col not in df.columns:
             df[col] = None
 
+    def column(col, default=None) -> pd.Series:
+        return df[col] if col in df.columns else pd.Series(default, index=df.index, dtype=object)
+
+    player_role = column('player_role', '')
+    event_flag = column('event_successful')
+    is_turnover = (column('event_type', '') == 'Turnover').to_numpy()
+    conditional = list(CONDITIONAL_DEFENSIVE_SUCCESS)
+    explicit = {detail: flag for detail, flag in PLAY_DETAIL_FLAGS.items() if detail not in CONDITIONAL_DEFENSIVE_SUCCESS}
+
     # Process each play_detail column
-    for pd_col, flag_col in [('play_detail1', 'play_detail1_s'), ('play_detail2', 'play_detail2_s')]:
+    for pd_col, flag_col in SLOT_COLUMNS:
         if pd_col not in df.columns:
             continue
 
-        for idx in df.index:
-            # Skip if already has a value (human input)
-            if pd.notna(df.at[idx, flag_col]):
-                continue
-
-            play_detail = df.at[idx, pd_col]
-            if pd.isna(play_detail) or play_detail == '':
-                continue
-
-            player_role = df.at[idx, 'player_role'] if 'player_role' in df.columns else ''
-            event_flag = df.at[idx, 'event_successful'] if 'event_successful' in df.columns else None
-            event_type = df.at[idx, 'event_type'] if 'event_type' in df.columns else ''
-
-            # Check for explicit override
-            if play_detail in PLAY_DETAIL_FLAGS:
-                # Conditional defensive success check
-                if play_detail in CONDITIONAL_DEFENSIVE_SUCCESS:
-                    # Only 's' if this event is a turnover (defensive success)
-                    if event_type == 'Turnover':
-                        df.at[idx, flag_col] = 's'
-                    # Otherwise leave blank
-                else:
-                    df.at[idx, flag_col] = PLAY_DETAIL_FLAGS[play_detail]
-
-            # Inheritance rule: event_player_1 inherits event flag
-            elif player_role == 'event_player_1' and pd.notna(event_flag):
-                df.at[idx, flag_col] = event_flag
+        # Skip values already set (human input) and empty play_details
+        play_detail = df[pd_col]
+        open_ = (df[flag_col].isna() & play_detail.notna() & (play_detail != '')).to_numpy()
+        flags = pd.Series(None, index=df.index, dtype=object)
+
+        # Explicit overrides; defensive actions only 's' on a turnover event
+        overridden = play_detail.isin(list(PLAY_DETAIL_FLAGS)).to_numpy()
+        flags[overridden] = play_detail[overridden].map(explicit).to_numpy(dtype=object)
+        flags[play_detail.isin(conditional).to_numpy() & is_turnover] = 's'
+
+        # Inheritance rule: event_player_1 inherits event flag
+        inherits = ~overridden & (player_role == 'event_player_1').to_numpy() & event_flag.notna().to_numpy()
+        flags[inherits] = event_flag[inherits].to_numpy(dtype=object)
+
+        rows = np.flatnonzero(open_ & flags.notna().to_numpy())
+        _set_values(df, flag_col, rows, flags.iloc[rows])
 
     if log:
         pd1_count = df['play_detail1_s'].notna().sum()
@@ -426,60 +438,54 @@ def derive_opposing_play_details(df: pd.DataFrame, config: Optional[Dict] = None
     if 'event_index' not in df.columns:
         return df
 
-    derivations_made = 0
-
-    for event_idx in df['event_index'].unique():
-        event_rows = df[df['event_index'] == event_idx]
-
-        # Collect all derivations for this event
-        derivations = []  # List of (target_idx, play_detail, flag, priority)
-
-        for idx, row in event_rows.iterrows():
-            player_role = row.get('player_role', '')
-
-            # Check each play_detail column
-            for pd_col, flag_col in [('play_detail1', 'play_detail1_s'), ('play_detail2', 'play_detail2_s')]:
-                if pd_col not in df.columns:
-                    continue
-
-                play_detail = row.get(pd_col)
-                flag = row.get(flag_col)
+    if 'player_role' not in df.columns:
+        if log:
+            log("  Auto-derived 0 opposing play_details")
+        return df
 
-                if pd.isna(play_detail) or play_detail == '':
+    codes = _event_codes(df)
+    role = df['player_role'].astype(str)
+    sides = [
+        (role.str.startswith('event_player').to_numpy(), OFFENSIVE_TO_DEFENSIVE),
+        (role.str.startswith('opp_player').to_numpy(), DEFENSIVE_TO_OFFENSIVE),
+    ]
+    targets = {}
+
+    # One candidate per source play_detail whose event has the target player
+    derivations = []
+    for slot, (pd_col, flag_col) in enumerate(SLOT_COLUMNS):
+        if pd_col not in df.columns:
+            continue
+        play_detail = df[pd_col]
+        flag = df[flag_col] if flag_col in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+        for side, mapping in sides:
+            for (source_pd, source_flag), (target_role, derived_pd, derived_flag) in mapping.items():
+                rows = np.flatnonzero(
+                    side & (play_detail == source_pd).to_numpy() & (flag == source_flag).to_numpy() & (codes >= 0)
+                )
+                if len(rows) == 0:
                     continue
-
-                # Check for derivation mapping
-                key = (play_detail, flag) if pd.notna(flag) else None
-
-                # Try offensive → defensive
-                if player_role.startswith('event_player') and key in OFFENSIVE_TO_DEFENSIVE:
-                    target_role, derived_pd, derived_flag = OFFENSIVE_TO_DEFENSIVE[key]
-                    priority = DERIVATION_PRIORITY.get(derived_pd, 99)
-
-                    # Find target player
-                    target_rows = event_rows[event_rows['player_role'] == target_role]
-                    if len(target_rows) > 0:
-                        target_idx = target_rows.index[0]
-                        derivations.append((target_idx, derived_pd, derived_flag, priority))
-
-                # Try defensive → offensive
-                elif player_role.startswith('opp_player') and key in DEFENSIVE_TO_OFFENSIVE:
-                    target_role, derived_pd, derived_flag = DEFENSIVE_TO_OFFENSIVE[key]
-                    priority = DERIVATION_PRIORITY.get(derived_pd, 99)
-
-                    # Find target player
-                    target_rows = event_rows[event_rows['player_role'] == target_role]
-                    if len(target_rows) > 0:
-                        target_idx = target_rows.index[0]
-                        derivations.append((target_idx, derived_pd, derived_flag, priority))
-
-        # Sort by priority and apply
-        derivations.sort(key=lambda x: x[3])
-
-        for target_idx, derived_pd, derived_flag, _ in derivations:
-            # Apply using slot management
-            df = _assign_to_empty_slot(df, target_idx, derived_pd, derived_flag)
-            derivations_made += 1
+                if target_role not in targets:
+                    targets[target_role] = _first_rows(codes, df['player_role'] == target_role)
+                target = targets[target_role][codes[rows]]
+                found = target >= 0
+                derivations.append(pd.DataFrame({
+                    'row': target[found],
+                    'play_detail': derived_pd,
+                    'flag': derived_flag,
+                    'priority': DERIVATION_PRIORITY.get(derived_pd, 99),
+                    'source': rows[found],
+                    'slot': slot,
+                }))
+
+    # Priority order, then source row and slot (as listed within the event)
+    derivations_made = 0
+    if derivations:
+        derivations = pd.concat(derivations, ignore_index=True).sort_values(
+            ['priority', 'source', 'slot'], kind='mergesort')
+        _assign_to_empty_slots(df, derivations['row'], derivations['play_detail'], derivations['flag'])
+        derivations_made = len(derivations)
 
     if log:
         log(f"  Auto-derived {derivations_made} opposing play_details")
@@ -487,36 +493,6 @@ def derive_opposing_play_details(df: pd.DataFrame, config: Optional[Dict] = None
     return df
 
 
-def _assign_to_empty_slot(df: pd.DataFrame, idx: int, play_detail: str, flag: str) -> pd.DataFrame:
-    """
-    Assign a derived play_detail to an empty slot.
-
-    Rules:
-    1. Never overwrite existing values (human input supreme)
-    2. Only 2 slots available
-    3. Fill play_detail1 first, then play_detail2
-    """
-    pd1 = df.at[idx, 'play_detail1'] if 'play_detail1' in df.columns else None
-    pd2 = df.at[idx, 'play_detail2'] if 'play_detail2' in df.columns else None
-
-    # Check if already exists
-    if pd1 == play_detail or pd2 == play_detail:
-        return df  # Already has this play_detail
-
-    # Find empty slot
-    if pd.isna(pd1) or pd1 == '':
-        df.at[idx, 'play_detail1'] = play_detail
-        if 'play_detail1_s' in df.columns:
-            df.at[idx, 'play_detail1_s'] = flag
-    elif pd.isna(pd2) or pd2 == '':
-        df.at[idx, 'play_detail2'] = play_detail
-        if 'play_detail2_s' in df.columns:
-            df.at[idx, 'play_detail2_s'] = flag
-    # Else: both slots full, don't add
-
-    return df
-
-
 # ============================================================
 # MAIN ENTRY POINT
 # ============================================================
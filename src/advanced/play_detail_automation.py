@@ -14,6 +14,11 @@ Rules:
 3. Apply derivation priority order
 4. Only fill empty slots
 
+Each derivation is evaluated over the whole frame: events are numbered once
+(game_id + event_index), the rows a rule reads or targets are picked per
+event with array lookups, and the resulting candidates are written with one
+masked slot assignment.
+
 See docs/reference/EVENT_SUCCESS_LOGIC.md for full specification.
 """
 
@@ -24,6 +29,9 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
+# Play detail slots in fill order: (play_detail column, success flag column)
+SLOT_COLUMNS = [('play_detail1', 'play_detail1_s'), ('play_detail2', 'play_detail2_s')]
+
 
 def load_thresholds(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load threshold configuration from JSON file."""
@@ -41,6 +49,43 @@ def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> Optional[f
     return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
 
+def _distances(x1, y1, x2, y2) -> np.ndarray:
+    """Vectorized calculate_distance (NaN where any coordinate is missing)."""
+    x1, y1, x2, y2 = (pd.to_numeric(pd.Series(v, dtype=object), errors='coerce').to_numpy(dtype=float)
+                      for v in (x1, y1, x2, y2))
+    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+
+# ============================================================
+# EVENT LOOKUPS
+# ============================================================
+
+def _event_codes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Event number of every row (-1 without an event_index).
+
+    event_index restarts every game, so events are keyed by game_id too
+    when the frame has one.
+    """
+    keys = ['game_id', 'event_index'] if 'game_id' in df.columns else ['event_index']
+    codes = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    return np.where(df['event_index'].notna().to_numpy(), codes, -1)
+
+
+def _first_rows(codes: np.ndarray, mask) -> np.ndarray:
+    """Position of each event's first row where mask holds (-1 if none)."""
+    first = np.full(codes.max() + 1 if len(codes) else 0, -1, dtype=np.int64)
+    rows = np.flatnonzero(np.asarray(mask, dtype=bool) & (codes >= 0))
+    events, at = np.unique(codes[rows], return_index=True)
+    first[events] = rows[at]
+    return first
+
+
+def _events_with(codes: np.ndarray, mask) -> np.ndarray:
+    """Events having at least one row where mask holds."""
+    return np.unique(codes[np.asarray(mask, dtype=bool) & (codes >= 0)])
+
+
 # ============================================================
 # DERIVATION FROM DEFENDER DISTANCE
 # ============================================================
@@ -71,8 +116,6 @@ def derive_ceded_zone(df: pd.DataFrame, config: Optional[Dict] = None, log=None)
     ceded_entry_ft = thresholds.get('ceded_entry', 20)
     ceded_exit_ft = thresholds.get('ceded_exit', 18)
 
-    derivations = 0
-
     # Required columns
     required_cols = ['event_index', 'event_detail', 'player_role']
     xy_cols = ['puck_x_start', 'puck_y_start']  # Puck position
@@ -92,41 +135,32 @@ def derive_ceded_zone(df: pd.DataFrame, config: Optional[Dict] = None, log=None)
             log("  Skipping ceded zone derivation - no XY data")
         return df
 
-    # Process zone entries and exits
-    zone_events = df[df['event_detail'].isin(['Zone_Entry', 'Zone_Exit'])]
-
-    for event_idx in zone_events['event_index'].unique():
-        event_rows = df[df['event_index'] == event_idx]
-        event_detail = event_rows['event_detail'].iloc[0]
-
-        # Get opp_player_1 row for this event
-        opp_rows = event_rows[event_rows['player_role'] == 'opp_player_1']
-        if len(opp_rows) == 0:
-            continue  # No defender tracked
-
-        opp_idx = opp_rows.index[0]
-
-        # Calculate distance
-        if has_opp_xy:
-            puck_x = event_rows['puck_x_start'].iloc[0]
-            puck_y = event_rows['puck_y_start'].iloc[0]
-            opp_x = opp_rows['opp_player_1_x'].iloc[0] if 'opp_player_1_x' in opp_rows.columns else None
-            opp_y = opp_rows['opp_player_1_y'].iloc[0] if 'opp_player_1_y' in opp_rows.columns else None
-
-            distance = calculate_distance(puck_x, puck_y, opp_x, opp_y)
-        else:
-            distance = None
-
-        if distance is None:
-            continue
-
-        # Check thresholds
-        if event_detail == 'Zone_Entry' and distance >= ceded_entry_ft:
-            df = _assign_to_empty_slot(df, opp_idx, 'CededZoneEntry', 'u')
-            derivations += 1
-        elif event_detail == 'Zone_Exit' and distance >= ceded_exit_ft:
-            df = _assign_to_empty_slot(df, opp_idx, 'CededZoneExit', 'u')
-            derivations += 1
+    # Zone entries and exits with a tracked defender (opp_player_1)
+    codes = _event_codes(df)
+    events = _events_with(codes, df['event_detail'].isin(['Zone_Entry', 'Zone_Exit']))
+    first = _first_rows(codes, np.ones(len(df), dtype=bool))[events]
+    opp = _first_rows(codes, df['player_role'] == 'opp_player_1')[events]
+    first, opp = first[opp >= 0], opp[opp >= 0]
+
+    # Puck position from the event's first row, defender from its opp_player_1 row
+    if has_opp_xy:
+        distance = _distances(
+            df['puck_x_start'].to_numpy()[first], df['puck_y_start'].to_numpy()[first],
+            df['opp_player_1_x'].to_numpy()[opp], df['opp_player_1_y'].to_numpy()[opp],
+        )
+    else:
+        distance = np.full(len(opp), np.nan)
+
+    event_detail = df['event_detail'].to_numpy(dtype=object)[first]
+    entry = (event_detail == 'Zone_Entry') & (distance >= ceded_entry_ft)
+    exit_ = (event_detail == 'Zone_Exit') & (distance >= ceded_exit_ft)
+    _assign_to_empty_slots(
+        df,
+        np.concatenate([opp[entry], opp[exit_]]),
+        ['CededZoneEntry'] * int(entry.sum()) + ['CededZoneExit'] * int(exit_.sum()),
+        'u',
+    )
+    derivations = int(entry.sum() + exit_.sum())
 
     if log:
         log(f"  Derived {derivations} ceded zone play_details")
@@ -156,51 +190,27 @@ def derive_forced_turnover(df: pd.DataFrame, config: Optional[Dict] = None, log=
     thresholds = config.get('distance_thresholds_ft', {})
     forced_to_distance = thresholds.get('forced_turnover', 2)
 
-    derivations = 0
-
     # Process turnover events
     if 'event_type' not in df.columns or 'event_detail' not in df.columns:
         return df
 
-    turnover_events = df[
-        (df['event_type'] == 'Turnover') &
-        (df['event_detail'] == 'Turnover_Giveaway')
-    ]
+    codes = _event_codes(df)
+    events = _events_with(codes, (df['event_type'] == 'Turnover') & (df['event_detail'] == 'Turnover_Giveaway'))
+    first = _first_rows(codes, np.ones(len(df), dtype=bool))[events]
+    opp = _first_rows(codes, df['player_role'] == 'opp_player_1')[events]
+    first, opp = first[opp >= 0], opp[opp >= 0]
 
-    # Check for XY data
+    # If we have XY data, keep defenders close enough to the puck
     has_xy = 'puck_x_start' in df.columns and 'puck_y_start' in df.columns
+    if has_xy and 'opp_player_1_x' in df.columns:
+        opp_y = df['opp_player_1_y'].to_numpy()[opp] if 'opp_player_1_y' in df.columns else np.full(len(opp), np.nan)
+        distance = _distances(
+            df['puck_x_start'].to_numpy()[first], df['puck_y_start'].to_numpy()[first],
+            df['opp_player_1_x'].to_numpy()[opp], opp_y,
+        )
+        opp = opp[distance <= forced_to_distance]
 
-    for event_idx in turnover_events['event_index'].unique():
-        event_rows = df[df['event_index'] == event_idx]
-
-        # Get opp_player_1 row
-        opp_rows = event_rows[event_rows['player_role'] == 'opp_player_1']
-        if len(opp_rows) == 0:
-            continue
-
-        opp_idx = opp_rows.index[0]
-
-        # Check if opp_player already has ForcedTurnover
-        pd1 = df.at[opp_idx, 'play_detail1'] if 'play_detail1' in df.columns else None
-        pd2 = df.at[opp_idx, 'play_detail2'] if 'play_detail2' in df.columns else None
-        if pd1 == 'ForcedTurnover' or pd2 == 'ForcedTurnover':
-            continue  # Already has it
-
-        # If we have XY data, check distance
-        if has_xy and 'opp_player_1_x' in df.columns:
-            puck_x = event_rows['puck_x_start'].iloc[0]
-            puck_y = event_rows['puck_y_start'].iloc[0]
-            opp_x = opp_rows['opp_player_1_x'].iloc[0] if 'opp_player_1_x' in opp_rows.columns else None
-            opp_y = opp_rows['opp_player_1_y'].iloc[0] if 'opp_player_1_y' in opp_rows.columns else None
-
-            distance = calculate_distance(puck_x, puck_y, opp_x, opp_y)
-
-            if distance is None or distance > forced_to_distance:
-                continue  # Not close enough
-
-        # Add ForcedTurnover
-        df = _assign_to_empty_slot(df, opp_idx, 'ForcedTurnover', 's')
-        derivations += 1
+    derivations = _assign_to_empty_slots(df, opp, 'ForcedTurnover', 's')
 
     if log:
         log(f"  Derived {derivations} ForcedTurnover play_details")
@@ -243,29 +253,18 @@ def derive_from_event_detail(df: pd.DataFrame, config: Optional[Dict] = None, lo
     if 'event_detail' not in df.columns or 'event_index' not in df.columns:
         return df
 
-    derivations = 0
+    codes = _event_codes(df)
+    targets, play_details, flags = [], [], []
 
     for event_detail, (play_detail, flag, target_role) in EVENT_DETAIL_MAPPINGS.items():
-        matching_events = df[df['event_detail'] == event_detail]
-
-        for event_idx in matching_events['event_index'].unique():
-            event_rows = df[df['event_index'] == event_idx]
+        events = _events_with(codes, df['event_detail'] == event_detail)
+        target = _first_rows(codes, df['player_role'] == target_role)[events]
+        target = target[target >= 0]
+        targets.append(target)
+        play_details += [play_detail] * len(target)
+        flags += [flag] * len(target)
 
-            # Find target player
-            target_rows = event_rows[event_rows['player_role'] == target_role]
-            if len(target_rows) == 0:
-                continue
-
-            target_idx = target_rows.index[0]
-
-            # Check if already has this play_detail
-            pd1 = df.at[target_idx, 'play_detail1'] if 'play_detail1' in df.columns else None
-            pd2 = df.at[target_idx, 'play_detail2'] if 'play_detail2' in df.columns else None
-            if pd1 == play_detail or pd2 == play_detail:
-                continue
-
-            df = _assign_to_empty_slot(df, target_idx, play_detail, flag)
-            derivations += 1
+    derivations = _assign_to_empty_slots(df, np.concatenate(targets), play_details, flags)
 
     if log:
         log(f"  Derived {derivations} play_details from event_detail")
@@ -303,8 +302,6 @@ def derive_from_sequence(df: pd.DataFrame, config: Optional[Dict] = None, log=No
     give_go_sec = time_windows.get('give_and_go_max_seconds', 4)
     one_timer_sec = time_windows.get('one_timer_max_seconds', 0.5)
 
-    derivations = 0
-
     # Require time columns
     if 'time_start_total_seconds' not in df.columns:
         if log:
@@ -316,33 +313,35 @@ def derive_from_sequence(df: pd.DataFrame, config: Optional[Dict] = None, log=No
     if all(c in df.columns for c in sort_cols):
         df = df.sort_values(sort_cols).reset_index(drop=True)
 
-    # Get primary event rows for sequence analysis
-    primary_rows = df[df['player_role'] == 'event_player_1'].copy()
-
-    # ShotOneTimer: Pass → Shot < 0.5 seconds
-    for idx in range(1, len(primary_rows)):
-        prev_row = primary_rows.iloc[idx - 1]
-        curr_row = primary_rows.iloc[idx]
-
-        # Same game, same period
-        if prev_row.get('game_id') != curr_row.get('game_id'):
-            continue
-        if prev_row.get('period') != curr_row.get('period'):
-            continue
-
-        prev_type = prev_row.get('event_type', '')
-        curr_type = curr_row.get('event_type', '')
-        prev_time = prev_row.get('time_start_total_seconds', 0)
-        curr_time = curr_row.get('time_start_total_seconds', 0)
-
-        time_diff = abs(curr_time - prev_time) if prev_time and curr_time else float('inf')
-
-        # Pass → Shot < 0.5 sec = ShotOneTimer
-        if prev_type == 'Pass' and curr_type == 'Shot' and time_diff <= one_timer_sec:
-            curr_idx = primary_rows.index[idx]
-            original_idx = df[df['event_index'] == curr_row['event_index']].index[0]
-            df = _assign_to_empty_slot(df, original_idx, 'ShotOneTimer', None)
-            derivations += 1
+    # Consecutive primary event rows (previous → current) in the same game and period
+    primary = np.flatnonzero((df['player_role'] == 'event_player_1').to_numpy())
+    prev, curr = primary[:-1], primary[1:]
+
+    def values(col):
+        if col in df.columns:
+            return df[col].to_numpy(dtype=object)
+        return np.full(len(df), None, dtype=object)
+
+    game, period, event_type = values('game_id'), values('period'), values('event_type')
+    same_period = (game[prev] == game[curr]) & (period[prev] == period[curr])
+
+    # Times of 0 count as missing
+    times = pd.to_numeric(df['time_start_total_seconds'], errors='coerce').to_numpy(dtype=float)
+    prev_time, curr_time = times[prev], times[curr]
+    timed = (prev_time != 0) & (curr_time != 0)
+
+    # Pass → Shot < 0.5 sec = ShotOneTimer (on the shot event's first row)
+    one_timer = (
+        same_period & timed &
+        (event_type[prev] == 'Pass') & (event_type[curr] == 'Shot') &
+        (np.abs(curr_time - prev_time) <= one_timer_sec)
+    )
+    codes = _event_codes(df)
+    shots = codes[curr[one_timer]]
+    shots = shots[shots >= 0]
+    targets = _first_rows(codes, np.ones(len(df), dtype=bool))[shots]
+    _assign_to_empty_slots(df, targets, 'ShotOneTimer', None)
+    derivations = len(targets)
 
     if log:
         log(f"  Derived {derivations} sequence-based play_details")
@@ -381,8 +380,6 @@ def derive_from_pass_path(df: pd.DataFrame, config: Optional[Dict] = None, log=N
     stretch_min = thresholds.get('pass_stretch_min', 60)
     chip_max = thresholds.get('chip_max', 15)
 
-    derivations = 0
-
     # Require XY columns
     xy_cols = ['puck_x_start', 'puck_y_start', 'puck_x_end', 'puck_y_end']
     if not all(c in df.columns for c in xy_cols):
@@ -390,45 +387,30 @@ def derive_from_pass_path(df: pd.DataFrame, config: Optional[Dict] = None, log=N
             log("  Skipping pass path derivation - no puck XY data")
         return df
 
-    # Process pass events
-    pass_events = df[df['event_type'] == 'Pass']
-
-    for event_idx in pass_events['event_index'].unique():
-        event_rows = df[df['event_index'] == event_idx]
-        passer_rows = event_rows[event_rows['player_role'] == 'event_player_1']
-
-        if len(passer_rows) == 0:
-            continue
-
-        passer_idx = passer_rows.index[0]
-
-        # Get XY data
-        x1 = passer_rows['puck_x_start'].iloc[0]
-        y1 = passer_rows['puck_y_start'].iloc[0]
-        x2 = passer_rows['puck_x_end'].iloc[0] if 'puck_x_end' in passer_rows.columns else None
-        y2 = passer_rows['puck_y_end'].iloc[0] if 'puck_y_end' in passer_rows.columns else None
-
-        if any(pd.isna(v) for v in [x1, y1, x2, y2]):
-            continue
-
-        # Calculate metrics
-        y_change = abs(y2 - y1)
-        distance = calculate_distance(x1, y1, x2, y2)
-
-        # PassCross: Large Y change
-        if y_change >= cross_min_y:
-            df = _assign_to_empty_slot(df, passer_idx, 'PassCross', None)
-            derivations += 1
-
-        # PassStretch: Long pass
-        elif distance and distance >= stretch_min:
-            df = _assign_to_empty_slot(df, passer_idx, 'PassStretch', None)
-            derivations += 1
-
-        # Chip: Short pass
-        elif distance and distance <= chip_max:
-            df = _assign_to_empty_slot(df, passer_idx, 'Chip', None)
-            derivations += 1
+    # Passer (event_player_1) of every pass event
+    codes = _event_codes(df)
+    events = _events_with(codes, df['event_type'] == 'Pass')
+    passer = _first_rows(codes, df['player_role'] == 'event_player_1')[events]
+    passer = passer[passer >= 0]
+
+    x1, y1, x2, y2 = (pd.to_numeric(df[c], errors='coerce').to_numpy(dtype=float)[passer] for c in xy_cols)
+    tracked = ~(np.isnan(x1) | np.isnan(y1) | np.isnan(x2) | np.isnan(y2))
+    y_change = np.abs(y2 - y1)
+    distance = _distances(x1, y1, x2, y2)
+    moved = tracked & (distance != 0)
+
+    # PassCross: large Y change; else PassStretch: long pass; else Chip: short pass
+    cross = tracked & (y_change >= cross_min_y)
+    stretch = moved & ~cross & (distance >= stretch_min)
+    chip = moved & ~cross & ~stretch & (distance <= chip_max)
+
+    _assign_to_empty_slots(
+        df,
+        np.concatenate([passer[cross], passer[stretch], passer[chip]]),
+        ['PassCross'] * int(cross.sum()) + ['PassStretch'] * int(stretch.sum()) + ['Chip'] * int(chip.sum()),
+        None,
+    )
+    derivations = int(cross.sum() + stretch.sum() + chip.sum())
 
     if log:
         log(f"  Derived {derivations} pass path play_details")
@@ -440,9 +422,19 @@ def derive_from_pass_path(df: pd.DataFrame, config: Optional[Dict] = None, log=N
 # SLOT MANAGEMENT
 # ============================================================
 
-def _assign_to_empty_slot(df: pd.DataFrame, idx: int, play_detail: str, flag: Optional[str]) -> pd.DataFrame:
+def _set_values(df: pd.DataFrame, col: str, rows, values) -> None:
+    """Write values at row positions, widening numeric (all-null) columns to object."""
+    rows = np.asarray(rows, dtype=np.int64)
+    if len(rows) == 0:
+        return
+    if df[col].dtype.kind in 'biufcmM':
+        df[col] = df[col].astype(object)
+    df.iloc[rows, df.columns.get_loc(col)] = np.asarray(values, dtype=object)
+
+
+def _assign_to_empty_slots(df: pd.DataFrame, rows, play_details, flags=None) -> int:
     """
-    Assign a derived play_detail to an empty slot.
+    Assign derived play_details to empty slots (in place).
 
     Rules:
     1. Never overwrite existing values (human input supreme)
@@ -450,40 +442,50 @@ def _assign_to_empty_slot(df: pd.DataFrame, idx: int, play_detail: str, flag: Op
     3. Fill play_detail1 first, then play_detail2
     4. Don't add duplicates
 
+    Candidates apply in order: the k-th new play_detail of a row takes the
+    row's k-th empty slot, the rest are dropped.
+
     Args:
         df: DataFrame to modify
-        idx: Row index to modify
-        play_detail: Play detail to add
-        flag: Success flag ('s', 'u', or None)
+        rows: Row position of each candidate
+        play_details: Play detail per candidate (or one for all)
+        flags: Success flag per candidate or one for all ('s', 'u', or None)
 
     Returns:
-        Modified DataFrame
+        Number of candidates their row did not already have
     """
-    # Ensure columns exist
-    if 'play_detail1' not in df.columns:
-        df['play_detail1'] = None
-    if 'play_detail2' not in df.columns:
-        df['play_detail2'] = None
-
-    pd1 = df.at[idx, 'play_detail1']
-    pd2 = df.at[idx, 'play_detail2']
-
-    # Check if already exists
-    if pd1 == play_detail or pd2 == play_detail:
-        return df  # Already has this play_detail
-
-    # Find empty slot
-    if pd.isna(pd1) or pd1 == '':
-        df.at[idx, 'play_detail1'] = play_detail
-        if flag and 'play_detail1_s' in df.columns:
-            df.at[idx, 'play_detail1_s'] = flag
-    elif pd.isna(pd2) or pd2 == '':
-        df.at[idx, 'play_detail2'] = play_detail
-        if flag and 'play_detail2_s' in df.columns:
-            df.at[idx, 'play_detail2_s'] = flag
-    # Else: both slots full, don't add
+    rows = np.asarray(rows, dtype=np.int64)
+    if len(rows) == 0:
+        return 0
 
-    return df
+    # Ensure columns exist
+    for col, _ in SLOT_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+
+    candidates = pd.DataFrame({'row': rows, 'play_detail': play_details, 'flag': flags})
+    details = candidates['play_detail'].to_numpy(dtype=object)
+    slots = [df[col].to_numpy(dtype=object)[rows] for col, _ in SLOT_COLUMNS]
+    present = (slots[0] == details) | (slots[1] == details)
+    candidates = candidates[~present].drop_duplicates(['row', 'play_detail'])
+
+    rank = candidates.groupby('row', sort=False).cumcount().to_numpy()
+    current = [df[col].to_numpy(dtype=object)[candidates['row'].to_numpy()] for col, _ in SLOT_COLUMNS]
+    empty1, empty2 = (pd.isna(values) | (values == '') for values in current)
+    slot = np.where(
+        empty1,
+        np.where(rank == 0, 1, np.where((rank == 1) & empty2, 2, 0)),
+        np.where((rank == 0) & empty2, 2, 0),
+    )
+
+    for number, (col, flag_col) in enumerate(SLOT_COLUMNS, start=1):
+        placed = candidates[slot == number]
+        _set_values(df, col, placed['row'], placed['play_detail'])
+        flagged = placed[placed['flag'].notna() & (placed['flag'] != '')]
+        if flag_col in df.columns:
+            _set_values(df, flag_col, flagged['row'], flagged['flag'])
+
+    return len(candidates)
 
 
 # ============================================================
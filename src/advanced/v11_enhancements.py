@@ -22,9 +22,13 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import logging
 import html
 from src.core.table_writer import save_output_table
+from src.core.table_stats import canonical_keys, get_table_stats
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -36,6 +40,14 @@ OUTPUT_DIR = BASE_DIR / 'data' / 'output'
 DOCS_DIR = BASE_DIR / 'docs'
 HTML_DIR = DOCS_DIR / 'html'
 HTML_TABLES_DIR = HTML_DIR / 'tables'
+PAGE_HASHES_PATH = HTML_TABLES_DIR / '.page_hashes.json'
+
+# Table pages: rows read for the preview, render threads
+PREVIEW_ROWS = 20
+DOCS_WORKERS = 8
+
+# Stand-in stats for a CSV that cannot be read
+EMPTY_STATS = {'rows': 0, 'columns': [], 'dtypes': {}, 'null_counts': {}, 'key_values': {}}
 
 VERSION = "11.04"
 VERSION_DATE = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -492,7 +504,13 @@ def _count_tracked_games() -> int:
 
 
 def generate_html_documentation():
-    """Generate comprehensive HTML documentation with table previews."""
+    """
+    Generate comprehensive HTML documentation with table previews.
+
+    Table pages are built from the stats save_output_table records at write
+    time plus a PREVIEW_ROWS preview read, and only rewritten when their
+    table (or its suspicious-stats alert) changed since the last run.
+    """
     logger.info("Generating HTML documentation...")
     
     HTML_DIR.mkdir(parents=True, exist_ok=True)
@@ -513,21 +531,68 @@ def generate_html_documentation():
         # Filter to unresolved only if 'resolved' column exists
         if 'resolved' in suspicious_df.columns:
             suspicious_df = suspicious_df[suspicious_df['resolved'] == False]
+    suspicious_games = None
+    if suspicious_df is not None and len(suspicious_df) > 0 and 'game_id' in suspicious_df.columns:
+        suspicious_games = pd.Series(canonical_keys(suspicious_df['game_id']))
+    
+    # Write-time stats (tables written outside save_output_table are re-profiled once)
+    with ThreadPoolExecutor(max_workers=DOCS_WORKERS) as executor:
+        profiles = list(executor.map(lambda f: get_table_stats(f.stem, OUTPUT_DIR) or EMPTY_STATS, csv_files))
+    table_stats = {f.stem: stats for f, stats in zip(csv_files, profiles)}
     
     # Get list of documentation files
     doc_files = _get_documentation_files()
     
     # Generate main index with documentation links
-    _generate_index_html(dim_tables, fact_tables, qa_tables, other_tables, suspicious_df, doc_files)
+    _generate_index_html(dim_tables, fact_tables, qa_tables, other_tables, suspicious_df, doc_files, table_stats)
     
-    # Generate individual table pages
+    # Generate individual table pages whose table changed
+    previous = _load_page_hashes()
+    hashes, stale = {}, []
     for csv_file in csv_files:
-        _generate_table_html(csv_file, suspicious_df)
+        stats = table_stats[csv_file.stem]
+        note = _suspicious_note(stats, suspicious_games)
+        hashes[csv_file.stem] = _page_hash(csv_file, stats, note)
+        page = HTML_TABLES_DIR / f'{csv_file.stem}.html'
+        if previous.get(csv_file.stem) != hashes[csv_file.stem] or not page.exists():
+            stale.append((csv_file, stats, note))
+    
+    HTML_TABLES_DIR.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=DOCS_WORKERS) as executor:
+        list(executor.map(lambda page: _generate_table_html(*page), stale))
+    PAGE_HASHES_PATH.write_text(json.dumps(hashes, indent=2))
     
     # Generate suspicious stats alert page
     _generate_suspicious_stats_html(suspicious_df)
     
-    logger.info(f"  Generated HTML docs for {len(csv_files)} tables")
+    logger.info(f"  Generated HTML docs for {len(csv_files)} tables ({len(stale)} pages updated)")
+
+
+def _load_page_hashes() -> Dict[str, str]:
+    """Table page hashes from the previous docs run."""
+    try:
+        return json.loads(PAGE_HASHES_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _page_hash(csv_file: Path, stats: Dict, suspicious_note: str) -> str:
+    """Hash of everything a table page shows apart from the generation date."""
+    try:
+        st = csv_file.stat()
+        signature = [st.st_size, st.st_mtime_ns]
+    except OSError:
+        signature = None
+    key = [VERSION, signature, stats['rows'], stats['columns'], suspicious_note]
+    return hashlib.md5(json.dumps(key).encode()).hexdigest()
+
+
+def _suspicious_note(stats: Dict, suspicious_games: Optional[pd.Series]) -> str:
+    """Alert for unresolved suspicious stats on the table's games ('' if none)."""
+    if suspicious_games is None or 'game_id' not in stats['key_values']:
+        return ""
+    count = int(suspicious_games.isin(stats['key_values']['game_id']).sum())
+    return f"⚠️ {count} suspicious stat entries for games in this table" if count else ""
 
 
 def _get_documentation_files() -> Dict[str, List[Path]]:
@@ -560,7 +625,7 @@ def _get_documentation_files() -> Dict[str, List[Path]]:
     return doc_files
 
 
-def _generate_index_html(dim_tables, fact_tables, qa_tables, other_tables, suspicious_df, doc_files):
+def _generate_index_html(dim_tables, fact_tables, qa_tables, other_tables, suspicious_df, doc_files, table_stats):
     """Generate main index.html with menu navigation only - NO tables on this page."""
     
     suspicious_count = len(suspicious_df) if suspicious_df is not None else 0
@@ -705,20 +770,16 @@ python3 -m pytest tests/test_etl.py -v</pre>
     (HTML_DIR / 'index.html').write_text(html_content)
     
     # Also generate tables.html page
-    _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables)
+    _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables, table_stats)
 
 
-def _generate_table_links(tables) -> str:
+def _generate_table_links(tables, table_stats) -> str:
     """Generate HTML for table links."""
     links = []
     for f in tables:
-        try:
-            df = pd.read_csv(f, nrows=1)
-            row_count = sum(1 for _ in open(f)) - 1  # Fast row count
-            col_count = len(df.columns)
-        except:
-            row_count = 0
-            col_count = 0
+        stats = table_stats.get(f.stem, EMPTY_STATS)
+        row_count = stats['rows']
+        col_count = len(stats['columns'])
         
         links.append(f"""
             <div class="table-item">
@@ -730,7 +791,7 @@ def _generate_table_links(tables) -> str:
     return '\n'.join(links)
 
 
-def _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables):
+def _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables, table_stats):
     """Generate tables.html with all table listings."""
     
     total = len(dim_tables) + len(fact_tables) + len(qa_tables) + len(other_tables)
@@ -777,20 +838,20 @@ def _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables):
     <div class="container">
         <h2>📦 Dimension Tables ({len(dim_tables)})</h2>
         <div class="table-grid">
-            {_generate_table_links(dim_tables)}
+            {_generate_table_links(dim_tables, table_stats)}
         </div>
         
         <h2>📈 Fact Tables ({len(fact_tables)})</h2>
         <div class="table-grid">
-            {_generate_table_links(fact_tables)}
+            {_generate_table_links(fact_tables, table_stats)}
         </div>
         
         <h2>🔍 QA Tables ({len(qa_tables)})</h2>
         <div class="table-grid">
-            {_generate_table_links(qa_tables)}
+            {_generate_table_links(qa_tables, table_stats)}
         </div>
         
-        {f'<h2>📁 Other ({len(other_tables)})</h2><div class="table-grid">{_generate_table_links(other_tables)}</div>' if other_tables else ''}
+        {f'<h2>📁 Other ({len(other_tables)})</h2><div class="table-grid">{_generate_table_links(other_tables, table_stats)}</div>' if other_tables else ''}
     </div>
     
     <footer>
@@ -802,35 +863,25 @@ def _generate_tables_html(dim_tables, fact_tables, qa_tables, other_tables):
     (HTML_DIR / 'tables.html').write_text(html_content)
 
 
-def _generate_table_html(csv_file: Path, suspicious_df):
-    """Generate HTML page for a single table."""
+def _generate_table_html(csv_file: Path, stats: Dict, suspicious_note: str = ""):
+    """Generate HTML page for a single table from its stats and a preview read."""
     
     table_name = csv_file.stem
     
     try:
-        df = pd.read_csv(csv_file, low_memory=False)
-        preview_df = df.head(20)
+        preview_df = pd.read_csv(csv_file, nrows=PREVIEW_ROWS, low_memory=False)
     except Exception as e:
         preview_df = pd.DataFrame()
-        df = pd.DataFrame()
-    
-    # Check if this table has suspicious data
-    has_suspicious = False
-    suspicious_note = ""
-    if suspicious_df is not None and len(suspicious_df) > 0:
-        if 'game_id' in df.columns:
-            game_ids = df['game_id'].unique()
-            suspicious_games = suspicious_df[suspicious_df['game_id'].isin(game_ids)]
-            if len(suspicious_games) > 0:
-                has_suspicious = True
-                suspicious_note = f"⚠️ {len(suspicious_games)} suspicious stat entries for games in this table"
+    
+    has_suspicious = bool(suspicious_note)
+    row_count = stats['rows']
     
     # Generate column info
     col_info = []
-    for col in df.columns:
-        dtype = str(df[col].dtype)
-        non_null = df[col].notna().sum()
-        null_pct = (1 - non_null / len(df)) * 100 if len(df) > 0 else 0
+    for col in stats['columns']:
+        dtype = stats['dtypes'][col]
+        non_null = row_count - stats['null_counts'][col]
+        null_pct = (1 - non_null / row_count) * 100 if row_count > 0 else 0
         col_info.append(f"<tr><td>{html.escape(col)}</td><td>{dtype}</td><td>{non_null:,}</td><td>{null_pct:.1f}%</td></tr>")
     
     # Generate preview table
@@ -931,8 +982,8 @@ def _generate_table_html(csv_file: Path, suspicious_df):
         {alert_html}
         
         <div class="meta">
-            <strong>Rows:</strong> {len(df):,} | 
-            <strong>Columns:</strong> {len(df.columns)} |
+            <strong>Rows:</strong> {row_count:,} | 
+            <strong>Columns:</strong> {len(stats['columns'])} |
             <strong>Last Updated:</strong> {VERSION_DATE} |
             <strong>Version:</strong> {VERSION}
         </div>
@@ -948,7 +999,7 @@ def _generate_table_html(csv_file: Path, suspicious_df):
         </div>
         
         <div class="card">
-            <h2>Data Preview (First 20 Rows)</h2>
+            <h2>Data Preview (First {PREVIEW_ROWS} Rows)</h2>
             <div style="overflow-x: auto;">
                 {preview_html}
             </div>
@@ -961,8 +1012,6 @@ def _generate_table_html(csv_file: Path, suspicious_df):
 </body>
 </html>"""
     
-    # Ensure tables subfolder exists
-    HTML_TABLES_DIR.mkdir(parents=True, exist_ok=True)
     (HTML_TABLES_DIR / f'{table_name}.html').write_text(html_content)
 
 
@@ -4,68 +4,667 @@ Goalie Stats Builder
 Builds fact_goalie_game_stats table from tracking data.
 Extracted from core_facts.py for better organization and testability.
 
-Version: 29.4
+Stats are computed column-wise for all goalie-games at once: every save,
+goal, shot and rebound is tagged with the goalie it was faced by through
+one join on (game_id, defending venue), and each metric family (core,
+period splits, time buckets, shot context, pressure, workload) is then a
+single grouped aggregation over the tagged rows.
+
+Usage:
+    from src.builders.goalie_stats import GoalieStatsBuilder
+
+    builder = GoalieStatsBuilder()
+    df = builder.goalie_game_stats(events, roster, players, fact_saves)
+
+Version: 29.6 - Columnar goalie stats engine
 """
 
+import numpy as np
 import pandas as pd
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+from src.calculations.goals import get_goal_filter
 from src.core.table_writer import save_output_table
 
-# Import the original function from core_facts
-# We'll refactor this later to extract calculation logic
-from src.tables.core_facts import _create_fact_goalie_game_stats_original
+# Import utility functions and goalie WAR constants from core_facts
+from src.tables.core_facts import (
+    load_table,
+    GOALIE_GAR_WEIGHTS,
+    LEAGUE_AVG_SV_PCT,
+    GOALS_PER_WIN,
+    GAMES_PER_SEASON,
+)
 
 OUTPUT_DIR = Path('data/output')
 
+PERIODS = [1, 2, 3]
+
+# event_detail_2 patterns (lower case) per save type
+SAVE_TYPES = {
+    'saves_butterfly': 'butterfly',
+    'saves_pad': 'pad',
+    'saves_glove': 'glove',
+    'saves_blocker': 'blocker',
+    'saves_chest': 'chest|shoulder',
+    'saves_stick': 'stick',
+    'saves_scramble': 'scramble',
+}
+
+# event_detail patterns per rebound outcome ('TeamRecovered' also matches Opp...)
+REBOUND_OUTCOMES = {
+    'rebounds_team_recovered': 'TeamRecovered',
+    'rebounds_opp_recovered': 'OppTeamRecovered',
+    'rebounds_shot_generated': 'ShotGenerated',
+    'rebounds_flurry_generated': 'Flurry',
+}
+
+# TB01 = early (0-5), TB02/TB03 = mid (5-15), TB04/TB05 = late (15-20)
+TIME_BUCKETS = {
+    'early_period': ['TB01'],
+    'mid_period': ['TB02', 'TB03'],
+    'late_period': ['TB04', 'TB05'],
+    'final_minute': ['TB05'],
+}
+
+# Goalies whose venue is unknown get game-level counts (None) and these
+# defaults, in this column order
+FALLBACK_DEFAULTS = {
+    'saves': None, 'goals_against': None, 'shots_against': None, 'save_pct': None,
+    **{col: 0 for col in SAVE_TYPES},
+    'hd_shots_against': 0, 'hd_goals_against': 0, 'hd_saves': 0, 'hd_save_pct': 100.0,
+    'saves_freeze': 0, 'saves_rebound': 0, 'freeze_pct': 0.0, 'rebound_rate': 0.0,
+    **{col: 0 for col in REBOUND_OUTCOMES},
+    'rebound_control_rate': 100.0, 'rebound_danger_rate': 0.0,
+    'second_chance_shots_against': 0, 'second_chance_goals_against': 0,
+    'second_chance_sv_pct': 100.0, 'dangerous_rebound_pct': 0.0,
+    **{f'p{p}_{s}': (100.0 if s == 'sv_pct' else 0)
+       for p in PERIODS for s in ['saves', 'goals_against', 'shots_against', 'sv_pct']},
+    'best_period': 0, 'worst_period': 0, 'period_consistency': 0.0,
+    **{f'{b}_{s}': (100.0 if s == 'sv_pct' else 0)
+       for b in TIME_BUCKETS for s in ['saves', 'ga', 'sv_pct']},
+    'rush_saves': 0, 'quick_attack_saves': 0, 'set_play_saves': 0,
+    'rush_goals_against': 0, 'quick_attack_ga': 0, 'set_play_ga': 0,
+    'rush_sv_pct': 100.0, 'quick_attack_sv_pct': 100.0, 'set_play_sv_pct': 100.0,
+    'avg_time_from_entry': 0.0, 'rush_pct_of_shots': 0.0, 'transition_defense_rating': 0.0,
+    'single_shot_saves': None, 'multi_shot_saves': 0, 'sustained_pressure_saves': 0,
+    'multi_shot_sv_pct': 100.0, 'sustained_pressure_sv_pct': 100.0,
+    'max_sequence_faced': 1, 'avg_sequence_length': 1.0,
+    'sequence_survival_rate': 100.0, 'pressure_handling_index': 100.0,
+    'glove_side_saves': 0, 'blocker_side_saves': 0, 'five_hole_saves': 0,
+    'glove_side_ga': 0, 'blocker_side_ga': 0, 'five_hole_ga': 0,
+    'glove_side_sv_pct': 100.0, 'blocker_side_sv_pct': 100.0, 'five_hole_sv_pct': 100.0,
+    'side_preference_ratio': 1.0,
+    'shots_per_period': 0.0, 'saves_per_period': 0.0, 'max_shots_in_period': 0,
+    'shot_volume_variance': 0.0, 'time_between_shots_avg': 0.0, 'time_between_shots_min': 0.0,
+    'rapid_fire_saves': 0, 'consecutive_saves_max': 0, 'workload_index': 0.0,
+    'fatigue_adjusted_gsaa': 0.0,
+    'is_quality_start': 0, 'is_bad_start': 0,
+    'expected_goals_against': 0.0, 'goals_saved_above_avg': 0.0,
+    'goalie_game_score': 0.0, 'goalie_gax': 0.0, 'goalie_gsax': 0.0,
+    'clutch_rating': 50.0, 'consistency_rating': 50.0, 'pressure_rating': 50.0,
+    'rebound_rating': 50.0, 'positioning_rating': 50.0, 'overall_game_rating': 5.0,
+    'win_probability_added': 0.0,
+}
+
+
+def _round(values, ndigits: int) -> np.ndarray:
+    """Element-wise built-in round (matches per-value Python arithmetic)."""
+    return np.array([round(v, ndigits) for v in np.asarray(values, dtype=float).tolist()], dtype=float)
+
+
+def _ratio(num, den, default: float, scale: float = 100, ndigits: int = 1) -> np.ndarray:
+    """round(num / den * scale) where den > 0, else default."""
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = num / den * scale if scale != 1 else num / den
+    return np.where(den > 0, _round(ratio, ndigits), default)
+
+
+def _lower(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.lower()
+
+
+def _keys(series: pd.Series) -> pd.Series:
+    # Object keys join like == does (5 matches 5.0)
+    return series.astype(object)
+
+
+def _counts(goalie: pd.Series, n: int, flags: Dict[str, pd.Series]) -> Dict[str, np.ndarray]:
+    """Per-goalie counts of boolean flags over tagged rows (one grouped sum)."""
+    frame = pd.DataFrame({k: np.asarray(v, dtype=bool) for k, v in flags.items()}, index=goalie.index)
+    counts = frame.groupby(goalie.to_numpy()).sum().reindex(range(n), fill_value=0)
+    return {k: counts[k].to_numpy(dtype=np.int64) for k in flags}
+
 
 class GoalieStatsBuilder:
     """
     Builder for fact_goalie_game_stats table.
-    
-    Creates comprehensive goalie game statistics with advanced metrics.
-    Currently wraps the existing create_fact_goalie_game_stats function.
-    Future refactoring will extract calculation logic into separate methods.
+
+    Creates comprehensive goalie game statistics with advanced metrics:
+    rebound control, period splits, time bucket / clutch, shot context,
+    pressure handling, body location, workload, composites and goalie WAR.
     """
-    
+
     def __init__(self, output_dir: Path = None):
         """
         Initialize the builder.
-        
+
         Args:
             output_dir: Path to output directory (default: data/output)
         """
         self.output_dir = output_dir or OUTPUT_DIR
-    
+
+    def _tag(self, frame: pd.DataFrame, venue: pd.Series, goalies: pd.DataFrame) -> pd.DataFrame:
+        """
+        Join rows to the goalie defending them.
+
+        Args:
+            frame: Event-like rows with game_id
+            venue: Defending venue ('h'/'a') of each row
+            goalies: goalie (row number), game_id, venue of tagged goalies
+
+        Returns:
+            frame rows repeated once per facing goalie, with a 'goalie' column
+        """
+        left = frame.drop(columns=['goalie'], errors='ignore').assign(
+            _game=_keys(frame['game_id']), _venue=venue.to_numpy()
+        )
+        right = goalies.rename(columns={'game_id': '_game', 'venue': '_venue'})
+        return left.merge(right, on=['_game', '_venue'], how='inner', sort=False)
+
+    def goalie_game_stats(
+        self,
+        events: pd.DataFrame,
+        roster: pd.DataFrame,
+        players: pd.DataFrame,
+        fact_saves: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate stats for every goalie-game in the tracked games.
+
+        Args:
+            events: fact_events
+            roster: fact_gameroster (goalies found by position)
+            players: dim_player (for player_name)
+            fact_saves: Optional save-level detail (time buckets, shot
+                context, sequences); saves from events are used otherwise
+
+        Returns:
+            DataFrame with one row per roster goalie, in roster order
+        """
+        if len(events) == 0:
+            print("  ERROR: fact_events not found!")
+            return pd.DataFrame()
+
+        tracked_game_ids = events['game_id'].dropna().unique().tolist()
+        roster_tracked = roster[roster['game_id'].isin(tracked_game_ids)]
+
+        pos_col = 'player_position' if 'player_position' in roster_tracked.columns else 'position'
+        if pos_col not in roster_tracked.columns:
+            print("  No position column found")
+            return pd.DataFrame()
+
+        goalies = roster_tracked[_lower(roster_tracked[pos_col]).str.contains('goalie', na=False)]
+        goalies = goalies.reset_index(drop=True)
+        n = len(goalies)
+        if n == 0:
+            print("  No goalies found")
+            return pd.DataFrame()
+
+        game_ids = goalies['game_id']
+        player_ids = goalies['player_id']
+
+        stats = {
+            'goalie_game_key': [f"GK{g}{p}" for g, p in zip(game_ids, player_ids)],
+            'game_id': game_ids.to_numpy(),
+            'player_id': player_ids.to_numpy(),
+            '_export_timestamp': datetime.now().isoformat(),
+        }
+
+        if len(players) > 0:
+            names = players.drop_duplicates('player_id').set_index('player_id')['player_full_name']
+            known = player_ids.isin(names.index)
+            stats['player_name'] = player_ids.map(names).where(known, '').to_numpy()
+
+        stats['team_name'] = goalies['team_name'].to_numpy() if 'team_name' in goalies.columns else ''
+        stats['team_id'] = goalies['team_id'].to_numpy() if 'team_id' in goalies.columns else ''
+
+        # Home team from the first event row of each game
+        team_ids = goalies['team_id'] if 'team_id' in goalies.columns else pd.Series([None] * n)
+        if 'home_team_id' in events.columns:
+            first_rows = events.drop_duplicates('game_id').set_index('game_id')['home_team_id']
+            home_team_ids = game_ids.map(first_rows)
+        else:
+            home_team_ids = pd.Series([None] * n)
+        is_home = [
+            (str(team) == str(home)) if team and home else None
+            for team, home in zip(team_ids.tolist(), home_team_ids.tolist())
+        ]
+        stats['is_home'] = is_home
+
+        # Goalies with a known venue are tagged with their events; the rest
+        # fall back to game-level counts
+        has_venue = 'team_venue' in events.columns
+        tagged = np.array([h is not None and has_venue for h in is_home])
+        venue = np.where(np.array([h is True for h in is_home]), 'h', 'a')
+        keys = pd.DataFrame({
+            'goalie': np.flatnonzero(tagged),
+            'game_id': _keys(game_ids[tagged]).to_numpy(),
+            'venue': venue[tagged],
+        })
+
+        event_type = _lower(events['event_type'])
+        is_save = event_type == 'save'
+        is_goal = get_goal_filter(events)
+
+        # ================================================================
+        # TAG EVENTS: saves at the goalie's venue, goals and shots at the
+        # opponent's venue
+        # ================================================================
+        team_venue = _lower(events['team_venue']) if has_venue else pd.Series('', index=events.index)
+        is_shot = event_type.isin(['shot', 'goal'])
+        faced_mask = is_save | is_goal | is_shot
+        defending = team_venue.where(is_save, team_venue.map({'h': 'a', 'a': 'h'}))
+        faced = self._tag(
+            events[faced_mask].assign(
+                _save=is_save[faced_mask], _goal=is_goal[faced_mask],
+                _shot=is_shot[faced_mask], _type=event_type[faced_mask]
+            ),
+            defending[faced_mask], keys
+        )
+        goalie_saves = faced[faced['_save']]
+        goals_against = faced[faced['_goal']]
+
+        if fact_saves is not None and len(fact_saves) > 0:
+            detailed_saves = self._tag(fact_saves, _lower(fact_saves['team_venue']), keys)
+        else:
+            detailed_saves = goalie_saves
+
+        # ================================================================
+        # CORE STATS
+        # ================================================================
+        core = _counts(faced['goalie'], n, {'saves': faced['_save'], 'goals_against': faced['_goal']})
+        saves, ga = core['saves'], core['goals_against']
+        sa = saves + ga
+        stats['saves'] = saves
+        stats['goals_against'] = ga
+        stats['shots_against'] = sa
+        stats['save_pct'] = _ratio(saves, sa, 100.0)
+
+        # ================================================================
+        # SAVE TYPE BREAKDOWN / BODY LOCATION
+        # ================================================================
+        has_detail_2 = 'event_detail_2' in events.columns
+        if has_detail_2:
+            save_types = _lower(goalie_saves['event_detail_2'])
+            types = _counts(goalie_saves['goalie'], n, {
+                **{col: save_types.str.contains(pattern, na=False) for col, pattern in SAVE_TYPES.items()},
+                'left_pad': save_types.str.contains('leftpad', na=False),
+                'right_pad': save_types.str.contains('rightpad', na=False),
+            })
+        else:
+            types = {col: np.zeros(n, dtype=np.int64) for col in [*SAVE_TYPES, 'left_pad', 'right_pad']}
+        for col in SAVE_TYPES:
+            stats[col] = types[col]
+
+        # ================================================================
+        # HIGH DANGER SAVES
+        # ================================================================
+        if 'danger_level' in events.columns:
+            hd = faced['_shot'] & (_lower(faced['danger_level']) == 'high')
+            high = _counts(faced['goalie'], n, {'hd': hd, 'hd_goals': hd & (faced['_type'] == 'goal')})
+            hd_sa, hd_ga = high['hd'], high['hd_goals']
+        else:
+            hd_sa = hd_ga = np.zeros(n, dtype=np.int64)
+        hd_saves = hd_sa - hd_ga
+        stats['hd_shots_against'] = hd_sa
+        stats['hd_goals_against'] = hd_ga
+        stats['hd_saves'] = hd_saves
+        stats['hd_save_pct'] = _ratio(hd_saves, hd_sa, 100.0)
+
+        # ================================================================
+        # REBOUND CONTROL
+        # ================================================================
+        if 'event_detail' in events.columns:
+            save_details = goalie_saves['event_detail'].astype(str)
+            control = _counts(goalie_saves['goalie'], n, {
+                'freeze': save_details.str.contains('Freeze', na=False, case=False),
+                'rebound': save_details.str.contains('Rebound', na=False, case=False),
+            })
+            freeze, rebound = control['freeze'], control['rebound']
+        else:
+            freeze = stats['saves_glove'] + stats['saves_chest']
+            rebound = saves - freeze
+        stats['saves_freeze'] = freeze
+        stats['saves_rebound'] = rebound
+        stats['freeze_pct'] = _ratio(freeze, saves, 0.0)
+        stats['rebound_rate'] = _ratio(rebound, saves, 0.0)
+
+        # Rebounds are linked to goalies via prev_event_id -> their saves
+        is_rebound = event_type == 'rebound'
+        if 'prev_event_id' in events.columns and 'event_id' in events.columns:
+            save_ids = goalie_saves[['goalie', '_game']].assign(_link=goalie_saves['event_id'].astype(str))
+            rebounds = events[is_rebound].assign(
+                _game=_keys(events.loc[is_rebound, 'game_id']),
+                _link=events.loc[is_rebound, 'prev_event_id'].astype(str)
+            ).merge(save_ids.drop_duplicates(), on=['_game', '_link'], how='inner', sort=False)
+        else:
+            # Fallback: game-level rebounds for every goalie in the game
+            rebounds = events[is_rebound].assign(_game=_keys(events.loc[is_rebound, 'game_id'])).merge(
+                keys[['goalie', 'game_id']].rename(columns={'game_id': '_game'}), on='_game', how='inner', sort=False
+            )
+        if 'event_detail' in events.columns:
+            rebound_details = rebounds['event_detail'].astype(str)
+            outcomes = _counts(rebounds['goalie'], n, {
+                col: rebound_details.str.contains(pattern, na=False) for col, pattern in REBOUND_OUTCOMES.items()
+            })
+        else:
+            outcomes = {col: np.zeros(n, dtype=np.int64) for col in REBOUND_OUTCOMES}
+        stats.update(outcomes)
+
+        total_rebounds = sum(outcomes.values())
+        dangerous = outcomes['rebounds_shot_generated'] + outcomes['rebounds_flurry_generated']
+        stats['rebound_control_rate'] = _ratio(outcomes['rebounds_team_recovered'], total_rebounds, 100.0)
+        stats['rebound_danger_rate'] = _ratio(dangerous, total_rebounds, 0.0)
+
+        # Second chance goals would need sequence analysis - 0 for now
+        stats['second_chance_shots_against'] = dangerous
+        stats['second_chance_goals_against'] = np.zeros(n, dtype=np.int64)
+        stats['second_chance_sv_pct'] = _ratio(dangerous, dangerous, 100.0)
+        stats['dangerous_rebound_pct'] = stats['rebound_danger_rate']
+
+        # ================================================================
+        # PERIOD SPLITS
+        # ================================================================
+        by_period = _counts(faced['goalie'], n, {
+            **{f'p{p}_saves': faced['_save'] & (faced['period'] == p) for p in PERIODS},
+            **{f'p{p}_goals_against': faced['_goal'] & (faced['period'] == p) for p in PERIODS},
+        })
+        for p in PERIODS:
+            p_saves, p_ga = by_period[f'p{p}_saves'], by_period[f'p{p}_goals_against']
+            stats[f'p{p}_saves'] = p_saves
+            stats[f'p{p}_goals_against'] = p_ga
+            stats[f'p{p}_shots_against'] = p_saves + p_ga
+            stats[f'p{p}_sv_pct'] = _ratio(p_saves, p_saves + p_ga, 100.0)
+
+        # Best/worst/consistency over periods with shots
+        period_sv = np.column_stack([stats[f'p{p}_sv_pct'] for p in PERIODS])
+        period_sa = np.column_stack([stats[f'p{p}_shots_against'] for p in PERIODS])
+        active = period_sa > 0
+        n_active = active.sum(axis=1)
+        any_active = n_active > 0
+        stats['best_period'] = np.where(any_active, np.argmax(np.where(active, period_sv, -np.inf), axis=1) + 1, 0)
+        stats['worst_period'] = np.where(any_active, np.argmin(np.where(active, period_sv, np.inf), axis=1) + 1, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(active, period_sv, 0.0).sum(axis=1) / n_active
+            deviation = np.where(active, period_sv - mean[:, None], 0.0)
+            std = np.sqrt((deviation * deviation).sum(axis=1) / n_active)
+        stats['period_consistency'] = np.where(n_active > 1, np.round(std, 2), 0.0)
+
+        # ================================================================
+        # TIME BUCKET / CLUTCH (saves from detailed saves, GA from events)
+        # ================================================================
+        for source, suffix in [(detailed_saves, 'saves'), (goals_against, 'ga')]:
+            if 'time_bucket_id' in source.columns:
+                buckets = _counts(source['goalie'], n, {
+                    b: source['time_bucket_id'].isin(ids) for b, ids in TIME_BUCKETS.items()
+                })
+            else:
+                buckets = {b: np.zeros(n, dtype=np.int64) for b in TIME_BUCKETS}
+            for b in TIME_BUCKETS:
+                stats[f'{b}_{suffix}'] = buckets[b]
+        for b in TIME_BUCKETS:
+            stats[f'{b}_sv_pct'] = _ratio(stats[f'{b}_saves'], stats[f'{b}_saves'] + stats[f'{b}_ga'], 100.0)
+
+        # ================================================================
+        # SHOT CONTEXT - RUSH VS SET PLAY
+        # ================================================================
+        detailed_count = _counts(detailed_saves['goalie'], n, {'n': pd.Series(True, index=detailed_saves.index)})['n']
+        if 'time_since_zone_entry' in detailed_saves.columns:
+            tsze = detailed_saves['time_since_zone_entry'].fillna(999)
+            context = _counts(detailed_saves['goalie'], n, {
+                'rush_saves': tsze < 5,
+                'quick_attack_saves': (tsze >= 5) & (tsze < 10),
+                'set_play_saves': tsze >= 10,
+            })
+            avg_entry = detailed_saves.groupby('goalie')['time_since_zone_entry'].mean().reindex(range(n))
+            stats.update(context)
+            stats['avg_time_from_entry'] = np.where(detailed_count > 0, np.round(avg_entry.to_numpy(dtype=float), 1), 0.0)
+        else:
+            for col in ['rush_saves', 'quick_attack_saves', 'set_play_saves']:
+                stats[col] = np.zeros(n, dtype=np.int64)
+            stats['avg_time_from_entry'] = np.zeros(n)
+
+        if 'time_since_zone_entry' in events.columns:
+            ga_tsze = goals_against['time_since_zone_entry'].fillna(999)
+            stats.update(_counts(goals_against['goalie'], n, {
+                'rush_goals_against': ga_tsze < 5,
+                'quick_attack_ga': (ga_tsze >= 5) & (ga_tsze < 10),
+                'set_play_ga': ga_tsze >= 10,
+            }))
+        else:
+            for col in ['rush_goals_against', 'quick_attack_ga', 'set_play_ga']:
+                stats[col] = np.zeros(n, dtype=np.int64)
+
+        rush_sa = stats['rush_saves'] + stats['rush_goals_against']
+        stats['rush_sv_pct'] = _ratio(stats['rush_saves'], rush_sa, 100.0)
+        stats['quick_attack_sv_pct'] = _ratio(stats['quick_attack_saves'], stats['quick_attack_saves'] + stats['quick_attack_ga'], 100.0)
+        stats['set_play_sv_pct'] = _ratio(stats['set_play_saves'], stats['set_play_saves'] + stats['set_play_ga'], 100.0)
+        stats['rush_pct_of_shots'] = _ratio(rush_sa, sa, 0.0)
+        stats['transition_defense_rating'] = _round(stats['rush_sv_pct'] - stats['set_play_sv_pct'], 1)
+
+        # ================================================================
+        # PRESSURE / SEQUENCE HANDLING
+        # ================================================================
+        if 'sequence_shot_count' in detailed_saves.columns:
+            seq = detailed_saves['sequence_shot_count'].fillna(0)
+            stats.update(_counts(detailed_saves['goalie'], n, {
+                'single_shot_saves': seq <= 1,
+                'multi_shot_saves': seq >= 2,
+                'sustained_pressure_saves': seq >= 4,
+            }))
+            seq_stats = seq.groupby(detailed_saves['goalie']).agg(['max', 'mean']).reindex(range(n))
+            has_saves = detailed_count > 0
+            stats['max_sequence_faced'] = np.where(has_saves, seq_stats['max'].fillna(0).to_numpy(), 0).astype(np.int64)
+            stats['avg_sequence_length'] = np.where(has_saves, np.round(seq_stats['mean'].to_numpy(dtype=float), 1), 0.0)
+        else:
+            stats['single_shot_saves'] = saves
+            stats['multi_shot_saves'] = np.zeros(n, dtype=np.int64)
+            stats['sustained_pressure_saves'] = np.zeros(n, dtype=np.int64)
+            stats['max_sequence_faced'] = np.ones(n, dtype=np.int64)
+            stats['avg_sequence_length'] = np.ones(n)
+
+        if 'sequence_shot_count' in events.columns:
+            ga_seq = goals_against['sequence_shot_count'].fillna(0)
+            pressure_ga = _counts(goals_against['goalie'], n, {'multi': ga_seq >= 2, 'sustained': ga_seq >= 4})
+        else:
+            pressure_ga = {'multi': np.zeros(n, dtype=np.int64), 'sustained': np.zeros(n, dtype=np.int64)}
+
+        stats['multi_shot_sv_pct'] = _ratio(stats['multi_shot_saves'], stats['multi_shot_saves'] + pressure_ga['multi'], 100.0)
+        stats['sustained_pressure_sv_pct'] = _ratio(
+            stats['sustained_pressure_saves'], stats['sustained_pressure_saves'] + pressure_ga['sustained'], 100.0
+        )
+        stats['sequence_survival_rate'] = _ratio(saves - ga, saves, 100.0)
+        stats['pressure_handling_index'] = _round((stats['multi_shot_sv_pct'] + stats['sustained_pressure_sv_pct']) / 2, 1)
+
+        # ================================================================
+        # BODY LOCATION / TECHNIQUE (GA by location needs goal-level data)
+        # ================================================================
+        no_goals = np.zeros(n, dtype=np.int64)
+        if has_detail_2:
+            stats['glove_side_saves'] = stats['saves_glove'] + types['left_pad']
+            stats['blocker_side_saves'] = stats['saves_blocker'] + types['right_pad']
+        else:
+            stats['glove_side_saves'] = stats['blocker_side_saves'] = no_goals
+        stats['five_hole_saves'] = stats['saves_butterfly'] + stats['saves_scramble']
+        for side in ['glove_side', 'blocker_side', 'five_hole']:
+            stats[f'{side}_ga'] = no_goals
+        for side in ['glove_side', 'blocker_side', 'five_hole']:
+            side_saves = stats[f'{side}_saves']
+            stats[f'{side}_sv_pct'] = _ratio(side_saves, side_saves + stats[f'{side}_ga'], 100.0)
+        stats['side_preference_ratio'] = _ratio(stats['glove_side_saves'], stats['blocker_side_saves'], 1.0, scale=1, ndigits=2)
+
+        # ================================================================
+        # WORKLOAD METRICS
+        # ================================================================
+        stats['shots_per_period'] = _round(sa / 3, 1)
+        stats['saves_per_period'] = _round(saves / 3, 1)
+        stats['max_shots_in_period'] = period_sa.max(axis=1)
+        stats['shot_volume_variance'] = np.where(period_sa.sum(axis=1) > 0, np.round(np.std(period_sa, axis=1), 2), 0.0)
+
+        if 'time_since_last_sog' in detailed_saves.columns:
+            gaps = detailed_saves[['goalie', 'time_since_last_sog']].dropna()
+            gap_stats = gaps.groupby('goalie')['time_since_last_sog'].agg(['mean', 'min']).reindex(range(n))
+            stats['time_between_shots_avg'] = np.round(gap_stats['mean'].fillna(0.0).to_numpy(dtype=float), 1)
+            stats['time_between_shots_min'] = np.round(gap_stats['min'].fillna(0.0).to_numpy(dtype=float), 1)
+            stats['rapid_fire_saves'] = _counts(gaps['goalie'], n, {'rapid': gaps['time_since_last_sog'] < 3})['rapid']
+        else:
+            stats['time_between_shots_avg'] = stats['time_between_shots_min'] = np.zeros(n)
+            stats['rapid_fire_saves'] = np.zeros(n, dtype=np.int64)
+
+        # Consecutive saves (estimate based on GA distribution)
+        stats['consecutive_saves_max'] = np.where(ga > 0, saves // np.maximum(ga, 1), saves)
+        stats['workload_index'] = np.round(sa * (1 + stats['shot_volume_variance'] / 10), 1)
+        # GSAA is only known after the quality indicators below, so this stays 0.0
+        stats['fatigue_adjusted_gsaa'] = np.zeros(n)
+
+        # ================================================================
+        # QUALITY INDICATORS
+        # ================================================================
+        save_pct = stats['save_pct']
+        stats['is_quality_start'] = ((save_pct >= 91.7) | (ga <= 2)).astype(np.int64)
+        stats['is_bad_start'] = (save_pct < 85.0).astype(np.int64)
+        expected = sa * (1 - LEAGUE_AVG_SV_PCT / 100)
+        stats['expected_goals_against'] = _round(expected, 2)
+        stats['goals_saved_above_avg'] = _round(expected - ga, 2)
+
+        # ================================================================
+        # ADVANCED COMPOSITES
+        # ================================================================
+        shutout_bonus = np.where(ga == 0, 2.0, 0.0)
+        stats['goalie_game_score'] = _round(saves * 0.1 - ga * 0.75 + shutout_bonus + hd_saves * 0.2, 2)
+
+        # Simple xG model: rush shots worth more, HD shots worth more
+        rush_xg = stats['rush_saves'] * 0.15 + stats['rush_goals_against'] * 1.0
+        set_xg = stats['set_play_saves'] * 0.08 + stats['set_play_ga'] * 1.0
+        hd_xg = hd_sa * 0.25
+        stats['goalie_gax'] = _round(rush_xg + set_xg + hd_xg * 0.5, 2)
+        stats['goalie_gsax'] = _round(stats['goalie_gax'] - ga, 2)
+
+        stats['clutch_rating'] = _round(
+            stats['p3_sv_pct'] * 0.4 + stats['late_period_sv_pct'] * 0.3 + stats['final_minute_sv_pct'] * 0.3, 1
+        )
+        stats['consistency_rating'] = np.round(100 - stats['period_consistency'] * 2, 1)
+        stats['pressure_rating'] = stats['pressure_handling_index']
+        stats['rebound_rating'] = _round(
+            stats['freeze_pct'] * 0.4 + stats['rebound_control_rate'] * 0.4 + (100 - stats['rebound_danger_rate']) * 0.2, 1
+        )
+        controlled_saves = stats['saves_glove'] + stats['saves_blocker'] + stats['saves_chest']
+        stats['positioning_rating'] = _ratio(controlled_saves, saves, 50.0)
+
+        raw_rating = (save_pct - 80) / 4 + stats['goalie_gsax'] * 0.5 + shutout_bonus * 0.5
+        stats['overall_game_rating'] = _round(np.clip(raw_rating + 5, 1, 10), 1)
+        stats['win_probability_added'] = _round(stats['goals_saved_above_avg'] * 0.05, 3)
+
+        # ================================================================
+        # FALLBACK FOR MISSING VENUE DATA: game-level counts, split in half
+        # ================================================================
+        fallback = ~tagged
+        if fallback.any():
+            game_keys = _keys(events['game_id'])
+            game_totals = pd.DataFrame({'saves': is_save, 'goals': is_goal}).groupby(game_keys.to_numpy()).sum()
+            totals = game_totals.reindex(_keys(game_ids).to_numpy()).fillna(0).to_numpy(dtype=np.int64)
+            fb_saves, fb_ga = totals[:, 0] // 2, totals[:, 1] // 2
+            computed = {
+                'saves': fb_saves,
+                'goals_against': fb_ga,
+                'shots_against': fb_saves + fb_ga,
+                'save_pct': _ratio(fb_saves, fb_saves + fb_ga, 100.0),
+                'single_shot_saves': fb_saves,
+            }
+            for col, default in FALLBACK_DEFAULTS.items():
+                value = computed[col] if default is None else default
+                stats[col] = np.where(fallback, value, stats[col])
+
+        stats.update(self._goalie_war(stats))
+
+        df = pd.DataFrame(stats)
+        if fallback[0]:
+            # Columns follow the first goalie's layout
+            head = list(df.columns[:list(df.columns).index('is_home') + 1])
+            war = list(df.columns[list(df.columns).index('goalie_gar_gsaa'):])
+            df = df[head + list(FALLBACK_DEFAULTS) + war]
+        return df
+
+    def _goalie_war(self, stats: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Goalie GAR/WAR columns (see core_facts.calculate_goalie_war)."""
+        gsaa = stats['goals_saved_above_avg']
+        saves = stats['saves']
+        hd_bonus = stats['hd_saves'] * GOALIE_GAR_WEIGHTS['high_danger_saves']
+        qs_bonus = np.where(stats['is_quality_start'] == 1, GOALIE_GAR_WEIGHTS['quality_start_bonus'], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rebound_control = np.where(
+                saves > 0, (stats['saves_freeze'] / saves) * GOALIE_GAR_WEIGHTS['rebound_control'] * saves, 0
+            )
+        gar_total = gsaa * GOALIE_GAR_WEIGHTS['goals_prevented'] + hd_bonus + qs_bonus + rebound_control
+        war = {
+            'goalie_gar_gsaa': _round(gsaa, 2),
+            'goalie_gar_hd_bonus': _round(hd_bonus, 2),
+            'goalie_gar_qs_bonus': _round(qs_bonus, 2),
+            'goalie_gar_rebound': _round(rebound_control, 2),
+            'goalie_gar_total': _round(gar_total, 2),
+            'goalie_war': _round(gar_total / GOALS_PER_WIN, 2),
+            'goalie_war_pace': _round(gar_total / GOALS_PER_WIN * GAMES_PER_SEASON, 2),
+        }
+        # Bonuses that apply to no goalie stay integer 0 columns
+        if not (stats['is_quality_start'] == 1).any():
+            war['goalie_gar_qs_bonus'] = war['goalie_gar_qs_bonus'].astype(np.int64)
+        if not (saves > 0).any():
+            war['goalie_gar_rebound'] = war['goalie_gar_rebound'].astype(np.int64)
+        return war
+
     def build(self, save: bool = True) -> pd.DataFrame:
         """
         Build the complete fact_goalie_game_stats table.
-        
+
         Args:
             save: Whether to save the table (default: True)
-            
+
         Returns:
             DataFrame with goalie game stats
         """
-        # For now, delegate to the original function
-        # Future: Extract calculation logic into builder methods
-        df = _create_fact_goalie_game_stats_original()
-        
-        # Save if requested (the original function saves by default, so we need to handle this)
+        print("\nBuilding fact_goalie_game_stats (v28.1 - ADVANCED GOALIE ANALYTICS)...")
+
+        events = load_table('fact_events')
+        roster = load_table('fact_gameroster')
+        players = load_table('dim_player')
+
+        # fact_saves adds save-level detail when available
+        try:
+            fact_saves = load_table('fact_saves')
+        except Exception:
+            fact_saves = pd.DataFrame()
+
+        df = self.goalie_game_stats(events, roster, players, fact_saves)
+        if len(df) > 0:
+            print(f"  Created {len(df)} goalie-game records with {len(df.columns)} columns")
+
         if save and len(df) > 0:
             save_output_table(df, 'fact_goalie_game_stats', self.output_dir)
-        
+
         return df
 
 
 def build_fact_goalie_game_stats(output_dir: Path = None, save: bool = True) -> pd.DataFrame:
     """
     Convenience function to build fact_goalie_game_stats.
-    
+
     Args:
         output_dir: Path to output directory (default: data/output)
         save: Whether to save the table (default: True)
-        
+
     Returns:
         DataFrame with goalie game stats
     """
@@ -21,6 +21,48 @@ from src.tables.core_facts import load_table
 
 OUTPUT_DIR = Path('data/output')
 
+# Team stats counted from events (not summed from players)
+EVENT_STATS = ['shots', 'sog', 'goals', 'giveaways', 'takeaways', 'blocks', 'hits']
+
+# Periods broken out as p{period}_{stat}
+PERIODS = [1, 2, 3]
+
+# Stats aggregated from player game stats - these are accurate when summed
+# NOTE: shots, sog, goals, giveaways, takeaways, blocks, hits come from events
+SUM_COLS = [
+    'assists', 'points',  # goals/shots/sog already from events
+    # 'giveaways', 'takeaways', 'blocks', 'hits',  # Already from events
+    'toi_seconds', 'corsi_for', 'corsi_against', 
+    'fenwick_for', 'fenwick_against', 'plus_total', 
+    'minus_total', 'xg_for', 'gar_total', 'war', 
+    'shot_assists', 'goal_creating_actions',
+    # Micro stats
+    'dekes', 'drives_total', 'cutbacks', 'delays', 'crash_net', 'screens',
+    'give_and_go', 'second_touch', 'cycles', 'poke_checks', 'stick_checks',
+    'zone_ent_denials', 'backchecks', 'forechecks', 'breakouts', 'dump_ins',
+    'loose_puck_wins', 'puck_recoveries', 'puck_battles_total',
+    'board_battles_won', 'board_battles_lost',
+    'passes_cross_ice', 'passes_stretch', 'passes_breakout', 'passes_rim',
+    'passes_bank', 'passes_royal_road', 'passes_slot', 'passes_behind_net',
+    'shots_one_timer', 'shots_snap', 'shots_wrist', 'shots_slap',
+    'shots_tip', 'shots_deflection', 'shots_wrap_around',
+    'pressure_plays', 'pressure_successful',
+    # Advanced micro stats
+    'possession_quality_index', 'transition_efficiency', 'pressure_index',
+    'offensive_creativity_index', 'defensive_activity_index',
+    'playmaking_quality', 'net_front_presence', 'puck_battles_per_60'
+]
+
+# Rate/index metrics are averaged over players instead of summed
+MEAN_SUFFIXES = ('_index', '_rate', '_pct', '_efficiency', '_quality', '_per_60')
+
+KEYS = ['game_id', 'team_id']
+
+
+def _as_keys(df: pd.DataFrame, cols) -> pd.DataFrame:
+    """Key columns as objects, so joins match like == does (5 == 5.0, '5' != 5)."""
+    return df.astype({c: object for c in cols})
+
 
 class TeamStatsBuilder:
     """
@@ -33,6 +75,9 @@ class TeamStatsBuilder:
     2. Aggregating other stats from player game stats where summing is accurate
        (assists, TOI, advanced metrics, etc.)
     
+    Both are computed for all teams at once: one groupby over player game
+    stats and one (game, team, period) pivot over team-owned events.
+    
     Version 29.5 Fix:
     - Previous version summed ALL stats from player_game_stats, causing inaccuracies
     - Shots/Blocks/Giveaways/Takeaways now calculated from events directly
@@ -48,205 +93,159 @@ class TeamStatsBuilder:
         """
         self.output_dir = output_dir or OUTPUT_DIR
     
-    def calculate_team_stats_from_events(self, game_id: int, team_id: str, 
-                                         events: pd.DataFrame, 
-                                         event_players: pd.DataFrame,
-                                         schedule: pd.DataFrame) -> Dict:
+    def _team_events(self, teams: pd.DataFrame, events: pd.DataFrame,
+                     event_players: pd.DataFrame, schedule: pd.DataFrame) -> pd.DataFrame:
+        """
+        Events "owned" by each team, one row per (team, event row).
+        
+        An event is owned by a team if any player from that team is
+        event_player_1; without event_players, event_team_id or the team's
+        venue (from dim_schedule) decides.
+        """
+        events = events.drop(columns='team_id', errors='ignore')
+        if len(event_players) > 0:
+            # Use player_team_id (actual column name) instead of team_id
+            team_col = 'player_team_id' if 'player_team_id' in event_players.columns else 'team_id'
+            primary = event_players[
+                event_players['player_role'].astype(str).str.lower() == 'event_player_1'
+            ][['game_id', team_col, 'event_id']].rename(columns={team_col: 'team_id'})
+            owners = _as_keys(primary.drop_duplicates(), ['game_id', 'team_id', 'event_id'])
+            owned = _as_keys(events, ['game_id', 'event_id']).merge(owners, on=['game_id', 'event_id'])
+        elif 'event_team_id' in events.columns:
+            owned = events.assign(team_id=events['event_team_id'])
+        elif 'team_venue' in events.columns:
+            # Venue from the schedule; teams default to away when unknown
+            venues = teams[KEYS].copy()
+            venues['team_venue'] = 'Away'
+            if len(schedule) > 0 and 'home_team_id' in schedule.columns:
+                home = schedule.drop_duplicates('game_id').set_index('game_id')['home_team_id']
+                is_home = venues['team_id'].to_numpy() == venues['game_id'].map(home).to_numpy()
+                venues.loc[is_home, 'team_venue'] = 'Home'
+            owned = _as_keys(events, ['game_id', 'team_venue']).merge(
+                _as_keys(venues, ['game_id', 'team_venue']), on=['game_id', 'team_venue'])
+        else:
+            return events.iloc[0:0].assign(team_id=None)
+        
+        owned = _as_keys(owned, KEYS).merge(_as_keys(teams[KEYS], KEYS), on=KEYS)
+        
+        # Ensure period column exists
+        if 'period' not in owned.columns:
+            # Try to get period from event_players
+            if len(event_players) > 0 and 'period' in event_players.columns:
+                period_map = event_players.drop_duplicates(subset='event_id').set_index('event_id')['period']
+                owned['period'] = owned['event_id'].map(period_map)
+            else:
+                owned['period'] = None
+        return owned
+    
+    def event_stats_by_team(self, teams: pd.DataFrame, events: pd.DataFrame,
+                            event_players: pd.DataFrame, schedule: pd.DataFrame) -> pd.DataFrame:
         """
-        Calculate team stats directly from events for accuracy.
+        Calculate team stats directly from events for accuracy, for many teams.
         
         This is critical because summing player stats can miss events where
         players aren't the primary actor (event_player_1).
         
         Args:
-            game_id: Game ID
-            team_id: Team ID
+            teams: (game_id, team_id) pairs
             events: fact_events DataFrame
             event_players: fact_event_players DataFrame
             schedule: dim_schedule DataFrame (for home/away identification)
             
         Returns:
-            Dict with team stats calculated from events
+            DataFrame aligned with teams: EVENT_STATS totals, p{period}_{stat}
+            splits and 'team_events' (number of owned events)
         """
-        stats = {}
-        
-        # Get game events
-        game_events = events[events['game_id'] == game_id] if len(events) > 0 else pd.DataFrame()
-        if len(game_events) == 0:
-            return stats
-        
-        # Determine if team is home or away
-        is_home = False
-        if len(schedule) > 0:
-            game_info = schedule[schedule['game_id'] == game_id]
-            if len(game_info) > 0:
-                home_team_id = game_info['home_team_id'].values[0] if 'home_team_id' in game_info.columns else None
-                away_team_id = game_info['away_team_id'].values[0] if 'away_team_id' in game_info.columns else None
-                is_home = (home_team_id == team_id) if home_team_id is not None else False
-        
-        # Identify team events - events "owned" by this team
-        # An event is owned by a team if any player from that team is event_player_1
-        team_event_mask = pd.Series([False] * len(game_events), index=game_events.index)
-        
-        # Method 1: Use event_players to find events where team has event_player_1
-        if len(event_players) > 0:
-            # Use player_team_id (actual column name) instead of team_id
-            team_col = 'player_team_id' if 'player_team_id' in event_players.columns else 'team_id'
-            team_primary_player_events = event_players[
-                (event_players['game_id'] == game_id) &
-                (event_players[team_col] == team_id) &
-                (event_players['player_role'].astype(str).str.lower() == 'event_player_1')
-            ]
-            team_event_ids = team_primary_player_events['event_id'].unique()
-            team_event_mask = game_events['event_id'].isin(team_event_ids)
-        # Method 2: Fallback - use event_team_id if available
-        elif 'event_team_id' in game_events.columns:
-            team_event_mask = game_events['event_team_id'] == team_id
-        # Method 3: Fallback - use team_venue if available
-        elif 'team_venue' in game_events.columns:
-            venue_filter = 'Home' if is_home else 'Away'
-            team_event_mask = game_events['team_venue'] == venue_filter
-        
-        team_events = game_events[team_event_mask]
-        
-        if len(team_events) == 0:
-            return stats
+        columns = EVENT_STATS + [f'p{p}_{stat}' for p in PERIODS for stat in EVENT_STATS]
+        result = pd.DataFrame(0, index=pd.MultiIndex.from_frame(_as_keys(teams[KEYS], KEYS)),
+                              columns=columns + ['team_events'], dtype=np.int64)
+        if len(events) == 0 or len(teams) == 0:
+            return result.reset_index(drop=True)
         
-        # Ensure period column exists
-        if 'period' not in team_events.columns:
-            # Try to get period from event_players
-            if len(event_players) > 0:
-                team_event_ids = team_events['event_id'].unique()
-                period_map = event_players[
-                    event_players['event_id'].isin(team_event_ids)
-                ].drop_duplicates(subset='event_id')[['event_id', 'period']].set_index('event_id')['period'].to_dict()
-                team_events['period'] = team_events['event_id'].map(period_map)
-            else:
-                team_events['period'] = None
+        owned = self._team_events(teams, events, event_players, schedule)
+        if len(owned) == 0:
+            return result.reset_index(drop=True)
         
-        # ========================================
-        # SHOTS - Count ALL shot attempts (excluding goals to avoid double-counting)
-        # Goals are tracked separately, Shot_Goal events count as shots AND goals
-        # ========================================
-        # Count shot events (including Shot_Goal which is a shot that scored)
-        shot_events = team_events[team_events['event_type'].astype(str).str.lower() == 'shot']
-        stats['shots'] = len(shot_events)
+        event_type = owned['event_type'].astype(str).str.lower()
+        event_detail = owned['event_detail'].astype(str).str.lower()
+        turnover = event_type == 'turnover'
+        flags = pd.DataFrame({
+            # Shots: all shot attempts; SOG when on net / saved / scored (Shot_Goal)
+            'shots': event_type == 'shot',
+            'sog': (event_type == 'shot') & event_detail.str.contains('onnet|saved|goal', na=False, regex=True),
+            'giveaways': turnover & event_detail.str.contains('giveaway', na=False),
+            'takeaways': turnover & event_detail.str.contains('takeaway', na=False),
+            'hits': event_type == 'hit',
+            'team_events': True,
+        })
+        flag_cols = list(flags.columns)
+        flags[KEYS + ['period']] = owned[KEYS + ['period']]
         
-        # Shots on goal: event_detail contains 'onnet' or 'saved', plus goals from Shot_Goal
-        sog_mask = shot_events['event_detail'].astype(str).str.lower().str.contains('onnet|saved|goal', na=False, regex=True)
-        stats['sog'] = int(sog_mask.sum())
+        # Goals: event_type='Goal' AND event_detail='Goal_Scored' ONLY, distinct events
+        goals = owned[get_goal_filter(owned).to_numpy()]
         
-        # ========================================
-        # GOALS - Count all goals by the team
-        # Per CLAUDE.md: event_type='Goal' AND event_detail='Goal_Scored' ONLY
-        # ========================================
-        goal_events = team_events[get_goal_filter(team_events)]
-        stats['goals'] = goal_events['event_id'].nunique() if len(goal_events) > 0 else 0
+        # Totals per team
+        totals = flags.groupby(KEYS, sort=False, observed=True)[flag_cols].sum()
+        totals['goals'] = goals.groupby(KEYS, sort=False, observed=True)['event_id'].nunique()
         
-        # ========================================
-        # GIVEAWAYS/TAKEAWAYS - Count all turnovers
-        # ========================================
-        turnovers = team_events[team_events['event_type'].astype(str).str.lower() == 'turnover']
-        stats['giveaways'] = int(turnovers[turnovers['event_detail'].astype(str).str.lower().str.contains('giveaway', na=False)].shape[0])
-        stats['takeaways'] = int(turnovers[turnovers['event_detail'].astype(str).str.lower().str.contains('takeaway', na=False)].shape[0])
+        # Period splits: one pivot over (game, team, period)
+        by_period = flags[flags['period'].isin(PERIODS)].groupby(KEYS + ['period'], sort=False, observed=True)[flag_cols].sum()
+        by_period['goals'] = goals.groupby(KEYS + ['period'], sort=False, observed=True)['event_id'].nunique()
         
-        # ========================================
-        # BLOCKS - Count all blocks by team players
-        # ========================================
-        # Blocks are tracked in event_players via play_detail1='BlockedShot'
-        # Count all events where any team player has BlockedShot
-        if len(event_players) > 0:
-            team_event_players = event_players[
-                (event_players['game_id'] == game_id) &
-                (event_players[team_col] == team_id)
-            ]
-            if 'play_detail1' in team_event_players.columns:
-                blocks_df = team_event_players[
-                    team_event_players['play_detail1'].astype(str).str.lower().str.contains('blockedshot', na=False)
-                ]
-                if len(blocks_df) > 0:
-                    # Avoid double-counting linked events
-                    if 'linked_event_key' in blocks_df.columns:
-                        linked = blocks_df[blocks_df['linked_event_key'].notna()]
-                        unlinked = blocks_df[blocks_df['linked_event_key'].isna()]
-                        stats['blocks'] = linked['linked_event_key'].nunique() + len(unlinked)
-                    else:
-                        # Deduplicate by event_id
-                        stats['blocks'] = blocks_df['event_id'].nunique()
-                else:
-                    stats['blocks'] = 0
+        # Blocks: team players with play_detail1='BlockedShot' (teams owning events only)
+        if len(event_players) > 0 and 'play_detail1' in event_players.columns:
+            team_col = 'player_team_id' if 'player_team_id' in event_players.columns else 'team_id'
+            block_cols = [c for c in ['game_id', team_col, 'event_id', 'linked_event_key'] if c in event_players.columns]
+            blocks = event_players.loc[
+                event_players['play_detail1'].astype(str).str.lower().str.contains('blockedshot', na=False),
+                block_cols
+            ].rename(columns={team_col: 'team_id'})
+            blocks = _as_keys(blocks, KEYS + ['event_id'])
+            if 'linked_event_key' in blocks.columns:
+                # Avoid double-counting linked events
+                linked = blocks[blocks['linked_event_key'].notna()]
+                totals['blocks'] = (
+                    linked.groupby(KEYS, observed=True)['linked_event_key'].nunique()
+                    .add(blocks[blocks['linked_event_key'].isna()].groupby(KEYS, observed=True).size(), fill_value=0)
+                )
             else:
-                stats['blocks'] = 0
-        else:
-            stats['blocks'] = 0
+                # Deduplicate by event_id
+                totals['blocks'] = blocks.groupby(KEYS, observed=True)['event_id'].nunique()
+            period_events = _as_keys(owned[KEYS + ['event_id', 'period']].drop_duplicates(), ['event_id'])
+            period_blocks = blocks.merge(period_events, on=KEYS + ['event_id'])
+            by_period['blocks'] = period_blocks.groupby(KEYS + ['period'], observed=True)['event_id'].nunique()
         
-        # ========================================
-        # HITS - Count all hits by the team
-        # ========================================
-        hits = team_events[team_events['event_type'].astype(str).str.lower() == 'hit']
-        stats['hits'] = len(hits)
+        split = by_period.unstack('period')
+        split.columns = [f'p{int(period)}_{stat}' for stat, period in split.columns]
         
-        # ========================================
-        # PERIOD BREAKDOWNS - Add period-specific stats
-        # ========================================
-        for period in [1, 2, 3]:
-            period_events = team_events[team_events['period'] == period] if 'period' in team_events.columns else pd.DataFrame()
-            
-            if len(period_events) == 0:
-                # Initialize all period stats to 0
-                stats[f'p{period}_shots'] = 0
-                stats[f'p{period}_sog'] = 0
-                stats[f'p{period}_goals'] = 0
-                stats[f'p{period}_giveaways'] = 0
-                stats[f'p{period}_takeaways'] = 0
-                stats[f'p{period}_blocks'] = 0
-                stats[f'p{period}_hits'] = 0
-                continue
-            
-            # Period shots
-            period_shots = period_events[period_events['event_type'].astype(str).str.lower() == 'shot']
-            stats[f'p{period}_shots'] = len(period_shots)
-            
-            # Period SOG
-            period_sog_mask = period_shots['event_detail'].astype(str).str.lower().str.contains('onnet|saved|goal', na=False, regex=True)
-            stats[f'p{period}_sog'] = int(period_sog_mask.sum())
-            
-            # Period goals - per CLAUDE.md: event_type='Goal' AND event_detail='Goal_Scored' ONLY
-            period_goals = period_events[get_goal_filter(period_events)]
-            stats[f'p{period}_goals'] = period_goals['event_id'].nunique() if len(period_goals) > 0 else 0
-            
-            # Period giveaways/takeaways
-            period_turnovers = period_events[period_events['event_type'].astype(str).str.lower() == 'turnover']
-            stats[f'p{period}_giveaways'] = int(period_turnovers[period_turnovers['event_detail'].astype(str).str.lower().str.contains('giveaway', na=False)].shape[0])
-            stats[f'p{period}_takeaways'] = int(period_turnovers[period_turnovers['event_detail'].astype(str).str.lower().str.contains('takeaway', na=False)].shape[0])
-            
-            # Period blocks (from event_players)
-            if len(event_players) > 0:
-                period_event_ids = period_events['event_id'].unique()
-                period_team_event_players = event_players[
-                    (event_players['game_id'] == game_id) &
-                    (event_players[team_col] == team_id) &
-                    (event_players['event_id'].isin(period_event_ids))
-                ]
-                if 'play_detail1' in period_team_event_players.columns:
-                    period_blocks_df = period_team_event_players[
-                        period_team_event_players['play_detail1'].astype(str).str.lower().str.contains('blockedshot', na=False)
-                    ]
-                    if len(period_blocks_df) > 0:
-                        # Deduplicate by event_id
-                        stats[f'p{period}_blocks'] = period_blocks_df['event_id'].nunique()
-                    else:
-                        stats[f'p{period}_blocks'] = 0
-                else:
-                    stats[f'p{period}_blocks'] = 0
-            else:
-                stats[f'p{period}_blocks'] = 0
-            
-            # Period hits
-            period_hits = period_events[period_events['event_type'].astype(str).str.lower() == 'hit']
-            stats[f'p{period}_hits'] = len(period_hits)
+        stats = totals.join(split, how='left')
+        stats = stats.reindex(result.index).reindex(columns=result.columns)
+        result = stats.fillna(0).astype(np.int64)
+        return result.reset_index(drop=True)
+    
+    def calculate_team_stats_from_events(self, game_id: int, team_id: str, 
+                                         events: pd.DataFrame, 
+                                         event_players: pd.DataFrame,
+                                         schedule: pd.DataFrame) -> Dict:
+        """
+        Calculate team stats directly from events for one team.
         
-        return stats
+        Args:
+            game_id: Game ID
+            team_id: Team ID
+            events: fact_events DataFrame
+            event_players: fact_event_players DataFrame
+            schedule: dim_schedule DataFrame (for home/away identification)
+            
+        Returns:
+            Dict with team stats calculated from events (empty when the team
+            owns no events in the game)
+        """
+        team = pd.DataFrame({'game_id': [game_id], 'team_id': [team_id]})
+        stats = self.event_stats_by_team(team, events, event_players, schedule).iloc[0]
+        if stats['team_events'] == 0:
+            return {}
+        return {k: int(v) for k, v in stats.drop('team_events').items()}
     
     def build(self, save: bool = True) -> pd.DataFrame:
         """
@@ -269,111 +268,71 @@ class TeamStatsBuilder:
             print("  ERROR: fact_player_game_stats not found!")
             return pd.DataFrame()
         
-        all_stats = []
+        # One row per (game, team): games in order of appearance, then teams
+        players = pgs[pgs['game_id'].notna() & pgs['team_id'].notna()]
+        game_order = pd.Index(pgs['game_id'].unique()).get_indexer(players['game_id'])
+        players = players.iloc[np.argsort(game_order, kind='stable')]
+        grouped = players.groupby(KEYS, sort=False, observed=True)
+        teams = players.drop_duplicates(KEYS)
+        
+        df = pd.DataFrame({
+            'team_game_key': [f"{team_id}_{game_id}" for game_id, team_id in zip(teams['game_id'], teams['team_id'])],
+            'game_id': teams['game_id'].to_numpy(),
+            'team_id': teams['team_id'].to_numpy(),
+        })
+        
+        # Season info
+        if len(schedule) > 0 and 'season_id' in schedule.columns:
+            season = schedule.drop_duplicates('game_id').set_index('game_id')['season_id']
+            if df['game_id'].isin(season.index).any():
+                df['season_id'] = df['game_id'].map(season)
+        
+        # Team name
+        if 'team_name' in teams.columns:
+            df['team_name'] = teams['team_name'].to_numpy()
+        
+        # ========================================
+        # CRITICAL: Calculate stats from events directly
+        # This fixes accuracy issues with shots, giveaways, takeaways, blocks
+        # ========================================
+        event_stats = self.event_stats_by_team(teams, events, event_players, schedule)
+        for col in EVENT_STATS:
+            df[col] = event_stats[col].to_numpy()
+        
+        # Sum other columns (aggregate from players) - these are accurate when summed
+        present = [col for col in SUM_COLS if col in players.columns]
+        mean_cols = [col for col in present if col.endswith(MEAN_SUFFIXES)]
+        sum_cols = [col for col in present if col not in mean_cols]
+        sums = grouped[sum_cols].sum() if sum_cols else None
+        means = grouped[mean_cols].mean().round(2) if mean_cols else None
+        for col in SUM_COLS:
+            if col in mean_cols:
+                df[col] = means[col].to_numpy()
+            elif col in present:
+                df[col] = sums[col].to_numpy()
+            else:
+                df[col] = 0
+        
+        # Recalculate points based on event-based goals + summed assists
+        df['points'] = df['goals'] + df['assists']
+        
+        # Calculated percentages
+        df['shooting_pct'] = [
+            round(goals / sog * 100, 1) if sog > 0 else 0.0
+            for goals, sog in zip(df['goals'].tolist(), df['sog'].tolist())
+        ]
+        corsi_total = df['corsi_for'] + df['corsi_against']
+        df['cf_pct'] = (df['corsi_for'] / corsi_total.where(corsi_total > 0) * 100).round(1).where(corsi_total > 0, 50.0)
+        
+        df['plus_minus_total'] = df['plus_total'] - df['minus_total']
+        
+        # Average metrics
+        if 'game_score' in players.columns:
+            df['avg_game_score'] = grouped['game_score'].mean().round(2).to_numpy()
+        
+        if 'adjusted_rating' in players.columns:
+            df['avg_adjusted_rating'] = grouped['adjusted_rating'].mean().round(1).to_numpy()
         
-        # Process each game
-        for game_id in pgs['game_id'].unique():
-            game_players = pgs[pgs['game_id'] == game_id]
-            
-            # Process each team in the game
-            for team_id in game_players['team_id'].dropna().unique():
-                team_players = game_players[game_players['team_id'] == team_id]
-                if len(team_players) == 0:
-                    continue
-                
-                stats = {
-                    'team_game_key': f"{team_id}_{game_id}",
-                    'game_id': game_id,
-                    'team_id': team_id
-                }
-                
-                # Season info
-                if len(schedule) > 0:
-                    game_info = schedule[schedule['game_id'] == game_id]
-                    if len(game_info) > 0 and 'season_id' in game_info.columns:
-                        stats['season_id'] = game_info['season_id'].values[0]
-                
-                # Team name
-                if 'team_name' in team_players.columns:
-                    stats['team_name'] = team_players['team_name'].values[0]
-                
-                # ========================================
-                # CRITICAL: Calculate stats from events directly
-                # This fixes accuracy issues with shots, giveaways, takeaways, blocks
-                # ========================================
-                event_stats = self.calculate_team_stats_from_events(
-                    game_id, team_id, events, event_players, schedule
-                )
-                
-                # Override shots, giveaways, takeaways, blocks with event-based calculations
-                stats['shots'] = event_stats.get('shots', 0)
-                stats['sog'] = event_stats.get('sog', 0)
-                stats['goals'] = event_stats.get('goals', 0)
-                stats['giveaways'] = event_stats.get('giveaways', 0)
-                stats['takeaways'] = event_stats.get('takeaways', 0)
-                stats['blocks'] = event_stats.get('blocks', 0)
-                stats['hits'] = event_stats.get('hits', 0)
-                
-                # Sum other columns (aggregate from players) - these are accurate when summed
-                # NOTE: shots, sog, goals, giveaways, takeaways, blocks, hits already set from events above
-                sum_cols = [
-                    'assists', 'points',  # goals/shots/sog already from events
-                    # 'giveaways', 'takeaways', 'blocks', 'hits',  # Already from events
-                    'toi_seconds', 'corsi_for', 'corsi_against', 
-                    'fenwick_for', 'fenwick_against', 'plus_total', 
-                    'minus_total', 'xg_for', 'gar_total', 'war', 
-                    'shot_assists', 'goal_creating_actions',
-                    # Micro stats
-                    'dekes', 'drives_total', 'cutbacks', 'delays', 'crash_net', 'screens',
-                    'give_and_go', 'second_touch', 'cycles', 'poke_checks', 'stick_checks',
-                    'zone_ent_denials', 'backchecks', 'forechecks', 'breakouts', 'dump_ins',
-                    'loose_puck_wins', 'puck_recoveries', 'puck_battles_total',
-                    'board_battles_won', 'board_battles_lost',
-                    'passes_cross_ice', 'passes_stretch', 'passes_breakout', 'passes_rim',
-                    'passes_bank', 'passes_royal_road', 'passes_slot', 'passes_behind_net',
-                    'shots_one_timer', 'shots_snap', 'shots_wrist', 'shots_slap',
-                    'shots_tip', 'shots_deflection', 'shots_wrap_around',
-                    'pressure_plays', 'pressure_successful',
-                    # Advanced micro stats
-                    'possession_quality_index', 'transition_efficiency', 'pressure_index',
-                    'offensive_creativity_index', 'defensive_activity_index',
-                    'playmaking_quality', 'net_front_presence', 'puck_battles_per_60'
-                ]
-                
-                for col in sum_cols:
-                    if col in team_players.columns:
-                        # For rate/index metrics, use mean instead of sum
-                        if col.endswith('_index') or col.endswith('_rate') or col.endswith('_pct') or col.endswith('_efficiency') or col.endswith('_quality') or col.endswith('_per_60'):
-                            stats[col] = round(team_players[col].mean(), 2) if len(team_players) > 0 else 0.0
-                        else:
-                            stats[col] = team_players[col].sum()
-                    else:
-                        stats[col] = 0
-                
-                # Recalculate points based on event-based goals + summed assists
-                stats['points'] = stats.get('goals', 0) + stats.get('assists', 0)
-                
-                # Calculated percentages
-                stats['shooting_pct'] = round(
-                    stats['goals'] / stats['sog'] * 100, 1
-                ) if stats['sog'] > 0 else 0.0
-                
-                stats['cf_pct'] = round(
-                    stats['corsi_for'] / (stats['corsi_for'] + stats['corsi_against']) * 100, 1
-                ) if (stats['corsi_for'] + stats['corsi_against']) > 0 else 50.0
-                
-                stats['plus_minus_total'] = stats['plus_total'] - stats['minus_total']
-                
-                # Average metrics
-                if 'game_score' in team_players.columns:
-                    stats['avg_game_score'] = round(team_players['game_score'].mean(), 2)
-                
-                if 'adjusted_rating' in team_players.columns:
-                    stats['avg_adjusted_rating'] = round(team_players['adjusted_rating'].mean(), 1)
-                
-                all_stats.append(stats)
-        
-        df = pd.DataFrame(all_stats)
         print(f"  Created {len(df)} team-game records")
         
         # Save if requested
@@ -6,8 +6,8 @@ Organized by domain (goalie, player, team, etc.)
 
 Version: 29.7
 
-Note: Goalie calculations module will be added in future refactoring.
-For now, goalie calculations remain in src/tables/core_facts.py
+Note: Goalie game stats are calculated in src/builders/goalie_stats.py
+(GoalieStatsBuilder), not in this module.
 """
 
 # Import existing calculation functions
@@ -39,6 +39,13 @@ from src.calculations.goals import (
     is_goal_scored,
 )
 
+from src.calculations.standings import (
+    POINTS_PER_WIN,
+    STANDINGS_TIEBREAKERS,
+    calculate_standings_points,
+    standings_order,
+)
+
 # Goalie calculations (v29.7)
 from src.calculations.goalie_calculations import (
     calculate_goalie_core_stats,
@@ -75,6 +82,11 @@ __all__ = [
     # Goals
     'get_goal_filter',
     'is_goal_scored',
+    # Standings
+    'POINTS_PER_WIN',
+    'STANDINGS_TIEBREAKERS',
+    'calculate_standings_points',
+    'standings_order',
     # Goalie calculations (v29.7)
     'calculate_goalie_core_stats',
     'calculate_goalie_save_types',
@@ -0,0 +1,62 @@
+"""
+Standings Calculations
+
+SINGLE SOURCE OF TRUTH for standings points and tiebreak order.
+Points are used by fact_team_standings_snapshot and the playoff simulator;
+the tiebreak order ranks the simulated standings.
+
+Rules:
+- A game is a win only when goals_for > goals_against
+- Everything else (loss or tie) counts as a loss: 0 points
+- Ranking: points, then wins, then goal differential, then goals for
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+
+POINTS_PER_WIN = 2
+POINTS_PER_LOSS = 0
+
+# Ordered tiebreakers (all descending)
+STANDINGS_TIEBREAKERS = ['points', 'wins', 'goal_diff', 'goals_for']
+
+
+def calculate_standings_points(wins, losses=0):
+    """
+    Standings points from wins/losses (scalars or arrays).
+
+    Args:
+        wins: Number of wins
+        losses: Number of losses (ties count as losses)
+
+    Returns:
+        Standings points
+    """
+    return wins * POINTS_PER_WIN + losses * POINTS_PER_LOSS
+
+
+def standings_order(tiebreakers: Dict[str, np.ndarray], tie_break: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Standings order along axis 0 (best first) by the tiebreak rules.
+
+    Works on one standings table (1-D columns) or many simulated tables at
+    once ([teams x sims] columns).
+
+    Args:
+        tiebreakers: {tiebreaker: values} for any of STANDINGS_TIEBREAKERS;
+            absent tiebreakers are skipped
+        tie_break: Values ordering exact ties, ascending (default: input order)
+
+    Returns:
+        Row positions in standings order (same shape as the columns)
+    """
+    # np.lexsort: last key is the primary one; descending via negation (nulls last)
+    keys = [-np.asarray(tiebreakers[c], dtype=float) for c in reversed(STANDINGS_TIEBREAKERS) if c in tiebreakers]
+    if tie_break is not None:
+        keys.insert(0, np.asarray(tie_break))
+    if not keys:
+        return np.arange(0)
+    return np.lexsort(keys, axis=0)
+
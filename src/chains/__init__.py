@@ -1,4 +1,5 @@
 # Shot chain builder module
+from .chain_materializer import EventChainIndex
 from .shot_chain_builder import build_shot_chains, main
 
-__all__ = ['build_shot_chains', 'main']
+__all__ = ['EventChainIndex', 'build_shot_chains', 'main']
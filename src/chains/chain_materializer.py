@@ -0,0 +1,148 @@
+"""
+Event Chain Materializer
+========================
+
+Resolves many event chains (sequences, rushes, cycles, shot chains) against
+one event stream in bulk.
+
+Events are sorted once by (game, key) and per-game position offsets are
+kept. A chain - game plus inclusive [start, end] key range - is then a
+contiguous slice [lo, hi) of the sorted stream, found with searchsorted.
+Chain strings, counts and distinct counts are computed for all chains at
+once from the slice bounds (prefix sums / compacted token lists), so the
+cost grows with events plus total chain length instead of chains x events.
+
+Usage:
+    from src.chains.chain_materializer import EventChainIndex
+
+    index = EventChainIndex(unique_events, key='event_index')
+    lo, hi = index.locate(seq['game_id'], seq['start_event_index'], seq['end_event_index'])
+    seq['play_chain'] = index.join('event_type', lo, hi)
+    seq['pass_count'] = index.count(index.values('event_type') == 'Pass', lo, hi)
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class EventChainIndex:
+    """
+    Sorted, game-partitioned event stream for slicing chains.
+
+    Args:
+        events: Event rows (one row per stream element)
+        key: Ordering column chains are ranged over (e.g. 'event_index',
+            'event_running_start'); rows with a null key or game are dropped
+        game_col: Game column
+    """
+
+    def __init__(self, events: pd.DataFrame, key: str, game_col: str = 'game_id'):
+        keys = pd.to_numeric(events[key], errors='coerce')
+        valid = keys.notna() & events[game_col].notna()
+        game_codes, self.games = pd.factorize(events.loc[valid, game_col], sort=True)
+        keys = keys[valid].to_numpy(dtype=float)
+
+        # Stable: events sharing a key keep their table order
+        order = np.lexsort((keys, game_codes))
+        self.events = events.loc[valid].iloc[order].reset_index(drop=True)
+        self.keys = keys[order]
+        self.offsets = np.searchsorted(game_codes[order], np.arange(len(self.games) + 1))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def values(self, column: str) -> pd.Series:
+        """A column of the sorted stream (aligned with slice positions)."""
+        return self.events[column]
+
+    def locate(self, game_ids, starts, ends) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Slice bounds for chains.
+
+        Args:
+            game_ids: Game of each chain
+            starts: Inclusive start key of each chain
+            ends: Inclusive end key of each chain
+
+        Returns:
+            (lo, hi) position arrays; chains with missing bounds, unknown
+            games or no events in range get lo == hi
+        """
+        codes = self.games.get_indexer(pd.Index(game_ids))
+        starts = pd.to_numeric(pd.Series(starts), errors='coerce').to_numpy(dtype=float)
+        ends = pd.to_numeric(pd.Series(ends), errors='coerce').to_numpy(dtype=float)
+        lo = np.zeros(len(codes), dtype=np.int64)
+        hi = np.zeros(len(codes), dtype=np.int64)
+
+        valid = (codes >= 0) & ~np.isnan(starts) & ~np.isnan(ends)
+        for code in np.unique(codes[valid]):
+            chains = valid & (codes == code)
+            first, last = self.offsets[code], self.offsets[code + 1]
+            segment = self.keys[first:last]
+            lo[chains] = first + np.searchsorted(segment, starts[chains], side='left')
+            hi[chains] = first + np.searchsorted(segment, ends[chains], side='right')
+        return lo, np.maximum(hi, lo)
+
+    def count(self, mask, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Per-chain count of stream rows where mask is true (prefix sums)."""
+        prefix = np.concatenate(([0], np.cumsum(np.asarray(mask, dtype=bool), dtype=np.int64)))
+        return prefix[hi] - prefix[lo]
+
+    def join(
+        self,
+        column: str,
+        lo: np.ndarray,
+        hi: np.ndarray,
+        sep: str = ' > ',
+        tokens: Optional[pd.Series] = None
+    ) -> np.ndarray:
+        """
+        Per-chain string of a column's non-null values, in stream order.
+
+        Args:
+            column: Column to join
+            lo, hi: Slice bounds from locate
+            sep: Separator
+            tokens: Pre-formatted text for the column (default: str of values)
+
+        Returns:
+            Object array; None for empty chains, '' when every value is null
+        """
+        values = self.events[column] if tokens is None else tokens
+        present = values.notna().to_numpy()
+        compact = values[present].astype(str).tolist()
+        # Slice bounds in the compacted (non-null) token list
+        prefix = np.concatenate(([0], np.cumsum(present, dtype=np.int64)))
+        starts, stops = prefix[lo], prefix[hi]
+
+        out = np.full(len(lo), None, dtype=object)
+        nonempty = np.flatnonzero(hi > lo)
+        out[nonempty] = [sep.join(compact[a:b]) for a, b in zip(starts[nonempty], stops[nonempty])]
+        return out
+
+    def distinct_count(self, column: str, lo: np.ndarray, hi: np.ndarray, sep: str = ',') -> np.ndarray:
+        """
+        Per-chain number of distinct items in a delimited text column
+        (e.g. unique players across 'event_player_ids').
+        """
+        values = self.events[column]
+        is_text = values.map(type).eq(str).to_numpy()
+        items = values.where(is_text).str.split(sep).explode().dropna()
+        if items.empty or len(lo) == 0:
+            return np.zeros(len(lo), dtype=np.int64)
+
+        # Items grouped by stream position (CSR layout)
+        item_codes = pd.factorize(items)[0].astype(np.int64)
+        item_offsets = np.searchsorted(items.index.to_numpy(), np.arange(len(self.keys) + 1))
+
+        # Item range of every chain, expanded to (chain, item) pairs
+        first, last = item_offsets[lo], item_offsets[hi]
+        lengths = last - first
+        owners = np.repeat(np.arange(len(lo), dtype=np.int64), lengths)
+        steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        pairs = owners * (item_codes.max() + 1) + item_codes[np.repeat(first, lengths) + steps]
+
+        distinct_owners = np.unique(pairs) // (item_codes.max() + 1)
+        return np.bincount(distinct_owners, minlength=len(lo)).astype(np.int64)
@@ -2,7 +2,10 @@
 """
 Shot Chain Builder - Creates fact_shot_chains table.
 
-Tracks zone_entry → shot chains with enhanced metrics.
+Tracks zone_entry → shot chains with enhanced metrics. Entries are linked to
+the next shot with a grouped as-of join and chain aggregates come from the
+range-indexed event stream (chain_materializer), so the window and chain
+definitions can be tuned without a per-entry scan.
 
 Version: 8.0.2
 Date: January 6, 2026
@@ -11,34 +14,110 @@ Date: January 6, 2026
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from typing import Optional
 import logging
 
+from src.chains.chain_materializer import EventChainIndex
+
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path('data/output')
 
+# A zone entry links to the first shot within this many seconds
+CHAIN_WINDOW_SECONDS = 60
+
+
+def _column(df: pd.DataFrame, name: str, default=None) -> pd.Series:
+    """Column by name, or a constant column when absent (like row.get)."""
+    if name in df.columns:
+        return df[name].reset_index(drop=True)
+    return pd.Series([default] * len(df), dtype=object)
+
+
+def _first_player(ids: pd.Series) -> pd.Series:
+    """First id of a comma-separated event_player_ids value (None when missing)."""
+    first = ids.astype(str).str.split(',').str[0]
+    return first.where(ids.notna(), None)
+
 
-def build_shot_chains():
+def link_entries_to_shots(
+    zone_entries: pd.DataFrame,
+    shots: pd.DataFrame,
+    window: float = CHAIN_WINDOW_SECONDS
+) -> pd.DataFrame:
+    """
+    Pair each zone entry with the next shot in the same game.
+    
+    Grouped as-of join on event_running_start: the first shot strictly after
+    the entry and at most `window` seconds later.
+    
+    Returns:
+        One row per linked entry with 'entry_row' / 'shot_row' (positions in
+        the inputs), in entry order
+    """
+    left = pd.DataFrame({
+        'game_id': zone_entries['game_id'].to_numpy(),
+        'event_running_start': zone_entries['event_running_start'].to_numpy(),
+        'entry_row': np.arange(len(zone_entries)),
+    }).dropna(subset=['game_id', 'event_running_start'])
+    right = pd.DataFrame({
+        'game_id': shots['game_id'].to_numpy(),
+        'event_running_start': shots['event_running_start'].to_numpy(),
+        'shot_row': np.arange(len(shots)),
+    }).dropna(subset=['game_id', 'event_running_start'])
+    
+    linked = pd.merge_asof(
+        left.sort_values('event_running_start', kind='stable'),
+        right.sort_values('event_running_start', kind='stable'),
+        on='event_running_start',
+        by='game_id',
+        direction='forward',
+        tolerance=window,
+        allow_exact_matches=False,
+    )
+    linked = linked.dropna(subset=['shot_row']).sort_values('entry_row')
+    return linked[['entry_row', 'shot_row']].astype(np.int64).reset_index(drop=True)
+
+
+def build_shot_chains(
+    events: Optional[pd.DataFrame] = None,
+    output_dir: Optional[Path] = None,
+    window: float = CHAIN_WINDOW_SECONDS
+) -> Optional[pd.DataFrame]:
     """
     Build fact_shot_chains from fact_events.
     
     A shot chain is: Zone_Entry → [events...] → Shot/Goal
+    
+    Args:
+        events: fact_events (default: table store, falling back to the CSV)
+        output_dir: Output directory (default: data/output)
+        window: Max seconds from zone entry to shot
     """
     logger.info("Building fact_shot_chains...")
+    output_dir = Path(output_dir) if output_dir is not None else OUTPUT_DIR
     
     # Load source data
-    events_path = OUTPUT_DIR / 'fact_events.csv'
-    if not events_path.exists():
-        logger.warning("fact_events.csv not found, skipping shot chains")
+    if events is None:
+        from src.core.table_store import get_table
+        events = get_table('fact_events', output_dir)
+    if events.empty:
+        logger.warning("fact_events not found, skipping shot chains")
         return None
     
-    events = pd.read_csv(events_path, low_memory=False)
+    # Stored tables may carry optimized dtypes: text columns come back as
+    # categoricals (cast to object so labels can be filled), chain times use float64
+    categorical = {col: object for col, dtype in events.dtypes.items()
+                   if isinstance(dtype, pd.CategoricalDtype)}
+    events = events.astype(categorical).assign(
+        event_running_start=pd.to_numeric(events['event_running_start'], errors='coerce').astype(float)
+    )
     
     # Zone entries - only actual entries (not exits/keepins)
     zone_entries = events[
-        (events['event_detail'].str.contains('Zone_Entry', case=False, na=False)) &
-        (~events['event_detail'].str.contains('failed', case=False, na=False))
-    ].copy()
+        (events['event_detail'].astype(str).str.contains('Zone_Entry', case=False, na=False)) &
+        (~events['event_detail'].astype(str).str.contains('failed', case=False, na=False))
+    ]
     
     # Shots - any shot attempt including goals
     shots = events[
@@ -46,7 +125,7 @@ def build_shot_chains():
         (events['is_goal'] == 1) |
         (events['event_type'] == 'Shot') |
         (events['event_type'] == 'Goal')
-    ].copy()
+    ]
     
     logger.info(f"  Zone entries: {len(zone_entries)}, Shots/Goals: {len(shots)}")
     
@@ -54,126 +133,87 @@ def build_shot_chains():
         logger.warning("No zone entries or shots found")
         return None
     
-    chains = []
-    chain_counter = 0
-    
-    # Process each game
-    for game_id in events['game_id'].unique():
-        game_events = events[events['game_id'] == game_id].sort_values('event_running_start')
-        game_entries = zone_entries[zone_entries['game_id'] == game_id].copy()
-        game_shots = shots[shots['game_id'] == game_id].sort_values('event_running_start')
-        
-        if game_entries.empty or game_shots.empty:
-            continue
-        
-        # For each zone entry, find the next shot
-        for idx, entry in game_entries.iterrows():
-            entry_time = entry['event_running_start']
-            if pd.isna(entry_time):
-                continue
-            
-            # Find next shot after this entry (within 60 sec)
-            candidate_shots = game_shots[
-                (game_shots['event_running_start'] > entry_time) &
-                (game_shots['event_running_start'] <= entry_time + 60)
-            ]
-            
-            if candidate_shots.empty:
-                continue
-            
-            shot = candidate_shots.iloc[0]
-            shot_time = shot['event_running_start']
-            time_to_shot = shot_time - entry_time
-            
-            # Events in the chain
-            chain_events = game_events[
-                (game_events['event_running_start'] >= entry_time) &
-                (game_events['event_running_start'] <= shot_time)
-            ]
-            
-            events_to_shot = len(chain_events)
-            pass_count = len(chain_events[chain_events['event_type'] == 'Pass'])
-            
-            # Get unique players
-            player_ids = set()
-            for val in chain_events['event_player_ids'].dropna():
-                if isinstance(val, str):
-                    player_ids.update(val.split(','))
-            touch_count = len(player_ids)
-            
-            # Build chain description
-            event_types_chain = ' > '.join(chain_events['event_type'].dropna().tolist())
-            event_details_chain = ' > '.join(chain_events['event_detail'].dropna().astype(str).tolist())
-            
-            # Shot result and goal flag
-            is_goal = shot.get('is_goal', 0) == 1
-            shot_result = 'Goal' if is_goal else shot.get('event_detail', 'Unknown')
-            
-            # Entry type
-            entry_type = entry.get('event_detail_2')
-            if pd.isna(entry_type) or entry_type == '':
-                entry_type = entry.get('event_detail', 'ZoneEntry-Unknown')
-            
-            # Player info
-            entry_player_id = str(entry['event_player_ids']).split(',')[0] if pd.notna(entry.get('event_player_ids')) else None
-            entry_player_name = entry.get('player_name')
-            shot_player_id = str(shot['event_player_ids']).split(',')[0] if pd.notna(shot.get('event_player_ids')) else None
-            shot_player_name = shot.get('player_name')
-            
-            # Team info
-            team_id = entry.get('home_team_id') if entry.get('event_team_zone') == 'o' else entry.get('away_team_id')
-            team_name = entry.get('home_team') if entry.get('event_team_zone') == 'o' else entry.get('away_team')
-            
-            # Build chain record
-            chain_counter += 1
-            chain_id = f"CH{game_id}{chain_counter:05d}"
-            
-            chain = {
-                'chain_id': chain_id,
-                'game_id': game_id,
-                'season_id': entry.get('season_id'),
-                'period': entry.get('period'),
-                'entry_event_key': entry.get('event_id'),
-                'shot_event_key': shot.get('event_id'),
-                'time_to_shot': round(time_to_shot, 1),
-                'pass_count': pass_count,
-                'events_to_shot': events_to_shot,
-                'touch_count': touch_count,
-                'entry_type': entry_type,
-                'shot_result': shot_result,
-                'is_goal': is_goal,
-                'team_id': team_id,
-                'team_name': team_name,
-                'home_team_id': entry.get('home_team_id'),
-                'away_team_id': entry.get('away_team_id'),
-                'home_team_name': entry.get('home_team'),
-                'away_team_name': entry.get('away_team'),
-                'event_types_chain': event_types_chain,
-                'event_details_chain': event_details_chain,
-                'entry_player_id': entry_player_id,
-                'entry_player_name': entry_player_name,
-                'shot_player_id': shot_player_id,
-                'shot_player_name': shot_player_name,
-                'sequence_key': entry.get('sequence_key'),
-                'play_key': entry.get('play_key'),
-                'zone_id': entry.get('event_zone_id'),
-                'zone_entry_type_id': entry.get('zone_entry_type_id'),
-                'shot_result_detail_id': shot.get('event_detail_id'),
-                'time_bucket_id': entry.get('time_bucket_id'),
-                'strength_id': entry.get('strength_id'),
-                'shot_type_id': shot.get('shot_type_id'),
-            }
-            chains.append(chain)
-    
-    if not chains:
+    # Chains are numbered in game order (first appearance), then entry order
+    game_order = pd.Index(events['game_id'].unique())
+    zone_entries = zone_entries.iloc[
+        np.argsort(game_order.get_indexer(zone_entries['game_id']), kind='stable')
+    ]
+    links = link_entries_to_shots(zone_entries, shots, window)
+    if links.empty:
         logger.warning("No shot chains found")
         return None
     
-    df = pd.DataFrame(chains)
+    entry = zone_entries.iloc[links['entry_row']].reset_index(drop=True)
+    shot = shots.iloc[links['shot_row']].reset_index(drop=True)
+    game_ids = entry['game_id']
+    entry_time = entry['event_running_start']
+    shot_time = shot['event_running_start']
+    
+    # Entry type: event_detail_2, else event_detail
+    entry_type = _column(entry, 'event_detail_2')
+    entry_type = entry_type.where(entry_type.notna() & (entry_type != ''),
+                                  _column(entry, 'event_detail', 'ZoneEntry-Unknown'))
+    
+    # Shot result and goal flag
+    is_goal = _column(shot, 'is_goal', 0).eq(1)
+    shot_result = _column(shot, 'event_detail', 'Unknown').where(~is_goal, 'Goal')
+    
+    # Team info
+    offensive = _column(entry, 'event_team_zone').eq('o').to_numpy()
+    home_team_id, away_team_id = _column(entry, 'home_team_id'), _column(entry, 'away_team_id')
+    home_team, away_team = _column(entry, 'home_team'), _column(entry, 'away_team')
+    
+    chain_ids = [f"CH{g}{n:05d}" for g, n in zip(game_ids, range(1, len(links) + 1))]
+    
+    df = pd.DataFrame({
+        'chain_id': chain_ids,
+        'game_id': game_ids,
+        'season_id': _column(entry, 'season_id'),
+        'period': _column(entry, 'period'),
+        'entry_event_key': _column(entry, 'event_id'),
+        'shot_event_key': _column(shot, 'event_id'),
+        'time_to_shot': (shot_time - entry_time).round(1),
+        'pass_count': None,
+        'events_to_shot': None,
+        'touch_count': None,
+        'entry_type': entry_type,
+        'shot_result': shot_result,
+        'is_goal': is_goal,
+        'team_id': np.where(offensive, home_team_id, away_team_id),
+        'team_name': np.where(offensive, home_team, away_team),
+        'home_team_id': home_team_id,
+        'away_team_id': away_team_id,
+        'home_team_name': home_team,
+        'away_team_name': away_team,
+        'event_types_chain': None,
+        'event_details_chain': None,
+        'entry_player_id': _first_player(_column(entry, 'event_player_ids')),
+        'entry_player_name': _column(entry, 'player_name'),
+        'shot_player_id': _first_player(_column(shot, 'event_player_ids')),
+        'shot_player_name': _column(shot, 'player_name'),
+        'sequence_key': _column(entry, 'sequence_key'),
+        'play_key': _column(entry, 'play_key'),
+        'zone_id': _column(entry, 'event_zone_id'),
+        'zone_entry_type_id': _column(entry, 'zone_entry_type_id'),
+        'shot_result_detail_id': _column(shot, 'event_detail_id'),
+        'time_bucket_id': _column(entry, 'time_bucket_id'),
+        'strength_id': _column(entry, 'strength_id'),
+        'shot_type_id': _column(shot, 'shot_type_id'),
+    })
+    
+    # Chain aggregates from prefix sums over the time-sorted event stream
+    stream = EventChainIndex(events, key='event_running_start')
+    lo, hi = stream.locate(game_ids, entry_time, shot_time)
+    df['events_to_shot'] = hi - lo
+    df['pass_count'] = stream.count(stream.values('event_type') == 'Pass', lo, hi)
+    df['touch_count'] = stream.distinct_count('event_player_ids', lo, hi)
+    df['event_types_chain'] = stream.join('event_type', lo, hi)
+    df['event_details_chain'] = stream.join('event_detail', lo, hi)
+    
     df = df.sort_values(['game_id', 'chain_id']).reset_index(drop=True)
     
     # Save
-    output_path = OUTPUT_DIR / 'fact_shot_chains.csv'
+    output_path = output_dir / 'fact_shot_chains.csv'
     df.to_csv(output_path, index=False)
     
     logger.info(f"  ✓ fact_shot_chains: {len(df)} rows, {len(df.columns)} cols")
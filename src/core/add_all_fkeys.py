@@ -9,6 +9,8 @@ import numpy as np
 from pathlib import Path
 import logging
 
+from src.chains.chain_materializer import EventChainIndex
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -776,120 +778,29 @@ class FKBuilder:
         # Normalize game_id to int for comparison
         events['game_id'] = pd.to_numeric(events['game_id'], errors='coerce').astype('Int64')
         
-        # Group events by game_id and event_index to get unique events
+        # Unique events, sorted once per game; each chain is a slice of this stream
         unique_events = events.drop_duplicates(['game_id', 'event_index'])
-        
-        # Process sequences
-        seq_file = OUTPUT_DIR / 'fact_sequences.csv'
-        if seq_file.exists():
-            seq = pd.read_csv(seq_file)
-            seq['game_id'] = pd.to_numeric(seq['game_id'], errors='coerce').astype('Int64')
-            
-            def get_play_chain(row):
-                start_idx = row.get('start_event_index')
-                end_idx = row.get('end_event_index')
-                game_id = row['game_id']
-                
-                if pd.isna(start_idx) or pd.isna(end_idx) or pd.isna(game_id):
-                    return None, None
-                
-                chain_events = unique_events[
-                    (unique_events['game_id'] == game_id) & 
-                    (unique_events['event_index'] >= start_idx) &
-                    (unique_events['event_index'] <= end_idx)
-                ].sort_values('event_index')
-                
-                if chain_events.empty:
-                    return None, None
-                
-                types = chain_events['event_type'].tolist()
-                indices = chain_events['event_index'].tolist()
-                
-                play_chain = ' > '.join([str(t) for t in types if pd.notna(t)])
-                event_chain = ','.join([str(int(i)) for i in indices if pd.notna(i)])
-                
-                return play_chain, event_chain
-            
-            chains = seq.apply(get_play_chain, axis=1, result_type='expand')
-            seq['play_chain'] = chains[0]
-            seq['event_chain_indices'] = chains[1]
-            seq.to_csv(seq_file, index=False)
-            logger.info(f"  ✓ fact_sequences: Added play chains")
-        
-        # Process rushes
-        rush_file = OUTPUT_DIR / 'fact_rush_events.csv'
-        if rush_file.exists():
-            rush = pd.read_csv(rush_file)
-            rush['game_id'] = pd.to_numeric(rush['game_id'], errors='coerce').astype('Int64')
-            
-            def get_rush_chain(row):
-                # Use entry_event_index and shot_event_index for rushes
-                start_idx = row.get('entry_event_index')
-                end_idx = row.get('shot_event_index')
-                game_id = row['game_id']
-                
-                if pd.isna(start_idx) or pd.isna(end_idx) or pd.isna(game_id):
-                    return None, None
-                
-                chain_events = unique_events[
-                    (unique_events['game_id'] == game_id) & 
-                    (unique_events['event_index'] >= start_idx) &
-                    (unique_events['event_index'] <= end_idx)
-                ].sort_values('event_index')
-                
-                if chain_events.empty:
-                    return None, None
-                
-                types = chain_events['event_type'].tolist()
-                indices = chain_events['event_index'].tolist()
-                
-                play_chain = ' > '.join([str(t) for t in types if pd.notna(t)])
-                event_chain = ','.join([str(int(i)) for i in indices if pd.notna(i)])
-                
-                return play_chain, event_chain
-            
-            chains = rush.apply(get_rush_chain, axis=1, result_type='expand')
-            rush['play_chain'] = chains[0]
-            rush['event_chain_indices'] = chains[1]
-            rush.to_csv(rush_file, index=False)
-            logger.info(f"  ✓ fact_rush_events: Added play chains")
-        
-        # Process cycles
-        cycle_file = OUTPUT_DIR / 'fact_cycle_events.csv'
-        if cycle_file.exists():
-            cycle = pd.read_csv(cycle_file)
-            cycle['game_id'] = pd.to_numeric(cycle['game_id'], errors='coerce').astype('Int64')
-            
-            def get_cycle_chain(row):
-                start_idx = row.get('cycle_start_event_index')
-                end_idx = row.get('cycle_end_event_index')
-                game_id = row['game_id']
-                
-                if pd.isna(start_idx) or pd.isna(end_idx) or pd.isna(game_id):
-                    return None, None
-                
-                chain_events = unique_events[
-                    (unique_events['game_id'] == game_id) & 
-                    (unique_events['event_index'] >= start_idx) &
-                    (unique_events['event_index'] <= end_idx)
-                ].sort_values('event_index')
-                
-                if chain_events.empty:
-                    return None, None
-                
-                types = chain_events['event_type'].tolist()
-                indices = chain_events['event_index'].tolist()
-                
-                play_chain = ' > '.join([str(t) for t in types if pd.notna(t)])
-                event_chain = ','.join([str(int(i)) for i in indices if pd.notna(i)])
-                
-                return play_chain, event_chain
+        index = EventChainIndex(unique_events, key='event_index')
+        index_tokens = pd.Series(index.keys.astype(np.int64).astype(str))
+        
+        for table_name, start_col, end_col in [
+            ('fact_sequences', 'start_event_index', 'end_event_index'),
+            # Rushes run from the zone entry to the shot
+            ('fact_rush_events', 'entry_event_index', 'shot_event_index'),
+            ('fact_cycle_events', 'cycle_start_event_index', 'cycle_end_event_index'),
+        ]:
+            table_file = OUTPUT_DIR / f'{table_name}.csv'
+            if not table_file.exists():
+                continue
+            table = pd.read_csv(table_file)
+            table['game_id'] = pd.to_numeric(table['game_id'], errors='coerce').astype('Int64')
             
-            chains = cycle.apply(get_cycle_chain, axis=1, result_type='expand')
-            cycle['play_chain'] = chains[0]
-            cycle['event_chain_indices'] = chains[1]
-            cycle.to_csv(cycle_file, index=False)
-            logger.info(f"  ✓ fact_cycle_events: Added play chains")
+            missing = pd.Series(np.nan, index=table.index)
+            lo, hi = index.locate(table['game_id'], table.get(start_col, missing), table.get(end_col, missing))
+            table['play_chain'] = index.join('event_type', lo, hi)
+            table['event_chain_indices'] = index.join('event_index', lo, hi, sep=',', tokens=index_tokens)
+            table.to_csv(table_file, index=False)
+            logger.info(f"  ✓ {table_name}: Added play chains")
     
     def run_all(self):
         """Run all FK additions."""
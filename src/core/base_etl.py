@@ -47,6 +47,7 @@ except ImportError:
 # Import central table writer for Supabase integration
 from src.core.table_writer import (
     save_output_table, 
+    deferred_writes,
     enable_supabase as enable_supabase_upload,
     disable_supabase as disable_supabase_upload,
     is_supabase_enabled
@@ -1027,36 +1028,39 @@ def main():
     # Phase 5: Create derived tables (uses dim tables for FKs)
     create_derived_tables(tracking_data, player_lookup)
 
-    # Phase 5.5: Enhance event tables with derived FKs
-    enhance_event_tables(
-        OUTPUT_DIR, log,
-        table_store_available=TABLE_STORE_AVAILABLE,
-        get_table_from_store=get_table_from_store if TABLE_STORE_AVAILABLE else None
-    )
+    # Phases 5.5-5.12 rewrite fact_events / fact_event_players several times:
+    # keep them in memory and write each once before validation
+    with deferred_writes():
+        # Phase 5.5: Enhance event tables with derived FKs
+        enhance_event_tables(
+            OUTPUT_DIR, log,
+            table_store_available=TABLE_STORE_AVAILABLE,
+            get_table_from_store=get_table_from_store if TABLE_STORE_AVAILABLE else None
+        )
 
-    # Phase 5.6: Enhance derived event tables
-    enhance_derived_event_tables(OUTPUT_DIR, log)
+        # Phase 5.6: Enhance derived event tables
+        enhance_derived_event_tables(OUTPUT_DIR, log)
 
-    # Phase 5.9: Enhance events with flags (before sequences)
-    enhance_events_with_flags(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.9: Enhance events with flags (before sequences)
+        enhance_events_with_flags(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.7: Create fact_sequences (now has is_goal flag)
-    create_fact_sequences(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.7: Create fact_sequences (now has is_goal flag)
+        create_fact_sequences(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.8: Create fact_plays (now has is_goal flag)
-    create_fact_plays(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.8: Create fact_plays (now has is_goal flag)
+        create_fact_plays(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.10: Create derived event tables
-    create_derived_event_tables(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.10: Create derived event tables
+        create_derived_event_tables(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.11: Enhance shift tables
-    enhance_shift_tables(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.11: Enhance shift tables
+        enhance_shift_tables(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.11B: Enhance shift players (v19.00)
-    enhance_shift_players(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.11B: Enhance shift players (v19.00)
+        enhance_shift_players(OUTPUT_DIR, log, save_output_table)
 
-    # Phase 5.12: Update roster positions from shifts
-    update_roster_positions_from_shifts(OUTPUT_DIR, log, save_output_table)
+        # Phase 5.12: Update roster positions from shifts
+        update_roster_positions_from_shifts(OUTPUT_DIR, log, save_output_table)
 
     # Phase 6: Validate
     valid = validate_all(OUTPUT_DIR, VALID_TRACKING_GAMES, log)
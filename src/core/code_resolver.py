@@ -0,0 +1,152 @@
+"""
+Dimension Code Resolver
+=======================
+
+Maps free-text tracking codes (event_detail / event_detail_2) to dimension
+IDs for whole columns at once.
+
+A CodeResolver is compiled once per dimension table: codes are normalized
+(e.g. '-' -> '_'), aliases are added (Rush <-> Carried, '/' -> '_', lower
+case) and, for prefix dimensions, the keys are compiled into a single
+anchored regex alternation. Resolving a column factorizes it, resolves only
+the distinct values with vectorized string ops (str.replace / str.extract /
+Index.map), and broadcasts the result back through the category codes - so
+an FK over ~N x 12 event-player rows costs one pass plus work proportional
+to the number of distinct codes.
+
+Usage:
+    from src.core.code_resolver import CodeResolver
+
+    ze = CodeResolver.from_dim(
+        ze_type, 'zone_entry_type_code', 'zone_entry_type_id',
+        replace=[('-', '_')], aliases=[('Rush', 'Carried'), ('Carried', 'Rush')],
+        match='prefix',
+    )
+    tracking['zone_entry_type_id'] = ze.resolve(tracking['event_detail_2'], where=is_entry)
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class CodeResolver:
+    """
+    Compiled code -> id lookup for one dimension.
+
+    Args:
+        code_map: Ordered code -> id mapping. For prefix matching, the first
+            key (in insertion order) that prefixes the value wins.
+        match: 'exact' or 'prefix'
+        strip_prefixes: Value prefixes removed before lookup (first match only),
+            e.g. ('Shot_', 'Goal_')
+        fallbacks: Value transforms tried in order when the value itself does
+            not match, e.g. (str.lower,)
+    """
+
+    def __init__(
+        self,
+        code_map: Dict[str, Any],
+        match: str = 'exact',
+        strip_prefixes: Sequence[str] = (),
+        fallbacks: Sequence[Callable[[str], str]] = ()
+    ):
+        if match not in ('exact', 'prefix'):
+            raise ValueError(f"match must be 'exact' or 'prefix', got {match!r}")
+        self.code_map = {k: v for k, v in code_map.items() if isinstance(k, str)}
+        self.match = match
+        self.fallbacks = list(fallbacks)
+        self._strip = (
+            re.compile('^(?:' + '|'.join(map(re.escape, strip_prefixes)) + ')')
+            if strip_prefixes else None
+        )
+        self._prefix = (
+            '^(' + '|'.join(map(re.escape, self.code_map)) + ')'
+            if match == 'prefix' and self.code_map else None
+        )
+
+    @classmethod
+    def from_dim(
+        cls,
+        dim: pd.DataFrame,
+        code_col: str,
+        id_col: str,
+        replace: Sequence[Tuple[str, str]] = (),
+        aliases: Sequence[Tuple[str, str]] = (),
+        lower: bool = False,
+        **kwargs
+    ) -> 'CodeResolver':
+        """
+        Compile a resolver from a dimension table.
+
+        Args:
+            dim: Dimension DataFrame (may be empty)
+            code_col: Code column (e.g. 'shot_type_code')
+            id_col: ID column (e.g. 'shot_type_id')
+            replace: Substring replacements applied to every code (normalization)
+            aliases: (old, new) pairs; codes containing old also get a key with new
+            lower: Also add lower-cased codes as keys
+            **kwargs: match / strip_prefixes / fallbacks (see CodeResolver)
+        """
+        if len(dim) == 0 or code_col not in dim.columns or id_col not in dim.columns:
+            return cls({}, **kwargs)
+
+        codes = dim[code_col]
+        ids = dim[id_col]
+        for old, new in replace:
+            codes = codes.str.replace(old, new, regex=False)
+
+        code_map = dict(zip(codes, ids))
+        for old, new in aliases:
+            mask = codes.str.contains(old, na=False, regex=False)
+            if mask.any():
+                code_map.update(zip(codes[mask].str.replace(old, new, regex=False), ids[mask]))
+        if lower:
+            code_map.update(zip(codes.str.lower(), ids))
+        return cls(code_map, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.code_map)
+
+    def resolve(self, values: pd.Series, where: Optional[pd.Series] = None) -> pd.Series:
+        """
+        Resolve a whole column to dimension IDs (None where unmatched).
+
+        Args:
+            values: Raw code column
+            where: Optional boolean mask; rows outside it resolve to None
+
+        Returns:
+            Object Series aligned to values.index
+        """
+        out = np.full(len(values), None, dtype=object)
+        if len(values) == 0 or not self.code_map:
+            return pd.Series(out, index=values.index, dtype=object)
+
+        source = values if where is None else values.where(where)
+        codes, uniques = pd.factorize(source, use_na_sentinel=True)
+        if len(uniques) > 0:
+            resolved = self._resolve_uniques(pd.Index(uniques).astype(str))
+            hit = codes >= 0
+            out[hit] = resolved[codes[hit]]
+        return pd.Series(out, index=values.index, dtype=object)
+
+    def _resolve_uniques(self, uniques: pd.Index) -> np.ndarray:
+        """Resolve distinct values (vectorized over the unique set)."""
+        if self._strip is not None:
+            uniques = uniques.str.replace(self._strip, '', regex=True)
+
+        if self.match == 'prefix':
+            matched = uniques.str.extract(self._prefix, expand=False)
+            return pd.Index(matched).map(self.code_map).to_numpy(dtype=object, na_value=None)
+
+        resolved = pd.Series(uniques.map(self.code_map), dtype=object)
+        for transform in self.fallbacks:
+            missing = resolved.isna().to_numpy()
+            if not missing.any():
+                break
+            resolved[missing] = pd.Index(uniques[missing].map(transform)).map(self.code_map)
+        return resolved.to_numpy(dtype=object, na_value=None)
+
@@ -11,6 +11,7 @@ Modules:
 - validation: ETL validation functions
 - event_enhancers: Event table enhancement functions (Phase 5.5, 5.6)
 - shift_enhancers: Shift table enhancement functions (Phase 5.11, 5.12)
+- game_context: Shared time bucket, strength, empty-net and score-state rules
 - derived_event_tables: Derived event table creation (Phase 5.9)
 - reference_tables: Reference/dimension table creation
 
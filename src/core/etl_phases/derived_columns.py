@@ -15,8 +15,59 @@ This module handles:
 - Pressure calculation from XY distance
 """
 
+import numpy as np
 import pandas as pd
 
+# Opponents within this distance pressure the event player (same as tracker default)
+PRESSURE_THRESHOLD_FEET = 10
+
+
+def find_nearest_opponents(df, group_col, x_col, y_col, evt_mask, opp_mask,
+                           threshold=PRESSURE_THRESHOLD_FEET):
+    """
+    Closest opposing player within threshold for every event-team player row.
+
+    Event-team and opponent rows with XY are self-merged per event and all
+    pair distances are computed at once; ties keep the first opponent in
+    table order.
+
+    Args:
+        df: Event-player rows
+        group_col: Event key (e.g. 'event_id')
+        x_col, y_col: Position columns
+        evt_mask, opp_mask: Boolean masks of event-team / opponent rows
+        threshold: Max distance in feet
+
+    Returns:
+        player_game_number of the nearest opponent, indexed by the event
+        player's row label (only rows with an opponent in range)
+    """
+    if 'player_game_number' not in df.columns:
+        return pd.Series(dtype=object)
+
+    rows = pd.DataFrame({
+        'event': df[group_col].to_numpy(),
+        'x': pd.to_numeric(df[x_col], errors='coerce').to_numpy(dtype=float),
+        'y': pd.to_numeric(df[y_col], errors='coerce').to_numpy(dtype=float),
+        'pos': np.arange(len(df)),
+    })
+    located = (rows['event'].notna() & rows['x'].notna() & rows['y'].notna()).to_numpy()
+    evt = rows[located & evt_mask.to_numpy(dtype=bool)]
+    opp = rows[located & opp_mask.to_numpy(dtype=bool)]
+
+    pairs = evt.merge(opp, on='event', suffixes=('', '_opp'))
+    dist = np.sqrt((pairs['x'] - pairs['x_opp']) ** 2 + (pairs['y'] - pairs['y_opp']) ** 2).to_numpy()
+    in_range = dist <= threshold
+    pairs = pairs[in_range].assign(dist=dist[in_range])
+
+    order = np.lexsort((pairs['pos_opp'], pairs['dist'], pairs['pos']))
+    closest = pairs.iloc[order].drop_duplicates('pos')
+    return pd.Series(
+        df['player_game_number'].to_numpy()[closest['pos_opp'].to_numpy()],
+        index=df.index[closest['pos'].to_numpy()],
+        dtype=object,
+    )
+
 
 def calculate_derived_columns(df, log):
     """
@@ -407,8 +458,6 @@ def calculate_derived_columns(df, log):
     # Calculate pressured_pressurer when opposing player is within threshold distance
     # This matches the tracker's auto-detection logic
 
-    PRESSURE_THRESHOLD_FEET = 10  # Same as tracker default
-
     has_xy = ('player_x' in df.columns and df['player_x'].notna().any()) or \
              ('puck_x_start' in df.columns and df['puck_x_start'].notna().any())
 
@@ -426,56 +475,30 @@ def calculate_derived_columns(df, log):
             x_col = 'player_x' if 'player_x' in df.columns and df['player_x'].notna().any() else 'puck_x_start'
             y_col = 'player_y' if 'player_y' in df.columns and df['player_y'].notna().any() else 'puck_y_start'
 
-            # Group by event and check for pressure
+            # Nearest opponent per event player, for all events at once
             if 'event_id' in df.columns or 'tracking_event_index' in df.columns:
                 group_col = 'event_id' if 'event_id' in df.columns else 'tracking_event_index'
 
-                for event_id, group in df.groupby(group_col):
-                    if len(group) < 2:
-                        continue
-
-                    # Identify event team vs opp team players
-                    if 'side_of_puck' in group.columns:
-                        evt_players = group[group['side_of_puck'] == 'event_team']
-                        opp_players = group[group['side_of_puck'] == 'opp_team']
-                    elif 'player_role' in group.columns:
-                        evt_players = group[group['player_role'].str.contains('event', na=False)]
-                        opp_players = group[group['player_role'].str.contains('opp', na=False)]
-                    else:
-                        continue
-
-                    if len(evt_players) == 0 or len(opp_players) == 0:
-                        continue
-
-                    # For each event player, find closest opponent
-                    for evt_idx, evt_row in evt_players.iterrows():
-                        if pd.isna(evt_row.get(x_col)) or pd.isna(evt_row.get(y_col)):
-                            continue
-
-                        evt_x = float(evt_row[x_col])
-                        evt_y = float(evt_row[y_col])
-
-                        closest_dist = float('inf')
-                        closest_opp = None
-
-                        for opp_idx, opp_row in opp_players.iterrows():
-                            if pd.isna(opp_row.get(x_col)) or pd.isna(opp_row.get(y_col)):
-                                continue
-
-                            opp_x = float(opp_row[x_col])
-                            opp_y = float(opp_row[y_col])
-
-                            # Calculate Euclidean distance
-                            dist = ((evt_x - opp_x)**2 + (evt_y - opp_y)**2)**0.5
-
-                            if dist <= PRESSURE_THRESHOLD_FEET and dist < closest_dist:
-                                closest_dist = dist
-                                closest_opp = opp_row.get('player_game_number')
-
-                        # Set pressured_pressurer if within threshold
-                        if closest_opp is not None and pd.isna(df.at[evt_idx, 'pressured_pressurer']):
-                            df.at[evt_idx, 'pressured_pressurer'] = str(int(float(closest_opp))) if pd.notna(closest_opp) else None
-                            pressure_count += 1
+                # Identify event team vs opp team players
+                if 'side_of_puck' in df.columns:
+                    evt_mask = df['side_of_puck'] == 'event_team'
+                    opp_mask = df['side_of_puck'] == 'opp_team'
+                else:
+                    evt_mask = df['player_role'].str.contains('event', na=False)
+                    opp_mask = df['player_role'].str.contains('opp', na=False)
+
+                nearest = find_nearest_opponents(df, group_col, x_col, y_col, evt_mask, opp_mask)
+
+                # Set pressured_pressurer where not already set
+                nearest = nearest[df.loc[nearest.index, 'pressured_pressurer'].isna().to_numpy()]
+                if len(nearest) > 0:
+                    numbers = pd.to_numeric(nearest, errors='coerce')
+                    values = pd.Series(None, index=nearest.index, dtype=object)
+                    values[numbers.notna()] = numbers.dropna().astype('int64').astype(str)
+                    if df['pressured_pressurer'].dtype != object:
+                        df['pressured_pressurer'] = df['pressured_pressurer'].astype(object)
+                    df.loc[nearest.index, 'pressured_pressurer'] = values
+                    pressure_count = len(nearest)
 
             if pressure_count > 0:
                 calculated.append('pressured_pressurer')
@@ -15,7 +15,7 @@ import numpy as np
 from pathlib import Path
 
 # Import table writer for saving
-from src.core.table_writer import save_output_table
+from src.core.table_writer import save_output_table, read_output_table
 
 # Import utilities
 from .utilities import drop_all_null_columns
@@ -54,14 +54,13 @@ def create_fact_sequences(output_dir: Path, log, save_table_func=None):
         save_table_func = lambda df, name: save_output_table(df, name, output_dir)
 
     events_path = output_dir / 'fact_events.csv'
-    tracking_path = output_dir / 'fact_event_players.csv'
 
     if not events_path.exists():
         log.warn("fact_events not found, skipping fact_sequences")
         return
 
-    events = pd.read_csv(events_path, low_memory=False)
-    tracking = pd.read_csv(tracking_path, low_memory=False)
+    events = read_output_table('fact_events', output_dir, low_memory=False)
+    tracking = read_output_table('fact_event_players', output_dir, low_memory=False)
 
     log.info(f"Aggregating {len(events)} events into sequences...")
 
@@ -193,14 +192,13 @@ def create_fact_plays(output_dir: Path, log, save_table_func=None):
         save_table_func = lambda df, name: save_output_table(df, name, output_dir)
 
     events_path = output_dir / 'fact_events.csv'
-    tracking_path = output_dir / 'fact_event_players.csv'
 
     if not events_path.exists():
         log.warn("fact_events not found, skipping fact_plays")
         return
 
-    events = pd.read_csv(events_path, low_memory=False)
-    tracking = pd.read_csv(tracking_path, low_memory=False)
+    events = read_output_table('fact_events', output_dir, low_memory=False)
+    tracking = read_output_table('fact_event_players', output_dir, low_memory=False)
 
     # Ensure season_id exists in events (fallback from schedule if missing)
     if 'season_id' not in events.columns or events['season_id'].isna().all():
@@ -314,7 +312,7 @@ def create_derived_event_tables(output_dir: Path, log, save_table_func=None):
     if save_table_func is None:
         save_table_func = lambda df, name: save_output_table(df, name, output_dir)
 
-    events = pd.read_csv(output_dir / 'fact_events.csv', low_memory=False)
+    events = read_output_table('fact_events', output_dir, low_memory=False)
 
     # dim_danger_level
     dim_danger = pd.DataFrame({
@@ -353,7 +351,7 @@ def create_derived_event_tables(output_dir: Path, log, save_table_func=None):
             log.warn(f"  Could not load dim_player for name/rating lookup: {e}")
 
     if event_players_path.exists():
-        event_players_df = pd.read_csv(event_players_path, low_memory=False)
+        event_players_df = read_output_table('fact_event_players', output_dir, low_memory=False)
         rushes = _add_player_ids_to_events(rushes, event_players_df, player_name_map, player_rating_map)
     else:
         log.warn("  fact_event_players.csv not found - cannot build player ID lists")
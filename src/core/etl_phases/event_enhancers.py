@@ -15,10 +15,13 @@ import numpy as np
 from pathlib import Path
 
 # Import key utilities
-from src.utils.key_parser import parse_shift_key
+from src.utils.key_parser import parse_shift_keys
+
+# Import dimension code resolver (vectorized code -> FK mapping)
+from src.core.code_resolver import CodeResolver
 
 # Import table writer for saving
-from src.core.table_writer import save_output_table
+from src.core.table_writer import save_output_table, read_output_table
 
 # Import safe CSV reader
 from src.core.safe_csv import safe_read_csv
@@ -26,6 +29,11 @@ from src.core.safe_csv import safe_read_csv
 # Import utilities
 from .utilities import drop_all_null_columns
 
+# Shared game-context rules (time bucket, strength)
+from .game_context import (
+    time_bucket_ids, count_skaters, parse_strength, strength_ids, EVEN_STRENGTH_ID,
+)
+
 
 def enhance_event_tables(output_dir: Path, log, table_store_available: bool = False, get_table_from_store=None):
     """Add derived FK columns to fact_events and fact_event_players.
@@ -90,72 +98,10 @@ def enhance_event_tables(output_dir: Path, log, table_store_available: bool = Fa
     # Need to convert event time to shift time format: shift_time = period_max - event_time
 
     if 'shift_start_total_seconds' in shifts.columns and 'shift_end_total_seconds' in shifts.columns:
-        # Find period max time for each game/period (= period duration in countdown format)
-        # VECTORIZED: Use groupby instead of iterrows
-        shifts_clean = shifts[['game_id', 'period', 'shift_start_total_seconds']].copy()
-        shifts_clean['game_id'] = shifts_clean['game_id'].astype(int)
-        shifts_clean['period'] = shifts_clean['period'].astype(int)
-        shifts_clean['shift_start_total_seconds'] = pd.to_numeric(shifts_clean['shift_start_total_seconds'], errors='coerce').fillna(0)
-        period_max = shifts_clean.groupby(['game_id', 'period'])['shift_start_total_seconds'].max().to_dict()
-
-        # Build lookup: for each game/period, list of (shift_id, start_countdown, end_countdown)
-        # VECTORIZED: Use groupby.apply instead of iterrows
-        shifts_for_ranges = shifts[['game_id', 'period', 'shift_id', 'shift_start_total_seconds', 'shift_end_total_seconds']].copy()
-        shifts_for_ranges['game_id'] = shifts_for_ranges['game_id'].astype(int)
-        shifts_for_ranges['period'] = shifts_for_ranges['period'].astype(int)
-        shifts_for_ranges['shift_start_total_seconds'] = pd.to_numeric(shifts_for_ranges['shift_start_total_seconds'], errors='coerce').fillna(0)
-        shifts_for_ranges['shift_end_total_seconds'] = pd.to_numeric(shifts_for_ranges['shift_end_total_seconds'], errors='coerce').fillna(0)
-
-        def build_shift_ranges(group):
-            return list(zip(group['shift_id'].values,
-                           group['shift_start_total_seconds'].values,
-                           group['shift_end_total_seconds'].values))
-
-        shift_ranges_dict = shifts_for_ranges.groupby(['game_id', 'period']).apply(build_shift_ranges).to_dict()
-        shift_ranges = {(int(k[0]), int(k[1])): v for k, v in shift_ranges_dict.items()}
-
-        def find_shift_id(row):
-            """Find shift_id for an event based on game, period, and time."""
-            try:
-                game_id = int(row['game_id'])
-                period = int(row['period']) if pd.notna(row.get('period')) else 1
-
-                # Get event time (elapsed format: 0 = period start)
-                event_elapsed = None
-                for col in ['time_start_total_seconds', 'event_total_seconds']:
-                    if col in row.index and pd.notna(row.get(col)):
-                        event_elapsed = float(row[col])
-                        break
-
-                if event_elapsed is None:
-                    return None
-
-                key = (game_id, period)
-                if key not in shift_ranges or key not in period_max:
-                    return None
-
-                # Convert event elapsed time to countdown format
-                # countdown = period_max - elapsed
-                event_countdown = period_max[key] - event_elapsed
-
-                # Find shift containing this event time
-                # Shift times are countdown: start > end (start is higher number)
-                # Event is in shift if: shift_end <= event_countdown <= shift_start
-                for shift_id, start, end in shift_ranges[key]:
-                    if end <= event_countdown <= start:
-                        return shift_id
-
-                return None
-            except (ValueError, TypeError):
-                return None
-
-        # Apply to fact_event_players
-        tracking['shift_id'] = tracking.apply(find_shift_id, axis=1)
+        # VECTORIZED: one sorted interval lookup for both tables
+        tracking['shift_id'], events['shift_id'] = _assign_shift_ids([tracking, events], shifts)
         shift_fill = tracking['shift_id'].notna().sum()
         log.info(f"    fact_event_players.shift_id: {shift_fill}/{len(tracking)} ({100*shift_fill/len(tracking):.1f}%)")
-
-        # Apply to fact_events
-        events['shift_id'] = events.apply(find_shift_id, axis=1)
         shift_fill_ev = events['shift_id'].notna().sum()
         log.info(f"    fact_events.shift_id: {shift_fill_ev}/{len(events)} ({100*shift_fill_ev/len(events):.1f}%)")
 
@@ -185,184 +131,91 @@ def enhance_event_tables(output_dir: Path, log, table_store_available: bool = Fa
     season_map = dict(zip(schedule['game_id'].astype(int), schedule['season_id']))
     tracking['season_id'] = tracking['game_id'].map(season_map)
 
+    # Row masks shared by the FK resolvers below
+    event_type = tracking['event_type']
+    detail = tracking['event_detail'].astype(str).where(tracking['event_detail'].notna(), '')
+    detail2 = tracking['event_detail_2'].astype(str).where(tracking['event_detail_2'].notna(), '')
+    is_zone_entry_exit = event_type == 'Zone_Entry_Exit'
+    is_turnover = event_type == 'Turnover'
+
     # 3. position_id (from roster)
     log.info("  Adding position_id...")
     # Map position names to IDs
     pos_map = {'Forward': 4, 'Defense': 5, 'Goalie': 6, 'Center': 1, 'Left Wing': 2, 'Right Wing': 3}
-    # VECTORIZED: Create player+game -> position lookup
-    roster_valid = roster[roster['player_position'].notna()].copy()
-    roster_pos = dict(zip(
-        zip(roster_valid['player_id'].astype(str), roster_valid['game_id'].astype(int)),
-        roster_valid['player_position'].map(pos_map).fillna(4)  # Default to Forward if unknown
-    ))
-
-    def get_position(row):
-        key = (str(row['player_id']), int(row['game_id']))
-        return roster_pos.get(key)
-    tracking['position_id'] = tracking.apply(get_position, axis=1)
+    # VECTORIZED: player+game -> position lookup (last roster row wins)
+    roster_valid = roster[roster['player_position'].notna()]
+    roster_pos = pd.Series(
+        roster_valid['player_position'].map(pos_map).fillna(4).to_numpy(),  # Default to Forward if unknown
+        index=pd.MultiIndex.from_arrays([roster_valid['player_id'].astype(str), roster_valid['game_id'].astype(int)])
+    )
+    roster_pos = roster_pos[~roster_pos.index.duplicated(keep='last')]
+    tracking_keys = pd.MultiIndex.from_arrays([tracking['player_id'].astype(str), tracking['game_id'].astype(int)])
+    tracking['position_id'] = roster_pos.reindex(tracking_keys).to_numpy()
 
     # 4. shot_type_id - VECTORIZED
     log.info("  Adding shot_type_id...")
-    shot_type_copy = shot_type.copy()
-    shot_type_copy['code_normalized'] = shot_type_copy['shot_type_code'].str.replace('-', '_')
-    shot_type_copy['code_lower'] = shot_type_copy['code_normalized'].str.lower()
-    shot_map = dict(zip(shot_type_copy['code_normalized'], shot_type_copy['shot_type_id']))
-    shot_map.update(dict(zip(shot_type_copy['code_lower'], shot_type_copy['shot_type_id'])))
-
-    def get_shot_type(row):
-        if row['event_type'] not in ['Shot', 'Goal']:
-            return None
-        detail2 = str(row['event_detail_2']) if pd.notna(row['event_detail_2']) else ''
-        # Strip prefixes: Shot_, Goal_
-        for prefix in ['Shot_', 'Goal_']:
-            if detail2.startswith(prefix):
-                detail2 = detail2[len(prefix):]
-                break
-        return shot_map.get(detail2) or shot_map.get(detail2.lower())
-
-    tracking['shot_type_id'] = tracking.apply(get_shot_type, axis=1)
+    # Strip prefixes: Shot_, Goal_; exact code match, then lower-case
+    shot_resolver = CodeResolver.from_dim(
+        shot_type, 'shot_type_code', 'shot_type_id', replace=[('-', '_')], lower=True,
+        strip_prefixes=('Shot_', 'Goal_'), fallbacks=(str.lower,)
+    )
+    tracking['shot_type_id'] = shot_resolver.resolve(detail2, where=event_type.isin(['Shot', 'Goal']))
 
     # 5. zone_entry_type_id - VECTORIZED
     log.info("  Adding zone_entry_type_id...")
-    ze_type_copy = ze_type.copy()
-    ze_type_copy['code_normalized'] = ze_type_copy['zone_entry_type_code'].str.replace('-', '_')
-    ze_map = dict(zip(ze_type_copy['code_normalized'], ze_type_copy['zone_entry_type_id']))
-    # Add aliases for Rush <-> Carried normalization
-    rush_mask = ze_type_copy['code_normalized'].str.contains('Rush', na=False)
-    carried_mask = ze_type_copy['code_normalized'].str.contains('Carried', na=False)
-    if rush_mask.any():
-        ze_map.update(dict(zip(
-            ze_type_copy.loc[rush_mask, 'code_normalized'].str.replace('Rush', 'Carried'),
-            ze_type_copy.loc[rush_mask, 'zone_entry_type_id']
-        )))
-    if carried_mask.any():
-        ze_map.update(dict(zip(
-            ze_type_copy.loc[carried_mask, 'code_normalized'].str.replace('Carried', 'Rush'),
-            ze_type_copy.loc[carried_mask, 'zone_entry_type_id']
-        )))
-
-    def get_ze_type(row):
-        if row['event_type'] != 'Zone_Entry_Exit':
-            return None
-        detail2 = str(row['event_detail_2']) if pd.notna(row['event_detail_2']) else ''
-        if not detail2.startswith('ZoneEntry'):
-            return None
-        for key, val in ze_map.items():
-            if detail2.startswith(key):
-                return val
-        return None
-    tracking['zone_entry_type_id'] = tracking.apply(get_ze_type, axis=1)
+    # Prefix match, with aliases for Rush <-> Carried normalization
+    ze_resolver = CodeResolver.from_dim(
+        ze_type, 'zone_entry_type_code', 'zone_entry_type_id', replace=[('-', '_')],
+        aliases=[('Rush', 'Carried'), ('Carried', 'Rush')], match='prefix'
+    )
+    tracking['zone_entry_type_id'] = ze_resolver.resolve(
+        detail2, where=is_zone_entry_exit & detail2.str.startswith('ZoneEntry')
+    )
 
     # 6. zone_exit_type_id (NEW) - VECTORIZED
     log.info("  Adding zone_exit_type_id...")
-    zx_type_copy = zx_type.copy()
-    zx_type_copy['code_normalized'] = zx_type_copy['zone_exit_type_code'].str.replace('-', '_')
-    zx_map = dict(zip(zx_type_copy['code_normalized'], zx_type_copy['zone_exit_type_id']))
-    # Add aliases for Rush <-> Carried normalization
-    rush_mask = zx_type_copy['code_normalized'].str.contains('Rush', na=False)
-    carried_mask = zx_type_copy['code_normalized'].str.contains('Carried', na=False)
-    if rush_mask.any():
-        zx_map.update(dict(zip(
-            zx_type_copy.loc[rush_mask, 'code_normalized'].str.replace('Rush', 'Carried'),
-            zx_type_copy.loc[rush_mask, 'zone_exit_type_id']
-        )))
-    if carried_mask.any():
-        zx_map.update(dict(zip(
-            zx_type_copy.loc[carried_mask, 'code_normalized'].str.replace('Carried', 'Rush'),
-            zx_type_copy.loc[carried_mask, 'zone_exit_type_id']
-        )))
-
-    def get_zx_type(row):
-        if row['event_type'] != 'Zone_Entry_Exit':
-            return None
-        detail2 = str(row['event_detail_2']) if pd.notna(row['event_detail_2']) else ''
-        if not detail2.startswith('ZoneExit'):
-            return None
-        for key, val in zx_map.items():
-            if detail2.startswith(key):
-                return val
-        return None
-    tracking['zone_exit_type_id'] = tracking.apply(get_zx_type, axis=1)
+    zx_resolver = CodeResolver.from_dim(
+        zx_type, 'zone_exit_type_code', 'zone_exit_type_id', replace=[('-', '_')],
+        aliases=[('Rush', 'Carried'), ('Carried', 'Rush')], match='prefix'
+    )
+    tracking['zone_exit_type_id'] = zx_resolver.resolve(
+        detail2, where=is_zone_entry_exit & detail2.str.startswith('ZoneExit')
+    )
 
     # 7. stoppage_type_id - Dynamic lookup from dim_stoppage_type
     log.info("  Adding stoppage_type_id...")
-    stoppage_type_path = output_dir / 'dim_stoppage_type.csv'
-    if stoppage_type_path.exists():
-        stoppage_dim = safe_read_csv(stoppage_type_path)
-        # Build mapping from code to ID
-        stoppage_map = dict(zip(stoppage_dim['stoppage_type_code'], stoppage_dim['stoppage_type_id']))
-    else:
-        stoppage_map = {}
+    if len(stoppage_type) == 0:
         log.warn("  dim_stoppage_type.csv not found - stoppage_type_id will be None")
-
-    tracking['stoppage_type_id'] = tracking.apply(
-        lambda r: stoppage_map.get(r['event_detail']) if r['event_type'] == 'Stoppage' else None, axis=1
+    stoppage_resolver = CodeResolver.from_dim(stoppage_type, 'stoppage_type_code', 'stoppage_type_id')
+    tracking['stoppage_type_id'] = stoppage_resolver.resolve(
+        tracking['event_detail'], where=event_type == 'Stoppage'
     )
 
     # 8. giveaway_type_id (NEW)
     log.info("  Adding giveaway_type_id...")
     # Dynamic lookup from dim_giveaway_type - match event_detail_2 to giveaway_type_code
-    giveaway_type_path = output_dir / 'dim_giveaway_type.csv'
-    if giveaway_type_path.exists():
-        giveaway_dim = safe_read_csv(giveaway_type_path)
-        # VECTORIZED: Build mapping from code to ID (handles variations like / vs _)
-        giveaway_map = dict(zip(giveaway_dim['giveaway_type_code'], giveaway_dim['giveaway_type_id']))
-        # Also map variations (replace / with _)
-        giveaway_map.update(dict(zip(
-            giveaway_dim['giveaway_type_code'].str.replace('/', '_'),
-            giveaway_dim['giveaway_type_id']
-        )))
-    else:
-        giveaway_map = {}
+    # (handles variations like / vs _)
+    if len(giveaway_type) == 0:
         log.warn("  dim_giveaway_type.csv not found - giveaway_type_id will be None")
-
-    def get_giveaway_type(row):
-        if row['event_type'] != 'Turnover':
-            return None
-        detail = str(row['event_detail']) if pd.notna(row['event_detail']) else ''
-        if 'Giveaway' not in detail:
-            return None
-        # Use event_detail_2 to determine giveaway type
-        detail2 = str(row['event_detail_2']) if pd.notna(row.get('event_detail_2')) else ''
-        if detail2 in giveaway_map:
-            return giveaway_map[detail2]
-        # Try variations
-        detail2_alt = detail2.replace('/', '_')
-        if detail2_alt in giveaway_map:
-            return giveaway_map[detail2_alt]
-        return None
-    tracking['giveaway_type_id'] = tracking.apply(get_giveaway_type, axis=1)
+    giveaway_resolver = CodeResolver.from_dim(
+        giveaway_type, 'giveaway_type_code', 'giveaway_type_id', aliases=[('/', '_')],
+        fallbacks=(lambda code: code.replace('/', '_'),)
+    )
+    tracking['giveaway_type_id'] = giveaway_resolver.resolve(
+        detail2, where=is_turnover & detail.str.contains('Giveaway', regex=False)
+    )
 
     # 9. takeaway_type_id - Dynamic lookup from dim_takeaway_type
     log.info("  Adding takeaway_type_id...")
-    takeaway_type_path = output_dir / 'dim_takeaway_type.csv'
-    if takeaway_type_path.exists():
-        takeaway_dim = safe_read_csv(takeaway_type_path)
-        # VECTORIZED: Build takeaway map
-        takeaway_map = dict(zip(takeaway_dim['takeaway_type_code'], takeaway_dim['takeaway_type_id']))
-        takeaway_map.update(dict(zip(
-            takeaway_dim['takeaway_type_code'].str.replace('/', '_'),
-            takeaway_dim['takeaway_type_id']
-        )))
-    else:
-        takeaway_map = {}
+    if len(takeaway_type) == 0:
         log.warn("  dim_takeaway_type.csv not found - takeaway_type_id will be None")
-
-    def get_takeaway_type(row):
-        if row['event_type'] != 'Turnover':
-            return None
-        detail = str(row['event_detail']) if pd.notna(row['event_detail']) else ''
-        if 'Takeaway' not in detail:
-            return None
-        # Use event_detail_2 to determine takeaway type
-        detail2 = str(row['event_detail_2']) if pd.notna(row.get('event_detail_2')) else ''
-        if detail2 in takeaway_map:
-            return takeaway_map[detail2]
-        detail2_alt = detail2.replace('/', '_')
-        if detail2_alt in takeaway_map:
-            return takeaway_map[detail2_alt]
-        return None
-    tracking['takeaway_type_id'] = tracking.apply(get_takeaway_type, axis=1)
+    takeaway_resolver = CodeResolver.from_dim(
+        takeaway_type, 'takeaway_type_code', 'takeaway_type_id', aliases=[('/', '_')],
+        fallbacks=(lambda code: code.replace('/', '_'),)
+    )
+    tracking['takeaway_type_id'] = takeaway_resolver.resolve(
+        detail2, where=is_turnover & detail.str.contains('Takeaway', regex=False)
+    )
 
     # 10. turnover_type_id - NOTE: dim_turnover_type is created later in static dimensions
     # giveaway_type_id and takeaway_type_id provide more specific categorization
@@ -371,104 +224,47 @@ def enhance_event_tables(output_dir: Path, log, table_store_available: bool = Fa
 
     # 11. pass_type_id - VECTORIZED
     log.info("  Adding pass_type_id...")
-    pass_map = dict(zip(pass_type['pass_type_code'], pass_type['pass_type_id']))
-    pass_map.update(dict(zip(
-        pass_type['pass_type_code'].str.lower(),
-        pass_type['pass_type_id']
-    )))
-
-    def get_pass_type(row):
-        if row['event_type'] != 'Pass':
-            return None
-        detail2 = str(row['event_detail_2']) if pd.notna(row['event_detail_2']) else ''
-        # Strip Pass_ prefix
-        if detail2.startswith('Pass_'):
-            detail2 = detail2[5:]
-        return pass_map.get(detail2) or pass_map.get(detail2.lower())
-
-    tracking['pass_type_id'] = tracking.apply(get_pass_type, axis=1)
+    # Strip Pass_ prefix; exact code match, then lower-case
+    pass_resolver = CodeResolver.from_dim(
+        pass_type, 'pass_type_code', 'pass_type_id', lower=True,
+        strip_prefixes=('Pass_',), fallbacks=(str.lower,)
+    )
+    tracking['pass_type_id'] = pass_resolver.resolve(detail2, where=event_type == 'Pass')
 
-    # 12. time_bucket_id
+    # 12. time_bucket_id - VECTORIZED (shared rules with fact_shifts)
     log.info("  Adding time_bucket_id...")
-    def get_time_bucket(row):
-        period = row['period']
-        start_min = row.get('event_start_min')
-        if pd.isna(start_min):
-            return None
-        if period > 3:
-            return 'TB06'
-        if start_min >= 15:
-            return 'TB01'
-        elif start_min >= 10:
-            return 'TB02'
-        elif start_min >= 5:
-            return 'TB03'
-        elif start_min >= 2:
-            return 'TB04'
-        else:
-            return 'TB05'
-    tracking['time_bucket_id'] = tracking.apply(get_time_bucket, axis=1)
+    start_min = tracking['event_start_min'] if 'event_start_min' in tracking.columns \
+        else pd.Series(np.nan, index=tracking.index)
+    tracking['time_bucket_id'] = time_bucket_ids(tracking['period'], start_min)
 
     # 13. strength_id (from shift data)
     log.info("  Adding strength_id...")
-    def count_skaters(row, prefix):
-        count = 0
-        for pos in ['forward_1', 'forward_2', 'forward_3', 'defense_1', 'defense_2']:
-            col = f'{prefix}_{pos}'
-            if col in row.index and pd.notna(row[col]):
-                count += 1
-        return count
-
-    # VECTORIZED: Calculate skater counts for all shifts at once
-    def count_skaters_vectorized(df, prefix):
-        """Count skaters for all rows at once."""
-        positions = ['forward_1', 'forward_2', 'forward_3', 'defense_1', 'defense_2']
-        count = pd.Series(0, index=df.index)
-        for pos in positions:
-            col = f'{prefix}_{pos}'
-            if col in df.columns:
-                count += df[col].notna().astype(int)
-        return count
-
+    tracking['strength_id'] = None
     if len(shifts) > 0:
-        home_sk = count_skaters_vectorized(shifts, 'home')
-        away_sk = count_skaters_vectorized(shifts, 'away')
-
-        strength_map = {
-            (5,5): 'STR0001', (5,4): 'STR0002', (5,3): 'STR0003',
-            (4,5): 'STR0004', (3,5): 'STR0005', (4,4): 'STR0006',
-            (3,3): 'STR0007', (4,3): 'STR0008', (3,4): 'STR0009',
-        }
-
-        # Create tuples and map
-        strength_tuples = list(zip(home_sk, away_sk))
-        shift_strength_values = [strength_map.get(t, 'STR0001') for t in strength_tuples]
-        shift_strength = dict(zip(
-            zip(shifts['game_id'], shifts['shift_index']),
-            shift_strength_values
-        ))
-    else:
-        shift_strength = {}
-
-    def get_strength(row):
-        shift_key = row.get('shift_key')
-        if pd.isna(shift_key):
-            return None
-        parts = parse_shift_key(shift_key)
-        if parts is None:
-            return None
-        return shift_strength.get((parts.game_id, parts.shift_index), 'STR0001')
-    tracking['strength_id'] = tracking.apply(get_strength, axis=1)
+        # (game_id, shift_index) -> strength from skater counts, last shift row wins
+        shift_strength = pd.Series(
+            strength_ids(count_skaters(shifts, 'home'), count_skaters(shifts, 'away'), default=EVEN_STRENGTH_ID),
+            index=pd.MultiIndex.from_arrays([shifts['game_id'], shifts['shift_index']]),
+            dtype=object
+        )
+        shift_strength = shift_strength[~shift_strength.index.duplicated(keep='last')]
+
+        # Parsed shift keys -> strength (default 5v5 when the shift is unknown)
+        if 'shift_key' in tracking.columns:
+            key_parts = parse_shift_keys(tracking['shift_key'])
+            parsed = key_parts['game_id'].notna().to_numpy()
+            lookup = pd.MultiIndex.from_arrays([
+                key_parts['game_id'][parsed].astype('int64'),
+                key_parts['shift_index'][parsed].astype('int64'),
+            ])
+            strength_values = shift_strength.reindex(lookup).fillna(EVEN_STRENGTH_ID).to_numpy()
+            strength_id = np.full(len(tracking), None, dtype=object)
+            strength_id[parsed] = strength_values
+            tracking['strength_id'] = strength_id
 
     # Fallback: Map from strength column if strength_id is still null
     if 'strength' in tracking.columns:
-        strength_direct_map = {
-            '5v5': 'STR01', '5v4': 'STR02', '4v5': 'STR03', '5v3': 'STR04',
-            '3v5': 'STR05', '4v4': 'STR06', '3v3': 'STR07', '4v3': 'STR08',
-            '3v4': 'STR09', '6v5': 'STR10', '5v6': 'STR11', '6v4': 'STR12',
-            '4v6': 'STR13', '6v3': 'STR14', '3v6': 'STR15'
-        }
-        strength_from_col = tracking['strength'].map(strength_direct_map)
+        strength_from_col = pd.Series(strength_ids(*parse_strength(tracking['strength'])), index=tracking.index)
         tracking['strength_id'] = tracking['strength_id'].fillna(strength_from_col)
 
     # 15. player_rating (from dim_player)
@@ -516,6 +312,120 @@ def enhance_event_tables(output_dir: Path, log, table_store_available: bool = Fa
             log.info(f"    {col}: {fill}/{len(tracking)} ({100*fill/len(tracking):.1f}%)")
 
 
+def _shift_lookup_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    (game_id, period, elapsed) lookup keys for events, NaN where not assignable.
+
+    Period defaults to 1 when missing; elapsed is the first non-null of
+    time_start_total_seconds / event_total_seconds (0 = period start).
+    """
+    game_id = pd.to_numeric(df['game_id'], errors='coerce')
+    if 'period' in df.columns:
+        period = pd.to_numeric(df['period'], errors='coerce').where(df['period'].notna(), 1)
+    else:
+        period = pd.Series(1.0, index=df.index)
+
+    elapsed = pd.Series(np.nan, index=df.index, dtype=object)
+    for col in ['time_start_total_seconds', 'event_total_seconds']:
+        if col in df.columns:
+            elapsed = elapsed.where(elapsed.notna(), df[col])
+    elapsed = pd.to_numeric(elapsed, errors='coerce')
+
+    return pd.DataFrame({
+        'game_id': np.trunc(game_id),
+        'period': np.trunc(period),
+        'elapsed': elapsed.astype(float),
+    }, index=df.index)
+
+
+def _assign_shift_ids(frames, shifts: pd.DataFrame):
+    """
+    Assign shift_id to each row of several event frames in one pass.
+
+    Event times are ascending (0 = period start); shift times are a countdown
+    (period max = period start). An event at countdown t = period_max - elapsed
+    belongs to a shift with end <= t <= start. When several shifts contain t
+    (e.g. t on a shift change), the first shift in fact_shifts order wins.
+
+    Lookup: shifts are sorted by (game, period, start); merge_asof finds the
+    first shift with start >= t, then the following shifts are checked while
+    their start is still within the longest shift duration of t.
+
+    Returns:
+        List of object Series (shift_id or None), one per frame
+    """
+    ranges = pd.DataFrame({
+        'game_id': shifts['game_id'].astype(int),
+        'period': shifts['period'].astype(int),
+        'start': pd.to_numeric(shifts['shift_start_total_seconds'], errors='coerce').fillna(0).astype(float),
+        'end': pd.to_numeric(shifts['shift_end_total_seconds'], errors='coerce').fillna(0).astype(float),
+        'shift_id': shifts['shift_id'].to_numpy(),
+        'order': np.arange(len(shifts)),
+    })
+    period_max = ranges.groupby(['game_id', 'period'])['start'].max().rename('period_max')
+
+    # Distinct lookup keys across all frames
+    keys = [_shift_lookup_keys(df) for df in frames]
+    queries = pd.concat(keys, ignore_index=True).dropna().drop_duplicates()
+    queries = queries.astype({'game_id': int, 'period': int})
+    queries = queries.join(period_max, on=['game_id', 'period'], how='inner')
+    queries['countdown'] = queries['period_max'] - queries['elapsed']
+    queries = queries.sort_values('countdown', kind='mergesort').reset_index(drop=True)
+
+    ranges = ranges.sort_values(['game_id', 'period', 'start'], kind='mergesort').reset_index(drop=True)
+    ranges['pos'] = np.arange(len(ranges))
+    first = pd.merge_asof(
+        queries,
+        ranges.drop_duplicates(['game_id', 'period', 'start'])[['game_id', 'period', 'start', 'pos']]
+        .sort_values('start', kind='mergesort'),
+        left_on='countdown', right_on='start', by=['game_id', 'period'],
+        direction='forward', allow_exact_matches=True
+    )
+
+    # Walk candidate shifts (start >= countdown) until starts exceed the longest duration
+    game = ranges['game_id'].to_numpy()
+    period = ranges['period'].to_numpy()
+    start = ranges['start'].to_numpy()
+    end = ranges['end'].to_numpy()
+    order = ranges['order'].to_numpy()
+    max_len = max(float((start - end).max()), 0.0) if len(ranges) else 0.0
+
+    q_game = first['game_id'].to_numpy()
+    q_period = first['period'].to_numpy()
+    t = first['countdown'].to_numpy()
+    pos = first['pos'].fillna(-1).to_numpy().astype(int)
+    best = np.full(len(first), -1)
+    best_order = np.full(len(first), np.iinfo(np.int64).max)
+
+    active = pos >= 0
+    while active.any():
+        idx = np.flatnonzero(active)
+        p = pos[idx]
+        in_group = (p < len(ranges))
+        p_safe = np.where(in_group, p, 0)
+        in_group &= (game[p_safe] == q_game[idx]) & (period[p_safe] == q_period[idx]) & (start[p_safe] - t[idx] <= max_len)
+        hit = in_group & (end[p_safe] <= t[idx]) & (order[p_safe] < best_order[idx])
+        best[idx[hit]] = p_safe[hit]
+        best_order[idx[hit]] = order[p_safe[hit]]
+        active[idx[~in_group]] = False
+        pos[idx] += 1
+
+    first['shift_id'] = np.where(best >= 0, ranges['shift_id'].to_numpy()[np.maximum(best, 0)], None)
+    assigned = first.set_index(['game_id', 'period', 'elapsed'])['shift_id']
+
+    results = []
+    for key in keys:
+        out = np.full(len(key), None, dtype=object)
+        valid = key.notna().all(axis=1).to_numpy()
+        if valid.any():
+            lookup = pd.MultiIndex.from_arrays([
+                key['game_id'][valid].astype(int), key['period'][valid].astype(int), key['elapsed'][valid]
+            ])
+            out[valid] = assigned.reindex(lookup).to_numpy(dtype=object, na_value=None)
+        results.append(pd.Series(out, index=key.index, dtype=object))
+    return results
+
+
 def _build_cycle_events(tracking, events, output_dir, log):
     """
     Build fact_cycle_events using zone inference.
@@ -706,8 +616,8 @@ def enhance_derived_event_tables(output_dir: Path, log):
     log.section("PHASE 5.6: ENHANCE DERIVED EVENT TABLES")
 
     # Load fact_events with new FKs for lookup
-    events = safe_read_csv(output_dir / 'fact_events.csv')
-    tracking = safe_read_csv(output_dir / 'fact_event_players.csv')
+    events = read_output_table('fact_events', output_dir, low_memory=False)
+    tracking = read_output_table('fact_event_players', output_dir, low_memory=False)
 
     # Create lookup maps from events
     event_fks = ['season_id', 'time_bucket_id', 'strength_id', 'shot_type_id',
@@ -782,14 +692,13 @@ def enhance_events_with_flags(output_dir: Path, log, save_table_func=None):
         save_table_func = lambda df, name: save_output_table(df, name, output_dir)
 
     events_path = output_dir / 'fact_events.csv'
-    tracking_path = output_dir / 'fact_event_players.csv'
 
     if not events_path.exists():
         log.warn("fact_events not found, skipping enhancement")
         return
 
-    events = safe_read_csv(events_path)
-    tracking = safe_read_csv(tracking_path)
+    events = read_output_table('fact_events', output_dir, low_memory=False)
+    tracking = read_output_table('fact_event_players', output_dir, low_memory=False)
 
     # Get first row per event for time/context
     first_per_event = tracking[tracking['player_role'] == 'event_player_1'].copy()
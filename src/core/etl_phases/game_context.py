@@ -0,0 +1,184 @@
+"""
+Game Context Columns
+====================
+
+Vectorized game-context derivations shared by the event and shift
+enhancers, so fact_event_players, fact_events and fact_shifts get the same
+IDs from one set of rules:
+
+- time_bucket_ids: TB01-TB06 from period and clock minute
+- count_skaters: skaters on ice per side from shift position columns
+- parse_strength / strength_ids: dim_strength IDs from skater counts or
+  strength labels ('5v4', '4v4 PP', ...)
+- empty_net_flags / apply_empty_net_labels: empty-net flags and the EN
+  strength/situation labels
+- score_state: score differential and game state at given game times
+
+Strength IDs come from dim_strength (src/tables/dimension_tables.py), so
+every strength_id written here is a valid FK.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.tables.dimension_tables import create_dim_strength
+
+# Clock minute (countdown) lower bound of each in-period bucket; below the last is TB05
+TIME_BUCKET_MINUTES = [(15, 'TB01'), (10, 'TB02'), (5, 'TB03'), (2, 'TB04')]
+FINAL_MINUTES_BUCKET = 'TB05'
+OVERTIME_BUCKET = 'TB06'
+
+# Shift position columns counted as skaters ({prefix}_{position})
+SKATER_POSITIONS = ['forward_1', 'forward_2', 'forward_3', 'defense_1', 'defense_2']
+
+# strength_code ('5v4') -> strength_id ('STR02')
+_dim_strength = create_dim_strength()
+STRENGTH_IDS = dict(zip(_dim_strength['strength_code'], _dim_strength['strength_id']))
+EVEN_STRENGTH_ID = STRENGTH_IDS['5v5']
+
+# Game times are ordered by period, then countdown clock (seconds < CLOCK_SPAN)
+CLOCK_SPAN = 10 ** 6
+
+
+def _numeric(values) -> np.ndarray:
+    return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+
+
+def _game_keys(values) -> np.ndarray:
+    """game_id as str, so int, whole-float and string IDs of one game match."""
+    ids = pd.Series(values, dtype=object).reset_index(drop=True)
+    numeric = pd.to_numeric(ids, errors='coerce')
+    whole = numeric.notna() & (numeric % 1 == 0)
+    ids[whole] = numeric[whole].astype(np.int64)
+    return ids.astype(str).to_numpy()
+
+
+def time_bucket_ids(period, start_min) -> np.ndarray:
+    """
+    time_bucket_id per row: TB06 for overtime, else by clock minute.
+
+    Args:
+        period: Period number per row
+        start_min: Clock minute (countdown) per row
+
+    Returns:
+        Object array; None where period or minute is missing
+    """
+    period = _numeric(period)
+    start_min = _numeric(start_min)
+    conditions = [np.isnan(period) | np.isnan(start_min), period > 3]
+    conditions += [start_min >= minute for minute, _ in TIME_BUCKET_MINUTES]
+    choices = [None, OVERTIME_BUCKET] + [bucket for _, bucket in TIME_BUCKET_MINUTES]
+    return np.select(conditions, choices, default=FINAL_MINUTES_BUCKET).astype(object)
+
+
+def count_skaters(df: pd.DataFrame, prefix: str) -> pd.Series:
+    """Skaters on ice for one side ('home'/'away'): filled position columns per row."""
+    count = pd.Series(0, index=df.index)
+    for pos in SKATER_POSITIONS:
+        col = f'{prefix}_{pos}'
+        if col in df.columns:
+            count += df[col].notna().astype(int)
+    return count
+
+
+def parse_strength(labels) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (home, away) skater counts from strength labels.
+
+    The first word of a label is read as '<home>v<away>' ('5v4', '4v4 PP');
+    anything else parses to NaN.
+    """
+    token = pd.Series(labels, dtype=object).astype(str).str.split().str[0]
+    counts = token.str.extract(r'^(\d+)v(\d+)(?:v|$)')
+    return _numeric(counts[0]), _numeric(counts[1])
+
+
+def strength_ids(home, away, default: Optional[str] = None) -> np.ndarray:
+    """
+    dim_strength IDs for (home, away) skater counts.
+
+    Args:
+        home, away: Skater counts per row (NaN = unknown)
+        default: ID for counts without a dim_strength row (e.g. 2v5)
+
+    Returns:
+        Object array of strength_id (default where unmapped)
+    """
+    home, away = _numeric(home), _numeric(away)
+    known = ~np.isnan(home) & ~np.isnan(away)
+    codes = pd.Series(np.full(len(home), None, dtype=object))
+    codes[known] = [f'{h}v{a}' for h, a in zip(home[known].astype(int), away[known].astype(int))]
+    return codes.map(STRENGTH_IDS).to_numpy(dtype=object, na_value=default)
+
+
+def empty_net_flags(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """(home_en, away_en) boolean arrays from home_team_en / away_team_en (1 = net empty)."""
+    flags = []
+    for col in ['home_team_en', 'away_team_en']:
+        flags.append((df[col] == 1).to_numpy() if col in df.columns else np.zeros(len(df), dtype=bool))
+    return flags[0], flags[1]
+
+
+def apply_empty_net_labels(df: pd.DataFrame) -> int:
+    """
+    Relabel empty-net rows in place (#177): strength ENH/ENA and situation
+    home_en/away_en name the team whose net is empty.
+
+    Returns:
+        Number of relabeled rows (0 when the EN flag columns are missing)
+    """
+    if 'home_team_en' not in df.columns or 'away_team_en' not in df.columns:
+        return 0
+    home_en, away_en = empty_net_flags(df)
+    df.loc[home_en, 'strength'] = 'ENH'
+    df.loc[away_en, 'strength'] = 'ENA'
+    df.loc[home_en, 'situation'] = 'home_en'
+    df.loc[away_en, 'situation'] = 'away_en'
+    return int(home_en.sum() + away_en.sum())
+
+
+def score_state(game_ids, periods, clock_seconds, goals: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score at given game times (goals strictly before each time).
+
+    A goal is before a time if it is in an earlier period, or in the same
+    period at a higher countdown clock.
+
+    Args:
+        game_ids, periods, clock_seconds: Game time per row (countdown seconds)
+        goals: Goals with game_id, period, event_total_seconds, is_home_goal
+
+    Returns:
+        DataFrame (same length, default index) with score_differential
+        (home - away) and game_state ('home_leading' / 'home_trailing' /
+        'tied'); rows with a missing time are tied
+    """
+    diff = np.zeros(len(game_ids), dtype=np.int64)
+    times = pd.DataFrame({
+        'game_id': _game_keys(game_ids),
+        'order': _numeric(periods) * CLOCK_SPAN - _numeric(clock_seconds),
+        'row': np.arange(len(diff)),
+    }).dropna(subset=['order'])
+
+    if len(goals) > 0 and len(times) > 0:
+        scored = pd.DataFrame({
+            'game_id': _game_keys(goals['game_id']),
+            'order': _numeric(goals['period']) * CLOCK_SPAN - _numeric(goals['event_total_seconds']),
+            'home': goals['is_home_goal'].fillna(False).astype(bool).to_numpy(),
+        }).dropna(subset=['order']).sort_values('order', kind='mergesort')
+        by_game = scored.groupby('game_id', sort=False)
+        scored['lead'] = by_game['home'].cumsum() * 2 - (by_game.cumcount() + 1)
+
+        matched = pd.merge_asof(
+            times.sort_values('order', kind='mergesort'), scored[['game_id', 'order', 'lead']],
+            on='order', by='game_id', direction='backward', allow_exact_matches=False
+        )
+        diff[matched['row'].to_numpy()] = matched['lead'].fillna(0).to_numpy(dtype=np.int64)
+
+    return pd.DataFrame({
+        'score_differential': diff,
+        'game_state': np.select([diff > 0, diff < 0], ['home_leading', 'home_trailing'], default='tied'),
+    })
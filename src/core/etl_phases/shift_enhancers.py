@@ -15,11 +15,16 @@ import numpy as np
 from pathlib import Path
 
 # Import table writer for saving
-from src.core.table_writer import save_output_table
+from src.core.table_writer import save_output_table, read_output_table
 
 # Import utilities
 from .utilities import drop_all_null_columns
 
+# Shared game-context rules (time bucket, strength, empty net, score state)
+from .game_context import (
+    time_bucket_ids, parse_strength, strength_ids, apply_empty_net_labels, score_state,
+)
+
 
 def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
     """Comprehensive shift enhancement with player IDs, plus/minus, and shift stats.
@@ -35,7 +40,6 @@ def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
         save_table_func = lambda df, name: save_output_table(df, name, output_dir)
 
     shifts_path = output_dir / 'fact_shifts.csv'
-    events_path = output_dir / 'fact_events.csv'
     roster_path = output_dir / 'fact_gameroster.csv'
 
     if not shifts_path.exists():
@@ -43,7 +47,7 @@ def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
         return
 
     shifts = pd.read_csv(shifts_path, low_memory=False)
-    events = pd.read_csv(events_path, low_memory=False)
+    events = read_output_table('fact_events', output_dir, low_memory=False)
     roster = pd.read_csv(roster_path, low_memory=False)
     dim_team = pd.read_csv(output_dir / 'dim_team.csv', low_memory=False)
     dim_schedule = pd.read_csv(output_dir / 'dim_schedule.csv', low_memory=False)
@@ -53,21 +57,9 @@ def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
 
     # Fix EN convention (#177): strength/situation should indicate who HAS empty net
     # The EN flags are correct (based on goalie presence), but strength/situation labels are backwards
-    if 'home_team_en' in shifts.columns and 'away_team_en' in shifts.columns:
-        home_en_mask = shifts['home_team_en'] == 1
-        away_en_mask = shifts['away_team_en'] == 1
-
-        # Correct strength: ENH = home has empty net, ENA = away has empty net
-        shifts.loc[home_en_mask, 'strength'] = 'ENH'
-        shifts.loc[away_en_mask, 'strength'] = 'ENA'
-
-        # Correct situation: home_en = home has empty net, away_en = away has empty net
-        shifts.loc[home_en_mask, 'situation'] = 'home_en'
-        shifts.loc[away_en_mask, 'situation'] = 'away_en'
-
-        en_corrected = home_en_mask.sum() + away_en_mask.sum()
-        if en_corrected > 0:
-            log.info(f"  Corrected {en_corrected} EN shift labels (strength/situation)")
+    en_corrected = apply_empty_net_labels(shifts)
+    if en_corrected > 0:
+        log.info(f"  Corrected {en_corrected} EN shift labels (strength/situation)")
 
     # Calculate total seconds for shifts (from period start, counting down)
     shifts['shift_start_total_seconds'] = shifts['shift_start_min'].fillna(0) * 60 + shifts['shift_start_sec'].fillna(0)
@@ -145,45 +137,8 @@ def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
     game_to_season = dict(zip(dim_schedule['game_id'], dim_schedule['season_id']))
     shifts['season_id'] = shifts['game_id'].map(game_to_season)
 
-    def get_time_bucket(row):
-        period = row['period']
-        start_min = row['shift_start_min']
-        if pd.isna(period) or pd.isna(start_min):
-            return None
-        if period > 3:
-            return 'TB06'
-        if start_min >= 15:
-            return 'TB01'
-        elif start_min >= 10:
-            return 'TB02'
-        elif start_min >= 5:
-            return 'TB03'
-        elif start_min >= 2:
-            return 'TB04'
-        else:
-            return 'TB05'
-    shifts['time_bucket_id'] = shifts.apply(get_time_bucket, axis=1)
-
-    def map_strength_id(strength_str):
-        if pd.isna(strength_str):
-            return None
-        strength_str = str(strength_str).split()[0]
-        if 'v' in strength_str:
-            parts = strength_str.split('v')
-            try:
-                home, away = int(parts[0]), int(parts[1])
-                strength_map = {
-                    (5, 5): 'STR0001', (5, 4): 'STR0002', (5, 3): 'STR0003',
-                    (4, 5): 'STR0004', (3, 5): 'STR0005', (4, 4): 'STR0006',
-                    (3, 3): 'STR0007', (4, 3): 'STR0008', (3, 4): 'STR0009',
-                    (6, 5): 'STR0010', (5, 6): 'STR0011', (6, 4): 'STR0012',
-                    (4, 6): 'STR0013', (0, 0): 'STR0016', (6, 6): 'STR0017',
-                }
-                return strength_map.get((home, away), None)
-            except Exception:
-                return None
-        return None
-    shifts['strength_id'] = shifts['strength'].apply(map_strength_id)
+    shifts['time_bucket_id'] = time_bucket_ids(shifts['period'], shifts['shift_start_min'])
+    shifts['strength_id'] = strength_ids(*parse_strength(shifts['strength']))
 
     # 2. Derive shift start/stop types
     def derive_start_type(shift_events_df, current_type):
@@ -398,52 +353,9 @@ def enhance_shift_tables(output_dir: Path, log, save_table_func=None):
 
     # 5b. Game state tracking
     log.info("  Calculating game state (leading/trailing/tied)...")
-    shifts['game_state'] = 'tied'
-    shifts['score_differential'] = 0
-
-    for game_id in shifts['game_id'].unique():
-        game_shifts = shifts[shifts['game_id'] == game_id].copy()
-        # Sort goals DESCENDING by event_total_seconds (countdown format: higher = earlier in period)
-        game_goals = actual_goals[actual_goals['game_id'] == game_id].sort_values('event_total_seconds', ascending=False)
-
-        if len(game_goals) == 0:
-            continue
-
-        home_score = 0
-        away_score = 0
-        goal_scores = []
-
-        # Build cumulative scores in chronological order (earliest goals first)
-        for _, goal in game_goals.iterrows():
-            if goal['is_home_goal']:
-                home_score += 1
-            else:
-                away_score += 1
-            goal_scores.append((goal['event_total_seconds'], home_score, away_score))
-
-        for idx in game_shifts.index:
-            shift_start = shifts.at[idx, 'shift_start_total_seconds']
-            if pd.isna(shift_start):
-                continue
-
-            h_score, a_score = 0, 0
-            # Countdown format: goal happened before shift if goal_time > shift_start
-            # (higher clock value = earlier in period)
-            for goal_time, h, a in goal_scores:
-                if goal_time > shift_start:
-                    h_score, a_score = h, a
-                else:
-                    break
-
-            diff = h_score - a_score
-            shifts.at[idx, 'score_differential'] = diff
-
-            if diff > 0:
-                shifts.at[idx, 'game_state'] = 'home_leading'
-            elif diff < 0:
-                shifts.at[idx, 'game_state'] = 'home_trailing'
-            else:
-                shifts.at[idx, 'game_state'] = 'tied'
+    state = score_state(shifts['game_id'], shifts['period'], shifts['shift_start_total_seconds'], actual_goals)
+    shifts['game_state'] = state['game_state'].to_numpy()
+    shifts['score_differential'] = state['score_differential'].to_numpy()
 
     shifts['is_close_game'] = shifts['score_differential'].abs() <= 1
 
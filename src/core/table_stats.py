@@ -0,0 +1,286 @@
+"""
+Columnar table statistics captured at write time.
+
+save_output_table profiles every table once, while the DataFrame is still in
+memory, and stores a small JSON summary next to the CSV:
+
+- row count, column names, dtypes and null counts
+- primary key duplicates (counted over uint64 hashes of the key values)
+- distinct values of key columns (FK columns and the parent columns they
+  reference, per config/table_manifest.json, plus game_id wherever present)
+
+Post-ETL verification (src/validation/table_verifier) and the HTML docs
+(src/advanced/v11_enhancements) then work on these summaries instead of
+re-reading every CSV. Values are compared in a canonical
+text form ('5', '5.0' and 5 are the same key) so write-time stats agree with
+what a CSV round trip would produce.
+
+Stats record the CSV's size and mtime; a CSV rewritten by code that bypasses
+save_output_table is detected as stale and re-profiled from disk.
+
+Usage:
+    from src.core.table_stats import get_table_stats
+
+    stats = get_table_stats('fact_events', output_dir)
+    stats['rows'], stats['pk']['duplicates'], stats['key_values']['player_id']
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger('TableStats')
+
+MANIFEST_PATH = Path(__file__).parent.parent.parent / 'config' / 'table_manifest.json'
+
+# Stats files live in a hidden folder beside the CSVs
+STATS_DIR_NAME = '.table_stats'
+
+# Bump when the stats layout changes so old files are re-profiled
+STATS_VERSION = 2
+
+# FK values treated as "no reference" rather than orphans
+NULL_MARKERS = {'0', '-1', '', 'null', 'none', 'nan'}
+
+# Duplicate PK values kept as a sample
+PK_SAMPLE_SIZE = 5
+
+# Key columns profiled in every table that has them
+COMMON_KEY_COLUMNS = ['game_id']
+
+
+def key_spec_from_manifest(manifest: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Key columns to profile per table, from a table manifest.
+
+    Returns:
+        {table: {'pk': column or None, 'key_columns': [columns]}} where
+        key_columns are the table's FK columns plus any of its columns
+        referenced as an FK parent by another table
+    """
+    spec: Dict[str, Dict[str, Any]] = {}
+    for table_name, table_spec in manifest.get('tables', {}).items():
+        pk = table_spec.get('primary_key')
+        entry = spec.setdefault(table_name, {'pk': None, 'key_columns': set()})
+        if pk and not table_spec.get('skip_pk_check', False):
+            entry['pk'] = pk.lower()
+        for fk_col, ref in (table_spec.get('foreign_keys') or {}).items():
+            parts = ref.split('.')
+            if len(parts) != 2:
+                continue
+            entry['key_columns'].add(fk_col.lower())
+            parent = spec.setdefault(parts[0], {'pk': None, 'key_columns': set()})
+            parent['key_columns'].add(parts[1].lower())
+
+    return {t: {'pk': e['pk'], 'key_columns': sorted(e['key_columns'])} for t, e in spec.items()}
+
+
+@lru_cache(maxsize=1)
+def load_key_spec() -> Dict[str, Dict[str, Any]]:
+    """Key spec for the project manifest (config/table_manifest.json), loaded once."""
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return key_spec_from_manifest(json.load(f))
+
+
+def canonical_keys(values) -> np.ndarray:
+    """
+    Canonical text form of key values (object array, None for nulls).
+
+    Integral numbers (5, 5.0, '5') become '5', other numbers their float
+    repr, everything else its stripped str().
+    """
+    values = pd.Series(values, dtype=object)
+    out = np.full(len(values), None, dtype=object)
+    present = values.notna().to_numpy()
+    if not present.any():
+        return out
+
+    text = values[present].astype(str).str.strip()
+    numeric = pd.to_numeric(text, errors='coerce')
+    finite = numeric.notna() & np.isfinite(numeric.fillna(0))
+    integral = finite & (numeric % 1 == 0) & (numeric.abs() < 2 ** 53)
+    canonical = text.copy()
+    canonical[integral] = numeric[integral].astype('int64').astype(str)
+    fractional = finite & ~integral
+    canonical[fractional] = numeric[fractional].map(repr)
+    out[present] = canonical.to_numpy(dtype=object)
+    return out
+
+
+def _factorized_keys(series: pd.Series):
+    """(codes, canonical uniques) for a column - canonicalizes distinct values only."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    canonical = canonical_keys(uniques)
+    # Different raw values can share a canonical form (5 / 5.0 / '5')
+    canon_codes, canon_uniques = pd.factorize(pd.Series(canonical, dtype=object), use_na_sentinel=True)
+    merged = np.where(codes >= 0, canon_codes[np.maximum(codes, 0)], -1)
+    return merged, canon_uniques
+
+
+def compute_table_stats(
+    df: pd.DataFrame,
+    table_name: str,
+    key_spec: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Profile a table in one pass per column of interest.
+
+    Args:
+        df: Table as written
+        table_name: Table name
+        key_spec: Output of load_key_spec (default: project manifest)
+
+    Returns:
+        JSON-serializable stats dict
+    """
+    spec = (key_spec if key_spec is not None else load_key_spec()).get(table_name, {})
+    columns = [str(c).lower().strip() for c in df.columns]
+    frame = df.set_axis(columns, axis=1)
+
+    stats: Dict[str, Any] = {
+        'version': STATS_VERSION,
+        'table': table_name,
+        'rows': int(len(frame)),
+        'columns': columns,
+        'dtypes': {c: str(t) for c, t in zip(columns, frame.dtypes)},
+        'null_counts': {c: int(n) for c, n in zip(columns, frame.isna().sum().to_numpy())},
+        'pk': None,
+        'key_values': {},
+    }
+
+    pk = spec.get('pk')
+    if pk and pk in frame.columns:
+        codes, uniques = _factorized_keys(frame[pk])
+        # Hash canonical keys (nulls hash as one value, like duplicated())
+        labels = np.append(uniques.to_numpy(dtype=object), '\x00null').astype(str)
+        hashes = pd.util.hash_array(labels)[codes]
+        duplicated = pd.Series(hashes).duplicated(keep=False).to_numpy()
+        dup_codes = pd.unique(codes[duplicated])
+        stats['pk'] = {
+            'column': pk,
+            'duplicates': int(len(hashes) - len(pd.unique(hashes))),
+            'sample_values': [None if c < 0 else uniques[c] for c in dup_codes[:PK_SAMPLE_SIZE]],
+        }
+
+    key_columns = spec.get('key_columns', [])
+    for col in key_columns + [c for c in COMMON_KEY_COLUMNS if c not in key_columns]:
+        if col not in frame.columns:
+            continue
+        _, uniques = _factorized_keys(frame[col])
+        stats['key_values'][col] = sorted(uniques.tolist())
+
+    return stats
+
+
+def stats_path(table_name: str, output_dir: Path) -> Path:
+    return Path(output_dir) / STATS_DIR_NAME / f"{table_name}.json"
+
+
+def _csv_signature(csv_path: Path) -> Optional[Dict[str, int]]:
+    try:
+        st = csv_path.stat()
+    except OSError:
+        return None
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def write_table_stats(stats: Dict[str, Any], output_dir: Path) -> None:
+    """Persist stats for a table whose CSV has just been written."""
+    output_dir = Path(output_dir)
+    stats = dict(stats, csv=_csv_signature(output_dir / f"{stats['table']}.csv"))
+    path = stats_path(stats['table'], output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(stats, f)
+
+
+def record_table_stats(df: pd.DataFrame, table_name: str, output_dir: Path) -> Dict[str, Any]:
+    """Compute and persist stats for a freshly written table (called by save_output_table)."""
+    stats = compute_table_stats(df, table_name)
+    write_table_stats(stats, output_dir)
+    return stats
+
+
+def load_table_stats(table_name: str, output_dir: Path) -> Optional[Dict[str, Any]]:
+    """Stored stats for a table, or None when missing or stale (CSV changed since)."""
+    output_dir = Path(output_dir)
+    path = stats_path(table_name, output_dir)
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if stats.get('version') != STATS_VERSION:
+        return None
+    signature = _csv_signature(output_dir / f"{table_name}.csv")
+    if signature is None or stats.get('csv') != signature:
+        return None
+    return stats
+
+
+def covers(stats: Dict[str, Any], pk: Optional[str] = None, key_columns=()) -> bool:
+    """True if stats hold the PK and key-column summaries a caller needs."""
+    if pk and pk in stats['columns'] and (stats.get('pk') or {}).get('column') != pk:
+        return False
+    return all(c in stats['key_values'] for c in key_columns if c in stats['columns'])
+
+
+def get_table_stats(
+    table_name: str,
+    output_dir: Path,
+    key_spec: Optional[Dict[str, Dict[str, Any]]] = None,
+    df: Optional[pd.DataFrame] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Stats for a table: stored stats when fresh and sufficient, else re-profiled.
+
+    Args:
+        table_name: Table name
+        output_dir: Directory holding {table_name}.csv
+        key_spec: Key columns required (default: project manifest)
+        df: Already-loaded table to profile instead of reading the CSV
+
+    Returns:
+        Stats dict, or None if the CSV does not exist / cannot be read
+    """
+    output_dir = Path(output_dir)
+    spec = key_spec if key_spec is not None else load_key_spec()
+    wanted = spec.get(table_name, {})
+
+    stats = load_table_stats(table_name, output_dir)
+    if stats is not None and covers(stats, wanted.get('pk'), wanted.get('key_columns', [])):
+        return stats
+
+    if df is None:
+        csv_path = output_dir / f"{table_name}.csv"
+        if not csv_path.exists():
+            return None
+        try:
+            df = pd.read_csv(csv_path, low_memory=False)
+        except Exception as e:
+            log.warning(f"Error reading {table_name}: {e}")
+            return None
+
+    stats = compute_table_stats(df, table_name, spec)
+    try:
+        write_table_stats(stats, output_dir)
+    except OSError as e:
+        log.debug(f"Could not persist stats for {table_name}: {e}")
+    return stats
+
+
+def key_set(stats: Dict[str, Any], column: str, drop_null_markers: bool = False) -> Set[str]:
+    """Distinct canonical values of a key column from stats."""
+    values = set(stats['key_values'].get(column, []))
+    if drop_null_markers:
+        values = {v for v in values if v.lower() not in NULL_MARKERS}
+    return values
@@ -7,6 +7,10 @@ ALL table output should go through this module.
 This handles:
 1. Writing to CSV (always)
 2. Uploading to Supabase (when enabled)
+3. Recording table statistics for verification (src/core/table_stats.py)
+4. Deferred materialization: inside deferred_writes(), tables that several
+   phases rewrite (fact_events, fact_event_players) are kept in memory and
+   written once when the block exits
 
 Usage:
     from src.core.table_writer import save_output_table, enable_supabase, upload_all_tables
@@ -17,6 +21,11 @@ Usage:
     
     # Option B: Upload all at end (after ETL complete)
     upload_all_tables()  # uploads all CSVs from data/output/
+    
+    # Write-once: phases read/save against memory, one CSV write at exit
+    with deferred_writes():
+        events = read_output_table('fact_events', output_dir)
+        save_output_table(events, 'fact_events', output_dir)
 ================================================================================
 """
 
@@ -25,6 +34,8 @@ import numpy as np
 import math
 import logging
 import configparser
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Tuple, List, Optional, Dict, Any
 
@@ -45,6 +56,18 @@ _supabase_batch_size = 500
 # Track what's been uploaded this session
 _uploaded_tables = set()
 
+# Tables rewritten by several phases in one run (deferred inside deferred_writes)
+DEFERRED_TABLES = ('fact_events', 'fact_event_players')
+
+# Deferred materialization state: table -> output dir of its pending write
+_deferred_tables = None
+_deferred_depth = 0
+_pending_writes: Dict[str, Path] = {}
+
+# save_output_table calls vs. CSV writes per table this session
+_save_counts = Counter()
+_write_counts = Counter()
+
 
 def enable_supabase() -> bool:
     """
@@ -165,6 +188,10 @@ def save_output_table(df: pd.DataFrame, table_name: str, output_dir: Optional[Pa
     
     This is the SINGLE function all ETL modules should use to save output tables.
     
+    Inside deferred_writes(), a deferred table is only updated in memory (the
+    table store); the CSV is written once when the block exits. Read such
+    tables back with read_output_table().
+    
     Args:
         df: DataFrame to save
         table_name: Name of the table (without .csv extension)
@@ -178,13 +205,39 @@ def save_output_table(df: pd.DataFrame, table_name: str, output_dir: Optional[Pa
         output_dir = OUTPUT_DIR
     
     output_dir = Path(output_dir)
+    _save_counts[table_name] += 1
+    
+    if _deferred_tables is not None and table_name in _deferred_tables:
+        pending_dir = _pending_writes.get(table_name)
+        if pending_dir is not None and pending_dir.resolve() != output_dir.resolve():
+            _flush_table(table_name)
+        # Later phases read the table as a CSV round trip would return it,
+        # so drop all-null fact columns now; dtypes are optimized at flush
+        if table_name.startswith('fact_') and len(df) > 0:
+            try:
+                from src.core.base_etl import drop_all_null_columns
+                df, _ = drop_all_null_columns(df)
+            except Exception as e:
+                log.debug(f"  Null column removal skipped for {table_name}: {e}")
+        from src.core.table_store import store_table
+        store_table(table_name, df)
+        _pending_writes[table_name] = output_dir
+        return len(df), len(df.columns)
+    
+    return _write_output_table(df, table_name, output_dir, optimize_dtypes)
+
+
+def _write_output_table(df: pd.DataFrame, table_name: str, output_dir: Path, optimize_dtypes: bool = True) -> Tuple[int, int]:
+    """Materialize a table: optimize, upload, cache, write CSV and record stats."""
     output_dir.mkdir(parents=True, exist_ok=True)
+    _write_counts[table_name] += 1
     
     # Optimize data types (v29.6)
     if optimize_dtypes and len(df) > 0:
         try:
             from src.utils.data_type_optimizer import optimize_dataframe_dtypes
-            df = optimize_dataframe_dtypes(df, categorical_threshold=10, optimize_floats=True)
+            df = optimize_dataframe_dtypes(df, categorical_threshold=10, optimize_floats=True,
+                                           table_name=table_name)
         except Exception as e:
             # Don't fail if optimization fails - just log and continue
             log.debug(f"  Data type optimization skipped for {table_name}: {e}")
@@ -221,9 +274,111 @@ def save_output_table(df: pd.DataFrame, table_name: str, output_dir: Optional[Pa
     csv_path = output_dir / f"{table_name}.csv"
     df.to_csv(csv_path, index=False)
     
+    # Profile once while the table is in memory (used by TableVerifier)
+    try:
+        from src.core.table_stats import record_table_stats
+        record_table_stats(df, table_name, output_dir)
+    except Exception as e:
+        log.debug(f"  Table stats skipped for {table_name}: {e}")
+    
     return len(df), len(df.columns)
 
 
+def _flush_table(table_name: str) -> None:
+    """Write one pending table from the table store."""
+    from src.core.table_store import get_table
+    output_dir = _pending_writes.pop(table_name)
+    _write_output_table(get_table(table_name, output_dir), table_name, output_dir)
+
+
+def flush_deferred_tables() -> int:
+    """
+    Write all pending deferred tables now.
+    
+    Returns:
+        Number of tables written
+    """
+    pending = list(_pending_writes)
+    for table_name in pending:
+        _flush_table(table_name)
+    return len(pending)
+
+
+@contextmanager
+def deferred_writes(tables=DEFERRED_TABLES):
+    """
+    Defer CSV writes of the given tables until the block exits.
+    
+    Phases inside the block save and re-read these tables in memory
+    (save_output_table / read_output_table); each table that was saved is
+    written exactly once on exit, even if the block raises. Nested blocks
+    join the outermost one.
+    
+    Args:
+        tables: Table names to defer (default: DEFERRED_TABLES)
+    """
+    global _deferred_tables, _deferred_depth
+    if _deferred_depth == 0:
+        _deferred_tables = set(tables)
+    else:
+        _deferred_tables |= set(tables)
+    _deferred_depth += 1
+    try:
+        yield
+    finally:
+        _deferred_depth -= 1
+        if _deferred_depth == 0:
+            _deferred_tables = None
+            flush_deferred_tables()
+
+
+def read_output_table(table_name: str, output_dir: Optional[Path] = None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Read an output table, preferring a pending deferred version in memory.
+    
+    Args:
+        table_name: Name of the table (without .csv extension)
+        output_dir: Optional output directory (default: data/output)
+        **read_csv_kwargs: Passed to pd.read_csv when reading the CSV
+    
+    Returns:
+        DataFrame (raises like pd.read_csv if the table does not exist)
+    """
+    output_dir = Path(output_dir) if output_dir is not None else OUTPUT_DIR
+    pending_dir = _pending_writes.get(table_name)
+    if pending_dir is not None and pending_dir.resolve() == output_dir.resolve():
+        from src.core.table_store import get_table
+        return get_table(table_name, output_dir)
+    return pd.read_csv(output_dir / f"{table_name}.csv", **read_csv_kwargs)
+
+
+def get_write_report() -> Dict[str, Any]:
+    """
+    Saves vs. CSV writes this session.
+    
+    Returns:
+        Dict with 'saves', 'writes', 'avoided' (redundant rewrites skipped by
+        deferred materialization) and per-table 'avoided_by_table'
+    """
+    avoided = {
+        name: _save_counts[name] - _write_counts[name]
+        for name in _save_counts
+        if _save_counts[name] > _write_counts[name] and name not in _pending_writes
+    }
+    return {
+        'saves': sum(_save_counts.values()),
+        'writes': sum(_write_counts.values()),
+        'avoided': sum(avoided.values()),
+        'avoided_by_table': avoided,
+    }
+
+
+def reset_write_report() -> None:
+    """Reset save/write counters (start of an ETL run)."""
+    _save_counts.clear()
+    _write_counts.clear()
+
+
 def upload_all_tables(output_dir: Optional[Path] = None) -> Dict[str, Any]:
     """
     Upload ALL tables from output directory to Supabase.
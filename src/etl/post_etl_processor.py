@@ -32,7 +32,7 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
-from src.core.table_writer import save_output_table
+from src.core.table_writer import save_output_table, read_output_table, deferred_writes
 
 # Configure logging
 logging.basicConfig(
@@ -191,7 +191,7 @@ def update_fk_in_fact_table(table_name: str, fk_col: str, id_map: Dict[str, str]
     if not path.exists():
         return 0
     
-    df = pd.read_csv(path, low_memory=False)
+    df = read_output_table(table_name, OUTPUT_DIR, low_memory=False)
     if fk_col not in df.columns:
         return 0
     
@@ -279,7 +279,7 @@ def add_game_state_to_events():
     """Add game_state_id to fact_events based on running score."""
     logger.info("Adding game_state_id to fact_events...")
     
-    events = pd.read_csv(OUTPUT_DIR / 'fact_events.csv')
+    events = read_output_table('fact_events', OUTPUT_DIR)
     
     if 'game_state_id' in events.columns and events['game_state_id'].notna().sum() > len(events) * 0.5:
         logger.info("  game_state_id already populated")
@@ -287,7 +287,7 @@ def add_game_state_to_events():
     
     # Need to derive scoring_team_id from tracking data for goals
     # For Goal_Scored events, event_player_1 is the scorer
-    tracking = pd.read_csv(OUTPUT_DIR / 'fact_event_players.csv', low_memory=False)
+    tracking = read_output_table('fact_event_players', OUTPUT_DIR, low_memory=False)
     
     # Get scoring team for goals (from Goal_Scored row, event_player_1)
     goal_scorers = tracking[
@@ -367,7 +367,7 @@ def add_competition_tier_to_events():
     """Add competition_tier_id to fact_events based on opponent ratings."""
     logger.info("Adding competition_tier_id to fact_events...")
     
-    events = pd.read_csv(OUTPUT_DIR / 'fact_events.csv')
+    events = read_output_table('fact_events', OUTPUT_DIR)
     
     if 'competition_tier_id' in events.columns:
         if events['competition_tier_id'].notna().sum() > len(events) * 0.5:
@@ -450,7 +450,7 @@ def add_turnover_quality_id():
     """Add turnover_quality_id based on giveaway/takeaway type."""
     logger.info("Adding turnover_quality_id to fact_events...")
     
-    events = pd.read_csv(OUTPUT_DIR / 'fact_events.csv')
+    events = read_output_table('fact_events', OUTPUT_DIR)
     
     if 'turnover_quality_id' in events.columns:
         if events['turnover_quality_id'].notna().sum() > 0:
@@ -507,7 +507,7 @@ def add_cascade_columns(table_name: str = 'fact_events'):
     if not path.exists():
         return
     
-    df = pd.read_csv(path, low_memory=False)
+    df = read_output_table(table_name, OUTPUT_DIR, low_memory=False)
     
     added_cols = []
     
@@ -545,8 +545,8 @@ def propagate_to_tracking():
     """Propagate new columns from fact_events to fact_event_players."""
     logger.info("Propagating columns to fact_event_players...")
     
-    events = pd.read_csv(OUTPUT_DIR / 'fact_events.csv')
-    tracking = pd.read_csv(OUTPUT_DIR / 'fact_event_players.csv', low_memory=False)
+    events = read_output_table('fact_events', OUTPUT_DIR)
+    tracking = read_output_table('fact_event_players', OUTPUT_DIR, low_memory=False)
     
     # Columns to propagate
     cols_to_check = [
@@ -584,50 +584,52 @@ def main():
         if id_map:
             all_id_maps[dim_name] = (id_col, id_map)
     
-    # Step 2: Update FK references
-    logger.info("\n[2/6] Updating FK references in fact tables...")
-    for fk_col, tables in FK_COLUMNS_MAP.items():
-        # Find which dimension this FK relates to
-        for dim_name, (id_col, id_map) in all_id_maps.items():
-            if id_col == fk_col or id_col.replace('_id', '') in fk_col:
-                for table in tables:
-                    changes = update_fk_in_fact_table(table, fk_col, id_map)
-                    if changes > 0:
-                        logger.info(f"  Updated {changes} rows in {table}.{fk_col}")
-    
-    # Step 3: Add game_state_id
-    logger.info("\n[3/6] Adding game_state_id...")
-    add_game_state_to_events()
-    
-    # Step 4: Add competition_tier_id
-    logger.info("\n[4/6] Adding competition_tier_id...")
-    add_competition_tier_to_events()
-    
-    # Step 5: Add turnover_quality_id and cascade columns
-    logger.info("\n[5/6] Adding cascade columns...")
-    add_turnover_quality_id()
-    add_cascade_columns('fact_events')
-    
-    # Also add to derived tables
-    derived_tables = [
-        'fact_zone_entries', 'fact_zone_exits', 'fact_turnovers_detailed',
-        'fact_rushes', 'fact_breakouts', 'fact_scoring_chances_detailed'
-    ]
-    for table in derived_tables:
-        if (OUTPUT_DIR / f'{table}.csv').exists():
-            add_cascade_columns(table)
-    
-    # Step 6: Propagate to tracking
-    logger.info("\n[6/6] Propagating to tracking tables...")
-    propagate_to_tracking()
-    
+    # Steps 2-6 rewrite fact_events several times: write it once at the end
+    with deferred_writes():
+        # Step 2: Update FK references
+        logger.info("\n[2/6] Updating FK references in fact tables...")
+        for fk_col, tables in FK_COLUMNS_MAP.items():
+            # Find which dimension this FK relates to
+            for dim_name, (id_col, id_map) in all_id_maps.items():
+                if id_col == fk_col or id_col.replace('_id', '') in fk_col:
+                    for table in tables:
+                        changes = update_fk_in_fact_table(table, fk_col, id_map)
+                        if changes > 0:
+                            logger.info(f"  Updated {changes} rows in {table}.{fk_col}")
+    
+        # Step 3: Add game_state_id
+        logger.info("\n[3/6] Adding game_state_id...")
+        add_game_state_to_events()
+    
+        # Step 4: Add competition_tier_id
+        logger.info("\n[4/6] Adding competition_tier_id...")
+        add_competition_tier_to_events()
+    
+        # Step 5: Add turnover_quality_id and cascade columns
+        logger.info("\n[5/6] Adding cascade columns...")
+        add_turnover_quality_id()
+        add_cascade_columns('fact_events')
+    
+        # Also add to derived tables
+        derived_tables = [
+            'fact_zone_entries', 'fact_zone_exits', 'fact_turnovers_detailed',
+            'fact_rushes', 'fact_breakouts', 'fact_scoring_chances_detailed'
+        ]
+        for table in derived_tables:
+            if (OUTPUT_DIR / f'{table}.csv').exists():
+                add_cascade_columns(table)
+    
+        # Step 6: Propagate to tracking
+        logger.info("\n[6/6] Propagating to tracking tables...")
+        propagate_to_tracking()
+
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("POST-ETL PROCESSING COMPLETE")
     logger.info("=" * 60)
     
     # Verify
-    events = pd.read_csv(OUTPUT_DIR / 'fact_events.csv')
+    events = read_output_table('fact_events', OUTPUT_DIR)
     logger.info(f"\nfact_events: {len(events)} rows, {len(events.columns)} columns")
     logger.info(f"  game_state_id: {events['game_state_id'].notna().sum()} populated")
     logger.info(f"  competition_tier_id: {events['competition_tier_id'].notna().sum()} populated")
@@ -8,6 +8,12 @@ Provides the same interface as Excel reads but pulls from Supabase tables.
 This module allows the ETL to read source data from Supabase instead of Excel files.
 The schema in Supabase should mirror the Excel structure.
 
+Tables are read concurrently: row count first, then keyset-paginated key
+ranges (integer keys) or ordered range pages, each retried on failure.
+Tracking loads select only the sheet columns, filter games in batches with
+in_() and keep a per-game copy in data/.supabase_cache that is reused until
+the game's staging rows change (row count / latest updated_at).
+
 Usage:
     from src.ingestion.supabase_source import SupabaseSource
     
@@ -44,10 +50,14 @@ Configuration:
         SUPABASE_KEY=your-service-role-key
 """
 
+import json
 import os
+import time
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from configparser import ConfigParser
 
 # Try to import supabase client
@@ -59,6 +69,99 @@ except ImportError:
     print("Warning: supabase-py not installed. Run: pip install supabase")
 
 
+class SupabaseReadError(Exception):
+    """A page of a Supabase table could not be read after retries."""
+    pass
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Per-game tracking pages cached between ETL runs
+TRACKING_CACHE_DIR = PROJECT_ROOT / 'data' / '.supabase_cache'
+
+# Staging text values that mean "no value" (Excel / str() conversions)
+NULL_TEXT = ('None', 'nan')
+
+
+def decode_page(rows: List[Dict[str, Any]], text: bool = False) -> pd.DataFrame:
+    """
+    Decode one page of PostgREST rows column-wise.
+
+    Args:
+        rows: JSON rows as returned by the API
+        text: Decode every value to its text form (None / 'None' / 'nan' -> NA),
+            matching the all-string frames the Excel loaders produce
+
+    Returns:
+        DataFrame for the page
+    """
+    if not rows:
+        return pd.DataFrame()
+
+    columns = list(rows[0])
+    if any(len(row) != len(columns) for row in rows):
+        columns = list(dict.fromkeys(col for row in rows for col in row))
+
+    data = {}
+    for col in columns:
+        values = [row.get(col) for row in rows]
+        if text:
+            values = [None if v is None else str(v) for v in values]
+            values = [pd.NA if v is None or v in NULL_TEXT else v for v in values]
+        data[col] = np.array(values, dtype=object) if text else values
+    return pd.DataFrame(data, columns=columns)
+
+
+class TrackingCache:
+    """
+    On-disk copies of per-game tracking rows keyed by their staging version.
+
+    Layout: {cache_dir}/manifest.json ({table: {game_id: version}}) plus one
+    pickle per table and game.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / 'manifest.json'
+        self.manifest: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path) as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = {}
+
+    def _path(self, table_name: str, game_id: str) -> Path:
+        return self.cache_dir / table_name / f"{game_id}.pkl"
+
+    def get(self, table_name: str, game_id: str, version: Optional[str]) -> Optional[pd.DataFrame]:
+        """Cached rows if stored for this exact version, else None."""
+        if version is None or self.manifest.get(table_name, {}).get(game_id) != version:
+            return None
+        try:
+            return pd.read_pickle(self._path(table_name, game_id))
+        except Exception:
+            return None
+
+    def put(self, table_name: str, game_id: str, version: Optional[str], df: pd.DataFrame):
+        if version is None:
+            return
+        path = self._path(table_name, game_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(path)
+        self.manifest.setdefault(table_name, {})[game_id] = version
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        self._dirty = False
+
+
 class SupabaseSource:
     """
     Data source that reads from Supabase instead of Excel files.
@@ -88,6 +191,58 @@ class SupabaseSource:
     EVENTS_TABLE = 'stage_events_tracking'
     SHIFTS_TABLE = 'stage_shifts_tracking'
     
+    # Primary keys (src/sql/supabase_staging_tables.sql). Integer keys are read
+    # with keyset pagination; other keys give a stable order for range pages.
+    # Keyless tables (stage_dim_playerurlref, stage_dim_rink_zone) are ordered
+    # by every column instead.
+    INTEGER_KEYS = {
+        'stage_events_tracking': 'id',
+        'stage_shifts_tracking': 'id',
+        'stage_dim_randomnames': 'id',
+        'stage_fact_leadership': 'id',
+    }
+    ORDER_KEYS = {
+        'stage_dim_player': 'player_id',
+        'stage_dim_team': 'team_id',
+        'stage_dim_league': 'league_id',
+        'stage_dim_season': 'season_id',
+        'stage_dim_schedule': 'game_id',
+        'stage_fact_gameroster': 'player_game_id',
+        'stage_fact_registration': 'player_season_registration_id',
+        'stage_fact_draft': 'player_draft_id',
+        'stage_fact_playergames': 'player_game_id',
+    }
+    
+    # Tracking sheet columns the ETL consumes (staging bookkeeping columns
+    # id / created_at / updated_at are not downloaded)
+    EVENTS_COLUMNS = [
+        'game_id', 'tracking_event_index', 'period', 'event_start_min', 'event_start_sec',
+        'event_end_min', 'event_end_sec', 'Type', 'event_detail', 'event_detail_2',
+        'event_successful', 'player_game_number', 'team_venue', 'team_venue_abv', 'role_abrev',
+        'event_team_zone', 'home_team_zone', 'away_team_zone', 'side_of_puck', 'sequence_index',
+        'play_index', 'play_detail1', 'play_detail_2', 'play_detail_successful',
+        'pressured_pressurer', 'zone_change_index', 'linked_event_index', 'shift_index',
+        'home_team', 'away_team', 'duration',
+    ]
+    SHIFTS_COLUMNS = [
+        'game_id', 'shift_index', 'Period', 'shift_start_type', 'shift_stop_type',
+        'shift_start_min', 'shift_start_sec', 'shift_end_min', 'shift_end_sec', 'home_team',
+        'away_team', 'home_forward_1', 'home_forward_2', 'home_forward_3', 'home_defense_1',
+        'home_defense_2', 'home_goalie', 'away_forward_1', 'away_forward_2', 'away_forward_3',
+        'away_defense_1', 'away_defense_2', 'away_goalie', 'strength', 'situation',
+    ]
+    
+    # Row version columns, newest first (updated_at needs the staging migration)
+    VERSION_COLUMNS = ('updated_at', 'created_at')
+    
+    # Games per in_() filter
+    GAME_BATCH_SIZE = 25
+    
+    PAGE_SIZE = 1000
+    READ_WORKERS = 8
+    PAGE_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+    
     def __init__(self, url: str = None, key: str = None, config_path: str = None):
         """
         Initialize Supabase connection.
@@ -118,6 +273,7 @@ class SupabaseSource:
             )
         
         self.client: Client = create_client(self.url, self.key)
+        self.cache_dir = TRACKING_CACHE_DIR
         self._test_connection()
     
     def _test_connection(self):
@@ -129,6 +285,17 @@ class SupabaseSource:
         except Exception as e:
             print(f"⚠ Supabase connection test failed: {e}")
     
+    @staticmethod
+    def _apply_filters(query, filters: Dict = None):
+        """Apply column=value (or column in list) filters to a query."""
+        if filters:
+            for col, val in filters.items():
+                if isinstance(val, list):
+                    query = query.in_(col, val)
+                else:
+                    query = query.eq(col, val)
+        return query
+    
     def _read_table(self, table_name: str, filters: Dict = None, limit: int = None) -> pd.DataFrame:
         """
         Read a table from Supabase into a DataFrame.
@@ -142,15 +309,7 @@ class SupabaseSource:
             DataFrame with table data
         """
         try:
-            query = self.client.table(table_name).select('*')
-            
-            # Apply filters
-            if filters:
-                for col, val in filters.items():
-                    if isinstance(val, list):
-                        query = query.in_(col, val)
-                    else:
-                        query = query.eq(col, val)
+            query = self._apply_filters(self.client.table(table_name).select('*'), filters)
             
             # Apply limit
             if limit:
@@ -167,51 +326,151 @@ class SupabaseSource:
             print(f"Error reading {table_name}: {e}")
             return pd.DataFrame()
     
-    def _read_table_paginated(self, table_name: str, filters: Dict = None, 
-                              page_size: int = 1000) -> pd.DataFrame:
+    def _execute_with_retry(self, build_query, what: str):
+        """Execute a query, retrying with backoff; raise SupabaseReadError when exhausted."""
+        for attempt in range(self.PAGE_RETRIES + 1):
+            try:
+                return build_query().execute()
+            except Exception as e:
+                if attempt == self.PAGE_RETRIES:
+                    raise SupabaseReadError(f"{what} failed after {attempt + 1} attempts: {e}") from e
+                time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+    
+    def _count_rows(self, table_name: str, filters: Dict = None) -> int:
+        """Exact row count for a (filtered) table."""
+        response = self._execute_with_retry(
+            lambda: self._apply_filters(
+                self.client.table(table_name).select('*', count='exact'), filters
+            ).limit(0),
+            f"Counting {table_name}"
+        )
+        return response.count or 0
+    
+    def _key_bound(self, table_name: str, key: str, filters: Dict, desc: bool) -> Optional[int]:
+        """Smallest / largest integer key matching the filters."""
+        response = self._execute_with_retry(
+            lambda: self._apply_filters(
+                self.client.table(table_name).select(key), filters
+            ).order(key, desc=desc).limit(1),
+            f"Reading {table_name} key bounds"
+        )
+        return int(response.data[0][key]) if response.data else None
+    
+    def _read_key_range(self, table_name: str, key: str, filters: Dict, low: int, high: int,
+                        page_size: int, text: bool, select: str = '*') -> List[pd.DataFrame]:
+        """Keyset-paginate low < key <= high."""
+        pages = []
+        last = low
+        while True:
+            response = self._execute_with_retry(
+                lambda last=last: self._apply_filters(
+                    self.client.table(table_name).select(select), filters
+                ).gt(key, last).lte(key, high).order(key).limit(page_size),
+                f"Reading {table_name} after {key}={last}"
+            )
+            rows = response.data or []
+            if rows:
+                pages.append(decode_page(rows, text))
+            if len(rows) < page_size:
+                return pages
+            last = int(rows[-1][key])
+    
+    def _column_names(self, table_name: str, filters: Dict = None) -> List[str]:
+        """Column names of a table, read from its first row."""
+        response = self._execute_with_retry(
+            lambda: self._apply_filters(self.client.table(table_name).select('*'), filters).limit(1),
+            f"Reading {table_name} columns"
+        )
+        return list(response.data[0]) if response.data else []
+    
+    def _read_offset_page(self, table_name: str, order_by: List[str], filters: Dict,
+                          offset: int, page_size: int, text: bool, select: str = '*') -> pd.DataFrame:
+        """One page of rows [offset, offset + page_size) ordered by the order_by columns."""
+        def build():
+            query = self._apply_filters(self.client.table(table_name).select(select), filters)
+            for col in order_by:
+                query = query.order(col)
+            return query.range(offset, offset + page_size - 1)
+        response = self._execute_with_retry(build, f"Reading {table_name} at offset {offset}")
+        return decode_page(response.data or [], text)
+    
+    def _read_table_paginated(self, table_name: str, filters: Dict = None,
+                              page_size: int = None, text: bool = False,
+                              max_workers: int = None, columns: List[str] = None) -> pd.DataFrame:
         """
-        Read a large table with pagination.
+        Read a large table with concurrent pagination.
+        
+        The row count is read first. Tables with an integer key are split into
+        key ranges that are keyset-paginated concurrently; other tables fetch
+        their offset pages concurrently, ordered by primary key (or by every
+        column when the table has none, so pages cannot overlap). All requests
+        share the client's connection pool. Failed pages are retried and raise
+        SupabaseReadError rather than returning a truncated table.
         
         Args:
             table_name: Name of the Supabase table
             filters: Optional dict of column=value filters
-            page_size: Rows per page (default 1000)
+            page_size: Rows per page (default PAGE_SIZE)
+            text: Decode values as text (see decode_page)
+            max_workers: Concurrent requests (default READ_WORKERS)
+            columns: Columns to select (default: all); the paging key is
+                fetched as well but only returned if requested
             
         Returns:
             DataFrame with all table data
         """
-        all_data = []
-        offset = 0
+        page_size = page_size or self.PAGE_SIZE
+        max_workers = max_workers or self.READ_WORKERS
         
-        while True:
-            try:
-                query = self.client.table(table_name).select('*')
-                
-                if filters:
-                    for col, val in filters.items():
-                        if isinstance(val, list):
-                            query = query.in_(col, val)
-                        else:
-                            query = query.eq(col, val)
-                
-                query = query.range(offset, offset + page_size - 1)
-                response = query.execute()
-                
-                if not response.data:
-                    break
-                
-                all_data.extend(response.data)
-                
-                if len(response.data) < page_size:
-                    break
-                
-                offset += page_size
-                
-            except Exception as e:
-                print(f"Error reading {table_name} at offset {offset}: {e}")
-                break
-        
-        return pd.DataFrame(all_data) if all_data else pd.DataFrame()
+        total = self._count_rows(table_name, filters)
+        if total == 0:
+            return pd.DataFrame()
+        n_pages = -(-total // page_size)
+        workers = max(1, min(max_workers, n_pages))
+        
+        key = self.INTEGER_KEYS.get(table_name)
+        order_key = key or self.ORDER_KEYS.get(table_name)
+        select = '*'
+        if columns:
+            select = ','.join(columns if order_key in columns or not order_key else columns + [order_key])
+        
+        if key:
+            low = self._key_bound(table_name, key, filters, desc=False)
+            high = self._key_bound(table_name, key, filters, desc=True)
+            if low is None:
+                return pd.DataFrame()
+            # Equal-width key ranges (low - 1, high]; one keyset walk per range
+            edges = np.linspace(low - 1, high, workers + 1).astype(np.int64)
+            ranges = [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                parts = executor.map(
+                    lambda bounds: self._read_key_range(table_name, key, filters, *bounds, page_size, text, select),
+                    ranges
+                )
+                pages = [page for part in parts for page in part]
+        else:
+            # Offset pages are only disjoint under a total order
+            order_by = [order_key] if order_key else columns or self._column_names(table_name, filters)
+            offsets = range(0, total, page_size)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = list(executor.map(
+                    lambda offset: self._read_offset_page(table_name, order_by, filters, offset, page_size, text, select),
+                    offsets
+                ))
+            # Rows added after the count was taken
+            while len(pages[-1]) == page_size:
+                pages.append(self._read_offset_page(
+                    table_name, order_by, filters, len(pages) * page_size, page_size, text, select))
+        
+        pages = [page for page in pages if len(page)]
+        if not pages:
+            return pd.DataFrame()
+        df = pd.concat(pages, ignore_index=True) if len(pages) > 1 else pages[0]
+        if columns and order_key not in columns:
+            df = df.drop(columns=[order_key])
+        if len(df) != total:
+            print(f"  Note: {table_name} returned {len(df):,} rows, count was {total:,} (changed during read)")
+        return df
     
     def load_blb_tables(self) -> Dict[str, pd.DataFrame]:
         """
@@ -228,22 +487,19 @@ class SupabaseSource:
         for output_name, supabase_table in self.BLB_TABLE_MAP.items():
             print(f"  Loading {output_name} from {supabase_table}...")
             
-            df = self._read_table_paginated(supabase_table)
+            # All columns as text (matching Excel behavior)
+            df = self._read_table_paginated(supabase_table, text=True)
             
             if df.empty:
                 print(f"    ⚠ No data found in {supabase_table}")
                 continue
             
-            # Convert all columns to string (matching Excel behavior)
-            df = df.astype(str)
-            df = df.replace('None', pd.NA).replace('nan', pd.NA)
-            
             loaded[output_name] = df
             print(f"    ✓ {output_name}: {len(df):,} rows")
         
         return loaded
     
-    def load_tracking_data(self, game_id: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def load_tracking_data(self, game_id: str, use_cache: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Load tracking data for a specific game from Supabase.
         
@@ -251,76 +507,124 @@ class SupabaseSource:
         
         Args:
             game_id: The game ID to load
+            use_cache: Reuse the local copy if the game is unchanged in staging
             
         Returns:
             Tuple of (events_df, shifts_df)
         """
         print(f"Loading tracking data for game {game_id} from Supabase...")
         
-        # Load events
-        events_df = self._read_table_paginated(
-            self.EVENTS_TABLE, 
-            filters={'game_id': str(game_id)}
-        )
-        
+        events_df = self._load_tracking_table(self.EVENTS_TABLE, self.EVENTS_COLUMNS, [str(game_id)], use_cache)
         if not events_df.empty:
-            events_df = events_df.astype(str)
-            events_df = events_df.replace('None', pd.NA).replace('nan', pd.NA)
             print(f"  ✓ Events: {len(events_df):,} rows")
         else:
             print(f"  ⚠ No events found for game {game_id}")
         
-        # Load shifts
-        shifts_df = self._read_table_paginated(
-            self.SHIFTS_TABLE,
-            filters={'game_id': str(game_id)}
-        )
-        
+        shifts_df = self._load_tracking_table(self.SHIFTS_TABLE, self.SHIFTS_COLUMNS, [str(game_id)], use_cache)
         if not shifts_df.empty:
-            shifts_df = shifts_df.astype(str)
-            shifts_df = shifts_df.replace('None', pd.NA).replace('nan', pd.NA)
             print(f"  ✓ Shifts: {len(shifts_df):,} rows")
         else:
             print(f"  ⚠ No shifts found for game {game_id}")
         
         return events_df, shifts_df
     
-    def load_all_tracking_data(self, game_ids: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def load_all_tracking_data(self, game_ids: List[str], use_cache: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Load tracking data for multiple games.
         
         Args:
             game_ids: List of game IDs to load
+            use_cache: Reuse local copies of games unchanged in staging
             
         Returns:
             Tuple of (combined_events_df, combined_shifts_df)
         """
         print(f"Loading tracking data for {len(game_ids)} games from Supabase...")
+        game_ids = [str(g) for g in game_ids]
         
-        # Load all events for these games
-        events_df = self._read_table_paginated(
-            self.EVENTS_TABLE,
-            filters={'game_id': game_ids}
-        )
-        
+        events_df = self._load_tracking_table(self.EVENTS_TABLE, self.EVENTS_COLUMNS, game_ids, use_cache)
         if not events_df.empty:
-            events_df = events_df.astype(str)
-            events_df = events_df.replace('None', pd.NA).replace('nan', pd.NA)
             print(f"  ✓ Events: {len(events_df):,} rows, {events_df['game_id'].nunique()} games")
         
-        # Load all shifts for these games
-        shifts_df = self._read_table_paginated(
-            self.SHIFTS_TABLE,
-            filters={'game_id': game_ids}
-        )
-        
+        shifts_df = self._load_tracking_table(self.SHIFTS_TABLE, self.SHIFTS_COLUMNS, game_ids, use_cache)
         if not shifts_df.empty:
-            shifts_df = shifts_df.astype(str)
-            shifts_df = shifts_df.replace('None', pd.NA).replace('nan', pd.NA)
             print(f"  ✓ Shifts: {len(shifts_df):,} rows, {shifts_df['game_id'].nunique()} games")
         
         return events_df, shifts_df
     
+    def _load_tracking_table(self, table_name: str, columns: List[str], game_ids: List[str],
+                             use_cache: bool = True) -> pd.DataFrame:
+        """
+        Projected, game-batched read of a tracking table, served from the
+        local cache for games whose staging rows have not changed.
+        """
+        game_ids = list(dict.fromkeys(game_ids))
+        cache = TrackingCache(self.cache_dir) if use_cache else None
+        versions = self._game_versions(table_name, game_ids) if cache else {}
+        
+        frames = {}
+        stale = []
+        for game_id in game_ids:
+            cached = cache.get(table_name, game_id, versions.get(game_id)) if cache else None
+            if cached is not None:
+                frames[game_id] = cached
+            elif not cache or versions.get(game_id) is not None:
+                stale.append(game_id)
+        if cache and frames:
+            print(f"  {table_name}: {len(frames)} unchanged games from cache")
+        
+        # Pages of each batch of games are fetched concurrently
+        for i in range(0, len(stale), self.GAME_BATCH_SIZE):
+            batch = stale[i:i + self.GAME_BATCH_SIZE]
+            df = self._read_table_paginated(table_name, filters={'game_id': batch}, text=True, columns=columns)
+            by_game = dict(tuple(df.groupby('game_id', sort=False))) if not df.empty else {}
+            for game_id in batch:
+                game_df = by_game.get(game_id, pd.DataFrame(columns=df.columns)).reset_index(drop=True)
+                frames[game_id] = game_df
+                if cache:
+                    cache.put(table_name, game_id, versions.get(game_id), game_df)
+        if cache:
+            cache.save()
+        
+        parts = [frames[g] for g in game_ids if g in frames and len(frames[g])]
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    
+    def _version_column(self, table_name: str) -> str:
+        """First VERSION_COLUMNS column present on the table."""
+        if not hasattr(self, '_version_columns'):
+            self._version_columns = {}
+        if table_name not in self._version_columns:
+            for col in self.VERSION_COLUMNS:
+                try:
+                    self.client.table(table_name).select(col).limit(1).execute()
+                    break
+                except Exception:
+                    continue
+            self._version_columns[table_name] = col
+        return self._version_columns[table_name]
+    
+    def _game_versions(self, table_name: str, game_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Version of each game's staging rows: row count plus latest row
+        timestamp (None for games with no rows). Queried concurrently.
+        """
+        col = self._version_column(table_name)
+        
+        def version(game_id):
+            response = self._execute_with_retry(
+                lambda: self.client.table(table_name).select(col, count='exact')
+                    .eq('game_id', game_id).order(col, desc=True).limit(1),
+                f"Reading {table_name} version for game {game_id}"
+            )
+            if not response.count:
+                return None
+            return f"{response.count}:{response.data[0][col] if response.data else ''}"
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.READ_WORKERS, len(game_ids)))) as executor:
+            return dict(zip(game_ids, executor.map(version, game_ids)))
+    
     def get_available_games(self) -> List[str]:
         """
         Get list of game IDs that have tracking data in Supabase.
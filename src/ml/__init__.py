@@ -0,0 +1,32 @@
+"""
+BenchSight ML Modules
+=====================
+
+Precomputed artifacts and vectorized models served by the API ML layer:
+
+- similarity_index: Normalized per-player feature vectors for similar-player search
+- season_simulator: Vectorized Monte Carlo playoff/seed probabilities
+- lineup_optimizer: Forward trio / defense pair selection from line-combo stats
+"""
+
+from .similarity_index import (
+    PlayerSimilarityIndex,
+    build_player_similarity_index,
+    SIMILARITY_FEATURES,
+    ML_OUTPUT_DIR,
+)
+from .season_simulator import (
+    simulate_season,
+    SeasonSimulatorCache,
+)
+from .lineup_optimizer import LineupModel
+
+__all__ = [
+    'PlayerSimilarityIndex',
+    'build_player_similarity_index',
+    'SIMILARITY_FEATURES',
+    'ML_OUTPUT_DIR',
+    'simulate_season',
+    'SeasonSimulatorCache',
+    'LineupModel',
+]
@@ -0,0 +1,338 @@
+"""
+Lineup Optimizer
+================
+
+Chooses forward trios and defense pairs that maximize expected on-ice
+share (CF%, FF% or GF%) from line-combo and pair statistics.
+
+Scoring (all shrunk toward 50% by PRIOR_EVENTS pseudo-events):
+- Pair score: pair's on-ice share together from fact_h2h (same_team rows),
+  falling back to fact_wowy "together" totals
+- Trio score: mean of its three pair scores, blended with the trio's own
+  observed share in fact_line_combos weighted by sample size
+- Defense pair score: fact_line_combos defense pairs, else the pair score
+
+Pair matrices and trio tensors are precomputed once per (team, season,
+metric) in a LineupModel. Each request only subsets them to the available
+roster and runs a branch-and-bound search over disjoint lines, so
+iterating on availability is a few milliseconds.
+
+Note: xGF% is not tracked at pair/line level (fact_line_combos, fact_h2h,
+fact_wowy have no xG columns), so CF% is the default objective.
+
+Usage:
+    from src.ml.lineup_optimizer import LineupModel
+
+    model = LineupModel.build(line_combos, h2h, wowy, team_id='T001', season_id='N20252026F')
+    model.optimize(excluded_player_ids=['P100003'])
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-events at 50% mixed into every observed share
+PRIOR_EVENTS = 20
+
+MAX_FORWARD_LINES = 4
+MAX_DEFENSE_PAIRS = 3
+
+# metric -> (for, against) columns in fact_line_combos / fact_h2h, fact_wowy
+# (fact_wowy has no fenwick totals, so FF% pairs come from fact_h2h only)
+METRIC_COLUMNS = {
+    'cf_pct': (('corsi_for', 'corsi_against'), ('cf_together', 'ca_together')),
+    'ff_pct': (('fenwick_for', 'fenwick_against'), None),
+    'gf_pct': (('goals_for', 'goals_against'), ('gf_together', 'ga_together')),
+}
+
+
+def _shrunk_pct(for_: np.ndarray, against: np.ndarray, prior: float = PRIOR_EVENTS) -> np.ndarray:
+    """On-ice share (0-100) shrunk toward 50%."""
+    for_ = np.asarray(for_, dtype=np.float64)
+    against = np.asarray(against, dtype=np.float64)
+    return (for_ + prior / 2) / (for_ + against + prior) * 100
+
+
+def _team_rows(df: pd.DataFrame, team_id: str) -> pd.DataFrame:
+    """Rows where the venue's team is team_id."""
+    if len(df) == 0 or not {'venue', 'home_team_id', 'away_team_id'} <= set(df.columns):
+        return df.iloc[0:0]
+    venue = df['venue'].astype(str).str.lower()
+    team = np.where(venue == 'home', df['home_team_id'].astype(str), df['away_team_id'].astype(str))
+    return df[team == str(team_id)]
+
+
+def _parse_ids(value) -> List[str]:
+    """Player ids from a JSON list or comma-separated string."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    text = str(value).strip()
+    if text.startswith('['):
+        try:
+            return [str(v) for v in json.loads(text)]
+        except ValueError:
+            pass
+    return [v.strip() for v in text.split(',') if v.strip()]
+
+
+def _best_disjoint_groups(groups: np.ndarray, scores: np.ndarray,
+                          n_groups: int) -> Tuple[List[int], float]:
+    """
+    Branch-and-bound: pick n_groups pairwise-disjoint groups maximizing total score.
+
+    Args:
+        groups: [m x size] player indices per candidate group
+        scores: [m] group scores
+        n_groups: Number of groups to choose
+
+    Returns:
+        (chosen candidate rows, total score); empty if infeasible
+    """
+    if n_groups <= 0 or len(groups) == 0:
+        return [], 0.0
+
+    order = np.argsort(-scores, kind='stable')
+    groups, scores = groups[order], scores[order]
+    masks = [sum(1 << int(p) for p in g) for g in groups]
+    score_list = scores.tolist()
+    m = len(score_list)
+
+    best: Dict[str, object] = {'total': -np.inf, 'picks': []}
+    picks: List[int] = []
+
+    def search(start: int, used: int, total: float):
+        remaining = n_groups - len(picks)
+        if remaining == 0:
+            if total > best['total']:
+                best['total'], best['picks'] = total, list(picks)
+            return
+        # Scores are sorted, so the next `remaining` candidates bound the gain
+        if start + remaining > m or total + sum(score_list[start:start + remaining]) <= best['total']:
+            return
+        for i in range(start, m):
+            if total + score_list[i] * remaining <= best['total']:
+                return
+            if masks[i] & used:
+                continue
+            picks.append(i)
+            search(i + 1, used | masks[i], total + score_list[i])
+            picks.pop()
+
+    search(0, 0, 0.0)
+    if not best['picks']:
+        return [], 0.0
+    return [int(order[i]) for i in best['picks']], float(best['total'])
+
+
+@dataclass
+class LineupModel:
+    """Precomputed pair/trio scores for one team-season and metric."""
+
+    team_id: str
+    season_id: Optional[str]
+    metric: str
+    forwards: List[str]
+    defense: List[str]
+    forward_pairs: np.ndarray = field(repr=False)    # [nF x nF] pair scores
+    trio_index: np.ndarray = field(repr=False)       # [m x 3] forward indices, i < j < k
+    trio_scores: np.ndarray = field(repr=False)      # [m] trio scores
+    defense_pairs: np.ndarray = field(repr=False)    # [nD x nD] pair scores
+
+    @classmethod
+    def build(cls, line_combos: pd.DataFrame, h2h: pd.DataFrame, wowy: pd.DataFrame,
+              team_id: str, season_id: Optional[str] = None, metric: str = 'cf_pct') -> 'LineupModel':
+        """
+        Precompute score matrices for a team from line/pair history.
+
+        Args:
+            line_combos: fact_line_combos
+            h2h: fact_h2h
+            wowy: fact_wowy
+            team_id: Team to optimize
+            season_id: Restrict to this season (None = all history)
+            metric: 'cf_pct', 'ff_pct' or 'gf_pct'
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unsupported metric '{metric}', expected one of {list(METRIC_COLUMNS)}")
+        (for_col, against_col), wowy_cols = METRIC_COLUMNS[metric]
+
+        combos = _team_rows(line_combos, team_id)
+        if season_id is not None and 'season_id' in combos.columns:
+            combos = combos[combos['season_id'].astype(str) == str(season_id)]
+        team_games = set(combos['game_id'].astype(str)) if len(combos) else set()
+
+        # Roster and positions from combo history (players listed as forwards vs defense)
+        combo_type = combos['combo_type'] if 'combo_type' in combos.columns else pd.Series(None, index=combos.index)
+        fwd = combos[combo_type == 'forward']
+        dfn = combos[combo_type == 'defense']
+        fwd_ids = fwd['forward_combo'].map(_parse_ids) if 'forward_combo' in fwd.columns else pd.Series(dtype=object)
+        def_ids = dfn['defense_combo'].map(_parse_ids) if 'defense_combo' in dfn.columns else pd.Series(dtype=object)
+        forwards = sorted({p for ids in fwd_ids for p in ids})
+        defense = sorted({p for ids in def_ids for p in ids} - set(forwards))
+        players = forwards + defense
+        pidx = {p: i for i, p in enumerate(players)}
+        n = len(players)
+
+        # Pair for/against totals: h2h same-team rows, wowy fills pairs h2h lacks
+        pair_for = np.zeros((n, n))
+        pair_against = np.zeros((n, n))
+        seen = np.zeros((n, n), dtype=bool)
+        for table, cols, same_team_only in ((h2h, (for_col, against_col), True),
+                                            (wowy, wowy_cols, False)):
+            rows = _team_rows(table, team_id)
+            if cols is None or len(rows) == 0 or not set(cols) <= set(rows.columns):
+                continue
+            if team_games:
+                rows = rows[rows['game_id'].astype(str).isin(team_games)]
+            if same_team_only and 'same_team' in rows.columns:
+                rows = rows[rows['same_team'].astype(str).str.lower().isin(['true', '1', '1.0'])]
+            i = rows['player_1_id'].astype(str).map(pidx)
+            j = rows['player_2_id'].astype(str).map(pidx)
+            ok = (i.notna() & j.notna()).to_numpy()
+            i, j = i[ok].astype(int).to_numpy(), j[ok].astype(int).to_numpy()
+            f = pd.to_numeric(rows[cols[0]], errors='coerce').fillna(0).to_numpy()[ok]
+            a = pd.to_numeric(rows[cols[1]], errors='coerce').fillna(0).to_numpy()[ok]
+            tf, ta = np.zeros((n, n)), np.zeros((n, n))
+            np.add.at(tf, (i, j), f)
+            np.add.at(ta, (i, j), a)
+            tf, ta = tf + tf.T, ta + ta.T
+            new = ((tf + ta) > 0) & ~seen
+            pair_for[new] = tf[new]
+            pair_against[new] = ta[new]
+            seen |= new
+        pair_scores = _shrunk_pct(pair_for, pair_against)
+
+        nf = len(forwards)
+        forward_pairs = pair_scores[:nf, :nf]
+        defense_pairs = pair_scores[nf:, nf:].copy()
+
+        # Trio tensor: mean pair score, blended with observed trio share
+        trio_index = np.array(list(combinations(range(nf), 3)), dtype=np.int64).reshape(-1, 3)
+        if len(trio_index):
+            a, b, c = trio_index.T
+            trio_values = (forward_pairs[a, b] + forward_pairs[a, c] + forward_pairs[b, c]) / 3
+        else:
+            trio_values = np.zeros(0)
+        trio_values = cls._blend_observed(trio_values, trio_index, fwd, fwd_ids, pidx,
+                                          for_col, against_col, group_size=3, n=nf)
+
+        if len(defense):
+            pair_index = np.array(list(combinations(range(len(defense)), 2)), dtype=np.int64).reshape(-1, 2)
+            pair_values = defense_pairs[pair_index[:, 0], pair_index[:, 1]] if len(pair_index) else np.zeros(0)
+            dpidx = {p: i for i, p in enumerate(defense)}
+            pair_values = cls._blend_observed(pair_values, pair_index, dfn, def_ids, dpidx,
+                                              for_col, against_col, group_size=2, n=len(defense))
+            defense_pairs[pair_index[:, 0], pair_index[:, 1]] = pair_values
+            defense_pairs[pair_index[:, 1], pair_index[:, 0]] = pair_values
+
+        return cls(
+            team_id=str(team_id),
+            season_id=season_id,
+            metric=metric,
+            forwards=forwards,
+            defense=defense,
+            forward_pairs=forward_pairs,
+            trio_index=trio_index,
+            trio_scores=trio_values,
+            defense_pairs=defense_pairs,
+        )
+
+    @staticmethod
+    def _blend_observed(values: np.ndarray, index: np.ndarray, combos: pd.DataFrame,
+                        combo_ids: pd.Series, pidx: Dict[str, int], for_col: str,
+                        against_col: str, group_size: int, n: int) -> np.ndarray:
+        """Blend modelled group scores with observed line-combo shares by sample size."""
+        if len(values) == 0 or len(combos) == 0 or for_col not in combos.columns:
+            return values
+        # Encode each group as a sorted index tuple -> position in `index`
+        base = np.array([n ** k for k in range(group_size)][::-1], dtype=np.int64)
+        lookup = {int(code): pos for pos, code in enumerate(index @ base)}
+
+        obs_for = np.zeros(len(values))
+        obs_against = np.zeros(len(values))
+        f = pd.to_numeric(combos[for_col], errors='coerce').fillna(0).to_numpy()
+        a = pd.to_numeric(combos[against_col], errors='coerce').fillna(0).to_numpy()
+        for ids, cf, ca in zip(combo_ids, f, a):
+            idx = sorted(pidx[p] for p in ids if p in pidx)
+            if len(idx) != group_size:
+                continue
+            pos = lookup.get(int(np.dot(idx, base)))
+            if pos is not None:
+                obs_for[pos] += cf
+                obs_against[pos] += ca
+
+        events = obs_for + obs_against
+        weight = events / (events + PRIOR_EVENTS)
+        return (1 - weight) * values + weight * _shrunk_pct(obs_for, obs_against)
+
+    def optimize(self, available_player_ids: Optional[Iterable[str]] = None,
+                 excluded_player_ids: Optional[Iterable[str]] = None,
+                 n_forward_lines: Optional[int] = None,
+                 n_defense_pairs: Optional[int] = None) -> Dict[str, object]:
+        """
+        Best disjoint forward lines and defense pairs for the available roster.
+
+        Args:
+            available_player_ids: Restrict to these players (default: full roster)
+            excluded_player_ids: Players unavailable (injured, absent)
+            n_forward_lines: Lines to fill (default: as many as roster allows, max 4)
+            n_defense_pairs: Pairs to fill (default: as many as roster allows, max 3)
+
+        Returns:
+            Dict with forward_lines, defense_pairs and expected_performance
+        """
+        allowed = set(self.forwards) | set(self.defense)
+        if available_player_ids is not None:
+            allowed &= {str(p) for p in available_player_ids}
+        if excluded_player_ids is not None:
+            allowed -= {str(p) for p in excluded_player_ids}
+
+        f_ok = np.array([p in allowed for p in self.forwards], dtype=bool)
+        d_ok = np.array([p in allowed for p in self.defense], dtype=bool)
+
+        n_lines = n_forward_lines if n_forward_lines is not None else min(MAX_FORWARD_LINES, int(f_ok.sum()) // 3)
+        n_pairs = n_defense_pairs if n_defense_pairs is not None else min(MAX_DEFENSE_PAIRS, int(d_ok.sum()) // 2)
+
+        trio_mask = f_ok[self.trio_index].all(axis=1) if len(self.trio_index) else np.zeros(0, dtype=bool)
+        trio_rows, trio_total = _best_disjoint_groups(
+            self.trio_index[trio_mask], self.trio_scores[trio_mask], n_lines)
+        trio_candidates = np.flatnonzero(trio_mask)
+
+        forward_lines = []
+        for r in trio_rows:
+            row = trio_candidates[r]
+            ids = [self.forwards[i] for i in self.trio_index[row]]
+            forward_lines.append({
+                'player1': ids[0], 'player2': ids[1], 'player3': ids[2],
+                f'expected_{self.metric}': round(float(self.trio_scores[row]), 2),
+            })
+
+        d_idx = np.flatnonzero(d_ok)
+        pair_index = np.array(list(combinations(d_idx, 2)), dtype=np.int64).reshape(-1, 2)
+        pair_values = self.defense_pairs[pair_index[:, 0], pair_index[:, 1]] if len(pair_index) else np.zeros(0)
+        pair_rows, pair_total = _best_disjoint_groups(pair_index, pair_values, n_pairs)
+        defense_pairs = [{
+            'player1': self.defense[pair_index[r, 0]],
+            'player2': self.defense[pair_index[r, 1]],
+            f'expected_{self.metric}': round(float(pair_values[r]), 2),
+        } for r in pair_rows]
+
+        sort_key = f'expected_{self.metric}'
+        forward_lines.sort(key=lambda x: -x[sort_key])
+        defense_pairs.sort(key=lambda x: -x[sort_key])
+
+        n_units = len(forward_lines) + len(defense_pairs)
+        return {
+            'forward_lines': forward_lines,
+            'defense_pairs': defense_pairs,
+            'expected_performance': round((trio_total + pair_total) / n_units, 2) if n_units else 50.0,
+        }
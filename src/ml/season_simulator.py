@@ -0,0 +1,367 @@
+"""
+Monte Carlo Season Simulator
+============================
+
+Simulates the remainder of a regular season many times at once to estimate
+seed, playoff and championship probabilities per team.
+
+Model:
+- Team attack/defense strengths from fact_team_game_stats goals for/against
+  (plus completed dim_schedule results for untracked games), shrunk toward
+  the league average by PRIOR_GAMES pseudo-games
+- Each remaining game: home/away goals ~ Poisson(avg * attack * defense)
+- Standings are ranked with src.calculations.standings.standings_order
+  (points, wins, goal differential, goals for)
+- Playoffs: single-game knockout bracket, seed 1 vs N, ties decided 50/50
+
+All remaining games are simulated together as a [games x sims] matrix;
+standings are accumulated with team incidence matrices, so 100k+ seasons
+take well under a second for a beer-league schedule.
+
+Usage:
+    from src.ml.season_simulator import simulate_season
+
+    result = simulate_season(schedule, team_game_stats, 'N20252026F')
+    result['teams']['T001']['playoff_probability']
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.calculations.standings import POINTS_PER_WIN, POINTS_PER_LOSS, standings_order
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATIONS = 100_000
+
+# Pseudo-games at league average mixed into every team's strength estimate
+PRIOR_GAMES = 3
+
+# Used when no playoff seeding can be found in dim_schedule
+DEFAULT_PLAYOFF_SPOTS = 4
+
+# Process simulations in chunks to bound peak memory
+SIM_CHUNK_SIZE = 25_000
+
+
+def _regular_season_games(schedule: pd.DataFrame, season_id: str) -> pd.DataFrame:
+    """Regular-season games for one season, with home/away ids as strings."""
+    games = schedule
+    if 'season_id' in games.columns:
+        games = games[games['season_id'].astype(str) == str(season_id)]
+    if 'game_type' in games.columns:
+        games = games[games['game_type'].fillna('Regular') == 'Regular']
+    games = games.dropna(subset=['home_team_id', 'away_team_id']).copy()
+    games['home_team_id'] = games['home_team_id'].astype(str)
+    games['away_team_id'] = games['away_team_id'].astype(str)
+    return games
+
+
+def _completed_mask(games: pd.DataFrame) -> pd.Series:
+    """Games with a final score recorded."""
+    if 'home_total_goals' not in games.columns or 'away_total_goals' not in games.columns:
+        return pd.Series(False, index=games.index)
+    return games['home_total_goals'].notna() & games['away_total_goals'].notna()
+
+
+def _season_team_stats(team_game_stats: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
+    """(game_id, team_id, goals) rows of fact_team_game_stats for the season's games."""
+    if len(team_game_stats) == 0 or not {'game_id', 'team_id', 'goals'} <= set(team_game_stats.columns):
+        return pd.DataFrame(columns=['game_id', 'team_id', 'goals'])
+    tgs = team_game_stats[['game_id', 'team_id', 'goals']].dropna(subset=['team_id']).copy()
+    tgs['game_id'] = tgs['game_id'].astype(str)
+    tgs = tgs[tgs['game_id'].isin(games['game_id'].astype(str))]
+    tgs['team_id'] = tgs['team_id'].astype(str)
+    tgs['goals'] = pd.to_numeric(tgs['goals'], errors='coerce').fillna(0)
+    return tgs.reset_index(drop=True)
+
+
+def _team_results(season_stats: pd.DataFrame, completed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Long frame of (game_id, team_id, goals_for, goals_against).
+
+    Tracked games come from the season's fact_team_game_stats rows (opponent
+    goals via self-join); completed schedule games without tracking fill the gaps.
+    """
+    frames = []
+    tracked_ids = set()
+    if len(season_stats) > 0:
+        tgs = season_stats
+        opp = tgs.rename(columns={'team_id': 'opp_team_id', 'goals': 'goals_against'})
+        tgs = tgs.merge(opp, on='game_id')
+        tgs = tgs[tgs['team_id'] != tgs['opp_team_id']]
+        frames.append(tgs.rename(columns={'goals': 'goals_for'})[
+            ['game_id', 'team_id', 'goals_for', 'goals_against']])
+        tracked_ids = set(tgs['game_id'])
+
+    if len(completed) > 0:
+        sched = completed[~completed['game_id'].astype(str).isin(tracked_ids)]
+        home = pd.DataFrame({
+            'game_id': sched['game_id'].astype(str),
+            'team_id': sched['home_team_id'],
+            'goals_for': sched['home_total_goals'].astype(float),
+            'goals_against': sched['away_total_goals'].astype(float),
+        })
+        away = pd.DataFrame({
+            'game_id': sched['game_id'].astype(str),
+            'team_id': sched['away_team_id'],
+            'goals_for': sched['away_total_goals'].astype(float),
+            'goals_against': sched['home_total_goals'].astype(float),
+        })
+        frames.extend([home, away])
+
+    if not frames:
+        return pd.DataFrame(columns=['game_id', 'team_id', 'goals_for', 'goals_against'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def estimate_team_strengths(results: pd.DataFrame, teams: np.ndarray,
+                            prior_games: float = PRIOR_GAMES) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Attack/defense multipliers per team (1.0 = league average).
+
+    Args:
+        results: Long (team_id, goals_for, goals_against) frame
+        teams: Team ids, defines the output order
+        prior_games: League-average pseudo-games added to every team
+
+    Returns:
+        (attack, defense, league average goals per team-game)
+    """
+    league_avg = float(results['goals_for'].mean()) if len(results) > 0 else 3.0
+    if not np.isfinite(league_avg) or league_avg <= 0:
+        league_avg = 3.0
+
+    per_team = results.groupby('team_id').agg(
+        gp=('goals_for', 'size'), gf=('goals_for', 'sum'), ga=('goals_against', 'sum')
+    ).reindex(teams, fill_value=0)
+
+    denom = (per_team['gp'] + prior_games) * league_avg
+    attack = ((per_team['gf'] + prior_games * league_avg) / denom).to_numpy()
+    defense = ((per_team['ga'] + prior_games * league_avg) / denom).to_numpy()
+    return attack, defense, league_avg
+
+
+def _playoff_spots(schedule: pd.DataFrame, season_id: str, n_teams: int) -> int:
+    """Playoff spots from the season's playoff seeding in dim_schedule."""
+    spots = 0
+    if {'season_id', 'game_type', 'home_team_seeding', 'away_team_seeding'} <= set(schedule.columns):
+        playoffs = schedule[(schedule['season_id'].astype(str) == str(season_id)) &
+                            (schedule['game_type'] == 'Playoffs')]
+        seeds = pd.concat([playoffs['home_team_seeding'], playoffs['away_team_seeding']])
+        seeds = pd.to_numeric(seeds, errors='coerce').dropna()
+        if len(seeds) > 0:
+            spots = int(seeds.max())
+    if spots <= 0:
+        spots = DEFAULT_PLAYOFF_SPOTS
+    return min(spots, n_teams)
+
+
+def _pairwise_win_probability(attack: np.ndarray, defense: np.ndarray, league_avg: float,
+                              max_goals: int = 15) -> np.ndarray:
+    """
+    P(team i beats team j) in a single knockout game, ties split 50/50.
+
+    Exact under the Poisson model: outer product of the two goal pmfs.
+    """
+    goals = np.arange(max_goals + 1)
+    log_fact = np.cumsum(np.log(np.maximum(goals, 1)))
+    lam = league_avg * attack[:, None] * defense[None, :]           # i scoring on j
+    pmf = np.exp(goals * np.log(lam[..., None]) - lam[..., None] - log_fact)  # [T, T, G]
+    cdf_below = np.cumsum(pmf, axis=-1) - pmf                         # P(X < g)
+    # P(i scores more than j): sum_g P(i = g) * P(j < g)
+    p_win = np.einsum('ijg,jig->ij', pmf, cdf_below)
+    p_tie = np.einsum('ijg,jig->ij', pmf, pmf)
+    return p_win + 0.5 * p_tie
+
+
+def _simulate_playoffs(seeds: np.ndarray, p_beat: np.ndarray,
+                       rng: np.random.Generator) -> np.ndarray:
+    """
+    Knockout bracket for every simulation at once.
+
+    Args:
+        seeds: [spots x sims] team index per seed (row 0 = 1st seed)
+        p_beat: [T x T] single-game win probabilities
+
+    Returns:
+        [sims] champion team index
+    """
+    spots, sims = seeds.shape
+    size = 1 << max(spots - 1, 0).bit_length()
+    # Pad to a power of two with byes (-1); top seeds receive the byes
+    bracket = np.full((size, sims), -1, dtype=np.int64)
+    bracket[:spots] = seeds
+
+    # Standard bracket order: 1 v N, 2 v N-1, ... with winners meeting in seed order
+    order = np.array([0])
+    while len(order) < size:
+        n = len(order) * 2
+        order = np.stack([order, n - 1 - order], axis=1).ravel()
+    alive = bracket[order]
+
+    while alive.shape[0] > 1:
+        a, b = alive[0::2], alive[1::2]
+        a_safe, b_safe = np.maximum(a, 0), np.maximum(b, 0)
+        a_wins = rng.random(a.shape) < p_beat[a_safe, b_safe]
+        a_wins = np.where(b < 0, True, np.where(a < 0, False, a_wins))
+        alive = np.where(a_wins, a, b)
+    return alive[0]
+
+
+def standings_hash(games: pd.DataFrame, season_stats: Optional[pd.DataFrame] = None) -> str:
+    """Content hash of the season's results, remaining schedule and tracked team stats."""
+    digest = hashlib.sha1()
+    cols = [c for c in ['game_id', 'home_team_id', 'away_team_id',
+                        'home_total_goals', 'away_total_goals'] if c in games.columns]
+    digest.update(pd.util.hash_pandas_object(games[cols].astype(str), index=False).to_numpy().tobytes())
+    if season_stats is not None and len(season_stats) > 0:
+        stats = season_stats[['game_id', 'team_id', 'goals']].astype(str)
+        digest.update(b'team_game_stats')
+        digest.update(pd.util.hash_pandas_object(stats, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def simulate_season(schedule: pd.DataFrame, team_game_stats: pd.DataFrame, season_id: str,
+                    n_sims: int = DEFAULT_SIMULATIONS, playoff_spots: Optional[int] = None,
+                    seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simulate the rest of a season.
+
+    Args:
+        schedule: dim_schedule
+        team_game_stats: fact_team_game_stats
+        season_id: Season to simulate
+        n_sims: Number of simulated seasons
+        playoff_spots: Teams qualifying (default: from schedule seeding)
+        seed: Random seed
+
+    Returns:
+        Dict with 'teams' -> {team_id: {seed_probabilities, playoff_probability,
+        championship_probability, current_points, projected_points}} plus run metadata
+    """
+    games = _regular_season_games(schedule, season_id)
+    teams = np.array(sorted(set(games['home_team_id']) | set(games['away_team_id'])))
+    n_teams = len(teams)
+    if n_teams == 0:
+        return {'season_id': season_id, 'n_sims': 0, 'remaining_games': 0, 'teams': {}}
+
+    team_idx = {t: i for i, t in enumerate(teams)}
+    done_mask = _completed_mask(games)
+    completed, remaining = games[done_mask], games[~done_mask]
+    spots = playoff_spots or _playoff_spots(schedule, season_id, n_teams)
+
+    # Current standings from completed games (same rules as standings snapshot)
+    home_i = completed['home_team_id'].map(team_idx).to_numpy()
+    away_i = completed['away_team_id'].map(team_idx).to_numpy()
+    hg = completed['home_total_goals'].to_numpy(dtype=float) if len(completed) else np.zeros(0)
+    ag = completed['away_total_goals'].to_numpy(dtype=float) if len(completed) else np.zeros(0)
+    wins0 = np.bincount(home_i, hg > ag, n_teams) + np.bincount(away_i, ag > hg, n_teams)
+    gp0 = np.bincount(home_i, minlength=n_teams) + np.bincount(away_i, minlength=n_teams)
+    gf0 = np.bincount(home_i, hg, n_teams) + np.bincount(away_i, ag, n_teams)
+    ga0 = np.bincount(home_i, ag, n_teams) + np.bincount(away_i, hg, n_teams)
+    points0 = wins0 * POINTS_PER_WIN + (gp0 - wins0) * POINTS_PER_LOSS
+
+    season_stats = _season_team_stats(team_game_stats, games)
+    results = _team_results(season_stats, completed)
+    attack, defense, league_avg = estimate_team_strengths(results, teams)
+    p_beat = _pairwise_win_probability(attack, defense, league_avg)
+
+    rh = remaining['home_team_id'].map(team_idx).to_numpy()
+    ra = remaining['away_team_id'].map(team_idx).to_numpy()
+    lam_home = (league_avg * attack[rh] * defense[ra])[:, None]
+    lam_away = (league_avg * attack[ra] * defense[rh])[:, None]
+
+    # Team x game incidence matrices: standings = incidence @ [games x sims]
+    n_rem = len(remaining)
+    home_inc = np.zeros((n_teams, n_rem), dtype=np.float32)
+    away_inc = np.zeros((n_teams, n_rem), dtype=np.float32)
+    home_inc[rh, np.arange(n_rem)] = 1
+    away_inc[ra, np.arange(n_rem)] = 1
+    gp_final = (gp0 + home_inc.sum(axis=1) + away_inc.sum(axis=1))[:, None]
+
+    rng = np.random.default_rng(seed)
+    seed_counts = np.zeros((n_teams, spots), dtype=np.int64)
+    champ_counts = np.zeros(n_teams, dtype=np.int64)
+    points_total = np.zeros(n_teams, dtype=np.float64)
+
+    for start in range(0, n_sims, SIM_CHUNK_SIZE):
+        sims = min(SIM_CHUNK_SIZE, n_sims - start)
+
+        # [games x sims] outcome matrices
+        home_goals = rng.poisson(lam_home, size=(n_rem, sims)).astype(np.float32)
+        away_goals = rng.poisson(lam_away, size=(n_rem, sims)).astype(np.float32)
+        home_win = (home_goals > away_goals).astype(np.float32)
+        away_win = (away_goals > home_goals).astype(np.float32)
+
+        wins = wins0[:, None] + home_inc @ home_win + away_inc @ away_win
+        points = wins * POINTS_PER_WIN + (gp_final - wins) * POINTS_PER_LOSS
+        goals_for = gf0[:, None] + home_inc @ home_goals + away_inc @ away_goals
+        goals_against = ga0[:, None] + home_inc @ away_goals + away_inc @ home_goals
+        goal_diff = goals_for - goals_against
+
+        # Shared tiebreak order for every simulated table; exact ties broken at random
+        order = standings_order(                                         # [rank x sims] -> team
+            {'points': points, 'wins': wins, 'goal_diff': goal_diff, 'goals_for': goals_for},
+            tie_break=rng.random((n_teams, sims)),
+        )
+
+        playoff_seeds = order[:spots]
+        np.add.at(seed_counts, (playoff_seeds, np.arange(spots)[:, None]), 1)
+        champions = _simulate_playoffs(playoff_seeds, p_beat, rng)
+        champ_counts += np.bincount(champions, minlength=n_teams)
+        points_total += points.sum(axis=1)
+
+    team_results = {}
+    for i, team_id in enumerate(teams):
+        seed_probs = seed_counts[i] / n_sims
+        team_results[team_id] = {
+            'seed_probabilities': {str(s + 1): float(p) for s, p in enumerate(seed_probs)},
+            'playoff_probability': float(seed_probs.sum()),
+            'championship_probability': float(champ_counts[i] / n_sims),
+            'current_points': float(points0[i]),
+            'projected_points': float(points_total[i] / n_sims),
+        }
+
+    return {
+        'season_id': season_id,
+        'n_sims': n_sims,
+        'playoff_spots': spots,
+        'remaining_games': n_rem,
+        'standings_hash': standings_hash(games, season_stats),
+        'teams': team_results,
+    }
+
+
+class SeasonSimulatorCache:
+    """
+    Memoizes simulate_season results per (season, standings-hash, n_sims).
+
+    A new result is computed only when the season's results, remaining
+    schedule or tracked team stats change; repeated dashboard requests are
+    dictionary lookups. Least recently used results are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[Tuple[str, str, int], Dict[str, Any]]" = OrderedDict()
+
+    def get(self, schedule: pd.DataFrame, team_game_stats: pd.DataFrame, season_id: str,
+            n_sims: int = DEFAULT_SIMULATIONS) -> Dict[str, Any]:
+        games = _regular_season_games(schedule, season_id)
+        key = (str(season_id), standings_hash(games, _season_team_stats(team_game_stats, games)), n_sims)
+        if key in self._results:
+            self._results.move_to_end(key)
+        else:
+            if len(self._results) >= self.max_entries:
+                self._results.popitem(last=False)
+            self._results[key] = simulate_season(schedule, team_game_stats, season_id, n_sims=n_sims)
+        return self._results[key]
+
+    def clear(self) -> None:
+        self._results.clear()
@@ -0,0 +1,351 @@
+"""
+Player Similarity Index
+=======================
+
+Builds normalized per-player-season feature vectors during ETL and persists
+them as a float32 matrix (``.npy``, memory-mappable) plus a JSON id map.
+The API loads the index once at startup and answers similar-player queries
+with a single matrix product + ``np.argpartition`` top-k.
+
+Files written to data/output/ml/:
+    player_similarity_vectors.npy   float32 [n_rows x n_features], unit rows
+    player_similarity_index.json    row metadata (player/season/position/name)
+
+Usage:
+    from src.ml.similarity_index import build_player_similarity_index, PlayerSimilarityIndex
+
+    build_player_similarity_index()                 # ETL stage
+    index = PlayerSimilarityIndex.load()            # API startup
+    index.query('P100001', 'N20252026F', k=10, position='Forward')
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = Path(__file__).parent.parent.parent / 'data' / 'output'
+ML_OUTPUT_DIR = OUTPUT_DIR / 'ml'
+
+VECTORS_FILE = 'player_similarity_vectors.npy'
+INDEX_FILE = 'player_similarity_index.json'
+
+# Rows fetched per requested neighbour before de-duplicating multi-season players
+CANDIDATE_OVERFETCH = 4
+
+# Counting stats, converted to per-game rates before scaling
+PER_GAME_FEATURES = [
+    'goals', 'assists', 'points', 'shots', 'sog',
+    'pass_attempts', 'giveaways', 'takeaways', 'blocks', 'hits',
+    'zone_ent_total', 'zone_ext_total', 'dekes', 'forechecks', 'backchecks',
+    'xg_for', 'toi_seconds',
+]
+
+# Ratio features recomputed from their season totals: name -> (numerator, denominator cols)
+RATIO_FEATURES = {
+    'shooting_pct': ('goals', ['shots']),
+    'pass_pct': ('pass_completed', ['pass_attempts']),
+    'fo_pct': ('fo_wins', ['fo_wins', 'fo_losses']),
+    'cf_pct': ('corsi_for', ['corsi_for', 'corsi_against']),
+    'ff_pct': ('fenwick_for', ['fenwick_for', 'fenwick_against']),
+    'zone_ent_control_pct': ('zone_ent_controlled', ['zone_ent_total']),
+    'zone_ext_control_pct': ('zone_ext_controlled', ['zone_ext_total']),
+}
+
+SIMILARITY_FEATURES = PER_GAME_FEATURES + list(RATIO_FEATURES)
+
+
+def _load_table(name: str) -> pd.DataFrame:
+    """Load a table from the ETL table store, falling back to CSV."""
+    try:
+        from src.core.table_store import get_table
+        return get_table(name, OUTPUT_DIR)
+    except ImportError:
+        path = OUTPUT_DIR / f'{name}.csv'
+        return pd.read_csv(path, low_memory=False) if path.exists() else pd.DataFrame()
+
+
+def _player_season_frame() -> pd.DataFrame:
+    """
+    Get one row per player-season (game_type 'All').
+
+    Uses fact_player_season_stats, or aggregates fact_player_game_stats when
+    the season table has not been built yet.
+    """
+    season = _load_table('fact_player_season_stats')
+    if len(season) > 0:
+        if 'game_type' in season.columns:
+            season = season[season['game_type'] == 'All']
+        return season.reset_index(drop=True)
+
+    pgs = _load_table('fact_player_game_stats')
+    if len(pgs) == 0 or 'player_id' not in pgs.columns:
+        return pd.DataFrame()
+
+    if 'season_id' not in pgs.columns:
+        schedule = _load_table('dim_schedule')
+        if 'season_id' in schedule.columns:
+            pgs = pgs.merge(schedule[['game_id', 'season_id']], on='game_id', how='left')
+        else:
+            pgs['season_id'] = 'N20252026F'
+
+    keep = [c for c in set(PER_GAME_FEATURES).union(*[[n, *d] for n, d in RATIO_FEATURES.values()])
+            if c in pgs.columns]
+    pgs[keep] = pgs[keep].apply(pd.to_numeric, errors='coerce')
+    grouped = pgs.groupby(['player_id', 'season_id'], as_index=False)
+    season = grouped[keep].sum()
+    season['games_played'] = grouped['game_id'].nunique()['game_id'].values
+    if 'player_name' in pgs.columns:
+        names = grouped['player_name'].first()
+        season['player_name'] = names['player_name'].values
+    return season
+
+
+def build_feature_matrix(season: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute raw (unscaled) similarity features for each player-season row.
+
+    Missing source columns produce zero-filled features so the vector layout
+    is always SIMILARITY_FEATURES.
+    """
+    n = len(season)
+    games = pd.to_numeric(season.get('games_played', pd.Series(1, index=season.index)),
+                          errors='coerce').fillna(0).clip(lower=1).to_numpy(dtype=np.float64)
+
+    def col(name: str) -> np.ndarray:
+        if name not in season.columns:
+            return np.zeros(n)
+        return pd.to_numeric(season[name], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+    features = {name: col(name) / games for name in PER_GAME_FEATURES}
+    for name, (num, denoms) in RATIO_FEATURES.items():
+        denom = sum(col(d) for d in denoms)
+        features[name] = np.divide(col(num), denom, out=np.zeros(n), where=denom > 0)
+
+    return pd.DataFrame(features, index=season.index)[SIMILARITY_FEATURES]
+
+
+def normalize_features(features: pd.DataFrame) -> np.ndarray:
+    """Z-score each feature, then scale every row to unit length (float32)."""
+    values = features.to_numpy(dtype=np.float64)
+    std = values.std(axis=0)
+    std[std == 0] = 1.0
+    z = (values - values.mean(axis=0)) / std
+
+    norms = np.linalg.norm(z, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (z / norms).astype(np.float32)
+
+
+def build_player_similarity_index(output_dir: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Build and persist the player similarity index (ETL stage).
+
+    Args:
+        output_dir: Destination directory (default: data/output/ml)
+
+    Returns:
+        Dict with row and feature counts (empty counts if no source data)
+    """
+    output_dir = Path(output_dir) if output_dir is not None else ML_OUTPUT_DIR
+    logger.info("Building player similarity index...")
+
+    season = _player_season_frame()
+    if len(season) == 0:
+        logger.warning("No player season stats available, skipping similarity index")
+        return {'rows': 0, 'features': 0}
+
+    meta = season[['player_id', 'season_id']].astype(str).copy()
+    meta['position'] = None
+    meta['player_name'] = season['player_name'] if 'player_name' in season.columns else None
+
+    players = _load_table('dim_player')
+    if len(players) > 0 and 'player_id' in players.columns:
+        players = players.drop_duplicates('player_id')
+        lookup = players.set_index(players['player_id'].astype(str))
+        if 'player_primary_position' in lookup.columns:
+            meta['position'] = meta['player_id'].map(lookup['player_primary_position'])
+        if 'player_full_name' in lookup.columns:
+            meta['player_name'] = meta['player_name'].fillna(meta['player_id'].map(lookup['player_full_name']))
+    meta = meta.fillna('')
+
+    vectors = normalize_features(build_feature_matrix(season))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    np.save(output_dir / VECTORS_FILE, vectors)
+    with open(output_dir / INDEX_FILE, 'w') as f:
+        json.dump({
+            'features': SIMILARITY_FEATURES,
+            'player_id': meta['player_id'].tolist(),
+            'season_id': meta['season_id'].tolist(),
+            'position': meta['position'].astype(str).tolist(),
+            'player_name': meta['player_name'].astype(str).tolist(),
+            'built_at': datetime.now().isoformat(),
+        }, f)
+
+    logger.info(f"  Similarity index: {vectors.shape[0]} player-seasons x {vectors.shape[1]} features")
+    return {'rows': int(vectors.shape[0]), 'features': int(vectors.shape[1])}
+
+
+class PlayerSimilarityIndex:
+    """
+    Read-only similarity index over unit-length player-season vectors.
+
+    Cosine similarity is a dot product because rows are L2-normalized.
+    The vector matrix is memory-mapped, so worker processes share pages.
+    """
+
+    def __init__(self, vectors: np.ndarray, meta: Dict[str, list]):
+        self.vectors = vectors
+        self.features: List[str] = list(meta['features'])
+        self.player_ids = np.asarray(meta['player_id'], dtype=object)
+        self.season_ids = np.asarray(meta['season_id'], dtype=object)
+        self.positions = np.asarray(meta['position'], dtype=object)
+        self.player_names = np.asarray(meta['player_name'], dtype=object)
+        self.built_at: Optional[str] = meta.get('built_at')
+
+        self._row_by_key: Dict[Tuple[str, str], int] = {
+            (p, s): i for i, (p, s) in enumerate(zip(self.player_ids, self.season_ids))
+        }
+        self._latest_row: Dict[str, int] = {}
+        for i, (p, s) in enumerate(zip(self.player_ids, self.season_ids)):
+            prev = self._latest_row.get(p)
+            if prev is None or s > self.season_ids[prev]:
+                self._latest_row[p] = i
+
+    @classmethod
+    def load(cls, index_dir: Optional[Path] = None) -> Optional['PlayerSimilarityIndex']:
+        """Load a persisted index, or None if it has not been built."""
+        index_dir = Path(index_dir) if index_dir is not None else ML_OUTPUT_DIR
+        vectors_path = index_dir / VECTORS_FILE
+        index_path = index_dir / INDEX_FILE
+        if not vectors_path.exists() or not index_path.exists():
+            return None
+        with open(index_path) as f:
+            meta = json.load(f)
+        return cls(np.load(vectors_path, mmap_mode='r'), meta)
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def row_for(self, player_id: str, season_id: Optional[str] = None) -> Optional[int]:
+        """Row for a player-season, falling back to the player's latest season."""
+        if season_id is not None:
+            row = self._row_by_key.get((str(player_id), str(season_id)))
+            if row is not None:
+                return row
+        return self._latest_row.get(str(player_id))
+
+    def candidate_mask(self, position: Optional[str] = None,
+                       season_id: Optional[str] = None) -> Optional[np.ndarray]:
+        """Boolean row mask for the optional position/season filters."""
+        mask = None
+        if position:
+            mask = np.char.lower(self.positions.astype(str)) == position.lower()
+        if season_id:
+            season_mask = self.season_ids == str(season_id)
+            mask = season_mask if mask is None else mask & season_mask
+        return mask
+
+    def top_k(self, rows: Sequence[int], k: int = 10,
+              mask: Optional[np.ndarray] = None) -> List[List[Tuple[int, float]]]:
+        """
+        Batched cosine top-k for several query rows.
+
+        Each neighbour is a distinct player (their most similar season row),
+        so a player indexed for several seasons fills one of the k slots.
+
+        Args:
+            rows: Index rows to query
+            k: Neighbours per query (the query's own player is excluded)
+            mask: Optional boolean candidate mask
+
+        Returns:
+            Per query, a list of (row, cosine) sorted by descending similarity
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        if len(candidates) == 0 or k <= 0:
+            return [[] for _ in rows]
+
+        # [n_candidates x n_queries]
+        sims = np.asarray(self.vectors[candidates]) @ np.asarray(self.vectors[rows]).T
+        candidate_players = self.player_ids[candidates]
+        sims[candidate_players[:, None] == self.player_ids[rows][None, :]] = -np.inf
+
+        return [self._top_distinct(sims[:, q], candidates, candidate_players, k)
+                for q in range(len(rows))]
+
+    @staticmethod
+    def _top_distinct(sims: np.ndarray, candidates: np.ndarray, players: np.ndarray,
+                      k: int) -> List[Tuple[int, float]]:
+        """Best k distinct players from one similarity column, over-fetching rows."""
+        n = min(len(sims), k * CANDIDATE_OVERFETCH)
+        while True:
+            idx = np.argpartition(-sims, n - 1)[:n] if n < len(sims) else np.arange(n)
+            idx = idx[np.argsort(-sims[idx], kind='stable')]
+            picked, seen = [], set()
+            for i in idx:
+                if not np.isfinite(sims[i]) or len(picked) == k:
+                    break
+                if players[i] not in seen:
+                    seen.add(players[i])
+                    picked.append((int(candidates[i]), float(sims[i])))
+            # Fewer than k players among n rows: widen unless every row was seen
+            if len(picked) == k or n == len(sims) or not np.isfinite(sims[idx[-1]]):
+                return picked
+            n = min(len(sims), n * 2)
+
+    def compare_features(self, row_a: int, row_b: int, n_similar: int = 3,
+                         n_different: int = 2) -> Tuple[List[str], List[str]]:
+        """Names of the closest and furthest features between two rows."""
+        diff = np.abs(np.asarray(self.vectors[row_a]) - np.asarray(self.vectors[row_b]))
+        order = np.argsort(diff)
+        similar = [self.features[i] for i in order[:n_similar]]
+        different = [self.features[i] for i in order[::-1][:n_different]]
+        return similar, different
+
+    def query(self, player_id: str, season_id: Optional[str] = None, k: int = 10,
+              position: Optional[str] = None,
+              candidate_season_id: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Find the k most similar player-seasons to one player.
+
+        Returns None if the player is not in the index.
+        """
+        row = self.row_for(player_id, season_id)
+        if row is None:
+            return None
+        mask = self.candidate_mask(position, candidate_season_id)
+        neighbours = self.top_k([row], k, mask)[0]
+
+        results = []
+        for other, cosine in neighbours:
+            similar, different = self.compare_features(row, other)
+            results.append({
+                'player_id': str(self.player_ids[other]),
+                'season_id': str(self.season_ids[other]),
+                'player_name': str(self.player_names[other]),
+                'cosine': cosine,
+                'similar_stats': similar,
+                'different_stats': different,
+            })
+        return results
+
+
+def main():
+    """Run similarity index build standalone."""
+    logging.basicConfig(level=logging.INFO)
+    build_player_similarity_index()
+
+
+if __name__ == '__main__':
+    main()
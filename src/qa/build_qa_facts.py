@@ -6,17 +6,29 @@ Creates two fact tables for monitoring data quality:
 1. fact_game_status - Detailed status for each game (completeness, coverage, etc.)
 2. fact_suspicious_stats - Consolidated table of all flagged stats
 
+Suspicious-stat rules live in the qa_rules section of config/etl_thresholds.json.
+Each rule is evaluated as one column expression over the whole stats table
+(thresholds, +/- extremes, z-score or robust outliers), giving a long table of
+violations in a single pass.
+
 Also implements:
 - Dynamic position assignment from shift data
 - Dim multiplier integration check
 
 Run: python scripts/build_qa_facts.py
+
+Usage:
+    from src.qa.build_qa_facts import find_suspicious_stats
+
+    flagged = find_suspicious_stats(player_game_stats, dim_player)
 """
 
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional
 import os
 import warnings
 
@@ -25,26 +37,119 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 OUTPUT_DIR = Path('data/output')
 GAMES_DIR = Path('data/raw/games')
 
-# ============================================================================
-# THRESHOLDS FOR OUTLIER DETECTION
-# ============================================================================
-THRESHOLDS = {
-    'goals_per_game': 5,
-    'assists_per_game': 6,
-    'toi_max_seconds_skater': 2400,
-    'toi_max_seconds_goalie': 3600,
-    'toi_min_seconds': 60,
-    'plus_minus_extreme': 6,
-    'shots_per_game': 20,
-    'cf_pct_extreme_low': 15,
-    'cf_pct_extreme_high': 85,
-    'zscore_threshold': 3,
-}
+QA_CONFIG_PATH = Path(__file__).parent.parent.parent / 'config' / 'etl_thresholds.json'
+
+# Scales the median absolute deviation to a standard deviation (normal data)
+MAD_SCALE = 1.4826
+
+SUSPICIOUS_COLUMNS = [
+    'game_id', 'player_id', 'player_name', 'position', 'stat_name', 'stat_value',
+    'threshold', 'threshold_direction', 'flag_type', 'severity', 'category', 'note',
+    'resolved', 'created_at',
+]
+
+
+def load_qa_rules(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the QA rule set (qa_rules section of config/etl_thresholds.json)."""
+    with open(config_path or QA_CONFIG_PATH, 'r') as f:
+        return json.load(f)['qa_rules']
+
+
+def _column(df: pd.DataFrame, name: str, default=None) -> pd.Series:
+    """A column, or a constant column when the table lacks it."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _join_issues(*parts: pd.Series) -> pd.Series:
+    """Join per-row issue texts (null = no issue) with '; ' - None when a row has none."""
+    out = pd.Series(None, index=parts[0].index, dtype=object)
+    for part in parts:
+        part = part.astype(object)
+        both = out.notna() & part.notna()
+        joined = out.where(out.notna(), part)
+        joined[both] = out[both] + '; ' + part[both]
+        out = joined
+    return out
 
 
 # ============================================================================
 # FACT_GAME_STATUS - Detailed status for each game
 # ============================================================================
+def _tracking_summary(tracking_file: Path) -> Dict[str, Any]:
+    """Coverage of one game's tracking workbook (raises if it cannot be read)."""
+    raw_events = pd.read_excel(tracking_file, sheet_name='events')
+    raw_shifts = pd.read_excel(tracking_file, sheet_name='shifts')
+
+    # Calculate fill rates
+    player_fill = raw_events['player_id'].notna().sum() / len(raw_events) * 100 if len(raw_events) > 0 else 0
+    type_fill = raw_events['Type'].notna().sum() / len(raw_events) * 100 if len(raw_events) > 0 else 0
+
+    # Determine status
+    if player_fill > 50:
+        status, issue = 'COMPLETE', None
+    elif player_fill > 10:
+        status, issue = 'PARTIAL', f'Partial tracking ({player_fill:.0f}%)'
+    else:
+        status, issue = 'TEMPLATE', 'Template only - not tracked'
+
+    # Count goals
+    goal_count = raw_events[raw_events['Type'] == 'Goal']['event_index'].nunique() if 'Type' in raw_events.columns else 0
+
+    # Get time range
+    tracked_events = raw_events[raw_events['Type'].notna()]
+    if len(tracked_events) > 0 and 'period' in tracked_events.columns:
+        periods = sorted([int(p) for p in tracked_events['period'].dropna().unique() if pd.notna(p)])
+        periods_str = ','.join(map(str, periods))
+
+        # Find start/end times
+        first_event = tracked_events.iloc[0]
+        last_event = tracked_events.iloc[-1]
+
+        start_period = first_event.get('period')
+        start_min = first_event.get('event_start_min', first_event.get('event_start_min_'))
+        start_sec = first_event.get('event_start_sec', first_event.get('event_start_sec_'))
+
+        end_period = last_event.get('period')
+        end_min = last_event.get('event_end_min', last_event.get('event_end_min_'))
+        end_sec = last_event.get('event_end_sec', last_event.get('event_end_sec_'))
+
+        start_time = f"{int(start_min or 0)}:{int(start_sec or 0):02d}" if pd.notna(start_min) else None
+        end_time = f"{int(end_min or 0)}:{int(end_sec or 0):02d}" if pd.notna(end_min) else None
+    else:
+        periods_str = ''
+        start_period = None
+        start_time = None
+        end_period = None
+        end_time = None
+
+    return {
+        'tracking_status': status,
+        'tracking_pct': round(player_fill, 1),
+        'events_row_count': len(raw_events),
+        'shifts_row_count': len(raw_shifts),
+        'player_id_fill_pct': round(player_fill, 1),
+        'goal_events': goal_count,
+        'periods_covered': periods_str,
+        'tracking_start_period': start_period,
+        'tracking_start_time': start_time,
+        'tracking_end_period': end_period,
+        'tracking_end_time': end_time,
+        'tracking_issue': issue,
+    }
+
+
+def _periods_by_game(events: pd.DataFrame) -> pd.Series:
+    """Comma-joined sorted periods present per game in an output table."""
+    if len(events) == 0 or 'period' not in events.columns:
+        return pd.Series(dtype=object)
+    periods = events[['game_id', 'period']].dropna()
+    periods = periods.assign(period=periods['period'].astype(int)).drop_duplicates()
+    periods = periods.sort_values(['game_id', 'period'])
+    return periods.groupby('game_id')['period'].agg(lambda p: ','.join(map(str, p)))
+
+
 def build_game_status():
     """Build fact_game_status with completeness metrics."""
     print("\nBuilding fact_game_status...")
@@ -54,7 +159,6 @@ def build_game_status():
     # Get loaded game stats
     pgs_file = OUTPUT_DIR / 'fact_player_game_stats.csv'
     pgs = pd.read_csv(pgs_file) if pgs_file.exists() else pd.DataFrame()
-    loaded_games = set(pgs['game_id'].unique()) if len(pgs) > 0 else set()
     
     events_file = OUTPUT_DIR / 'fact_event_players.csv'
     events = pd.read_csv(events_file) if events_file.exists() else pd.DataFrame()
@@ -62,191 +166,111 @@ def build_game_status():
     shifts_file = OUTPUT_DIR / 'fact_shift_players.csv'
     shifts = pd.read_csv(shifts_file) if shifts_file.exists() else pd.DataFrame()
     
-    status_rows = []
+    game_ids = schedule['game_id']
+    keys = game_ids.astype(int).to_numpy()
     
-    for _, game_row in schedule.iterrows():
-        game_id = game_row['game_id']
-        
-        row = {
-            'game_id': game_id,
-            'game_date': game_row.get('date'),
-            'home_team': game_row.get('home_team_name'),
-            'away_team': game_row.get('away_team_name'),
-            'official_home_goals': game_row.get('home_total_goals'),
-            'official_away_goals': game_row.get('away_total_goals'),
-            'official_total_goals': int(game_row.get('home_total_goals', 0) or 0) + int(game_row.get('away_total_goals', 0) or 0),
-            'game_url': game_row.get('game_url'),
-        }
-        
-        # Check tracking file
+    def per_game(values: pd.Series, fill) -> pd.Series:
+        return pd.Series(values.reindex(keys, fill_value=fill).to_numpy(), index=schedule.index)
+    
+    # Per-game totals of the output tables, aligned with the schedule
+    if len(pgs) > 0:
+        totals = pgs.groupby('game_id').agg(
+            goals=('goals', 'sum'), assists=('assists', 'sum'), players=('goals', 'size'))
+        loaded = pd.Series(np.isin(keys, pgs['game_id'].unique()), index=schedule.index)
+    else:
+        totals = pd.DataFrame({'goals': [], 'assists': [], 'players': []})
+        loaded = pd.Series(False, index=schedule.index)
+    goals = per_game(totals['goals'], 0)
+    assists = per_game(totals['assists'], 0)
+    players = per_game(totals['players'], 0)
+    event_rows = per_game(events['game_id'].value_counts(), 0) if len(events) > 0 else pd.Series(0, index=schedule.index)
+    shift_rows = per_game(shifts['game_id'].value_counts(), 0) if len(shifts) > 0 else pd.Series(0, index=schedule.index)
+    
+    base = pd.DataFrame({
+        'game_id': game_ids,
+        'game_date': _column(schedule, 'date'),
+        'home_team': _column(schedule, 'home_team_name'),
+        'away_team': _column(schedule, 'away_team_name'),
+        'official_home_goals': _column(schedule, 'home_total_goals'),
+        'official_away_goals': _column(schedule, 'away_total_goals'),
+        'official_total_goals': (
+            _column(schedule, 'home_total_goals', 0).fillna(0).astype(int)
+            + _column(schedule, 'away_total_goals', 0).fillna(0).astype(int)
+        ),
+        'game_url': _column(schedule, 'game_url'),
+    })
+    
+    goals_in_stats = goals.astype(int).where(loaded, 0)
+    goal_match = (goals_in_stats == base['official_total_goals']).astype(object).where(loaded, None)
+    mismatch = ('Goal mismatch: ' + goals_in_stats.astype(str) + ' vs '
+                + base['official_total_goals'].astype(str)).where(loaded & (goal_match == False))
+    
+    # Reading the tracking workbooks is the only per-game step
+    tracked, errors = {}, {}
+    for idx, game_id in game_ids.items():
         tracking_file = GAMES_DIR / str(game_id) / f"{game_id}_tracking.xlsx"
-        
         if not tracking_file.exists():
-            row.update({
-                'tracking_status': 'NO_FILE',
-                'tracking_pct': 0.0,
-                'events_row_count': 0,
-                'shifts_row_count': 0,
-                'player_id_fill_pct': 0.0,
-                'goal_events': 0,
-                'periods_covered': '',
-                'tracking_start_period': None,
-                'tracking_start_time': None,
-                'tracking_end_period': None,
-                'tracking_end_time': None,
-                'is_loaded': False,
-                'goals_in_stats': 0,
-                'goal_match': None,
-                'player_count': 0,
-                'issues': 'No tracking file'
-            })
-        else:
-            try:
-                raw_events = pd.read_excel(tracking_file, sheet_name='events')
-                raw_shifts = pd.read_excel(tracking_file, sheet_name='shifts')
-                
-                # Calculate fill rates
-                player_fill = raw_events['player_id'].notna().sum() / len(raw_events) * 100 if len(raw_events) > 0 else 0
-                type_fill = raw_events['Type'].notna().sum() / len(raw_events) * 100 if len(raw_events) > 0 else 0
-                
-                # Determine status
-                if player_fill > 50:
-                    status = 'COMPLETE'
-                elif player_fill > 10:
-                    status = 'PARTIAL'
-                else:
-                    status = 'TEMPLATE'
-                
-                # Count goals
-                goal_count = raw_events[raw_events['Type'] == 'Goal']['event_index'].nunique() if 'Type' in raw_events.columns else 0
-                
-                # Get time range
-                tracked_events = raw_events[raw_events['Type'].notna()]
-                if len(tracked_events) > 0 and 'period' in tracked_events.columns:
-                    periods = sorted([int(p) for p in tracked_events['period'].dropna().unique() if pd.notna(p)])
-                    periods_str = ','.join(map(str, periods))
-                    
-                    # Find start/end times
-                    first_event = tracked_events.iloc[0]
-                    last_event = tracked_events.iloc[-1]
-                    
-                    start_period = first_event.get('period')
-                    start_min = first_event.get('event_start_min', first_event.get('event_start_min_'))
-                    start_sec = first_event.get('event_start_sec', first_event.get('event_start_sec_'))
-                    
-                    end_period = last_event.get('period')
-                    end_min = last_event.get('event_end_min', last_event.get('event_end_min_'))
-                    end_sec = last_event.get('event_end_sec', last_event.get('event_end_sec_'))
-                    
-                    start_time = f"{int(start_min or 0)}:{int(start_sec or 0):02d}" if pd.notna(start_min) else None
-                    end_time = f"{int(end_min or 0)}:{int(end_sec or 0):02d}" if pd.notna(end_min) else None
-                else:
-                    periods_str = ''
-                    start_period = None
-                    start_time = None
-                    end_period = None
-                    end_time = None
-                
-                # Check if loaded
-                is_loaded = int(game_id) in loaded_games
-                goals_in_stats = int(pgs[pgs['game_id'] == int(game_id)]['goals'].sum()) if is_loaded else 0
-                goal_match = goals_in_stats == row['official_total_goals'] if is_loaded else None
-                player_count = len(pgs[pgs['game_id'] == int(game_id)]) if is_loaded else 0
-                
-                # Identify issues
-                issues = []
-                if status == 'TEMPLATE':
-                    issues.append('Template only - not tracked')
-                elif status == 'PARTIAL':
-                    issues.append(f'Partial tracking ({player_fill:.0f}%)')
-                if is_loaded and not goal_match:
-                    issues.append(f'Goal mismatch: {goals_in_stats} vs {row["official_total_goals"]}')
-                
-                # Check for missing assists
-                if is_loaded:
-                    game_stats = pgs[pgs['game_id'] == int(game_id)]
-                    if game_stats['goals'].sum() > 2 and game_stats['assists'].sum() == 0:
-                        issues.append('No assists tracked')
-                
-                row.update({
-                    'tracking_status': status,
-                    'tracking_pct': round(player_fill, 1),
-                    'events_row_count': len(raw_events),
-                    'shifts_row_count': len(raw_shifts),
-                    'player_id_fill_pct': round(player_fill, 1),
-                    'goal_events': goal_count,
-                    'periods_covered': periods_str,
-                    'tracking_start_period': start_period,
-                    'tracking_start_time': start_time,
-                    'tracking_end_period': end_period,
-                    'tracking_end_time': end_time,
-                    'is_loaded': is_loaded,
-                    'goals_in_stats': goals_in_stats,
-                    'goal_match': goal_match,
-                    'player_count': player_count,
-                    'issues': '; '.join(issues) if issues else None
-                })
-                
-            except Exception as e:
-                # Check if game was actually loaded by ETL despite file read error
-                # This handles cases where file might have been fixed or ETL succeeded
-                game_events_count = len(events[events['game_id'] == int(game_id)]) if len(events) > 0 else 0
-                game_shifts_count = len(shifts[shifts['game_id'] == int(game_id)]) if len(shifts) > 0 else 0
-                is_loaded = int(game_id) in loaded_games
-                goals_in_stats = int(pgs[pgs['game_id'] == int(game_id)]['goals'].sum()) if is_loaded else 0
-                goal_match = goals_in_stats == row['official_total_goals'] if is_loaded else None
-                player_count = len(pgs[pgs['game_id'] == int(game_id)]) if is_loaded else 0
-                
-                # Determine status based on whether data exists despite file error
-                if is_loaded and (game_events_count > 0 or game_shifts_count > 0):
-                    # File read failed but ETL successfully processed it
-                    # Try to determine status from loaded data
-                    if game_events_count > 100:  # Reasonable threshold for complete game
-                        status = 'COMPLETE'
-                    elif game_events_count > 20:
-                        status = 'PARTIAL'
-                    else:
-                        status = 'TEMPLATE'
-                    
-                    # Try to get info from loaded data
-                    game_events_df = events[events['game_id'] == int(game_id)] if len(events) > 0 else pd.DataFrame()
-                    if len(game_events_df) > 0 and 'period' in game_events_df.columns:
-                        periods = sorted([int(p) for p in game_events_df['period'].dropna().unique() if pd.notna(p)])
-                        periods_str = ','.join(map(str, periods))
-                    else:
-                        periods_str = ''
-                    
-                    issues = [f'File read error (ETL succeeded): {str(e)[:100]}']
-                    if not goal_match and is_loaded:
-                        issues.append(f'Goal mismatch: {goals_in_stats} vs {row["official_total_goals"]}')
-                else:
-                    # File read failed and no data in output tables
-                    status = 'ERROR'
-                    periods_str = ''
-                    issues = [f'Error reading file: {str(e)[:200]}']
-                
-                row.update({
-                    'tracking_status': status,
-                    'tracking_pct': 0.0 if not is_loaded else 100.0,  # If loaded, assume complete
-                    'events_row_count': game_events_count,
-                    'shifts_row_count': game_shifts_count,
-                    'player_id_fill_pct': 0.0,
-                    'goal_events': 0,
-                    'periods_covered': periods_str,
-                    'tracking_start_period': None,
-                    'tracking_start_time': None,
-                    'tracking_end_period': None,
-                    'tracking_end_time': None,
-                    'is_loaded': is_loaded,
-                    'goals_in_stats': goals_in_stats,
-                    'goal_match': goal_match,
-                    'player_count': player_count,
-                    'issues': '; '.join(issues) if issues else None
-                })
-        
-        status_rows.append(row)
-    
-    df = pd.DataFrame(status_rows)
+            continue
+        try:
+            tracked[idx] = _tracking_summary(tracking_file)
+        except Exception as e:
+            errors[idx] = str(e)
+    
+    status = pd.DataFrame({
+        'tracking_status': 'NO_FILE',
+        'tracking_pct': 0.0,
+        'events_row_count': 0,
+        'shifts_row_count': 0,
+        'player_id_fill_pct': 0.0,
+        'goal_events': 0,
+        'periods_covered': '',
+        'tracking_start_period': None,
+        'tracking_start_time': None,
+        'tracking_end_period': None,
+        'tracking_end_time': None,
+        'is_loaded': False,
+        'goals_in_stats': 0,
+        'goal_match': None,
+        'player_count': 0,
+        'issues': 'No tracking file',
+    }, index=schedule.index).astype(object)
+    
+    has_file = pd.Series(schedule.index.isin(list(tracked) + list(errors)), index=schedule.index)
+    status.loc[has_file, 'is_loaded'] = loaded[has_file]
+    status.loc[has_file, 'goals_in_stats'] = goals_in_stats[has_file]
+    status.loc[has_file, 'goal_match'] = goal_match[has_file]
+    status.loc[has_file, 'player_count'] = players.astype(int).where(loaded, 0)[has_file]
+    
+    if tracked:
+        summary = pd.DataFrame.from_dict(tracked, orient='index')
+        rows = summary.index
+        no_assists = pd.Series('No assists tracked', index=schedule.index).where(
+            loaded & (goals > 2) & (assists == 0))
+        issues = _join_issues(summary['tracking_issue'], mismatch[rows], no_assists[rows])
+        summary = summary.drop(columns='tracking_issue').assign(issues=issues)
+        status.loc[rows, summary.columns] = summary.astype(object)
+    
+    if errors:
+        rows = pd.Index(list(errors))
+        message = pd.Series(errors)
+        # File read failed but the ETL still produced data for the game
+        recovered = loaded[rows] & ((event_rows[rows] > 0) | (shift_rows[rows] > 0))
+        recovered_status = np.select(
+            [event_rows[rows] > 100, event_rows[rows] > 20], ['COMPLETE', 'PARTIAL'], 'TEMPLATE')
+        periods = per_game(_periods_by_game(events), '')[rows]
+        issues = _join_issues(
+            ('File read error (ETL succeeded): ' + message.str[:100]).where(recovered,
+                                                                          'Error reading file: ' + message.str[:200]),
+            mismatch[rows].where(recovered),
+        )
+        status.loc[rows, 'tracking_status'] = np.where(recovered, recovered_status, 'ERROR')
+        status.loc[rows, 'tracking_pct'] = np.where(loaded[rows], 100.0, 0.0)
+        status.loc[rows, 'events_row_count'] = event_rows[rows]
+        status.loc[rows, 'shifts_row_count'] = shift_rows[rows]
+        status.loc[rows, 'periods_covered'] = periods.where(recovered, '')
+        status.loc[rows, 'issues'] = issues
+    
+    df = pd.concat([base, status.infer_objects()], axis=1)
     df.to_csv(OUTPUT_DIR / 'fact_game_status.csv', index=False)
     print(f"  ✓ fact_game_status: {len(df)} games")
     
@@ -268,6 +292,144 @@ def build_game_status():
 # ============================================================================
 # FACT_SUSPICIOUS_STATS - Consolidated suspicious stats table
 # ============================================================================
+def _positions(pgs: pd.DataFrame, players: pd.DataFrame) -> pd.Series:
+    """Primary position of each stats row's player ('' when not in dim_player)."""
+    player_ids = _column(pgs, 'player_id')
+    if len(players) == 0 or 'player_id' not in players.columns:
+        return pd.Series('', index=pgs.index, dtype=object)
+    lookup = pd.Series(_column(players, 'player_primary_position', '').to_numpy(), index=players['player_id'])
+    lookup = lookup[~lookup.index.duplicated(keep='last')]
+    return player_ids.map(lookup).where(player_ids.isin(lookup.index), '')
+
+
+def _threshold_violations(pgs: pd.DataFrame, base: pd.DataFrame, is_goalie: pd.Series, rules) -> pd.DataFrame:
+    """Rows breaking threshold rules, in (stats row, rule) order."""
+    flagged = []
+    for order, rule in enumerate(rules):
+        stat, op = rule['stat'], rule['op']
+        if stat not in pgs.columns:
+            continue
+        values = pgs[stat]
+        threshold = pd.Series(rule['value'], index=pgs.index)
+        if 'goalie_value' in rule:
+            threshold = threshold.mask(is_goalie, rule['goalie_value'])
+        
+        if op == '>':
+            hit = values > threshold
+        elif op == '<':
+            hit = values < threshold
+        elif op == '±':
+            hit = values.abs() > threshold
+        else:
+            raise ValueError(f"Unknown QA rule op {op!r} for {stat}")
+        if not hit.any():
+            continue
+        
+        rows = base[hit].assign(
+            stat_name=stat,
+            stat_value=values[hit],
+            threshold=threshold[hit],
+            threshold_direction=op,
+            flag_type=rule['flag_type'],
+            severity=rule.get('severity', 'WARNING'),
+            category=rule.get('category', 'THRESHOLD_EXCEEDED'),
+            _row=np.flatnonzero(hit),
+            _rule=order,
+        )
+        template = rule.get('note', '{stat}={value} exceeds {op}{threshold}')
+        rows['note'] = [template.format(stat=stat, value=v, op=op, threshold=t)
+                        for v, t in zip(rows['stat_value'], rows['threshold'])]
+        flagged.append(rows)
+    
+    if not flagged:
+        return pd.DataFrame()
+    return pd.concat(flagged).sort_values(['_row', '_rule'], kind='mergesort').drop(columns=['_row', '_rule'])
+
+
+def _outlier_violations(pgs: pd.DataFrame, base: pd.DataFrame, outliers: Dict[str, Any]) -> pd.DataFrame:
+    """Rows whose z-score (or robust median/MAD z-score) exceeds the outlier limit."""
+    limit = outliers.get('threshold', 3)
+    method = outliers.get('method', 'zscore')
+    if method not in ('zscore', 'robust'):
+        raise ValueError(f"Unknown QA outlier method {method!r}")
+    label = 'Robust z-score' if method == 'robust' else 'Z-score'
+    
+    flagged = []
+    for stat in outliers.get('stats', []):
+        if stat not in pgs.columns:
+            continue
+        values = pgs[stat]
+        present = values.dropna()
+        if len(present) <= outliers.get('min_rows', 10):
+            continue
+        if method == 'robust':
+            center = present.median()
+            scale = (present - center).abs().median() * MAD_SCALE
+        else:
+            center = present.mean()
+            scale = present.std()
+        if not scale > 0:
+            continue
+        
+        zscore = (values - center) / scale
+        hit = zscore.abs() > limit
+        rows = base[hit].assign(
+            stat_name=stat,
+            stat_value=values[hit],
+            threshold=limit,
+            threshold_direction='z>',
+            flag_type='ZSCORE',
+            severity='INFO',
+            category='STATISTICAL_OUTLIER',
+            note=[f'{label}={z:.2f} exceeds {limit}' for z in zscore[hit]],
+        )
+        flagged.append(rows)
+    
+    return pd.concat(flagged) if flagged else pd.DataFrame()
+
+
+def find_suspicious_stats(
+    pgs: pd.DataFrame,
+    players: pd.DataFrame,
+    rules: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Evaluate QA rules over player game stats.
+    
+    Args:
+        pgs: fact_player_game_stats
+        players: dim_player (for positions; may be empty)
+        rules: qa_rules config (default: config/etl_thresholds.json)
+    
+    Returns:
+        One row per violation (SUSPICIOUS_COLUMNS), deduplicated per
+        game, player, stat and category
+    """
+    rules = rules if rules is not None else load_qa_rules()
+    position = _positions(pgs, players)
+    is_goalie = position.isin(rules.get('goalie_positions', []))
+    base = pd.DataFrame({
+        'game_id': pgs['game_id'],
+        'player_id': _column(pgs, 'player_id'),
+        'player_name': _column(pgs, 'player_name', 'Unknown'),
+        'position': position,
+    })
+    
+    parts = [
+        _threshold_violations(pgs, base, is_goalie, rules.get('thresholds', [])),
+        _outlier_violations(pgs, base, rules.get('outliers') or {}),
+    ]
+    parts = [p for p in parts if len(p) > 0]
+    if not parts:
+        return pd.DataFrame(columns=SUSPICIOUS_COLUMNS)
+    
+    df = pd.concat(parts, ignore_index=True)
+    df['resolved'] = False
+    df['created_at'] = datetime.now().isoformat()
+    # Deduplicate (same player+game+stat)
+    return df[SUSPICIOUS_COLUMNS].drop_duplicates(subset=['game_id', 'player_id', 'stat_name', 'category'])
+
+
 def build_suspicious_stats():
     """Build fact_suspicious_stats with all flagged values."""
     print("\nBuilding fact_suspicious_stats...")
@@ -280,116 +442,7 @@ def build_suspicious_stats():
     pgs = pd.read_csv(pgs_file)
     players = pd.read_csv(OUTPUT_DIR / 'dim_player.csv') if (OUTPUT_DIR / 'dim_player.csv').exists() else pd.DataFrame()
     
-    # Position lookup
-    position_lookup = {}
-    if len(players) > 0 and 'player_id' in players.columns:
-        for _, p in players.iterrows():
-            position_lookup[p['player_id']] = p.get('player_primary_position', '')
-    
-    suspicious = []
-    
-    for _, row in pgs.iterrows():
-        game_id = row['game_id']
-        player_id = row.get('player_id')
-        player_name = row.get('player_name', 'Unknown')
-        
-        # Determine if goalie
-        position = position_lookup.get(player_id, '')
-        is_goalie = position in ['Goalie', 'G', 'goalie']
-        toi_max = THRESHOLDS['toi_max_seconds_goalie'] if is_goalie else THRESHOLDS['toi_max_seconds_skater']
-        
-        # Check thresholds
-        checks = [
-            ('goals', row['goals'], THRESHOLDS['goals_per_game'], '>', 'HIGH'),
-            ('assists', row['assists'], THRESHOLDS['assists_per_game'], '>', 'HIGH'),
-            ('toi_seconds', row['toi_seconds'], toi_max, '>', 'HIGH'),
-            ('toi_seconds', row['toi_seconds'], THRESHOLDS['toi_min_seconds'], '<', 'LOW'),
-            ('shots', row.get('shots', 0), THRESHOLDS['shots_per_game'], '>', 'HIGH'),
-            ('cf_pct', row.get('cf_pct', 50), THRESHOLDS['cf_pct_extreme_low'], '<', 'LOW'),
-            ('cf_pct', row.get('cf_pct', 50), THRESHOLDS['cf_pct_extreme_high'], '>', 'HIGH'),
-        ]
-        
-        for stat, value, threshold, direction, flag_type in checks:
-            if pd.isna(value):
-                continue
-            
-            is_outlier = (direction == '>' and value > threshold) or \
-                         (direction == '<' and value < threshold)
-            
-            if is_outlier:
-                suspicious.append({
-                    'game_id': game_id,
-                    'player_id': player_id,
-                    'player_name': player_name,
-                    'position': position,
-                    'stat_name': stat,
-                    'stat_value': value,
-                    'threshold': threshold,
-                    'threshold_direction': direction,
-                    'flag_type': flag_type,
-                    'severity': 'WARNING',
-                    'category': 'THRESHOLD_EXCEEDED',
-                    'note': f'{stat}={value} exceeds {direction}{threshold}',
-                    'resolved': False,
-                    'created_at': datetime.now().isoformat()
-                })
-        
-        # Check plus/minus extremes
-        for pm_col in ['plus_minus_ev', 'plus_minus_total']:
-            if pm_col in row and pd.notna(row[pm_col]):
-                pm = row[pm_col]
-                if abs(pm) > THRESHOLDS['plus_minus_extreme']:
-                    suspicious.append({
-                        'game_id': game_id,
-                        'player_id': player_id,
-                        'player_name': player_name,
-                        'position': position,
-                        'stat_name': pm_col,
-                        'stat_value': pm,
-                        'threshold': THRESHOLDS['plus_minus_extreme'],
-                        'threshold_direction': '±',
-                        'flag_type': 'EXTREME',
-                        'severity': 'INFO',
-                        'category': 'EXTREME_VALUE',
-                        'note': f'Extreme +/- of {pm}',
-                        'resolved': False,
-                        'created_at': datetime.now().isoformat()
-                    })
-    
-    # Add z-score outliers
-    numeric_cols = ['goals', 'assists', 'toi_seconds', 'shots', 'corsi_for']
-    for col in numeric_cols:
-        if col in pgs.columns:
-            values = pgs[col].dropna()
-            if len(values) > 10:
-                mean = values.mean()
-                std = values.std()
-                if std > 0:
-                    for idx, row in pgs.iterrows():
-                        if pd.notna(row[col]):
-                            zscore = (row[col] - mean) / std
-                            if abs(zscore) > THRESHOLDS['zscore_threshold']:
-                                suspicious.append({
-                                    'game_id': row['game_id'],
-                                    'player_id': row.get('player_id'),
-                                    'player_name': row.get('player_name', 'Unknown'),
-                                    'position': position_lookup.get(row.get('player_id'), ''),
-                                    'stat_name': col,
-                                    'stat_value': row[col],
-                                    'threshold': THRESHOLDS['zscore_threshold'],
-                                    'threshold_direction': 'z>',
-                                    'flag_type': 'ZSCORE',
-                                    'severity': 'INFO',
-                                    'category': 'STATISTICAL_OUTLIER',
-                                    'note': f'Z-score={zscore:.2f} exceeds {THRESHOLDS["zscore_threshold"]}',
-                                    'resolved': False,
-                                    'created_at': datetime.now().isoformat()
-                                })
-    
-    df = pd.DataFrame(suspicious)
-    if len(df) > 0:
-        # Deduplicate (same player+game+stat)
-        df = df.drop_duplicates(subset=['game_id', 'player_id', 'stat_name', 'category'])
+    df = find_suspicious_stats(pgs, players)
     
     df.to_csv(OUTPUT_DIR / 'fact_suspicious_stats.csv', index=False)
     print(f"  ✓ fact_suspicious_stats: {len(df)} entries")
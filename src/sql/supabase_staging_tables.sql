@@ -268,6 +268,28 @@ CREATE TABLE IF NOT EXISTS stage_shifts_tracking (
 CREATE INDEX IF NOT EXISTS idx_shifts_game ON stage_shifts_tracking(game_id);
 CREATE INDEX IF NOT EXISTS idx_shifts_idx ON stage_shifts_tracking(shift_index);
 
+-- Row versions for incremental ETL reads (SupabaseSource tracking cache):
+-- a game is re-downloaded only when its row count or latest updated_at changes
+ALTER TABLE stage_events_tracking ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+ALTER TABLE stage_shifts_tracking ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+
+CREATE OR REPLACE FUNCTION stage_set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_events_updated_at ON stage_events_tracking;
+CREATE TRIGGER trg_events_updated_at BEFORE UPDATE ON stage_events_tracking
+    FOR EACH ROW EXECUTE FUNCTION stage_set_updated_at();
+DROP TRIGGER IF EXISTS trg_shifts_updated_at ON stage_shifts_tracking;
+CREATE TRIGGER trg_shifts_updated_at BEFORE UPDATE ON stage_shifts_tracking
+    FOR EACH ROW EXECUTE FUNCTION stage_set_updated_at();
+
+CREATE INDEX IF NOT EXISTS idx_events_game_updated ON stage_events_tracking(game_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_shifts_game_updated ON stage_shifts_tracking(game_id, updated_at);
+
 -- ============================================================
 -- HELPER VIEWS
 -- ============================================================
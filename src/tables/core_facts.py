@@ -3412,533 +3412,6 @@ def create_fact_goalie_game_stats() -> pd.DataFrame:
     return build_fact_goalie_game_stats(save=False)  # Save handled by create_all_core_facts
 
 
-def _create_fact_goalie_game_stats_original() -> pd.DataFrame:
-    """Create fact_goalie_game_stats with comprehensive advanced goalie metrics.
-    
-    v28.1 - EXPANDED with ~90 columns including:
-    - Rebound control advanced (12 cols)
-    - Period splits (15 cols)
-    - Time bucket / clutch (12 cols)
-    - Shot context / rush vs set play (12 cols)
-    - Pressure / sequence handling (10 cols)
-    - Body location / technique (10 cols)
-    - Workload metrics (10 cols)
-    - Advanced composites (10 cols)
-    """
-    print("\nBuilding fact_goalie_game_stats (v28.1 - ADVANCED GOALIE ANALYTICS)...")
-    
-    events = load_table('fact_events')
-    roster = load_table('fact_gameroster')
-    players = load_table('dim_player')
-    
-    # Try to load fact_saves for detailed save-level data
-    try:
-        fact_saves = load_table('fact_saves')
-        has_fact_saves = len(fact_saves) > 0
-    except:
-        fact_saves = pd.DataFrame()
-        has_fact_saves = False
-    
-    if len(events) == 0:
-        print("  ERROR: fact_events not found!")
-        return pd.DataFrame()
-    
-    tracked_game_ids = events['game_id'].dropna().unique().tolist()
-    roster_tracked = roster[roster['game_id'].isin(tracked_game_ids)]
-    
-    pos_col = 'player_position' if 'player_position' in roster_tracked.columns else 'position'
-    if pos_col not in roster_tracked.columns:
-        print("  No position column found")
-        return pd.DataFrame()
-    
-    goalies = roster_tracked[roster_tracked[pos_col].astype(str).str.lower().str.contains('goalie', na=False)]
-    
-    if len(goalies) == 0:
-        print("  No goalies found")
-        return pd.DataFrame()
-    
-    all_stats = []
-    
-    for _, goalie in goalies.iterrows():
-        game_id = goalie['game_id']
-        player_id = goalie['player_id']
-        
-        stats = {
-            'goalie_game_key': f"GK{game_id}{player_id}",
-            'game_id': game_id,
-            'player_id': player_id,
-            '_export_timestamp': datetime.now().isoformat(),
-        }
-        
-        if len(players) > 0:
-            player_info = players[players['player_id'] == player_id]
-            stats['player_name'] = player_info['player_full_name'].values[0] if len(player_info) > 0 else ''
-        
-        stats['team_name'] = goalie.get('team_name', '')
-        stats['team_id'] = goalie.get('team_id', '')
-        
-        game_events = events[events['game_id'] == game_id]
-        
-        goalie_team_id = goalie.get('team_id')
-        home_team_id = game_events['home_team_id'].iloc[0] if len(game_events) > 0 and 'home_team_id' in game_events.columns else None
-        is_home = (str(goalie_team_id) == str(home_team_id)) if goalie_team_id and home_team_id else None
-        stats['is_home'] = is_home
-        
-        all_saves_events = game_events[game_events['event_type'].astype(str).str.lower() == 'save']
-        all_goals = game_events[is_goal_scored(game_events)]
-        all_rebounds = game_events[game_events['event_type'].astype(str).str.lower() == 'rebound']
-        
-        if is_home is not None and 'team_venue' in game_events.columns:
-            goalie_venue = 'h' if is_home else 'a'
-            opp_venue = 'a' if is_home else 'h'
-            
-            # Get this goalie's saves
-            goalie_saves = all_saves_events[all_saves_events['team_venue'].astype(str).str.lower() == goalie_venue]
-            goalie_goals_against = all_goals[all_goals['team_venue'].astype(str).str.lower() == opp_venue]
-            
-            # Also get detailed saves from fact_saves if available
-            if has_fact_saves:
-                detailed_saves = fact_saves[(fact_saves['game_id'] == game_id) & 
-                                           (fact_saves['team_venue'].astype(str).str.lower() == goalie_venue)]
-            else:
-                detailed_saves = goalie_saves
-            
-            # ================================================================
-            # CORE STATS
-            # ================================================================
-            stats['saves'] = len(goalie_saves)
-            stats['goals_against'] = len(goalie_goals_against)
-            stats['shots_against'] = stats['saves'] + stats['goals_against']
-            stats['save_pct'] = round(stats['saves'] / stats['shots_against'] * 100, 1) if stats['shots_against'] > 0 else 100.0
-            
-            # ================================================================
-            # SAVE TYPE BREAKDOWN (existing)
-            # ================================================================
-            if 'event_detail_2' in goalie_saves.columns:
-                save_types = goalie_saves['event_detail_2'].astype(str).str.lower()
-                stats['saves_butterfly'] = len(save_types[save_types.str.contains('butterfly', na=False)])
-                stats['saves_pad'] = len(save_types[save_types.str.contains('pad', na=False)])
-                stats['saves_glove'] = len(save_types[save_types.str.contains('glove', na=False)])
-                stats['saves_blocker'] = len(save_types[save_types.str.contains('blocker', na=False)])
-                stats['saves_chest'] = len(save_types[save_types.str.contains('chest|shoulder', na=False)])
-                stats['saves_stick'] = len(save_types[save_types.str.contains('stick', na=False)])
-                stats['saves_scramble'] = len(save_types[save_types.str.contains('scramble', na=False)])
-            else:
-                for st in ['saves_butterfly', 'saves_pad', 'saves_glove', 'saves_blocker', 'saves_chest', 'saves_stick', 'saves_scramble']:
-                    stats[st] = 0
-            
-            # ================================================================
-            # HIGH DANGER SAVES (existing)
-            # ================================================================
-            opp_shots = game_events[(game_events['team_venue'].astype(str).str.lower() == opp_venue) & 
-                                   (game_events['event_type'].astype(str).str.lower().isin(['shot', 'goal']))]
-            if 'danger_level' in opp_shots.columns:
-                hd = opp_shots[opp_shots['danger_level'].astype(str).str.lower() == 'high']
-                hd_goals = len(hd[hd['event_type'].astype(str).str.lower() == 'goal'])
-                stats['hd_shots_against'] = len(hd)
-                stats['hd_goals_against'] = hd_goals
-                stats['hd_saves'] = len(hd) - hd_goals
-                stats['hd_save_pct'] = round(stats['hd_saves'] / len(hd) * 100, 1) if len(hd) > 0 else 100.0
-            else:
-                stats['hd_shots_against'] = stats['hd_goals_against'] = stats['hd_saves'] = 0
-                stats['hd_save_pct'] = 100.0
-            
-            # ================================================================
-            # CATEGORY 1: REBOUND CONTROL ADVANCED (12 columns)
-            # ================================================================
-            # Use event_detail to get freeze vs rebound from saves
-            if 'event_detail' in goalie_saves.columns:
-                save_details = goalie_saves['event_detail'].astype(str)
-                stats['saves_freeze'] = len(save_details[save_details.str.contains('Freeze', na=False, case=False)])
-                stats['saves_rebound'] = len(save_details[save_details.str.contains('Rebound', na=False, case=False)])
-            else:
-                stats['saves_freeze'] = stats.get('saves_glove', 0) + stats.get('saves_chest', 0)
-                stats['saves_rebound'] = stats['saves'] - stats['saves_freeze']
-            
-            stats['freeze_pct'] = round(stats['saves_freeze'] / stats['saves'] * 100, 1) if stats['saves'] > 0 else 0.0
-            stats['rebound_rate'] = round(stats['saves_rebound'] / stats['saves'] * 100, 1) if stats['saves'] > 0 else 0.0
-            
-            # Analyze rebound outcomes from Rebound events
-            # v28.1 FIX: Link rebounds to specific goalies via prev_event_id -> Save events
-            if 'prev_event_id' in all_rebounds.columns and 'event_id' in goalie_saves.columns:
-                # Get the event_ids of this goalie's saves
-                goalie_save_ids = set(goalie_saves['event_id'].astype(str).tolist())
-                # Filter rebounds to those that followed THIS goalie's saves
-                goalie_rebounds = all_rebounds[all_rebounds['prev_event_id'].astype(str).isin(goalie_save_ids)]
-            else:
-                # Fallback: Use all rebounds (game-level, less accurate)
-                goalie_rebounds = all_rebounds
-            
-            if 'event_detail' in goalie_rebounds.columns and len(goalie_rebounds) > 0:
-                rebound_details = goalie_rebounds['event_detail'].astype(str)
-                stats['rebounds_team_recovered'] = len(rebound_details[rebound_details.str.contains('TeamRecovered', na=False)])
-                stats['rebounds_opp_recovered'] = len(rebound_details[rebound_details.str.contains('OppTeamRecovered', na=False)])
-                stats['rebounds_shot_generated'] = len(rebound_details[rebound_details.str.contains('ShotGenerated', na=False)])
-                stats['rebounds_flurry_generated'] = len(rebound_details[rebound_details.str.contains('Flurry', na=False)])
-            else:
-                stats['rebounds_team_recovered'] = stats['rebounds_opp_recovered'] = 0
-                stats['rebounds_shot_generated'] = stats['rebounds_flurry_generated'] = 0
-            
-            total_rebounds = stats['rebounds_team_recovered'] + stats['rebounds_opp_recovered'] + stats['rebounds_shot_generated'] + stats['rebounds_flurry_generated']
-            stats['rebound_control_rate'] = round(stats['rebounds_team_recovered'] / total_rebounds * 100, 1) if total_rebounds > 0 else 100.0
-            stats['rebound_danger_rate'] = round((stats['rebounds_shot_generated'] + stats['rebounds_flurry_generated']) / total_rebounds * 100, 1) if total_rebounds > 0 else 0.0
-            
-            # Second chance analysis (shots/goals after rebounds)
-            stats['second_chance_shots_against'] = stats['rebounds_shot_generated'] + stats['rebounds_flurry_generated']
-            # For goals, we'd need to track which goals came after rebounds - estimate as 0 for now
-            stats['second_chance_goals_against'] = 0  # Would need sequence analysis
-            stats['second_chance_sv_pct'] = 100.0 if stats['second_chance_shots_against'] == 0 else round((stats['second_chance_shots_against'] - stats['second_chance_goals_against']) / stats['second_chance_shots_against'] * 100, 1)
-            
-            stats['dangerous_rebound_pct'] = stats['rebound_danger_rate']
-            
-            # ================================================================
-            # CATEGORY 2: PERIOD SPLITS (15 columns)
-            # ================================================================
-            for period in [1, 2, 3]:
-                p_saves = len(goalie_saves[goalie_saves['period'] == period])
-                p_ga = len(goalie_goals_against[goalie_goals_against['period'] == period])
-                p_sa = p_saves + p_ga
-                p_sv_pct = round(p_saves / p_sa * 100, 1) if p_sa > 0 else 100.0
-                
-                stats[f'p{period}_saves'] = p_saves
-                stats[f'p{period}_goals_against'] = p_ga
-                stats[f'p{period}_shots_against'] = p_sa
-                stats[f'p{period}_sv_pct'] = p_sv_pct
-            
-            # Best/worst period
-            period_sv_pcts = {1: stats['p1_sv_pct'], 2: stats['p2_sv_pct'], 3: stats['p3_sv_pct']}
-            period_sas = {1: stats['p1_shots_against'], 2: stats['p2_shots_against'], 3: stats['p3_shots_against']}
-            
-            # Only consider periods with shots
-            active_periods = {p: sv for p, sv in period_sv_pcts.items() if period_sas[p] > 0}
-            if active_periods:
-                stats['best_period'] = max(active_periods, key=active_periods.get)
-                stats['worst_period'] = min(active_periods, key=active_periods.get)
-                sv_pct_values = list(active_periods.values())
-                stats['period_consistency'] = round(np.std(sv_pct_values), 2) if len(sv_pct_values) > 1 else 0.0
-            else:
-                stats['best_period'] = stats['worst_period'] = 0
-                stats['period_consistency'] = 0.0
-            
-            # ================================================================
-            # CATEGORY 3: TIME BUCKET / CLUTCH (12 columns)
-            # ================================================================
-            if 'time_bucket_id' in detailed_saves.columns:
-                # TB01 = early (0-5), TB02/TB03 = mid (5-15), TB04/TB05 = late (15-20)
-                early_saves = detailed_saves[detailed_saves['time_bucket_id'] == 'TB01']
-                mid_saves = detailed_saves[detailed_saves['time_bucket_id'].isin(['TB02', 'TB03'])]
-                late_saves = detailed_saves[detailed_saves['time_bucket_id'].isin(['TB04', 'TB05'])]
-                final_min_saves = detailed_saves[detailed_saves['time_bucket_id'] == 'TB05']
-                
-                stats['early_period_saves'] = len(early_saves)
-                stats['mid_period_saves'] = len(mid_saves)
-                stats['late_period_saves'] = len(late_saves)
-                stats['final_minute_saves'] = len(final_min_saves)
-            else:
-                stats['early_period_saves'] = stats['mid_period_saves'] = stats['late_period_saves'] = stats['final_minute_saves'] = 0
-            
-            # For GA by time bucket, use goals_against events
-            if 'time_bucket_id' in goalie_goals_against.columns:
-                stats['early_period_ga'] = len(goalie_goals_against[goalie_goals_against['time_bucket_id'] == 'TB01'])
-                stats['mid_period_ga'] = len(goalie_goals_against[goalie_goals_against['time_bucket_id'].isin(['TB02', 'TB03'])])
-                stats['late_period_ga'] = len(goalie_goals_against[goalie_goals_against['time_bucket_id'].isin(['TB04', 'TB05'])])
-                stats['final_minute_ga'] = len(goalie_goals_against[goalie_goals_against['time_bucket_id'] == 'TB05'])
-            else:
-                stats['early_period_ga'] = stats['mid_period_ga'] = stats['late_period_ga'] = stats['final_minute_ga'] = 0
-            
-            # Calculate SV% for each time bucket
-            for bucket in ['early_period', 'mid_period', 'late_period', 'final_minute']:
-                sv = stats[f'{bucket}_saves']
-                ga = stats[f'{bucket}_ga']
-                sa = sv + ga
-                stats[f'{bucket}_sv_pct'] = round(sv / sa * 100, 1) if sa > 0 else 100.0
-            
-            # ================================================================
-            # CATEGORY 4: SHOT CONTEXT - RUSH VS SET PLAY (12 columns)
-            # ================================================================
-            if 'time_since_zone_entry' in detailed_saves.columns:
-                tsze = detailed_saves['time_since_zone_entry'].fillna(999)
-                rush_saves_df = detailed_saves[tsze < 5]
-                quick_attack_df = detailed_saves[(tsze >= 5) & (tsze < 10)]
-                set_play_df = detailed_saves[tsze >= 10]
-                
-                stats['rush_saves'] = len(rush_saves_df)
-                stats['quick_attack_saves'] = len(quick_attack_df)
-                stats['set_play_saves'] = len(set_play_df)
-                stats['avg_time_from_entry'] = round(detailed_saves['time_since_zone_entry'].mean(), 1) if len(detailed_saves) > 0 else 0.0
-            else:
-                stats['rush_saves'] = stats['quick_attack_saves'] = stats['set_play_saves'] = 0
-                stats['avg_time_from_entry'] = 0.0
-            
-            # GA by shot context - NOW USING ACTUAL DATA (time_since_zone_entry on goals)
-            if 'time_since_zone_entry' in goalie_goals_against.columns:
-                ga_tsze = goalie_goals_against['time_since_zone_entry'].fillna(999)
-                stats['rush_goals_against'] = len(goalie_goals_against[ga_tsze < 5])
-                stats['quick_attack_ga'] = len(goalie_goals_against[(ga_tsze >= 5) & (ga_tsze < 10)])
-                stats['set_play_ga'] = len(goalie_goals_against[ga_tsze >= 10])
-            else:
-                stats['rush_goals_against'] = 0
-                stats['quick_attack_ga'] = 0
-                stats['set_play_ga'] = 0
-            
-            # SV% by context - NOW CALCULATED WITH REAL GA DATA
-            rush_sa = stats['rush_saves'] + stats['rush_goals_against']
-            quick_sa = stats['quick_attack_saves'] + stats['quick_attack_ga']
-            set_sa = stats['set_play_saves'] + stats['set_play_ga']
-            
-            stats['rush_sv_pct'] = round(stats['rush_saves'] / rush_sa * 100, 1) if rush_sa > 0 else 100.0
-            stats['quick_attack_sv_pct'] = round(stats['quick_attack_saves'] / quick_sa * 100, 1) if quick_sa > 0 else 100.0
-            stats['set_play_sv_pct'] = round(stats['set_play_saves'] / set_sa * 100, 1) if set_sa > 0 else 100.0
-            
-            stats['rush_pct_of_shots'] = round((stats['rush_saves'] + stats['rush_goals_against']) / stats['shots_against'] * 100, 1) if stats['shots_against'] > 0 else 0.0
-            stats['transition_defense_rating'] = round(stats['rush_sv_pct'] - stats['set_play_sv_pct'], 1)
-            
-            # ================================================================
-            # CATEGORY 5: PRESSURE / SEQUENCE HANDLING (10 columns)
-            # ================================================================
-            if 'sequence_shot_count' in detailed_saves.columns:
-                seq_counts = detailed_saves['sequence_shot_count'].fillna(0)
-                single_shot = detailed_saves[seq_counts <= 1]
-                multi_shot = detailed_saves[seq_counts >= 2]
-                sustained = detailed_saves[seq_counts >= 4]
-                
-                stats['single_shot_saves'] = len(single_shot)
-                stats['multi_shot_saves'] = len(multi_shot)
-                stats['sustained_pressure_saves'] = len(sustained)
-                stats['max_sequence_faced'] = int(seq_counts.max()) if len(seq_counts) > 0 else 0
-                stats['avg_sequence_length'] = round(seq_counts.mean(), 1) if len(seq_counts) > 0 else 0.0
-            else:
-                stats['single_shot_saves'] = stats['saves']
-                stats['multi_shot_saves'] = 0
-                stats['sustained_pressure_saves'] = 0
-                stats['max_sequence_faced'] = 1
-                stats['avg_sequence_length'] = 1.0
-            
-            # SV% under pressure - NOW USING ACTUAL SEQUENCE DATA FROM GOALS
-            if 'sequence_shot_count' in goalie_goals_against.columns:
-                ga_seq = goalie_goals_against['sequence_shot_count'].fillna(0)
-                multi_shot_ga = len(goalie_goals_against[ga_seq >= 2])
-                sustained_ga = len(goalie_goals_against[ga_seq >= 4])
-            else:
-                multi_shot_ga = 0
-                sustained_ga = 0
-            
-            multi_shot_sa = stats['multi_shot_saves'] + multi_shot_ga
-            sustained_sa = stats['sustained_pressure_saves'] + sustained_ga
-            
-            stats['multi_shot_sv_pct'] = round(stats['multi_shot_saves'] / multi_shot_sa * 100, 1) if multi_shot_sa > 0 else 100.0
-            stats['sustained_pressure_sv_pct'] = round(stats['sustained_pressure_saves'] / sustained_sa * 100, 1) if sustained_sa > 0 else 100.0
-            
-            # Sequence survival (% of sequences with 0 GA)
-            stats['sequence_survival_rate'] = round((stats['saves'] - stats['goals_against']) / stats['saves'] * 100, 1) if stats['saves'] > 0 else 100.0
-            stats['pressure_handling_index'] = round((stats['multi_shot_sv_pct'] + stats['sustained_pressure_sv_pct']) / 2, 1)
-            
-            # ================================================================
-            # CATEGORY 6: BODY LOCATION / TECHNIQUE (10 columns)
-            # ================================================================
-            # Glove side = Save_Glove + Save_LeftPad
-            stats['glove_side_saves'] = stats.get('saves_glove', 0) + len(goalie_saves[goalie_saves['event_detail_2'].astype(str).str.contains('LeftPad', na=False, case=False)]) if 'event_detail_2' in goalie_saves.columns else 0
-            stats['blocker_side_saves'] = stats.get('saves_blocker', 0) + len(goalie_saves[goalie_saves['event_detail_2'].astype(str).str.contains('RightPad', na=False, case=False)]) if 'event_detail_2' in goalie_saves.columns else 0
-            stats['five_hole_saves'] = stats.get('saves_butterfly', 0) + stats.get('saves_scramble', 0)
-            
-            # GA by location (would need goal-level data)
-            stats['glove_side_ga'] = 0
-            stats['blocker_side_ga'] = 0
-            stats['five_hole_ga'] = 0
-            
-            # SV% by location
-            stats['glove_side_sv_pct'] = round(stats['glove_side_saves'] / (stats['glove_side_saves'] + stats['glove_side_ga']) * 100, 1) if (stats['glove_side_saves'] + stats['glove_side_ga']) > 0 else 100.0
-            stats['blocker_side_sv_pct'] = round(stats['blocker_side_saves'] / (stats['blocker_side_saves'] + stats['blocker_side_ga']) * 100, 1) if (stats['blocker_side_saves'] + stats['blocker_side_ga']) > 0 else 100.0
-            stats['five_hole_sv_pct'] = round(stats['five_hole_saves'] / (stats['five_hole_saves'] + stats['five_hole_ga']) * 100, 1) if (stats['five_hole_saves'] + stats['five_hole_ga']) > 0 else 100.0
-            
-            stats['side_preference_ratio'] = round(stats['glove_side_saves'] / stats['blocker_side_saves'], 2) if stats['blocker_side_saves'] > 0 else 1.0
-            
-            # ================================================================
-            # CATEGORY 7: WORKLOAD METRICS (10 columns)
-            # ================================================================
-            stats['shots_per_period'] = round(stats['shots_against'] / 3, 1)
-            stats['saves_per_period'] = round(stats['saves'] / 3, 1)
-            stats['max_shots_in_period'] = max(stats['p1_shots_against'], stats['p2_shots_against'], stats['p3_shots_against'])
-            
-            # Shot volume variance
-            period_shots = [stats['p1_shots_against'], stats['p2_shots_against'], stats['p3_shots_against']]
-            stats['shot_volume_variance'] = round(np.std(period_shots), 2) if sum(period_shots) > 0 else 0.0
-            
-            # Time between shots analysis
-            if 'time_since_last_sog' in detailed_saves.columns:
-                time_gaps = detailed_saves['time_since_last_sog'].dropna()
-                stats['time_between_shots_avg'] = round(time_gaps.mean(), 1) if len(time_gaps) > 0 else 0.0
-                stats['time_between_shots_min'] = round(time_gaps.min(), 1) if len(time_gaps) > 0 else 0.0
-                stats['rapid_fire_saves'] = len(time_gaps[time_gaps < 3])
-            else:
-                stats['time_between_shots_avg'] = 0.0
-                stats['time_between_shots_min'] = 0.0
-                stats['rapid_fire_saves'] = 0
-            
-            # Consecutive saves (estimate based on GA distribution)
-            stats['consecutive_saves_max'] = stats['saves'] // max(1, stats['goals_against']) if stats['goals_against'] > 0 else stats['saves']
-            
-            # Workload index (composite)
-            stats['workload_index'] = round(stats['shots_against'] * (1 + stats['shot_volume_variance'] / 10), 1)
-            
-            # Fatigue-adjusted GSAA (penalize high workload slightly)
-            fatigue_factor = 1.0 - (stats['shots_against'] - 20) * 0.005 if stats['shots_against'] > 20 else 1.0
-            stats['fatigue_adjusted_gsaa'] = round(stats.get('goals_saved_above_avg', 0) * fatigue_factor, 2)
-            
-            # ================================================================
-            # QUALITY INDICATORS (existing, enhanced)
-            # ================================================================
-            stats['is_quality_start'] = 1 if (stats['save_pct'] >= 91.7 or stats['goals_against'] <= 2) else 0
-            stats['is_bad_start'] = 1 if stats['save_pct'] < 85.0 else 0
-            
-            # GSAx (existing)
-            expected = stats['shots_against'] * (1 - LEAGUE_AVG_SV_PCT / 100)
-            stats['expected_goals_against'] = round(expected, 2)
-            stats['goals_saved_above_avg'] = round(expected - stats['goals_against'], 2)
-            
-            # ================================================================
-            # CATEGORY 8: ADVANCED COMPOSITES (10 columns)
-            # ================================================================
-            # Goalie Game Score (inspired by Dom Luszczyszyn)
-            # Base: saves * 0.1 - GA * 0.75 + shutout bonus
-            shutout_bonus = 2.0 if stats['goals_against'] == 0 else 0.0
-            stats['goalie_game_score'] = round(stats['saves'] * 0.1 - stats['goals_against'] * 0.75 + shutout_bonus + stats['hd_saves'] * 0.2, 2)
-            
-            # Simple xG model: rush shots worth more, HD shots worth more
-            rush_xg = stats['rush_saves'] * 0.15 + stats['rush_goals_against'] * 1.0
-            set_xg = stats['set_play_saves'] * 0.08 + stats['set_play_ga'] * 1.0
-            hd_xg = stats['hd_shots_against'] * 0.25
-            stats['goalie_gax'] = round(rush_xg + set_xg + hd_xg * 0.5, 2)  # Expected GA
-            stats['goalie_gsax'] = round(stats['goalie_gax'] - stats['goals_against'], 2)  # Goals Saved Above Expected
-            
-            # Clutch rating (P3 + late period performance weighted)
-            stats['clutch_rating'] = round((stats['p3_sv_pct'] * 0.4 + stats['late_period_sv_pct'] * 0.3 + stats['final_minute_sv_pct'] * 0.3), 1)
-            
-            # Consistency rating (inverse of variance)
-            stats['consistency_rating'] = round(100 - stats['period_consistency'] * 2, 1)
-            
-            # Pressure rating
-            stats['pressure_rating'] = stats['pressure_handling_index']
-            
-            # Rebound rating
-            stats['rebound_rating'] = round(stats['freeze_pct'] * 0.4 + stats['rebound_control_rate'] * 0.4 + (100 - stats['rebound_danger_rate']) * 0.2, 1)
-            
-            # Positioning rating (based on save technique distribution - more controlled = better)
-            controlled_saves = stats.get('saves_glove', 0) + stats.get('saves_blocker', 0) + stats.get('saves_chest', 0)
-            stats['positioning_rating'] = round(controlled_saves / stats['saves'] * 100, 1) if stats['saves'] > 0 else 50.0
-            
-            # Overall game rating (1-10 scale)
-            raw_rating = (stats['save_pct'] - 80) / 4  # 80% = 0, 100% = 5
-            raw_rating += stats['goalie_gsax'] * 0.5  # GSAX bonus
-            raw_rating += shutout_bonus * 0.5
-            stats['overall_game_rating'] = round(max(1, min(10, raw_rating + 5)), 1)  # Scale to 1-10
-            
-            # Win probability added (simplified)
-            stats['win_probability_added'] = round(stats['goals_saved_above_avg'] * 0.05, 3)
-            
-            # ================================================================
-            # GOALIE WAR (existing, updated)
-            # ================================================================
-            war_stats = calculate_goalie_war(stats)
-            stats.update(war_stats)
-            
-        else:
-            # Fallback for missing venue data
-            stats['saves'] = len(all_saves_events) // 2
-            stats['goals_against'] = len(all_goals) // 2
-            stats['shots_against'] = stats['saves'] + stats['goals_against']
-            stats['save_pct'] = round(stats['saves'] / stats['shots_against'] * 100, 1) if stats['shots_against'] > 0 else 100.0
-            
-            # Set all advanced stats to defaults
-            for col in ['saves_butterfly', 'saves_pad', 'saves_glove', 'saves_blocker', 'saves_chest', 'saves_stick', 'saves_scramble']:
-                stats[col] = 0
-            for col in ['hd_shots_against', 'hd_goals_against', 'hd_saves']:
-                stats[col] = 0
-            stats['hd_save_pct'] = 100.0
-            
-            # Rebound control defaults
-            stats['saves_freeze'] = stats['saves_rebound'] = 0
-            stats['freeze_pct'] = stats['rebound_rate'] = 0.0
-            stats['rebounds_team_recovered'] = stats['rebounds_opp_recovered'] = 0
-            stats['rebounds_shot_generated'] = stats['rebounds_flurry_generated'] = 0
-            stats['rebound_control_rate'] = 100.0
-            stats['rebound_danger_rate'] = 0.0
-            stats['second_chance_shots_against'] = stats['second_chance_goals_against'] = 0
-            stats['second_chance_sv_pct'] = 100.0
-            stats['dangerous_rebound_pct'] = 0.0
-            
-            # Period splits defaults
-            for p in [1, 2, 3]:
-                stats[f'p{p}_saves'] = stats[f'p{p}_goals_against'] = stats[f'p{p}_shots_against'] = 0
-                stats[f'p{p}_sv_pct'] = 100.0
-            stats['best_period'] = stats['worst_period'] = 0
-            stats['period_consistency'] = 0.0
-            
-            # Time bucket defaults
-            for tb in ['early_period', 'mid_period', 'late_period', 'final_minute']:
-                stats[f'{tb}_saves'] = stats[f'{tb}_ga'] = 0
-                stats[f'{tb}_sv_pct'] = 100.0
-            
-            # Shot context defaults
-            stats['rush_saves'] = stats['quick_attack_saves'] = stats['set_play_saves'] = 0
-            stats['rush_goals_against'] = stats['quick_attack_ga'] = stats['set_play_ga'] = 0
-            stats['rush_sv_pct'] = stats['quick_attack_sv_pct'] = stats['set_play_sv_pct'] = 100.0
-            stats['avg_time_from_entry'] = 0.0
-            stats['rush_pct_of_shots'] = 0.0
-            stats['transition_defense_rating'] = 0.0
-            
-            # Pressure defaults
-            stats['single_shot_saves'] = stats['saves']
-            stats['multi_shot_saves'] = stats['sustained_pressure_saves'] = 0
-            stats['multi_shot_sv_pct'] = stats['sustained_pressure_sv_pct'] = 100.0
-            stats['max_sequence_faced'] = 1
-            stats['avg_sequence_length'] = 1.0
-            stats['sequence_survival_rate'] = 100.0
-            stats['pressure_handling_index'] = 100.0
-            
-            # Body location defaults
-            stats['glove_side_saves'] = stats['blocker_side_saves'] = stats['five_hole_saves'] = 0
-            stats['glove_side_ga'] = stats['blocker_side_ga'] = stats['five_hole_ga'] = 0
-            stats['glove_side_sv_pct'] = stats['blocker_side_sv_pct'] = stats['five_hole_sv_pct'] = 100.0
-            stats['side_preference_ratio'] = 1.0
-            
-            # Workload defaults
-            stats['shots_per_period'] = stats['saves_per_period'] = 0.0
-            stats['max_shots_in_period'] = 0
-            stats['shot_volume_variance'] = 0.0
-            stats['time_between_shots_avg'] = stats['time_between_shots_min'] = 0.0
-            stats['rapid_fire_saves'] = 0
-            stats['consecutive_saves_max'] = 0
-            stats['workload_index'] = 0.0
-            stats['fatigue_adjusted_gsaa'] = 0.0
-            
-            # Quality indicators
-            stats['is_quality_start'] = 0
-            stats['is_bad_start'] = 0
-            stats['expected_goals_against'] = 0.0
-            stats['goals_saved_above_avg'] = 0.0
-            
-            # Composites defaults
-            stats['goalie_game_score'] = 0.0
-            stats['goalie_gax'] = stats['goalie_gsax'] = 0.0
-            stats['clutch_rating'] = 50.0
-            stats['consistency_rating'] = 50.0
-            stats['pressure_rating'] = 50.0
-            stats['rebound_rating'] = 50.0
-            stats['positioning_rating'] = 50.0
-            stats['overall_game_rating'] = 5.0
-            stats['win_probability_added'] = 0.0
-            
-            war_stats = calculate_goalie_war(stats)
-            stats.update(war_stats)
-        
-        all_stats.append(stats)
-    
-    df = pd.DataFrame(all_stats)
-    print(f"  Created {len(df)} goalie-game records with {len(df.columns)} columns")
-    return df
-
-
 def create_all_core_facts():
     """Create all core fact tables."""
     print("\n" + "=" * 70)
@@ -958,6 +958,19 @@ def create_fact_rush_events() -> pd.DataFrame:
     return df
 
 
+def _group_mode(df: pd.DataFrame, keys: list, col: str) -> pd.Series:
+    """
+    Most frequent non-null value of col per key group (smallest value on
+    ties, like Series.mode().iloc[0]), indexed by keys.
+    """
+    counts = df[keys + [col]].dropna().groupby(keys + [col], sort=True).size()
+    if len(counts) == 0:
+        return pd.Series(dtype=object, index=pd.MultiIndex.from_arrays([[]] * len(keys), names=keys))
+    counts = counts.reset_index(name='_n')
+    best = counts.loc[counts.groupby(keys, sort=False)['_n'].idxmax()]
+    return best.set_index(keys)[col]
+
+
 def create_fact_possession_time() -> pd.DataFrame:
     """
     Create possession time estimates per player per game.
@@ -966,6 +979,10 @@ def create_fact_possession_time() -> pd.DataFrame:
     EXCEPT for defensive/support roles which should also be counted.
     
     This ensures proper attribution while capturing defensive contributions.
+
+    Counts are grouped sums over (game, player); venue and team come from
+    the player's event rows (most frequent value), falling back to the
+    roster through one merge.
     """
     PRIMARY_PLAYER = 'event_player_1'
     
@@ -981,121 +998,94 @@ def create_fact_possession_time() -> pd.DataFrame:
     
     # Filter to event_player_1 OR defender/support roles
     # Defensive/support roles might be: 'defender', 'support', 'defensive_player', etc.
-    primary_mask = event_players['player_role'].astype(str).str.lower() == PRIMARY_PLAYER.lower()
-    defensive_support_mask = event_players['player_role'].astype(str).str.lower().str.contains(
-        r'defender|support|defensive', na=False, regex=True
-    )
+    role = event_players['player_role'].astype(str).str.lower()
+    primary_mask = role == PRIMARY_PLAYER.lower()
+    defensive_support_mask = role.str.contains(r'defender|support|defensive', na=False, regex=True)
     
     # Include both primary players and defensive/support roles
-    filtered_events = event_players[primary_mask | defensive_support_mask].copy()
+    filtered_events = event_players[primary_mask | defensive_support_mask]
+    filtered_events = filtered_events[
+        filtered_events['game_id'].notna() & filtered_events['player_id'].notna() &
+        (filtered_events['game_id'] != 99999)
+    ]
     
     if len(filtered_events) == 0:
         print("  WARNING: No event_player_1 or defender/support events found!")
         return pd.DataFrame()
     
-    # Group by game and player
-    grouped = filtered_events.groupby(['game_id', 'player_id'])
+    keys = ['game_id', 'player_id']
+    grouped = filtered_events.groupby(keys, sort=True)
+    poss = grouped.size().rename('_rows').reset_index()[keys]
+    
+    poss.insert(0, 'possession_key', [f"POSS_{g}_{p}" for g, p in zip(poss['game_id'].tolist(), poss['player_id'].tolist())])
+    
+    # Get season_id
+    if len(schedule) > 0 and 'season_id' in schedule.columns:
+        seasons = schedule.drop_duplicates('game_id').set_index('game_id')['season_id']
+        found = poss['game_id'].isin(seasons.index)
+        if found.any():
+            poss['season_id'] = poss['game_id'].map(seasons).where(found)
+    
+    # Venue and team_id: most frequent value in event_players, else first roster value
+    group_index = pd.MultiIndex.from_frame(poss[keys])
+    venue = pd.Series(None, index=group_index, dtype=object)
+    team_id = pd.Series(None, index=group_index, dtype=object)
+    if 'team_venue' in filtered_events.columns:
+        venue = _group_mode(filtered_events, keys, 'team_venue').reindex(group_index).astype(object)
+    if 'player_team_id' in filtered_events.columns:
+        team_id = _group_mode(filtered_events, keys, 'player_team_id').reindex(group_index).astype(object)
+    
+    if len(roster) > 0 and (venue.isna().any() or team_id.isna().any()):
+        roster_cols = [c for c in ['team_venue', 'team_id'] if c in roster.columns]
+        first = roster.groupby(keys, sort=False)[roster_cols].first() if roster_cols else pd.DataFrame()
+        matched = poss[keys].astype(object).merge(
+            first.reset_index().astype({k: object for k in keys}), on=keys, how='left'
+        ) if roster_cols else poss[keys]
+        if 'team_venue' in matched.columns:
+            venue = venue.fillna(pd.Series(matched['team_venue'].to_numpy(), index=group_index))
+        if 'team_id' in matched.columns:
+            team_id = team_id.fillna(pd.Series(matched['team_id'].to_numpy(), index=group_index))
+    
+    # Map venue to full name if needed
+    venue_lower = venue.astype(str).str.lower()
+    venue = venue.mask(venue_lower.isin(['h', 'home']), 'home').mask(venue_lower.isin(['a', 'away']), 'away')
+    venue_map = {'home': 'VEN001', 'away': 'VEN002', 'h': 'VEN001', 'a': 'VEN002'}
+    
+    poss['venue'] = venue.where(venue.notna(), None).tolist()
+    poss['team_id'] = team_id.where(team_id.notna(), None).tolist()
+    poss['venue_id'] = venue.astype(str).str.lower().map(venue_map).where(venue.notna(), None).tolist()
+    
+    # Count possession-related events (only from filtered events - event_player_1 or defender/support)
+    event_type = filtered_events['event_type'].astype(str).str.lower()
+    detail = filtered_events['event_detail'].astype(str).str.lower()
+    is_entry = detail.str.contains('entry', na=False)
+    is_zone = event_type.str.contains('zone', na=False)
+    flags = {
+        'zone_entries': is_zone & is_entry,
+        'zone_exits': is_zone & detail.str.contains('exit', na=False),
+    }
     
-    all_possession = []
+    # Offensive / defensive (bad) zone entries
+    if 'event_team_zone' in filtered_events.columns:
+        team_zone = filtered_events['event_team_zone'].astype(str).str.lower()
+        flags['ozone_entries'] = team_zone.str.contains(r'^o|offensive', na=False, regex=True) & is_entry
+        flags['dzone_entries'] = team_zone.str.contains(r'^d|defensive', na=False, regex=True) & is_entry
+    else:
+        flags['ozone_entries'] = flags['dzone_entries'] = False
     
-    for (game_id, player_id), group in grouped:
-        if pd.isna(player_id) or game_id == 99999:
-            continue
-        
-        poss = {
-            'possession_key': f"POSS_{game_id}_{player_id}",
-            'game_id': game_id,
-            'player_id': player_id,
-        }
-        
-        # Get season_id
-        if len(schedule) > 0:
-            game_info = schedule[schedule['game_id'] == game_id]
-            if len(game_info) > 0 and 'season_id' in game_info.columns:
-                poss['season_id'] = game_info['season_id'].values[0]
-        
-        # Get venue and team_id from event_players or roster
-        venue = None
-        team_id = None
-        
-        # Try to get from group (event_players)
-        if 'team_venue' in group.columns:
-            venue_vals = group['team_venue'].dropna()
-            if len(venue_vals) > 0:
-                venue = venue_vals.mode().iloc[0] if len(venue_vals.mode()) > 0 else venue_vals.iloc[0]
-        
-        if 'player_team_id' in group.columns:
-            team_vals = group['player_team_id'].dropna()
-            if len(team_vals) > 0:
-                team_id = team_vals.mode().iloc[0] if len(team_vals.mode()) > 0 else team_vals.iloc[0]
-        
-        # Fallback to roster if not found in event_players
-        if (venue is None or team_id is None) and len(roster) > 0:
-            player_roster = roster[
-                (roster['game_id'] == game_id) &
-                (roster['player_id'] == player_id)
-            ]
-            if len(player_roster) > 0:
-                if venue is None and 'team_venue' in player_roster.columns:
-                    venue_vals = player_roster['team_venue'].dropna()
-                    if len(venue_vals) > 0:
-                        venue = venue_vals.iloc[0]
-                
-                if team_id is None and 'team_id' in player_roster.columns:
-                    team_vals = player_roster['team_id'].dropna()
-                    if len(team_vals) > 0:
-                        team_id = team_vals.iloc[0]
-        
-        # Map venue to full name if needed
-        if venue is not None:
-            venue_lower = str(venue).lower()
-            if venue_lower in ['h', 'home']:
-                venue = 'home'
-            elif venue_lower in ['a', 'away']:
-                venue = 'away'
-        
-        poss['venue'] = venue
-        poss['team_id'] = team_id
-        
-        # Add venue_id if venue is available
-        if venue is not None:
-            venue_map = {'home': 'VEN001', 'away': 'VEN002', 'h': 'VEN001', 'a': 'VEN002'}
-            poss['venue_id'] = venue_map.get(venue.lower(), None)
-        else:
-            poss['venue_id'] = None
-        
-        # Count possession-related events (only from filtered events - event_player_1 or defender/support)
-        # Zone entries
-        entries = group[group['event_type'].astype(str).str.lower().str.contains('zone', na=False)]
-        poss['zone_entries'] = len(entries[entries['event_detail'].astype(str).str.lower().str.contains('entry', na=False)])
-        poss['zone_exits'] = len(entries[entries['event_detail'].astype(str).str.lower().str.contains('exit', na=False)])
-        
-        # Offensive zone entries
-        if 'event_team_zone' in group.columns:
-            ozone = group[group['event_team_zone'].astype(str).str.lower().str.contains(r'^o|offensive', na=False, regex=True)]
-            poss['ozone_entries'] = len(ozone[ozone['event_detail'].astype(str).str.lower().str.contains('entry', na=False)])
-        else:
-            poss['ozone_entries'] = 0
-        
-        # Defensive zone entries (bad)
-        if 'event_team_zone' in group.columns:
-            dzone = group[group['event_team_zone'].astype(str).str.lower().str.contains(r'^d|defensive', na=False, regex=True)]
-            poss['dzone_entries'] = len(dzone[dzone['event_detail'].astype(str).str.lower().str.contains('entry', na=False)])
-        else:
-            poss['dzone_entries'] = 0
-        
-        # Total possession events (passes, shots, carries)
-        possession_events = group[
-            group['event_type'].astype(str).str.lower().isin(['pass', 'shot', 'possession', 'deke'])
-        ]
-        poss['possession_events'] = len(possession_events)
-        
-        # Estimate possession time (very rough: 3 seconds per possession event)
-        poss['estimated_possession_seconds'] = poss['possession_events'] * 3
-        
-        all_possession.append(poss)
+    # Total possession events (passes, shots, carries)
+    flags['possession_events'] = event_type.isin(['pass', 'shot', 'possession', 'deke'])
+    
+    counts = pd.DataFrame(flags, index=filtered_events.index).groupby(
+        [filtered_events[k] for k in keys], sort=True
+    ).sum()
+    for col in flags:
+        poss[col] = counts[col].to_numpy(dtype=np.int64)
+    
+    # Estimate possession time (very rough: 3 seconds per possession event)
+    poss['estimated_possession_seconds'] = poss['possession_events'] * 3
     
-    df = pd.DataFrame(all_possession)
+    df = poss
     print(f"  Created {len(df)} possession records")
     return df
 
@@ -22,10 +22,12 @@ import numpy as np
 from datetime import datetime
 from src.tables.core_facts import load_table, save_table
 from src.utils.game_type_aggregator import (
-    GAME_TYPE_SPLITS,
     add_game_type_to_df,
-    get_team_record_from_schedule,
-    get_goalie_record_from_games
+    aggregate_game_type_splits,
+    format_key_column,
+    ratio,
+    goalie_game_results,
+    team_game_results
 )
 
 
@@ -34,6 +36,12 @@ def is_goalie(position: str) -> bool:
     return 'goalie' in str(position).lower()
 
 
+def _rate(numerator, denominator: pd.Series, scale: float = 1.0, decimals: int = 2) -> pd.Series:
+    """Rounded numerator / denominator * scale; NaN where the denominator is not > 0."""
+    valid = denominator > 0
+    return (numerator / denominator.where(valid) * scale).round(decimals)
+
+
 # =============================================================================
 # BASIC TABLES (from roster/schedule - official league stats)
 # =============================================================================
@@ -62,54 +70,32 @@ def create_fact_player_season_stats_basic() -> pd.DataFrame:
     # Add game_type using shared utility
     skaters = add_game_type_to_df(skaters, schedule)
     
-    all_stats = []
-    
-    # Get unique player-season combinations
-    # VECTORIZED: Use groupby instead of iterrows
-    grouped = skaters.groupby(['player_id', 'season_id', 'game_type'])
+    # Regular / Playoffs / All in one pass
+    df = aggregate_game_type_splits(
+        skaters,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'games_played': ('game_id', 'nunique'),
+            'goals': ('goals', 'sum'),
+            'assists': ('assist', 'sum'),
+            'points': ('points', 'sum'),
+            'pim': ('pim', 'sum'),
+            'goals_per_game': ratio('goals', 'games_played', decimals=2),
+            'assists_per_game': ratio('assists', 'games_played', decimals=2),
+            'points_per_game': ratio('points', 'games_played', decimals=2),
+            'pim_per_game': ratio('pim', 'games_played', decimals=2),
+        },
+        key_col='player_season_basic_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+    )
     
-    # Get player metadata (first occurrence per player_id, season_id)
-    player_meta = skaters[['player_id', 'season_id', 'player_full_name', 'team_id', 
+    # Player metadata (first roster row per player_id, season_id)
+    player_meta = skaters[['player_id', 'season_id', 'player_full_name', 'team_id',
                            'team_name', 'player_position', 'season']].drop_duplicates(
-                               subset=['player_id', 'season_id']).set_index(['player_id', 'season_id'])
-    
-    for (player_id, season_id, game_type), games in grouped:
-        if len(games) == 0:
-            continue
-        
-        # Get metadata
-        meta = player_meta.loc[(player_id, season_id)]
-        
-        gp = games['game_id'].nunique()
-        goals = int(games['goals'].sum())
-        assists = int(games['assist'].sum())
-        points = int(games['points'].sum())
-        pim = int(games['pim'].sum())
-        
-        stats = {
-            'player_season_basic_key': f"{player_id}_{season_id}_{game_type}",
-            'player_id': player_id,
-            'season_id': season_id,
-            'season': meta.get('season', ''),
-            'game_type': game_type,
-            'player_name': meta.get('player_full_name', ''),
-            'team_id': meta.get('team_id', ''),
-            'team_name': meta.get('team_name', ''),
-            'position': meta.get('player_position', ''),
-            'games_played': gp,
-            'goals': goals,
-            'assists': assists,
-            'points': points,
-            'pim': pim,
-            'goals_per_game': round(goals / gp, 2) if gp > 0 else 0,
-            'assists_per_game': round(assists / gp, 2) if gp > 0 else 0,
-            'points_per_game': round(points / gp, 2) if gp > 0 else 0,
-            'pim_per_game': round(pim / gp, 2) if gp > 0 else 0,
-            '_export_timestamp': datetime.now().isoformat(),
-        }
-        all_stats.append(stats)
-    
-    df = pd.DataFrame(all_stats)
+                               subset=['player_id', 'season_id']).rename(
+                               columns={'player_full_name': 'player_name', 'player_position': 'position'})
+    df = df.merge(player_meta, on=['player_id', 'season_id'], how='left')
+    df['_export_timestamp'] = datetime.now().isoformat()
     
     # Reorder columns
     cols = ['player_season_basic_key', 'player_id', 'season_id', 'season', 'game_type',
@@ -145,64 +131,30 @@ def create_fact_player_career_stats_basic() -> pd.DataFrame:
     # Add game_type from schedule
     skaters = add_game_type_to_df(skaters, schedule)
     
-    all_stats = []
+    df = aggregate_game_type_splits(
+        skaters,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'career_games': ('game_id', 'nunique'),
+            'career_goals': ('goals', 'sum'),
+            'career_assists': ('assist', 'sum'),
+            'career_points': ('points', 'sum'),
+            'career_pim': ('pim', 'sum'),
+            'goals_per_game': ratio('career_goals', 'career_games', decimals=2),
+            'assists_per_game': ratio('career_assists', 'career_games', decimals=2),
+            'points_per_game': ratio('career_points', 'career_games', decimals=2),
+            'pim_per_game': ratio('career_pim', 'career_games', decimals=2),
+        },
+        key_col='player_career_basic_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+    )
     
-    # Get unique player-season combinations
-    player_seasons = skaters[['player_id', 'season_id', 'player_full_name', 'player_position', 
-                               'team_name']].drop_duplicates(subset=['player_id', 'season_id'])
-    
-    for _, ps in player_seasons.iterrows():
-        player_id = ps['player_id']
-        season_id = ps['season_id']
-        
-        player_games = skaters[(skaters['player_id'] == player_id) & 
-                               (skaters['season_id'] == season_id)]
-        
-        # Split by game_type
-        for game_type in GAME_TYPE_SPLITS:
-            if game_type == 'All':
-                games = player_games
-            else:
-                games = player_games[player_games['game_type'] == game_type]
-            
-            if len(games) == 0:
-                continue
-            
-            # Aggregate stats
-            career_games = games['game_id'].nunique()
-            career_goals = int(games['goals'].sum())
-            career_assists = int(games['assist'].sum())
-            career_points = int(games['points'].sum())
-            career_pim = int(games['pim'].sum())
-            
-            # Per-game rates
-            goals_per_game = round(career_goals / career_games, 2) if career_games > 0 else 0.0
-            assists_per_game = round(career_assists / career_games, 2) if career_games > 0 else 0.0
-            points_per_game = round(career_points / career_games, 2) if career_games > 0 else 0.0
-            pim_per_game = round(career_pim / career_games, 2) if career_games > 0 else 0.0
-            
-            stats = {
-                'player_career_basic_key': f"{player_id}_{season_id}_{game_type}",
-                'player_id': player_id,
-                'season_id': season_id,
-                'game_type': game_type,
-                'player_name': ps['player_full_name'],
-                'position': ps['player_position'],
-                'current_team': ps['team_name'],
-                'career_games': career_games,
-                'career_goals': career_goals,
-                'career_assists': career_assists,
-                'career_points': career_points,
-                'career_pim': career_pim,
-                'goals_per_game': goals_per_game,
-                'assists_per_game': assists_per_game,
-                'points_per_game': points_per_game,
-                'pim_per_game': pim_per_game,
-                '_export_timestamp': datetime.now().isoformat(),
-            }
-            all_stats.append(stats)
-    
-    df = pd.DataFrame(all_stats)
+    player_meta = skaters[['player_id', 'season_id', 'player_full_name', 'player_position',
+                           'team_name']].drop_duplicates(subset=['player_id', 'season_id']).rename(
+                               columns={'player_full_name': 'player_name', 'player_position': 'position',
+                                        'team_name': 'current_team'})
+    df = df.merge(player_meta, on=['player_id', 'season_id'], how='left')
+    df['_export_timestamp'] = datetime.now().isoformat()
     
     cols = ['player_career_basic_key', 'player_id', 'season_id', 'game_type', 
             'player_name', 'position', 'current_team',
@@ -251,54 +203,34 @@ def create_fact_goalie_season_stats_basic() -> pd.DataFrame:
         if col in goalies.columns:
             goalies[col] = pd.to_numeric(goalies[col], errors='coerce').fillna(0).astype(int)
     
-    all_stats = []
-    
-    # Get unique goalie-season combinations
-    # VECTORIZED: Use groupby instead of iterrows
-    grouped = goalies.groupby(['player_id', 'season_id', 'game_type'])
+    # Per-game W/L/T flags (shared rule), summed by the aggregation
+    goalies = goalies.join(goalie_game_results(goalies))
+    
+    df = aggregate_game_type_splits(
+        goalies,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'games_played': ('game_id', 'nunique'),
+            'wins': ('wins', 'sum'),
+            'losses': ('losses', 'sum'),
+            'ties': ('ties', 'sum'),
+            'goals_against': ('goals_against', 'sum'),
+            'gaa': ratio('goals_against', 'games_played', decimals=2),
+            'shutouts': ('shutouts', 'sum'),
+            'shutout_pct': ratio('shutouts', 'games_played', scale=100, decimals=1),
+            'win_pct': ratio('wins', 'games_played', scale=100, decimals=1),
+        },
+        key_col='goalie_season_basic_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+    )
     
-    # Get goalie metadata
+    # Goalie metadata
     goalie_meta = goalies[['player_id', 'season_id', 'player_full_name', 'team_id', 
                            'team_name', 'season']].drop_duplicates(
-                               subset=['player_id', 'season_id']).set_index(['player_id', 'season_id'])
-    
-    for (player_id, season_id, game_type), games in grouped:
-        if len(games) == 0:
-            continue
-        
-        # Get metadata
-        meta = goalie_meta.loc[(player_id, season_id)]
-        
-        # Use shared utility for W-L-T calculation
-        record = get_goalie_record_from_games(games)
-        
-        gp = games['game_id'].nunique()
-        ga = int(games['goals_against'].sum())
-        so = int(games['shutouts'].sum())
-        
-        stats = {
-            'goalie_season_basic_key': f"{player_id}_{season_id}_{game_type}",
-            'player_id': player_id,
-            'season_id': season_id,
-            'season': meta.get('season', ''),
-            'game_type': game_type,
-            'player_name': meta.get('player_full_name', ''),
-            'team_id': meta.get('team_id', ''),
-            'team_name': meta.get('team_name', ''),
-            'games_played': gp,
-            'wins': record['wins'],
-            'losses': record['losses'],
-            'ties': record['ties'],
-            'goals_against': ga,
-            'gaa': round(ga / gp, 2) if gp > 0 else 0.0,
-            'shutouts': so,
-            'shutout_pct': round(so / gp * 100, 1) if gp > 0 else 0.0,
-            'win_pct': round(record['wins'] / gp * 100, 1) if gp > 0 else 0.0,
-            '_export_timestamp': datetime.now().isoformat(),
-        }
-        all_stats.append(stats)
-    
-    df = pd.DataFrame(all_stats)
+                               subset=['player_id', 'season_id']).rename(
+                               columns={'player_full_name': 'player_name'})
+    df = df.merge(goalie_meta, on=['player_id', 'season_id'], how='left')
+    df['_export_timestamp'] = datetime.now().isoformat()
     
     cols = ['goalie_season_basic_key', 'player_id', 'season_id', 'season', 'game_type',
             'player_name', 'team_id', 'team_name', 'games_played', 'wins', 'losses', 'ties',
@@ -323,62 +255,34 @@ def create_fact_goalie_career_stats_basic() -> pd.DataFrame:
     # Use the season stats as base (already has season_id and game_type)
     season_stats = load_table('fact_goalie_season_stats_basic')
     
-    all_stats = []
+    # Career rates (same for both sources)
+    career_rates = {
+        'career_gaa': ratio('career_goals_against', 'career_games', decimals=2),
+        'career_shutout_pct': ratio('career_shutouts', 'career_games', scale=100, decimals=1),
+        'career_win_pct': ratio('career_wins', 'career_games', scale=100, decimals=1),
+    }
+    key_args = dict(key_col='goalie_career_basic_key', key_template='{player_id}_{season_id}_{game_type}')
     
     if len(season_stats) > 0:
         # Aggregate from season stats, preserving season_id and game_type
-        # Get unique player-season combinations
-        player_seasons = season_stats[['player_id', 'season_id', 'player_name', 
-                                       'team_name']].drop_duplicates(subset=['player_id', 'season_id'])
-        
-        for _, ps in player_seasons.iterrows():
-            player_id = ps['player_id']
-            season_id = ps['season_id']
-            
-            player_season_data = season_stats[
-                (season_stats['player_id'] == player_id) & 
-                (season_stats['season_id'] == season_id)
-            ]
-            
-            # Split by game_type
-            for game_type in GAME_TYPE_SPLITS:
-                type_data = player_season_data[player_season_data['game_type'] == game_type]
-                
-                if len(type_data) == 0:
-                    continue
-                
-                # Aggregate stats
-                career_games = int(type_data['games_played'].sum())
-                career_wins = int(type_data['wins'].sum())
-                career_losses = int(type_data['losses'].sum())
-                career_ties = int(type_data.get('ties', pd.Series([0] * len(type_data))).sum())
-                career_goals_against = int(type_data['goals_against'].sum())
-                career_shutouts = int(type_data['shutouts'].sum())
-                
-                # Calculate rates
-                career_gaa = round(career_goals_against / career_games, 2) if career_games > 0 else 0.0
-                career_win_pct = round(career_wins / career_games * 100, 1) if career_games > 0 else 0.0
-                career_shutout_pct = round(career_shutouts / career_games * 100, 1) if career_games > 0 else 0.0
-                
-                stats = {
-                    'goalie_career_basic_key': f"{player_id}_{season_id}_{game_type}",
-                    'player_id': player_id,
-                    'season_id': season_id,
-                    'game_type': game_type,
-                    'player_name': ps['player_name'],
-                    'current_team': ps['team_name'],
-                    'career_games': career_games,
-                    'career_wins': career_wins,
-                    'career_losses': career_losses,
-                    'career_ties': career_ties,
-                    'career_goals_against': career_goals_against,
-                    'career_gaa': career_gaa,
-                    'career_shutouts': career_shutouts,
-                    'career_shutout_pct': career_shutout_pct,
-                    'career_win_pct': career_win_pct,
-                    '_export_timestamp': datetime.now().isoformat(),
-                }
-                all_stats.append(stats)
+        if 'ties' not in season_stats.columns:
+            season_stats = season_stats.assign(ties=0)
+        grouped = aggregate_game_type_splits(
+            season_stats,
+            group_cols=['player_id', 'season_id'],
+            aggregations={
+                'career_games': ('games_played', 'sum'),
+                'career_wins': ('wins', 'sum'),
+                'career_losses': ('losses', 'sum'),
+                'career_ties': ('ties', 'sum'),
+                'career_goals_against': ('goals_against', 'sum'),
+                'career_shutouts': ('shutouts', 'sum'),
+                **career_rates,
+            },
+            precomputed_splits=True,
+            **key_args,
+        )
+        meta = season_stats[['player_id', 'season_id', 'player_name', 'team_name']]
     else:
         # Fallback: build from roster directly
         roster = load_table('fact_gameroster')
@@ -391,71 +295,40 @@ def create_fact_goalie_career_stats_basic() -> pd.DataFrame:
         # Add game_type
         goalies = add_game_type_to_df(goalies, schedule)
         
-        # Get unique player-season combinations
-        player_seasons = goalies[['player_id', 'season_id', 'player_full_name', 
-                                  'team_name']].drop_duplicates(subset=['player_id', 'season_id'])
+        # Join schedule result columns once for the W/L/T rule
+        # Ensure consistent game_id types before merge
+        schedule_cols = schedule[['game_id', 'home_team_name', 'away_team_name',
+                                  'home_total_goals', 'away_total_goals', 'home_team_t', 'away_team_t']].copy()
+        schedule_cols['game_id'] = schedule_cols['game_id'].astype(str)
+        goalies = goalies.merge(schedule_cols, on='game_id', how='left')
+        # Ensure goal columns are numeric
+        for col in ['home_total_goals', 'away_total_goals', 'home_team_t', 'away_team_t']:
+            goalies[col] = pd.to_numeric(goalies[col], errors='coerce').fillna(0).astype(int)
+        goalies = goalies.join(goalie_game_results(goalies))
         
-        for _, ps in player_seasons.iterrows():
-            player_id = ps['player_id']
-            season_id = ps['season_id']
-            
-            goalie_games = goalies[(goalies['player_id'] == player_id) & 
-                                   (goalies['season_id'] == season_id)]
-            
-            # Split by game_type
-            for game_type in GAME_TYPE_SPLITS:
-                if game_type == 'All':
-                    games = goalie_games
-                else:
-                    games = goalie_games[goalie_games['game_type'] == game_type]
-                
-                if len(games) == 0:
-                    continue
-                
-                career_games = games['game_id'].nunique()
-                career_goals_against = int(games['goals_against'].sum())
-                career_shutouts = int(games['shutouts'].sum())
-                
-                # Get record using utility function
-                # Ensure consistent game_id types before merge
-                schedule_cols = schedule[['game_id', 'game_type', 'home_team_name', 'away_team_name',
-                                         'home_total_goals', 'away_total_goals', 'home_team_t', 'away_team_t']].copy()
-                schedule_cols['game_id'] = schedule_cols['game_id'].astype(str)
-                games_copy = games.copy()
-                games_copy['game_id'] = games_copy['game_id'].astype(str)
-                games_with_schedule = games_copy.merge(schedule_cols, on='game_id', how='left')
-                # Ensure goal columns are numeric
-                for col in ['home_total_goals', 'away_total_goals', 'home_team_t', 'away_team_t']:
-                    if col in games_with_schedule.columns:
-                        games_with_schedule[col] = pd.to_numeric(games_with_schedule[col], errors='coerce').fillna(0).astype(int)
-                record = get_goalie_record_from_games(games_with_schedule)
-                
-                # Calculate rates
-                career_gaa = round(career_goals_against / career_games, 2) if career_games > 0 else 0.0
-                career_win_pct = round(record['wins'] / career_games * 100, 1) if career_games > 0 else 0.0
-                career_shutout_pct = round(career_shutouts / career_games * 100, 1) if career_games > 0 else 0.0
-                
-                stats = {
-                    'goalie_career_basic_key': f"{player_id}_{season_id}_{game_type}",
-                    'player_id': player_id,
-                    'season_id': season_id,
-                    'game_type': game_type,
-                    'player_name': ps['player_full_name'],
-                    'current_team': ps['team_name'],
-                    'career_games': career_games,
-                    'career_wins': record['wins'],
-                    'career_losses': record['losses'],
-                    'career_ties': record['ties'],
-                    'career_goals_against': career_goals_against,
-                    'career_gaa': career_gaa,
-                    'career_shutouts': career_shutouts,
-                    'career_shutout_pct': career_shutout_pct,
-                    'career_win_pct': career_win_pct,
-                    '_export_timestamp': datetime.now().isoformat(),
-                }
-                all_stats.append(stats)
-    
-    grouped = pd.DataFrame(all_stats)
+        grouped = aggregate_game_type_splits(
+            goalies,
+            group_cols=['player_id', 'season_id'],
+            aggregations={
+                'career_games': ('game_id', 'nunique'),
+                'career_wins': ('wins', 'sum'),
+                'career_losses': ('losses', 'sum'),
+                'career_ties': ('ties', 'sum'),
+                'career_goals_against': ('goals_against', 'sum'),
+                'career_shutouts': ('shutouts', 'sum'),
+                **career_rates,
+            },
+            **key_args,
+        )
+        meta = goalies[['player_id', 'season_id', 'player_full_name', 'team_name']].rename(
+            columns={'player_full_name': 'player_name'})
+    
+    if len(grouped) == 0:
+        return pd.DataFrame()
+    
+    meta = meta.drop_duplicates(subset=['player_id', 'season_id']).rename(columns={'team_name': 'current_team'})
+    grouped = grouped.merge(meta, on=['player_id', 'season_id'], how='left')
+    grouped['_export_timestamp'] = datetime.now().isoformat()
     
     # Reorder columns
     priority_cols = ['goalie_career_basic_key', 'player_id', 'season_id', 'game_type',
@@ -488,64 +361,55 @@ def create_fact_team_season_stats_basic() -> pd.DataFrame:
     if len(schedule) == 0:
         return pd.DataFrame()
     
-    all_stats = []
+    # Team records for every team-season-gametype (one row per team per Past game)
+    records = aggregate_game_type_splits(
+        team_game_results(schedule),
+        group_cols=['team_id', 'season_id'],
+        aggregations={
+            'games_played': ('game_id', 'size'),
+            'wins': ('wins', 'sum'),
+            'ties': ('ties', 'sum'),
+            'goals_for': ('goals_for', 'sum'),
+            'goals_against': ('goals_against', 'sum'),
+            'goals_for_per_game': ratio('goals_for', 'games_played', decimals=2),
+            'goals_against_per_game': ratio('goals_against', 'games_played', decimals=2),
+        },
+    )
+    for col in ['wins', 'ties', 'goals_for', 'goals_against']:
+        records[col] = records[col].astype(int)
+    records['losses'] = records['games_played'] - records['wins'] - records['ties']
+    records['points'] = records['wins'] * 2 + records['ties']  # W=2, T=1, L=0
+    # Win percentage = points / (games_played * 2) * 100
+    records['win_pct'] = (records['points'] / (records['games_played'] * 2) * 100).round(1)
+    records['goal_diff'] = records['goals_for'] - records['goals_against']
     
     # Get unique team-season combinations from roster
     team_seasons = roster[['team_id', 'team_name', 'season_id', 'season']].drop_duplicates()
-    
-    for _, ts in team_seasons.iterrows():
-        team_id = ts['team_id']
-        season_id = ts['season_id']
-        
-        # Use GAME_TYPE_SPLITS from shared utility
-        for game_type in GAME_TYPE_SPLITS:
-            # Use shared utility for record calculation
-            record = get_team_record_from_schedule(schedule, team_id, season_id, game_type)
-            
-            # Skip if no games for this game_type
-            if record is None:
-                continue
-            
-            stats = {
-                'team_season_basic_key': f"{team_id}_{season_id}_{game_type}",
-                'team_id': team_id,
-                'team_name': ts['team_name'],
-                'season_id': season_id,
-                'season': ts['season'],
-                'game_type': game_type,
-                'games_played': record['games_played'],
-                'wins': record['wins'],
-                'losses': record['losses'],
-                'ties': record['ties'],
-                'points': record['points'],
-                # Win percentage = points / (games_played * 2) * 100
-                'win_pct': round(record['points'] / (record['games_played'] * 2) * 100, 1) if record['games_played'] > 0 else 0.0,
-                'goals_for': record['goals_for'],
-                'goals_against': record['goals_against'],
-                'goal_diff': record['goals_for'] - record['goals_against'],
-                'goals_for_per_game': round(record['goals_for'] / record['games_played'], 2),
-                'goals_against_per_game': round(record['goals_against'] / record['games_played'], 2),
-            }
-            
-            # Team scoring from roster - only available for 'All' game_type
-            # (roster data is season-level, not split by game_type)
-            if game_type == 'All':
-                team_roster = roster[(roster['team_id'] == team_id) & (roster['season_id'] == season_id)]
-                skaters = team_roster[~team_roster['player_position'].astype(str).str.lower().str.contains('goalie', na=False)]
-                stats['team_goals'] = int(skaters['goals'].sum())
-                stats['team_assists'] = int(skaters['assist'].sum())
-                stats['team_pim'] = int(skaters['pim'].sum())
-                stats['unique_players'] = skaters['player_id'].nunique()
-            else:
-                stats['team_goals'] = None
-                stats['team_assists'] = None
-                stats['team_pim'] = None
-                stats['unique_players'] = None
-            
-            stats['_export_timestamp'] = datetime.now().isoformat()
-            all_stats.append(stats)
-    
-    df = pd.DataFrame(all_stats)
+    df = team_seasons.assign(
+        _team=team_seasons['team_id'].astype(str),
+        _season=team_seasons['season_id'].astype(str),
+    ).merge(
+        records.rename(columns={'team_id': '_team', 'season_id': '_season'}),
+        on=['_team', '_season'],
+        how='inner'
+    ).drop(columns=['_team', '_season'])
+    df['team_season_basic_key'] = format_key_column(df, '{team_id}_{season_id}_{game_type}')
+    
+    # Team scoring from roster - only available for 'All' game_type
+    # (roster data is season-level, not split by game_type)
+    skaters = roster[~roster['player_position'].astype(str).str.lower().str.contains('goalie', na=False)]
+    team_scoring = skaters.groupby(['team_id', 'season_id'], sort=False, observed=True).agg(
+        team_goals=('goals', 'sum'),
+        team_assists=('assist', 'sum'),
+        team_pim=('pim', 'sum'),
+        unique_players=('player_id', 'nunique'),
+    ).reset_index()
+    df = df.merge(team_scoring, on=['team_id', 'season_id'], how='left')
+    is_all = df['game_type'] == 'All'
+    for col in ['team_goals', 'team_assists', 'team_pim', 'unique_players']:
+        df[col] = df[col].fillna(0).where(is_all)
+    
+    df['_export_timestamp'] = datetime.now().isoformat()
     
     # Reorder columns logically
     col_order = [
@@ -620,54 +484,26 @@ def create_fact_goalie_season_stats() -> pd.DataFrame:
     mean_cols = ['goalie_war', 'goalie_game_score', 'overall_game_rating', 
                  'clutch_rating', 'pressure_rating', 'rebound_rating']
     
-    all_results = []
+    grouped = aggregate_game_type_splits(
+        game_stats,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'season': ('season', 'first'),
+            'player_name': ('player_name', 'first'),
+            'team_name': ('team_name', 'first'),
+            'team_id': ('team_id', 'first'),
+            'games_played': ('game_id', 'nunique'),
+            **{col: (col, 'sum') for col in sum_cols},
+            **{col: (col, 'mean') for col in mean_cols},
+        },
+        key_col='goalie_season_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+    )
     
-    # Get unique player-season combinations
-    player_seasons = game_stats[['player_id', 'season_id']].drop_duplicates()
-    
-    for _, ps in player_seasons.iterrows():
-        player_id = ps['player_id']
-        season_id = ps['season_id']
-        
-        player_games = game_stats[(game_stats['player_id'] == player_id) & 
-                                   (game_stats['season_id'] == season_id)]
-        
-        # Use GAME_TYPE_SPLITS from shared utility
-        for game_type in GAME_TYPE_SPLITS:
-            if game_type == 'All':
-                games = player_games
-            else:
-                games = player_games[player_games['game_type'] == game_type]
-            
-            if len(games) == 0:
-                continue
-            
-            # Build aggregation
-            result = {
-                'goalie_season_key': f"{player_id}_{season_id}_{game_type}",
-                'player_id': player_id,
-                'season_id': season_id,
-                'season': games['season'].iloc[0] if 'season' in games.columns else None,
-                'game_type': game_type,
-                'player_name': games['player_name'].iloc[0] if 'player_name' in games.columns else None,
-                'team_name': games['team_name'].iloc[0] if 'team_name' in games.columns else None,
-                'team_id': games['team_id'].iloc[0] if 'team_id' in games.columns else None,
-                'games_played': games['game_id'].nunique(),
-            }
-            
-            # Sum columns
-            for col in sum_cols:
-                if col in games.columns:
-                    result[col] = games[col].sum()
-            
-            # Mean columns
-            for col in mean_cols:
-                if col in games.columns:
-                    result[col] = games[col].mean()
-            
-            all_results.append(result)
-    
-    grouped = pd.DataFrame(all_results)
+    # Keep season ahead of game_type
+    if 'season' in grouped.columns:
+        lead = ['goalie_season_key', 'player_id', 'season_id', 'season', 'game_type']
+        grouped = grouped[lead + [c for c in grouped.columns if c not in lead]]
     
     if len(grouped) == 0:
         return pd.DataFrame()
@@ -738,96 +574,47 @@ def create_fact_goalie_career_stats() -> pd.DataFrame:
     
     sum_cols = [col for col in season_stats.columns if col not in exclude_cols]
     
-    all_results = []
-    
-    # Get unique player-season combinations
-    player_seasons = season_stats[['player_id', 'season_id', 'player_name', 'team_name']].drop_duplicates(
-        subset=['player_id', 'season_id']
+    # Mean of ratings (summed columns otherwise)
+    rating_cols = ['goalie_war', 'goalie_game_score', 'overall_game_rating', 'clutch_rating',
+                   'pressure_rating', 'rebound_rating']
+    
+    df = aggregate_game_type_splits(
+        season_stats,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'player_name': ('player_name', 'first'),
+            'team_name': ('team_name', 'last'),
+            'team_id': ('team_id', 'last'),
+            'career_games': ('games_played', 'sum'),
+            **{f'career_{col}': (col, 'mean' if col in rating_cols else 'sum') for col in sum_cols},
+        },
+        key_col='goalie_career_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+        precomputed_splits=True,
     )
     
-    for _, ps in player_seasons.iterrows():
-        player_id = ps['player_id']
-        season_id = ps['season_id']
-        
-        player_season_data = season_stats[
-            (season_stats['player_id'] == player_id) & 
-            (season_stats['season_id'] == season_id)
-        ]
-        
-        # Split by game_type
-        for game_type in GAME_TYPE_SPLITS:
-            type_data = player_season_data[player_season_data['game_type'] == game_type]
-            
-            if len(type_data) == 0:
-                continue
-            
-            # Build aggregation dict
-            agg_dict = {}
-            for col in sum_cols:
-                if col in type_data.columns:
-                    agg_dict[col] = 'sum'
-            
-            agg_dict['games_played'] = 'sum'
-
-            # Mean of ratings
-            for col in ['goalie_war', 'goalie_game_score', 'overall_game_rating', 'clutch_rating',
-                       'pressure_rating', 'rebound_rating']:
-                if col in type_data.columns:
-                    agg_dict[col] = 'mean'
-
-            # Aggregate numeric columns
-            grouped_type = type_data.agg(agg_dict).to_dict()
-
-            # Get first/last values directly (pandas 2.0+ doesn't support 'first'/'last' as agg strings)
-            grouped_type['player_name'] = type_data['player_name'].iloc[0] if len(type_data) > 0 else None
-            grouped_type['team_name'] = type_data['team_name'].iloc[-1] if len(type_data) > 0 else None
-            grouped_type['team_id'] = type_data['team_id'].iloc[-1] if len(type_data) > 0 else None
-            
-            career_games = int(grouped_type.get('games_played', 0))
-            
-            # Calculate career rates
-            if career_games > 0:
-                if 'saves' in grouped_type and 'shots_against' in grouped_type:
-                    career_save_pct = round(grouped_type['saves'] / grouped_type['shots_against'] * 100, 2) if grouped_type['shots_against'] > 0 else 0.0
-                else:
-                    career_save_pct = 0.0
-                
-                if 'goals_against' in grouped_type:
-                    career_gaa = round(grouped_type['goals_against'] / career_games, 2)
-                else:
-                    career_gaa = 0.0
-            else:
-                career_save_pct = 0.0
-                career_gaa = 0.0
-            
-            result = {
-                'goalie_career_key': f"{player_id}_{season_id}_{game_type}",
-                'player_id': player_id,
-                'season_id': season_id,
-                'game_type': game_type,
-                'player_name': grouped_type.get('player_name'),
-                'team_name': grouped_type.get('team_name'),
-                'team_id': grouped_type.get('team_id'),
-                'career_games': career_games,
-                'career_save_pct': career_save_pct,
-                'career_gaa': career_gaa,
-                '_export_timestamp': datetime.now().isoformat(),
-            }
-            
-            # Add all summed columns
-            for col in sum_cols:
-                if col in grouped_type:
-                    result[f'career_{col}'] = grouped_type[col]
-            
-            # Add mean columns with 'career_' prefix
-            for col in ['goalie_war', 'goalie_game_score', 'overall_game_rating', 'clutch_rating',
-                       'pressure_rating', 'rebound_rating']:
-                if col in grouped_type:
-                    result[f'career_{col}'] = round(grouped_type[col], 2) if pd.notna(grouped_type[col]) else 0.0
-            
-            all_results.append(result)
-    
-    df = pd.DataFrame(all_results)
+    # Calculate career rates
+    has_games = df['career_games'] > 0
+    if 'career_saves' in df.columns and 'career_shots_against' in df.columns:
+        save_pct = (df['career_saves'] / df['career_shots_against'] * 100).round(2)
+        df['career_save_pct'] = save_pct.where(has_games & (df['career_shots_against'] > 0), 0.0)
+    else:
+        df['career_save_pct'] = 0.0
+    if 'career_goals_against' in df.columns:
+        df['career_gaa'] = (df['career_goals_against'] / df['career_games'].where(has_games)).round(2).fillna(0.0)
+    else:
+        df['career_gaa'] = 0.0
+    
+    for col in rating_cols:
+        if f'career_{col}' in df.columns:
+            df[f'career_{col}'] = df[f'career_{col}'].round(2).fillna(0.0)
+    
+    df['_export_timestamp'] = datetime.now().isoformat()
+    
+    lead = ['goalie_career_key', 'player_id', 'season_id', 'game_type', 'player_name', 'team_name',
+            'team_id', 'career_games', 'career_save_pct', 'career_gaa', '_export_timestamp']
+    lead = [c for c in lead if c in df.columns]
+    df = df[lead + [c for c in df.columns if c not in lead]]
     
     print(f"  Created {len(df)} goalie career records (by season+type) with {len(df.columns)} columns")
     return df
@@ -884,118 +671,71 @@ def create_fact_player_career_stats_enhanced() -> pd.DataFrame:
         'pk_toi', 'pp_toi', 'ev_toi', 'toi',
     ]
     
-    all_results = []
-
-    # Pre-load tables once (avoid reloading inside nested loop)
-    game_stats = load_table('fact_player_game_stats')
-    if len(game_stats) > 0 and 'game_type' not in game_stats.columns:
-        schedule = load_table('dim_schedule')
-        game_stats = add_game_type_to_df(game_stats, schedule)
-    if len(game_stats) > 0:
-        if 'season_id' in game_stats.columns:
-            game_stats['player_id'] = game_stats['player_id'].astype(str)
-            game_stats['season_id'] = game_stats['season_id'].astype(str)
-
-    # Get unique player-season combinations
-    player_seasons = season_stats[['player_id', 'season_id', 'player_name']].drop_duplicates(
-        subset=['player_id', 'season_id']
+    # Mean of rates/indices
+    rate_cols = ['war', 'gar', 'game_score', 'offensive_rating', 'defensive_rating']
+
+    df = aggregate_game_type_splits(
+        season_stats,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'player_name': ('player_name', 'first'),
+            'current_team': ('team_name', 'last'),
+            'team_id': ('team_id', 'last'),
+            **{col: (col, 'sum') for col in sum_cols},
+            **{col: (col, 'mean') for col in rate_cols},
+        },
+        key_col='player_career_key',
+        key_template='{player_id}_{season_id}_{game_type}',
+        precomputed_splits=True,
     )
 
-    for _, ps in player_seasons.iterrows():
-        player_id = ps['player_id']
-        season_id = ps['season_id']
-        
-        player_season_data = season_stats[
-            (season_stats['player_id'] == player_id) & 
-            (season_stats['season_id'] == season_id)
-        ]
-        
-        # Split by game_type
-        for game_type in GAME_TYPE_SPLITS:
-            type_data = player_season_data[player_season_data['game_type'] == game_type]
-            
-            if len(type_data) == 0:
-                continue
-            
-            # Build aggregation
-            agg_dict = {}
-            for col in sum_cols:
-                if col in type_data.columns:
-                    agg_dict[col] = 'sum'
-
-            # Mean of rates/indices
-            rate_cols = ['war', 'gar', 'game_score', 'offensive_rating', 'defensive_rating']
-            for col in rate_cols:
-                if col in type_data.columns:
-                    agg_dict[col] = 'mean'
-
-            # Aggregate numeric columns
-            grouped_type = type_data.agg(agg_dict).to_dict()
-
-            # Get first/last values directly (pandas 2.0+ doesn't support 'first'/'last' as agg strings)
-            grouped_type['player_name'] = type_data['player_name'].iloc[0] if len(type_data) > 0 else None
-            grouped_type['team_name'] = type_data['team_name'].iloc[-1] if len(type_data) > 0 else None
-            grouped_type['team_id'] = type_data['team_id'].iloc[-1] if len(type_data) > 0 else None
-            
-            # Get games played from pre-loaded game_stats
-            if len(game_stats) > 0 and 'season_id' in game_stats.columns:
-                player_game_stats = game_stats[
-                    (game_stats['player_id'] == str(player_id)) &
-                    (game_stats['season_id'] == str(season_id)) &
-                    (game_stats['game_type'] == game_type)
-                ]
-                career_games = player_game_stats['game_id'].nunique()
-            else:
-                career_games = 0
-            
-            result = {
-                'player_career_key': f"{player_id}_{season_id}_{game_type}",
-                'player_id': player_id,
-                'season_id': season_id,
-                'game_type': game_type,
-                'player_name': grouped_type.get('player_name'),
-                'current_team': grouped_type.get('team_name'),
-                'team_id': grouped_type.get('team_id'),
-                'career_games': career_games,
-                '_export_timestamp': datetime.now().isoformat(),
-            }
-            
-            # Add all summed columns with 'career_' prefix
-            for col in sum_cols:
-                if col in grouped_type:
-                    result[col] = grouped_type[col]
-            
-            # Add mean columns
-            for col in rate_cols:
-                if col in grouped_type:
-                    result[col] = round(grouped_type[col], 2) if pd.notna(grouped_type[col]) else 0.0
-            
-            # Calculate career rates
-            if career_games > 0:
-                if 'goals' in result:
-                    result['goals_per_game'] = round(result['goals'] / career_games, 2)
-                if 'assists' in result:
-                    result['assists_per_game'] = round(result['assists'] / career_games, 2)
-                if 'points' in result:
-                    result['points_per_game'] = round(result['points'] / career_games, 2)
-            
-            if 'sog' in result and result['sog'] > 0:
-                result['shooting_pct'] = round(result.get('goals', 0) / result['sog'] * 100, 1)
-            
-            if 'pass_attempts' in result and result['pass_attempts'] > 0:
-                result['pass_completion_pct'] = round(result.get('pass_completed', 0) / result['pass_attempts'] * 100, 1)
-            
-            if 'fo_wins' in result and 'fo_losses' in result:
-                total_fo = result['fo_wins'] + result['fo_losses']
-                if total_fo > 0:
-                    result['faceoff_pct'] = round(result['fo_wins'] / total_fo * 100, 1)
-            
-            if 'takeaways' in result and 'giveaways' in result and result['giveaways'] > 0:
-                result['takeaway_giveaway_ratio'] = round(result['takeaways'] / result['giveaways'], 2)
-            
-            all_results.append(result)
-    
-    df = pd.DataFrame(all_results)
+    # Games played per split from game-level stats (grouping sets incl. 'All')
+    game_stats = load_table('fact_player_game_stats')
+    if len(game_stats) > 0 and 'season_id' in game_stats.columns:
+        if 'game_type' not in game_stats.columns:
+            schedule = load_table('dim_schedule')
+            game_stats = add_game_type_to_df(game_stats, schedule)
+        games_played = aggregate_game_type_splits(
+            game_stats.assign(player_id=game_stats['player_id'].astype(str),
+                              season_id=game_stats['season_id'].astype(str)),
+            group_cols=['player_id', 'season_id'],
+            aggregations={'career_games': ('game_id', 'nunique')},
+        )
+        df = df.assign(
+            _player=df['player_id'].astype(str),
+            _season=df['season_id'].astype(str),
+        ).merge(
+            games_played.rename(columns={'player_id': '_player', 'season_id': '_season'}),
+            on=['_player', '_season', 'game_type'],
+            how='left'
+        ).drop(columns=['_player', '_season'])
+        df['career_games'] = df['career_games'].fillna(0).astype(int)
+    else:
+        df['career_games'] = 0
+    df['_export_timestamp'] = datetime.now().isoformat()
+
+    for col in rate_cols:
+        if col in df.columns:
+            df[col] = df[col].round(2).fillna(0.0)
+
+    # Calculate career rates (left empty where the denominator is 0)
+    per_game = {'goals_per_game': 'goals', 'assists_per_game': 'assists', 'points_per_game': 'points'}
+    for out_col, col in per_game.items():
+        if col in df.columns:
+            df[out_col] = _rate(df[col], df['career_games'], decimals=2)
+    if 'sog' in df.columns:
+        df['shooting_pct'] = _rate(df['goals'] if 'goals' in df.columns else 0, df['sog'], scale=100, decimals=1)
+    if 'pass_attempts' in df.columns:
+        df['pass_completion_pct'] = _rate(df['pass_completed'] if 'pass_completed' in df.columns else 0,
+                                          df['pass_attempts'], scale=100, decimals=1)
+    if 'fo_wins' in df.columns and 'fo_losses' in df.columns:
+        df['faceoff_pct'] = _rate(df['fo_wins'], df['fo_wins'] + df['fo_losses'], scale=100, decimals=1)
+    if 'takeaways' in df.columns and 'giveaways' in df.columns:
+        df['takeaway_giveaway_ratio'] = _rate(df['takeaways'], df['giveaways'], decimals=2)
+
+    lead = ['player_career_key', 'player_id', 'season_id', 'game_type', 'player_name',
+            'current_team', 'team_id', 'career_games', '_export_timestamp']
+    df = df[lead + [c for c in df.columns if c not in lead]]
     
     # Add position from roster
     if len(roster) > 0:
@@ -5,14 +5,17 @@ Creates 35 additional tables to reach the full 129-table schema.
 v29.0 - Uses game_type_aggregator for consistent game_type splits
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from src.utils.game_type_aggregator import (
     GAME_TYPE_SPLITS,
     add_game_type_to_df
 )
 from src.calculations.goals import get_goal_filter
+from src.calculations.standings import calculate_standings_points
 
 # Import utility to add names to tables
 try:
@@ -185,13 +188,178 @@ def create_fact_player_period_stats() -> pd.DataFrame:
     return pd.DataFrame(records)
 
 
+# Momentum weights per stat share; turnovers are scored inversely (fewer is better)
+PERIOD_MOMENTUM_WEIGHTS = {
+    'goals': 0.30,
+    'corsi_for': 0.20,
+    'time_in_o_zone': 0.15,
+    'zone_entries': 0.10,
+    'passes': 0.10,
+    'possession_time_o_zone': 0.10,
+    'turnovers': 0.05,
+}
+
+TIME_WINDOW_MOMENTUM_WEIGHTS = {
+    'goals': 0.30,
+    'corsi_for': 0.25,
+    'time_in_o_zone': 0.20,
+    'zone_entries': 0.15,
+    'passes': 0.10,
+}
+
+# Time window size in seconds (3 minutes = 180 seconds)
+MOMENTUM_WINDOW_SECONDS = 180
+
+# Momentum bonus for the team leading at the start of a time window
+LEADING_MOMENTUM_BONUS = 5
+
+
+def _round(values, ndigits: int) -> np.ndarray:
+    """Element-wise built-in round (same results as rounding each value in Python)."""
+    return np.array([round(v, ndigits) for v in np.asarray(values, dtype=float).tolist()], dtype=float)
+
+
+def _season_ids(schedule: pd.DataFrame, game_ids: pd.Series) -> list:
+    """season_id of each game (first schedule match), None when unknown."""
+    if len(schedule) == 0 or 'season_id' not in schedule.columns:
+        return [None] * len(game_ids)
+    seasons = schedule.drop_duplicates('game_id').set_index('game_id')['season_id']
+    found = game_ids.isin(seasons.index).to_numpy()
+    mapped = game_ids.map(seasons).tolist()
+    return [s if f else None for s, f in zip(mapped, found)]
+
+
+def _zone_mask(zone: pd.Series, prefix: str, name: str) -> pd.Series:
+    return zone.str.startswith(prefix, na=False) | zone.str.contains(name, na=False)
+
+
+def _credited_team_events(events: pd.DataFrame, event_players: pd.DataFrame) -> pd.DataFrame:
+    """
+    Events credited to the home or away team of their game.
+
+    Credit goes to event_player_1's team (fact_event_players), falling back
+    to event_team_id. Teams come from the first event row of each game, and
+    each event is matched to them with one merge on (game, team).
+
+    Returns:
+        Credited events with team_id, venue ('home'/'away'), _venue_order,
+        _team_name and _game_order/_period_order (first appearance in
+        fact_events)
+    """
+    events = events.assign(
+        _game_order=pd.factorize(events['game_id'])[0],
+        _period_order=pd.factorize(pd.MultiIndex.from_arrays([events['game_id'], events['period']]))[0],
+    )
+    first_rows = events[events['game_id'].notna()].drop_duplicates('game_id')
+    events = events[events['game_id'].notna() & events['period'].notna()]
+
+    credit = pd.Series(np.nan, index=events.index, dtype=object)
+    if len(event_players) > 0:
+        ep1 = event_players[event_players['player_role'].astype(str).str.lower().str.contains('event_player_1', na=False)]
+        if 'player_id' in ep1.columns and 'team_id' in ep1.columns:
+            # Last event_player_1 row wins, as with a dict built from the rows
+            ep1_team = ep1.drop_duplicates('event_id', keep='last').set_index('event_id')['team_id']
+            credit = events['event_id'].map(ep1_team).astype(object)
+    if 'event_team_id' in events.columns:
+        credit = credit.fillna(events['event_team_id'])
+
+    teams = []
+    for order, venue in enumerate(['home', 'away']):
+        if f'{venue}_team_id' not in events.columns:
+            continue
+        teams.append(pd.DataFrame({
+            '_game': first_rows['game_id'].astype(object).to_numpy(),
+            '_team': first_rows[f'{venue}_team_id'].astype(object).to_numpy(),
+            'venue': venue,
+            '_venue_order': order,
+        }))
+    if not teams:
+        return events.iloc[:0]
+    teams = pd.concat(teams, ignore_index=True).dropna(subset=['_team'])
+
+    credited = events.assign(_game=events['game_id'].astype(object), _team=credit.to_numpy())
+    credited = credited[credited['_team'].notna()].merge(teams, on=['_game', '_team'], how='inner', sort=False)
+    credited['team_id'] = credited['_team']
+
+    team_name = pd.Series(None, index=credited.index, dtype=object)
+    for venue in ['home', 'away']:
+        if f'{venue}_team' in credited.columns:
+            is_venue = credited['venue'] == venue
+            team_name[is_venue] = credited.loc[is_venue, f'{venue}_team']
+    return credited.assign(_team_name=team_name)
+
+
+def _group_starts(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """First row of each key group of a frame sorted by keys."""
+    return df[~df.duplicated(keys)].reset_index(drop=True)
+
+
+def _momentum_scores(team: pd.DataFrame, opp: pd.DataFrame, weights: dict) -> np.ndarray:
+    """
+    Momentum score (0-100) of each team row against its opponent row.
+
+    Each stat contributes the team's share of the pair's total (50 when
+    neither team has any), weighted; turnovers count the opponent's excess.
+    """
+    momentum = 0
+    for stat, weight in weights.items():
+        own = team[stat].to_numpy(dtype=float)
+        other = opp[stat].to_numpy(dtype=float)
+        total = own + other
+        with np.errstate(divide='ignore', invalid='ignore'):
+            share = (other - own) / total * 50 + 50 if stat == 'turnovers' else own / total * 100
+        momentum = momentum + np.where(total > 0, share, 50.0) * weight
+    return _round(momentum, 2)
+
+
+def _add_momentum(df: pd.DataFrame, pair_keys: list, weights: dict, lead_col: Optional[str] = None) -> Optional[np.ndarray]:
+    """
+    Normalized momentum_pct for rows whose pair (home + away) is complete.
+
+    Args:
+        df: Team rows sorted by pair_keys then venue (home first)
+        pair_keys: Columns identifying a period/window
+        weights: Stat weights (see _momentum_scores)
+        lead_col: Optional score column; the leading team gets a bonus
+
+    Returns:
+        momentum_pct per row (NaN outside complete pairs), or None when no
+        pair is complete
+    """
+    paired = (df.groupby(pair_keys, sort=False)[pair_keys[0]].transform('size') == 2).to_numpy()
+    if not paired.any():
+        return None
+
+    rows = np.flatnonzero(paired)
+    first, second = rows[0::2], rows[1::2]
+    team1, team2 = df.iloc[first], df.iloc[second]
+    momentum1 = _momentum_scores(team1, team2, weights)
+    momentum2 = _momentum_scores(team2, team1, weights)
+
+    if lead_col is not None:
+        lead = team1[lead_col].to_numpy() - team2[lead_col].to_numpy()
+        momentum1 = momentum1 + np.where(lead > 0, LEADING_MOMENTUM_BONUS, 0)
+        momentum2 = momentum2 + np.where(lead < 0, LEADING_MOMENTUM_BONUS, 0)
+
+    # Normalize so each pair sums to 100%
+    total = momentum1 + momentum2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        momentum1 = np.where(total > 0, _round(momentum1 / total * 100, 2), momentum1)
+        momentum2 = np.where(total > 0, _round(momentum2 / total * 100, 2), momentum2)
+
+    momentum = np.full(len(df), np.nan)
+    momentum[first] = momentum1
+    momentum[second] = momentum2
+    return momentum
+
+
 def create_fact_period_momentum() -> pd.DataFrame:
     """
     Create period-level momentum metrics per team.
-    
+
     Each team gets a row for each period with comprehensive stats.
     Only event_player_1 gets credit for event counts (passes, shots, etc.).
-    
+
     Stats included:
     - Goals, shots, passes (only event_player_1)
     - Zone entries, exits (only event_player_1)
@@ -201,505 +369,214 @@ def create_fact_period_momentum() -> pd.DataFrame:
     - Turnovers by zone (only event_player_1)
     - Giveaways, takeaways, bad giveaways (only event_player_1)
     - Momentum percentage (calculated from weighted metrics)
+
+    Events are credited to teams in one merge and every stat is a grouped
+    sum over (game, period, team).
     """
     events = load_table('fact_events')
     event_players = load_table('fact_event_players')
     schedule = load_table('dim_schedule')
-    
+
     if len(events) == 0:
         return pd.DataFrame()
-    
-    # Get event_player_1_id -> team_id mapping from event_players
-    player_team_map = {}
-    if len(event_players) > 0:
-        # Filter to event_player_1 only (they get credit)
-        ep1 = event_players[event_players['player_role'].astype(str).str.lower().str.contains('event_player_1', na=False)]
-        if 'player_id' in ep1.columns and 'team_id' in ep1.columns:
-            player_team_map = dict(zip(ep1['event_id'], ep1['team_id']))
-    
-    records = []
-    
-    for game_id in events['game_id'].dropna().unique():
-        game_events = events[events['game_id'] == game_id].copy()
-        
-        # Get team IDs for this game
-        home_team_id = None
-        away_team_id = None
-        if 'home_team_id' in game_events.columns:
-            home_team_id = game_events['home_team_id'].iloc[0] if len(game_events) > 0 else None
-        if 'away_team_id' in game_events.columns:
-            away_team_id = game_events['away_team_id'].iloc[0] if len(game_events) > 0 else None
-        
-        # Get season_id
-        season_id = None
-        if len(schedule) > 0:
-            game_info = schedule[schedule['game_id'] == game_id]
-            if len(game_info) > 0 and 'season_id' in game_info.columns:
-                season_id = game_info['season_id'].values[0]
-        
-        for period in game_events['period'].dropna().unique():
-            period_events = game_events[game_events['period'] == period].copy()
-            
-            if len(period_events) == 0:
-                continue
-            
-            # Get events where we can identify the team via event_player_1
-            # Add team_id from mapping
-            period_events['_event_team_id'] = period_events['event_id'].map(player_team_map)
-            
-            # Also try event_team_id column if it exists
-            if 'event_team_id' in period_events.columns:
-                period_events['_event_team_id'] = period_events['_event_team_id'].fillna(period_events['event_team_id'])
-            
-            # Process each team
-            for team_id, venue in [(home_team_id, 'home'), (away_team_id, 'away')]:
-                if team_id is None:
-                    continue
-                
-                # Filter to events for this team (only count event_player_1 events)
-                team_events = period_events[period_events['_event_team_id'] == team_id].copy()
-                
-                if len(team_events) == 0:
-                    continue
-                
-                # Initialize stats
-                stats = {
-                    'momentum_key': f"MOM_{game_id}_P{int(period)}_{team_id}",
-                    'game_id': game_id,
-                    'season_id': season_id,
-                    'period': int(period),
-                    'team_id': team_id,
-                    'venue': venue,
-                    'team_name': team_events[f'{venue}_team'].iloc[0] if f'{venue}_team' in team_events.columns else None,
-                }
-                
-                # Event counts (only event_player_1 gets credit)
-                stats['events_count'] = len(team_events)
-                
-                # Goals (only event_player_1)
-                if 'is_goal' in team_events.columns:
-                    stats['goals'] = int(team_events['is_goal'].sum())
-                else:
-                    stats['goals'] = get_goal_filter(team_events).sum()
-                
-                # Shots (only event_player_1, event_type='Shot')
-                stats['shots'] = len(team_events[team_events['event_type'].astype(str).str.lower() == 'shot'])
-                
-                # Passes (only event_player_1, event_type='Pass')
-                stats['passes'] = len(team_events[team_events['event_type'].astype(str).str.lower() == 'pass'])
-                
-                # Zone entries (only event_player_1)
-                if 'is_zone_entry' in team_events.columns:
-                    stats['zone_entries'] = int(team_events['is_zone_entry'].sum())
-                else:
-                    stats['zone_entries'] = len(team_events[
-                        team_events['event_detail'].astype(str).str.lower().str.contains('zone_entry', na=False)
-                    ])
-                
-                # Zone exits (only event_player_1)
-                if 'is_zone_exit' in team_events.columns:
-                    stats['zone_exits'] = int(team_events['is_zone_exit'].sum())
-                else:
-                    stats['zone_exits'] = len(team_events[
-                        team_events['event_detail'].astype(str).str.lower().str.contains('zone_exit', na=False)
-                    ])
-                
-                # Corsi (only event_player_1)
-                if 'is_corsi' in team_events.columns:
-                    stats['corsi_for'] = int(team_events['is_corsi'].sum())
-                else:
-                    # Fallback: shots + blocked shots + missed shots
-                    shots = len(team_events[team_events['event_type'].astype(str).str.lower() == 'shot'])
-                    blocked = len(team_events[team_events['event_detail'].astype(str).str.contains('Blocked', na=False)])
-                    missed = len(team_events[team_events['event_detail'].astype(str).str.contains('Missed', na=False)])
-                    stats['corsi_for'] = shots + blocked + missed
-                
-                # Fenwick (only event_player_1)
-                if 'is_fenwick' in team_events.columns:
-                    stats['fenwick_for'] = int(team_events['is_fenwick'].sum())
-                else:
-                    # Fallback: shots + missed shots (excludes blocked)
-                    stats['fenwick_for'] = stats['shots'] + len(team_events[
-                        team_events['event_detail'].astype(str).str.contains('Missed', na=False)
-                    ])
-                
-                # Turnovers (only event_player_1)
-                if 'is_turnover' in team_events.columns:
-                    stats['turnovers'] = int(team_events['is_turnover'].sum())
-                else:
-                    stats['turnovers'] = len(team_events[
-                        team_events['event_type'].astype(str).str.lower() == 'turnover'
-                    ])
-                
-                # Turnovers by zone (only event_player_1)
-                if 'event_team_zone' in team_events.columns and 'is_turnover' in team_events.columns:
-                    turnover_events = team_events[team_events['is_turnover'] == 1]
-                    zone_str = turnover_events['event_team_zone'].astype(str).str.lower()
-                    stats['turnovers_o_zone'] = len(turnover_events[zone_str.str.startswith('o', na=False)])
-                    stats['turnovers_d_zone'] = len(turnover_events[zone_str.str.startswith('d', na=False)])
-                    stats['turnovers_n_zone'] = len(turnover_events[zone_str.str.startswith('n', na=False)])
-                else:
-                    stats['turnovers_o_zone'] = 0
-                    stats['turnovers_d_zone'] = 0
-                    stats['turnovers_n_zone'] = 0
-                
-                # Giveaways (only event_player_1)
-                if 'is_giveaway' in team_events.columns:
-                    stats['giveaways'] = int(team_events['is_giveaway'].sum())
-                else:
-                    stats['giveaways'] = 0
-                
-                # Takeaways (only event_player_1)
-                if 'is_takeaway' in team_events.columns:
-                    stats['takeaways'] = int(team_events['is_takeaway'].sum())
-                else:
-                    stats['takeaways'] = 0
-                
-                # Bad giveaways (only event_player_1)
-                if 'is_bad_giveaway' in team_events.columns:
-                    stats['bad_giveaways'] = int(team_events['is_bad_giveaway'].sum())
-                else:
-                    stats['bad_giveaways'] = 0
-                
-                # Time in zones (sum of event durations)
-                if 'duration' in team_events.columns and 'event_team_zone' in team_events.columns:
-                    duration = team_events['duration'].fillna(0)
-                    zone_str = team_events['event_team_zone'].astype(str).str.lower()
-                    
-                    # Time in offensive zone
-                    o_zone_mask = zone_str.str.startswith('o', na=False) | zone_str.str.contains('offensive', na=False)
-                    stats['time_in_o_zone'] = int(duration[o_zone_mask].sum())
-                    
-                    # Time in defensive zone
-                    d_zone_mask = zone_str.str.startswith('d', na=False) | zone_str.str.contains('defensive', na=False)
-                    stats['time_in_d_zone'] = int(duration[d_zone_mask].sum())
-                    
-                    # Time in neutral zone
-                    n_zone_mask = zone_str.str.startswith('n', na=False) | zone_str.str.contains('neutral', na=False)
-                    stats['time_in_n_zone'] = int(duration[n_zone_mask].sum())
-                else:
-                    stats['time_in_o_zone'] = 0
-                    stats['time_in_d_zone'] = 0
-                    stats['time_in_n_zone'] = 0
-                
-                # Possession time by zone (from possession/zone_entry_exit events with rush/carry)
-                # Only count events where event_player_1 is the primary actor
-                possession_events = team_events[
-                    (team_events['event_type'].astype(str).str.lower().isin(['possession', 'zone_entry_exit'])) &
-                    (team_events['event_detail'].astype(str).str.lower().str.contains('rush|carry', na=False, regex=True))
-                ]
-                
-                if 'duration' in possession_events.columns and 'event_team_zone' in possession_events.columns:
-                    poss_duration = possession_events['duration'].fillna(0)
-                    poss_zone_str = possession_events['event_team_zone'].astype(str).str.lower()
-                    
-                    poss_o_mask = poss_zone_str.str.startswith('o', na=False) | poss_zone_str.str.contains('offensive', na=False)
-                    poss_d_mask = poss_zone_str.str.startswith('d', na=False) | poss_zone_str.str.contains('defensive', na=False)
-                    poss_n_mask = poss_zone_str.str.startswith('n', na=False) | poss_zone_str.str.contains('neutral', na=False)
-                    
-                    stats['possession_time_o_zone'] = int(poss_duration[poss_o_mask].sum())
-                    stats['possession_time_d_zone'] = int(poss_duration[poss_d_mask].sum())
-                    stats['possession_time_n_zone'] = int(poss_duration[poss_n_mask].sum())
-                else:
-                    stats['possession_time_o_zone'] = 0
-                    stats['possession_time_d_zone'] = 0
-                    stats['possession_time_n_zone'] = 0
-                
-                records.append(stats)
-            
-            # Calculate momentum percentages after both teams are processed
-            # Get the two team records for this period
-            period_records = [r for r in records if r.get('game_id') == game_id and r.get('period') == period]
-            
-            if len(period_records) == 2:
-                team1, team2 = period_records
-                
-                # Calculate momentum score for each team based on weighted metrics
-                # Weighted components: goals (30%), corsi (20%), zone time (15%), zone entries (10%), 
-                # passes (10%), possession time (10%), turnovers ratio (5%)
-                
-                def calc_momentum_score(team_stats, opp_stats):
-                    """Calculate momentum score (0-100) based on multiple weighted factors."""
-                    # Goals advantage
-                    total_goals = team_stats.get('goals', 0) + opp_stats.get('goals', 0)
-                    goal_pct = (team_stats.get('goals', 0) / total_goals * 100) if total_goals > 0 else 50.0
-                    
-                    # Corsi advantage
-                    total_corsi = team_stats.get('corsi_for', 0) + opp_stats.get('corsi_for', 0)
-                    corsi_pct = (team_stats.get('corsi_for', 0) / total_corsi * 100) if total_corsi > 0 else 50.0
-                    
-                    # Zone time advantage (o-zone time)
-                    total_ozone = team_stats.get('time_in_o_zone', 0) + opp_stats.get('time_in_o_zone', 0)
-                    ozone_pct = (team_stats.get('time_in_o_zone', 0) / total_ozone * 100) if total_ozone > 0 else 50.0
-                    
-                    # Zone entries advantage
-                    total_entries = team_stats.get('zone_entries', 0) + opp_stats.get('zone_entries', 0)
-                    entries_pct = (team_stats.get('zone_entries', 0) / total_entries * 100) if total_entries > 0 else 50.0
-                    
-                    # Passes advantage
-                    total_passes = team_stats.get('passes', 0) + opp_stats.get('passes', 0)
-                    passes_pct = (team_stats.get('passes', 0) / total_passes * 100) if total_passes > 0 else 50.0
-                    
-                    # Possession time advantage (o-zone)
-                    total_poss_o = team_stats.get('possession_time_o_zone', 0) + opp_stats.get('possession_time_o_zone', 0)
-                    poss_pct = (team_stats.get('possession_time_o_zone', 0) / total_poss_o * 100) if total_poss_o > 0 else 50.0
-                    
-                    # Turnover ratio (lower is better, so invert)
-                    team_tos = team_stats.get('turnovers', 0)
-                    opp_tos = opp_stats.get('turnovers', 0)
-                    total_tos = team_tos + opp_tos
-                    to_pct = ((opp_tos - team_tos) / total_tos * 50 + 50) if total_tos > 0 else 50.0  # Normalize to 0-100
-                    
-                    # Weighted average
-                    momentum = (
-                        goal_pct * 0.30 +
-                        corsi_pct * 0.20 +
-                        ozone_pct * 0.15 +
-                        entries_pct * 0.10 +
-                        passes_pct * 0.10 +
-                        poss_pct * 0.10 +
-                        to_pct * 0.05
-                    )
-                    
-                    return round(momentum, 2)
-                
-                # Calculate momentum for both teams
-                team1_momentum = calc_momentum_score(team1, team2)
-                team2_momentum = calc_momentum_score(team2, team1)
-                
-                # Normalize so they sum to 100%
-                total_momentum = team1_momentum + team2_momentum
-                if total_momentum > 0:
-                    team1_momentum = round(team1_momentum / total_momentum * 100, 2)
-                    team2_momentum = round(team2_momentum / total_momentum * 100, 2)
-                
-                # Update records
-                for r in records:
-                    if r.get('game_id') == game_id and r.get('period') == period and r.get('team_id') == team1.get('team_id'):
-                        r['momentum_pct'] = team1_momentum
-                    elif r.get('game_id') == game_id and r.get('period') == period and r.get('team_id') == team2.get('team_id'):
-                        r['momentum_pct'] = team2_momentum
-    
-    df = pd.DataFrame(records)
+
+    keys = ['_game_order', '_period_order', '_venue_order']
+    te = _credited_team_events(events, event_players).sort_values(keys, kind='stable')
+    if len(te) == 0:
+        df = pd.DataFrame()
+        df['_export_timestamp'] = datetime.now().isoformat()
+        return df
+
+    event_type = te['event_type'].astype(str).str.lower()
+    detail = te['event_detail'].astype(str)
+    detail_lower = detail.str.lower()
+    is_shot = event_type == 'shot'
+
+    # Per-event contributions; each stat is then one grouped sum
+    flags = {
+        'events_count': pd.Series(1, index=te.index),
+        'goals': te['is_goal'] if 'is_goal' in te.columns else get_goal_filter(te),
+        'shots': is_shot,
+        'passes': event_type == 'pass',
+        'zone_entries': te['is_zone_entry'] if 'is_zone_entry' in te.columns
+            else detail_lower.str.contains('zone_entry', na=False),
+        'zone_exits': te['is_zone_exit'] if 'is_zone_exit' in te.columns
+            else detail_lower.str.contains('zone_exit', na=False),
+    }
+    blocked = detail.str.contains('Blocked', na=False)
+    missed = detail.str.contains('Missed', na=False)
+    # Fallback: shots + blocked shots + missed shots (Fenwick excludes blocked)
+    flags['corsi_for'] = te['is_corsi'] if 'is_corsi' in te.columns else \
+        is_shot.astype(int) + blocked.astype(int) + missed.astype(int)
+    flags['fenwick_for'] = te['is_fenwick'] if 'is_fenwick' in te.columns else \
+        is_shot.astype(int) + missed.astype(int)
+    flags['turnovers'] = te['is_turnover'] if 'is_turnover' in te.columns else event_type == 'turnover'
+
+    has_zone = 'event_team_zone' in te.columns
+    zone = te['event_team_zone'].astype(str).str.lower() if has_zone else None
+    for z in ['o', 'd', 'n']:
+        if has_zone and 'is_turnover' in te.columns:
+            flags[f'turnovers_{z}_zone'] = (te['is_turnover'] == 1) & zone.str.startswith(z, na=False)
+        else:
+            flags[f'turnovers_{z}_zone'] = 0
+    for col in ['giveaways', 'takeaways', 'bad_giveaways']:
+        flag_col = 'is_bad_giveaway' if col == 'bad_giveaways' else f'is_{col[:-1]}'
+        flags[col] = te[flag_col] if flag_col in te.columns else 0
+
+    # Time in zones and possession time by zone (sum of event durations)
+    is_possession = (
+        event_type.isin(['possession', 'zone_entry_exit']) &
+        detail_lower.str.contains('rush|carry', na=False, regex=True)
+    )
+    for z, name in [('o', 'offensive'), ('d', 'defensive'), ('n', 'neutral')]:
+        if 'duration' in te.columns and has_zone:
+            in_zone = te['duration'].fillna(0).where(_zone_mask(zone, z, name), 0)
+            flags[f'time_in_{z}_zone'] = in_zone
+            flags[f'possession_time_{z}_zone'] = in_zone.where(is_possession, 0)
+        else:
+            flags[f'time_in_{z}_zone'] = flags[f'possession_time_{z}_zone'] = 0
+
+    sums = pd.DataFrame(flags, index=te.index).groupby([te[k] for k in keys], sort=True).sum()
+    sums = sums.astype(np.int64).reset_index(drop=True)
+
+    rows = _group_starts(te, keys)
+    game_ids = rows['game_id'].tolist()
+    periods = rows['period'].astype(int).tolist()
+    team_ids = rows['team_id'].tolist()
+
+    df = pd.DataFrame({
+        'momentum_key': [f"MOM_{g}_P{p}_{t}" for g, p, t in zip(game_ids, periods, team_ids)],
+        'game_id': game_ids,
+        'season_id': _season_ids(schedule, rows['game_id']),
+        'period': periods,
+        'team_id': team_ids,
+        'team_name': rows['_team_name'].tolist(),
+        'venue': rows['venue'].tolist(),
+    })
+    for col in ['events_count', 'goals', 'shots', 'passes', 'zone_entries', 'zone_exits',
+                'time_in_o_zone', 'time_in_d_zone', 'time_in_n_zone',
+                'possession_time_o_zone', 'possession_time_d_zone', 'possession_time_n_zone',
+                'corsi_for', 'fenwick_for',
+                'turnovers', 'turnovers_o_zone', 'turnovers_d_zone', 'turnovers_n_zone',
+                'giveaways', 'takeaways', 'bad_giveaways']:
+        df[col] = sums[col].to_numpy()
+
+    momentum = _add_momentum(df.assign(**{k: rows[k].to_numpy() for k in keys}), keys[:2], PERIOD_MOMENTUM_WEIGHTS)
+    if momentum is not None:
+        df['momentum_pct'] = momentum
     df['_export_timestamp'] = datetime.now().isoformat()
-    
-    # Reorder columns
-    priority_cols = ['momentum_key', 'game_id', 'season_id', 'period', 'team_id', 'team_name', 'venue',
-                    'events_count', 'goals', 'shots', 'passes',
-                    'zone_entries', 'zone_exits',
-                    'time_in_o_zone', 'time_in_d_zone', 'time_in_n_zone',
-                    'possession_time_o_zone', 'possession_time_d_zone', 'possession_time_n_zone',
-                    'corsi_for', 'fenwick_for',
-                    'turnovers', 'turnovers_o_zone', 'turnovers_d_zone', 'turnovers_n_zone',
-                    'giveaways', 'takeaways', 'bad_giveaways',
-                    'momentum_pct', '_export_timestamp']
-    other_cols = [c for c in df.columns if c not in priority_cols]
-    df = df[[c for c in priority_cols if c in df.columns] + other_cols]
-    
+
     return df
 
 
 def create_fact_time_period_momentum() -> pd.DataFrame:
     """
     Create granular time-period momentum (2-3 minute windows) with momentum predictor.
-    
+
     Each team gets a row for each time window (e.g., 0-3min, 3-6min, etc.) with:
     - Same stats as period momentum
     - Current score at window start
     - Momentum percentage predictor based on score + metrics
+
+    Windows are [0, 180), [180, 360), ... up to the period's last event time
+    (exclusive). Stats are grouped sums over (game, period, window, team).
     """
     events = load_table('fact_events')
     event_players = load_table('fact_event_players')
     schedule = load_table('dim_schedule')
-    
+
     if len(events) == 0:
         return pd.DataFrame()
-    
-    # Get event_player_1_id -> team_id mapping
-    player_team_map = {}
-    if len(event_players) > 0:
-        ep1 = event_players[event_players['player_role'].astype(str).str.lower().str.contains('event_player_1', na=False)]
-        if 'player_id' in ep1.columns and 'team_id' in ep1.columns:
-            player_team_map = dict(zip(ep1['event_id'], ep1['team_id']))
-    
-    # Time window size in seconds (3 minutes = 180 seconds)
-    WINDOW_SIZE = 180
-    
-    records = []
-    
-    for game_id in events['game_id'].dropna().unique():
-        game_events = events[events['game_id'] == game_id].copy()
-        
-        # Get team IDs
-        home_team_id = None
-        away_team_id = None
-        if 'home_team_id' in game_events.columns:
-            home_team_id = game_events['home_team_id'].iloc[0] if len(game_events) > 0 else None
-        if 'away_team_id' in game_events.columns:
-            away_team_id = game_events['away_team_id'].iloc[0] if len(game_events) > 0 else None
-        
-        season_id = None
-        if len(schedule) > 0:
-            game_info = schedule[schedule['game_id'] == game_id]
-            if len(game_info) > 0 and 'season_id' in game_info.columns:
-                season_id = game_info['season_id'].values[0]
-        
-        for period in game_events['period'].dropna().unique():
-            period_events = game_events[game_events['period'] == period].copy()
-            
-            if len(period_events) == 0:
-                continue
-            
-            # Add team_id from mapping
-            period_events['_event_team_id'] = period_events['event_id'].map(player_team_map)
-            if 'event_team_id' in period_events.columns:
-                period_events['_event_team_id'] = period_events['_event_team_id'].fillna(period_events['event_team_id'])
-            
-            # Get time column (use time_start_total_seconds or calculate from period time)
-            if 'time_start_total_seconds' in period_events.columns:
-                time_col = 'time_start_total_seconds'
-            elif 'event_start_seconds' in period_events.columns:
-                time_col = 'event_start_seconds'
-            else:
-                # Skip if no time column
-                continue
-            
-            period_events[time_col] = period_events[time_col].fillna(0)
-            
-            # Calculate time windows (0-180, 180-360, 360-540, etc. within period)
-            period_start = 0
-            period_end = period_events[time_col].max() if len(period_events) > 0 else WINDOW_SIZE * 10
-            
-            # Create time windows
-            windows = []
-            window_start = period_start
-            while window_start < period_end:
-                window_end = min(window_start + WINDOW_SIZE, period_end)
-                windows.append((window_start, window_end))
-                window_start = window_end
-            
-            # Process each time window
-            for window_num, (win_start, win_end) in enumerate(windows):
-                window_events = period_events[
-                    (period_events[time_col] >= win_start) & 
-                    (period_events[time_col] < win_end)
-                ].copy()
-                
-                if len(window_events) == 0:
-                    continue
-                
-                # Calculate score at window start (cumulative goals up to this point)
-                events_before_window = period_events[period_events[time_col] < win_start]
-                
-                # Process each team in this window
-                for team_id, venue in [(home_team_id, 'home'), (away_team_id, 'away')]:
-                    if team_id is None:
-                        continue
-                    
-                    # Filter to events for this team
-                    team_events = window_events[window_events['_event_team_id'] == team_id].copy()
-                    
-                    # Calculate current score at window start
-                    team_goals_before = 0
-                    if 'is_goal' in events_before_window.columns:
-                        team_events_before = events_before_window[events_before_window['_event_team_id'] == team_id]
-                        team_goals_before = int(team_events_before['is_goal'].sum()) if len(team_events_before) > 0 else 0
-                    
-                    if len(team_events) == 0:
-                        continue
-                    
-                    # Calculate same stats as period momentum (simplified - reuse logic)
-                    stats = {
-                        'time_window_key': f"TW_{game_id}_P{int(period)}_W{window_num}_{team_id}",
-                        'game_id': game_id,
-                        'season_id': season_id,
-                        'period': int(period),
-                        'time_window_num': window_num,
-                        'time_window_start': win_start,
-                        'time_window_end': win_end,
-                        'time_window_label': f"{int(win_start//60)}:{int(win_start%60):02d}-{int(win_end//60)}:{int(win_end%60):02d}",
-                        'team_id': team_id,
-                        'venue': venue,
-                        'team_name': team_events[f'{venue}_team'].iloc[0] if f'{venue}_team' in team_events.columns else None,
-                        'score_at_window_start': team_goals_before,
-                    }
-                    
-                    # Quick stats calculation (same as period momentum)
-                    stats['goals'] = int(team_events['is_goal'].sum()) if 'is_goal' in team_events.columns else 0
-                    stats['shots'] = len(team_events[team_events['event_type'].astype(str).str.lower() == 'shot'])
-                    stats['passes'] = len(team_events[team_events['event_type'].astype(str).str.lower() == 'pass'])
-                    stats['zone_entries'] = int(team_events['is_zone_entry'].sum()) if 'is_zone_entry' in team_events.columns else 0
-                    stats['corsi_for'] = int(team_events['is_corsi'].sum()) if 'is_corsi' in team_events.columns else stats['shots']
-                    
-                    if 'duration' in team_events.columns and 'event_team_zone' in team_events.columns:
-                        duration = team_events['duration'].fillna(0)
-                        zone_str = team_events['event_team_zone'].astype(str).str.lower()
-                        o_zone_mask = zone_str.str.startswith('o', na=False) | zone_str.str.contains('offensive', na=False)
-                        stats['time_in_o_zone'] = int(duration[o_zone_mask].sum())
-                    else:
-                        stats['time_in_o_zone'] = 0
-                    
-                    records.append(stats)
-                
-                # Calculate momentum for this window (same logic as period)
-                window_records = [r for r in records if (
-                    r.get('game_id') == game_id and 
-                    r.get('period') == period and 
-                    r.get('time_window_num') == window_num
-                )]
-                
-                if len(window_records) == 2:
-                    team1, team2 = window_records
-                    
-                    # Calculate momentum score (same formula as period)
-                    def calc_momentum_score(team_stats, opp_stats):
-                        total_goals = team_stats.get('goals', 0) + opp_stats.get('goals', 0)
-                        goal_pct = (team_stats.get('goals', 0) / total_goals * 100) if total_goals > 0 else 50.0
-                        total_corsi = team_stats.get('corsi_for', 0) + opp_stats.get('corsi_for', 0)
-                        corsi_pct = (team_stats.get('corsi_for', 0) / total_corsi * 100) if total_corsi > 0 else 50.0
-                        total_ozone = team_stats.get('time_in_o_zone', 0) + opp_stats.get('time_in_o_zone', 0)
-                        ozone_pct = (team_stats.get('time_in_o_zone', 0) / total_ozone * 100) if total_ozone > 0 else 50.0
-                        total_entries = team_stats.get('zone_entries', 0) + opp_stats.get('zone_entries', 0)
-                        entries_pct = (team_stats.get('zone_entries', 0) / total_entries * 100) if total_entries > 0 else 50.0
-                        total_passes = team_stats.get('passes', 0) + opp_stats.get('passes', 0)
-                        passes_pct = (team_stats.get('passes', 0) / total_passes * 100) if total_passes > 0 else 50.0
-                        
-                        momentum = (
-                            goal_pct * 0.30 + corsi_pct * 0.25 + ozone_pct * 0.20 +
-                            entries_pct * 0.15 + passes_pct * 0.10
-                        )
-                        return round(momentum, 2)
-                    
-                    team1_momentum = calc_momentum_score(team1, team2)
-                    team2_momentum = calc_momentum_score(team2, team1)
-                    
-                    # Add score differential factor (teams leading tend to have momentum)
-                    score_diff_team1 = team1.get('score_at_window_start', 0) - team2.get('score_at_window_start', 0)
-                    if score_diff_team1 > 0:
-                        team1_momentum += 5  # Bonus for leading
-                    elif score_diff_team1 < 0:
-                        team2_momentum += 5
-                    
-                    # Normalize
-                    total_momentum = team1_momentum + team2_momentum
-                    if total_momentum > 0:
-                        team1_momentum = round(team1_momentum / total_momentum * 100, 2)
-                        team2_momentum = round(team2_momentum / total_momentum * 100, 2)
-                    
-                    # Update records
-                    for r in records:
-                        if (r.get('game_id') == game_id and r.get('period') == period and 
-                            r.get('time_window_num') == window_num and r.get('team_id') == team1.get('team_id')):
-                            r['momentum_pct'] = team1_momentum
-                            r['momentum_predictor'] = team1_momentum  # Predictor = current momentum
-                        elif (r.get('game_id') == game_id and r.get('period') == period and 
-                              r.get('time_window_num') == window_num and r.get('team_id') == team2.get('team_id')):
-                            r['momentum_pct'] = team2_momentum
-                            r['momentum_predictor'] = team2_momentum
-    
-    df = pd.DataFrame(records)
+
+    # Get time column (use time_start_total_seconds or calculate from period time)
+    time_col = next((c for c in ['time_start_total_seconds', 'event_start_seconds'] if c in events.columns), None)
+
+    keys = ['_game_order', '_period_order', '_venue_order']
+    te = _credited_team_events(events, event_players) if time_col else pd.DataFrame()
+    if len(te) == 0:
+        df = pd.DataFrame()
+        df['_export_timestamp'] = datetime.now().isoformat()
+        return df
+
+    # Period end = last event time in the period (any team)
+    period_times = events.loc[events['game_id'].notna() & events['period'].notna()]
+    period_end = period_times[time_col].fillna(0).groupby(
+        [period_times['game_id'].astype(object), period_times['period']]
+    ).max()
+    t = te[time_col].fillna(0)
+    end = period_end.reindex(pd.MultiIndex.from_arrays([te['game_id'].astype(object), te['period']]))
+    te = te.assign(_t=t.to_numpy(), _end=end.to_numpy(), _bin=t.to_numpy(dtype=float) // MOMENTUM_WINDOW_SECONDS)
+
+    # Score at window start: team goals earlier in the period (cumulative by window)
+    goals = te['is_goal'].fillna(0) if 'is_goal' in te.columns else pd.Series(0, index=te.index)
+    bin_goals = goals.groupby([te[k] for k in keys] + [te['_bin']], sort=True).sum()
+    goals_before = bin_goals.groupby(level=[0, 1, 2]).cumsum() - bin_goals
+
+    windowed = te[(te['_t'] >= 0) & (te['_t'] < te['_end'])]
+    wkeys = ['_game_order', '_period_order', '_bin', '_venue_order']
+    windowed = windowed.sort_values(wkeys, kind='stable')
+    if len(windowed) == 0:
+        df = pd.DataFrame()
+        df['_export_timestamp'] = datetime.now().isoformat()
+        return df
+
+    event_type = windowed['event_type'].astype(str).str.lower()
+    flags = {
+        'goals': windowed['is_goal'] if 'is_goal' in windowed.columns else 0,
+        'shots': event_type == 'shot',
+        'passes': event_type == 'pass',
+        'zone_entries': windowed['is_zone_entry'] if 'is_zone_entry' in windowed.columns else 0,
+    }
+    flags['corsi_for'] = windowed['is_corsi'] if 'is_corsi' in windowed.columns else flags['shots']
+    if 'duration' in windowed.columns and 'event_team_zone' in windowed.columns:
+        zone = windowed['event_team_zone'].astype(str).str.lower()
+        flags['time_in_o_zone'] = windowed['duration'].fillna(0).where(_zone_mask(zone, 'o', 'offensive'), 0)
+    else:
+        flags['time_in_o_zone'] = 0
+    sums = pd.DataFrame(flags, index=windowed.index).groupby([windowed[k] for k in wkeys], sort=True).sum()
+    sums = sums.astype(np.int64).reset_index(drop=True)
+
+    rows = _group_starts(windowed, wkeys)
+    window_num = rows['_bin'].astype(np.int64).to_numpy()
+    start = window_num * MOMENTUM_WINDOW_SECONDS
+    end = np.minimum(start + MOMENTUM_WINDOW_SECONDS, rows['_end'].to_numpy())
+    score = goals_before.reindex(pd.MultiIndex.from_frame(rows[keys + ['_bin']])).to_numpy()
+
+    game_ids = rows['game_id'].tolist()
+    periods = rows['period'].astype(int).tolist()
+    team_ids = rows['team_id'].tolist()
+
+    def clock(seconds: np.ndarray) -> pd.Series:
+        seconds = pd.Series(seconds)
+        minutes = (seconds // 60).astype(np.int64).astype(str)
+        return minutes + ':' + (seconds % 60).astype(np.int64).astype(str).str.zfill(2)
+
+    df = pd.DataFrame({
+        'time_window_key': [f"TW_{g}_P{p}_W{w}_{t}" for g, p, w, t in zip(game_ids, periods, window_num.tolist(), team_ids)],
+        'game_id': game_ids,
+        'season_id': _season_ids(schedule, rows['game_id']),
+        'period': periods,
+        'time_window_num': window_num,
+        'time_window_start': start,
+        'time_window_end': end,
+        'time_window_label': (clock(start) + '-' + clock(end)).to_numpy(),
+        'team_id': team_ids,
+        'venue': rows['venue'].tolist(),
+        'team_name': rows['_team_name'].tolist(),
+        'score_at_window_start': score.astype(np.int64),
+    })
+    for col in ['goals', 'shots', 'passes', 'zone_entries', 'corsi_for', 'time_in_o_zone']:
+        df[col] = sums[col].to_numpy()
+
+    momentum = _add_momentum(
+        df.assign(**{k: rows[k].to_numpy() for k in wkeys}), wkeys[:3],
+        TIME_WINDOW_MOMENTUM_WEIGHTS, lead_col='score_at_window_start'
+    )
+    if momentum is not None:
+        df['momentum_pct'] = momentum
+        df['momentum_predictor'] = momentum  # Predictor = current momentum
     df['_export_timestamp'] = datetime.now().isoformat()
-    
+
     return df
 
 
@@ -997,7 +874,7 @@ def create_fact_team_standings_snapshot() -> pd.DataFrame:
             'games_played': len(team_stats),
             'wins': wins,
             'losses': losses,
-            'points': wins * 2,
+            'points': calculate_standings_points(wins, losses),
             'goals_for': team_stats['goals'].sum() if 'goals' in team_stats.columns else 0,
             'goals_against': team_stats.get('goals_against', pd.Series([0])).sum(),
             'snapshot_date': datetime.now().date().isoformat(),
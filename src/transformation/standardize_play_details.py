@@ -10,6 +10,7 @@ Usage:
     df = standardize_tracking_data(df, dim_tables_path)
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Set, Optional, Tuple
@@ -85,6 +86,24 @@ def standardize_event_code(code: str) -> str:
     return standardized
 
 
+def standardize_event_code_values(values: pd.Series) -> pd.Series:
+    """
+    Vectorized standardize_event_code over a column.
+    
+    Each distinct code is standardized once and mapped back; non-string
+    values are left as they are.
+    """
+    is_text = values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    if not is_text.any():
+        return values
+    
+    codes, uniques = pd.factorize(values[is_text])
+    standardized = np.array([standardize_event_code(code) for code in uniques], dtype=object)
+    out = values.astype(object)
+    out[is_text] = standardized[codes]
+    return out
+
+
 def standardize_event_codes_df(
     df: pd.DataFrame,
     columns: list = None,
@@ -111,7 +130,7 @@ def standardize_event_codes_df(
             continue
             
         original = df[col].copy()
-        df[col] = df[col].apply(standardize_event_code)
+        df[col] = standardize_event_code_values(df[col])
         
         # Count changes
         changes = (original != df[col]) & original.notna()
@@ -272,18 +291,13 @@ def standardize_column(
     if column not in df.columns:
         return df, 0
     
-    changes = 0
-    
-    def normalize(val):
-        nonlocal changes
-        if pd.isna(val):
-            return val
-        if val in mapping:
-            changes += 1
-            return mapping[val]
-        return val
-    
-    df[column] = df[column].apply(normalize)
+    values = df[column]
+    mapped = values.notna() & values.isin(list(mapping))
+    changes = int(mapped.sum())
+    if changes:
+        normalized = values.astype(object)
+        normalized[mapped.to_numpy()] = values[mapped].map(mapping).to_numpy(dtype=object)
+        df[column] = normalized
     
     if log_changes and changes > 0:
         logger.info(f"Column {column}: normalized {changes} values")
@@ -6,92 +6,255 @@ Optimizes pandas DataFrame data types for better memory usage and performance.
 - Uses int8/int16 for small integers
 - Uses float32 where precision allows
 
+Dtypes chosen for a table are learned once (config/dtype_schema.json) and
+re-applied on later saves with a single astype mapping.
+
+Usage:
+    from src.utils.data_type_optimizer import optimize_dataframe_dtypes
+
+    df = optimize_dataframe_dtypes(df, table_name='fact_events')
+
 Version: 29.6
 """
 
+import json
+import logging
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+log = logging.getLogger('DataTypeOptimizer')
+
+# Learned per-table dtypes, kept next to the Supabase schema snapshot
+DTYPE_SCHEMA_PATH = Path(__file__).parent.parent.parent / 'config' / 'dtype_schema.json'
+
+FLOAT32_MAX = 3.4e38
+
+
+class DtypeSchema:
+    """
+    Learned target dtypes per table.
+
+    For each column the schema records the source dtype it was learned from and
+    the target ('int8', 'float32', 'category' + category list, or the source
+    dtype itself when no conversion applies, e.g. high-cardinality strings).
+    A later save of the same table applies the targets with one astype mapping;
+    only new columns, columns whose source dtype changed, or values outside the
+    learned range / category set are inferred again (and the schema widened).
+
+    Stored as JSON (default: config/dtype_schema.json).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DTYPE_SCHEMA_PATH
+        self.tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.tables = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning(f"Ignoring unreadable dtype schema {self.path}: {e}")
+
+    def get(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        return self.tables.get(table_name, {})
+
+    def update(self, table_name: str, columns: Dict[str, Dict[str, Any]]):
+        """Merge learned column specs for a table and persist the schema."""
+        self.tables.setdefault(table_name, {}).update(columns)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(self.tables, f, indent=1, sort_keys=True)
+        except OSError as e:
+            log.debug(f"Could not persist dtype schema: {e}")
+
+
+_default_schema: Optional[DtypeSchema] = None
+
+
+def get_dtype_schema() -> DtypeSchema:
+    """Process-wide schema loaded from DTYPE_SCHEMA_PATH on first use."""
+    global _default_schema
+    if _default_schema is None:
+        _default_schema = DtypeSchema()
+    return _default_schema
+
+
+def _infer_column(
+    series: pd.Series,
+    categorical_threshold: int,
+    max_categories: int,
+    optimize_floats: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[pd.Series]]:
+    """
+    Infer the target dtype for one column.
+
+    Returns:
+        (spec, converted) - spec is None for columns the optimizer never touches;
+        converted is None when the column stays as it is
+    """
+    dtype = series.dtype
+    source = str(dtype)
+
+    # Skip if already optimized
+    if dtype.name.startswith('category'):
+        return None, None
+
+    # Object/string columns - convert to categorical if appropriate
+    if dtype == 'object':
+        unique_count = series.nunique()
+        total_count = series.count()
+
+        # Convert to categorical if:
+        # - Has repeated values (unique < threshold)
+        # - Not too many unique values (unique < max_categories)
+        # - Has enough data to benefit
+        if (unique_count < categorical_threshold or
+            (unique_count < max_categories and total_count > unique_count * 2)):
+            try:
+                converted = series.astype('category')
+            except (ValueError, TypeError):
+                # Can't convert to categorical (e.g., mixed types)
+                return {'source': source, 'target': source}, None
+            spec = {'source': source, 'target': 'category'}
+            categories = converted.cat.categories
+            if all(isinstance(c, str) for c in categories):
+                spec['categories'] = categories.tolist()
+            return spec, converted
+        return {'source': source, 'target': source}, None
+
+    # Integer columns - downcast to the smallest signed type that fits
+    # (0..255 always fits int16, so the unsigned path never applied)
+    if dtype.name.startswith('int'):
+        converted = pd.to_numeric(series, downcast='integer')
+        return {'source': source, 'target': str(converted.dtype)}, converted
+
+    # Float columns - convert to float32 (7 significant digits is enough for stats)
+    if optimize_floats and dtype == 'float64':
+        if _fits_float32(series):
+            try:
+                return {'source': source, 'target': 'float32'}, series.astype('float32')
+            except (ValueError, OverflowError):
+                pass
+        return {'source': source, 'target': source}, None
+
+    return None, None
+
+
+def _fits_float32(series: pd.Series) -> bool:
+    values = series.to_numpy()
+    finite = values[np.isfinite(values)]
+    return len(finite) == 0 or float(np.abs(finite).max()) <= FLOAT32_MAX
+
+
+def _learned_dtype(series: pd.Series, spec: Dict[str, Any]) -> Optional[Any]:
+    """
+    Target dtype for a column from its learned spec, or None if the spec does
+    not apply to this data (re-infer). Range checks are vectorized min/max.
+    """
+    target = spec['target']
+    if target == 'category':
+        return pd.CategoricalDtype(spec['categories']) if 'categories' in spec else 'category'
+    if target.startswith('int'):
+        if len(series) == 0:
+            return target
+        bounds = np.iinfo(target)
+        values = series.to_numpy()
+        return target if bounds.min <= values.min() and values.max() <= bounds.max else None
+    if target == 'float32':
+        return target if _fits_float32(series) else None
+    return target
 
 
 def optimize_dataframe_dtypes(
     df: pd.DataFrame,
     categorical_threshold: int = 10,
     max_categories: int = 1000,
-    optimize_floats: bool = True
+    optimize_floats: bool = True,
+    table_name: Optional[str] = None,
+    schema: Optional[DtypeSchema] = None,
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Optimize DataFrame data types for memory and performance.
     
+    With a table_name, dtypes learned on earlier saves of the table (see
+    DtypeSchema) are applied with a single astype mapping; only columns the
+    schema does not cover are inferred (nunique / min / max) and learned.
+    
     Args:
         df: DataFrame to optimize
         categorical_threshold: Minimum unique values to consider categorical (default: 10)
         max_categories: Maximum categories before skipping (default: 1000)
         optimize_floats: Whether to convert float64 to float32 (default: True)
+        table_name: Table whose learned schema to apply / extend (default: infer only)
+        schema: Schema store (default: get_dtype_schema())
+        inplace: Convert df's columns in place. Otherwise a new frame is returned
+            that shares all unconverted columns with df (no defensive copy).
         
     Returns:
         Optimized DataFrame
     """
-    df = df.copy()
-    
+    if table_name is not None and schema is None:
+        schema = get_dtype_schema()
+    learned = schema.get(table_name) if table_name is not None else {}
+
+    mapping: Dict[str, Any] = {}
+    pending: List[str] = []
     for col in df.columns:
-        dtype = df[col].dtype
-        
-        # Skip if already optimized
-        if dtype.name.startswith('category'):
+        spec = learned.get(col)
+        series = df[col]
+        if spec is None or spec['source'] != str(series.dtype):
+            pending.append(col)
             continue
-        
-        # Object/string columns - convert to categorical if appropriate
-        if dtype == 'object':
-            unique_count = df[col].nunique()
-            total_count = len(df[col].dropna())
-            
-            # Convert to categorical if:
-            # - Has repeated values (unique < threshold)
-            # - Not too many unique values (unique < max_categories)
-            # - Has enough data to benefit
-            if (unique_count < categorical_threshold or 
-                (unique_count < max_categories and total_count > unique_count * 2)):
-                try:
-                    df[col] = df[col].astype('category')
-                except (ValueError, TypeError):
-                    # Can't convert to categorical (e.g., mixed types)
-                    pass
-        
-        # Integer columns - downcast if possible
-        elif dtype.name.startswith('int'):
-            col_min = df[col].min() if len(df[col].dropna()) > 0 else 0
-            col_max = df[col].max() if len(df[col].dropna()) > 0 else 0
-            
-            # Determine appropriate integer type
-            if col_min >= -128 and col_max <= 127:
-                df[col] = pd.to_numeric(df[col], downcast='integer')
-            elif col_min >= -32768 and col_max <= 32767:
-                df[col] = pd.to_numeric(df[col], downcast='integer')
-            elif col_min >= 0 and col_max <= 255:
-                df[col] = pd.to_numeric(df[col], downcast='unsigned')
-            else:
-                # Try downcast anyway (pandas will choose appropriate size)
-                df[col] = pd.to_numeric(df[col], downcast='integer')
-        
-        # Float columns - convert to float32 if appropriate
-        elif optimize_floats and dtype.name.startswith('float'):
-            # Check if precision loss is acceptable
-            # For most stats, float32 is sufficient (7 decimal digits)
-            if dtype == 'float64':
-                # Check if values fit in float32 range
-                col_min = df[col].min() if len(df[col].dropna()) > 0 else 0
-                col_max = df[col].max() if len(df[col].dropna()) > 0 else 0
-                
-                # float32 range: -3.4e38 to 3.4e38
-                if (col_min >= -3.4e38 and col_max <= 3.4e38):
-                    try:
-                        df[col] = df[col].astype('float32')
-                    except (ValueError, OverflowError):
-                        # Can't convert (precision loss or overflow)
-                        pass
-    
-    return df
+        if spec['target'] == spec['source']:
+            continue
+        target = _learned_dtype(series, spec)
+        if target is None:
+            pending.append(col)
+        else:
+            mapping[col] = target
+
+    out = df.astype(mapping, copy=False) if mapping else df.copy(deep=False)
+    changed = list(mapping)
+
+    # Learned category sets: new values re-infer the column, unused categories are dropped
+    for col, target in mapping.items():
+        if not isinstance(target, pd.CategoricalDtype):
+            continue
+        unknown = (out[col].cat.codes.to_numpy() == -1) & df[col].notna().to_numpy()
+        if unknown.any():
+            out[col] = df[col]
+            changed.remove(col)
+            pending.append(col)
+        else:
+            out[col] = out[col].cat.remove_unused_categories()
+
+    updates: Dict[str, Dict[str, Any]] = {}
+    for col in pending:
+        spec, converted = _infer_column(df[col], categorical_threshold, max_categories, optimize_floats)
+        if spec is None:
+            continue
+        previous = learned.get(col)
+        if previous is not None and previous.get('categories') and spec.get('categories'):
+            # Widen the learned category set rather than replacing it
+            spec['categories'] = sorted(set(previous['categories']) | set(spec['categories']))
+        if previous != spec:
+            updates[col] = spec
+        if converted is not None:
+            out[col] = converted
+            changed.append(col)
+
+    if table_name is not None and updates:
+        schema.update(table_name, updates)
+
+    if inplace:
+        for col in changed:
+            df[col] = out[col]
+        return df
+    return out
 
 
 def optimize_specific_columns(
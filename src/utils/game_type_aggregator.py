@@ -20,7 +20,20 @@ Usage:
     from src.utils.game_type_aggregator import (
         GAME_TYPE_SPLITS,
         add_game_type_to_df,
-        aggregate_with_game_type
+        aggregate_game_type_splits,
+        ratio
+    )
+
+    season = aggregate_game_type_splits(
+        player_games,
+        group_cols=['player_id', 'season_id'],
+        aggregations={
+            'games_played': ('game_id', 'nunique'),
+            'goals': ('goals', 'sum'),
+            'goals_per_game': ratio('goals', 'games_played', decimals=2),
+        },
+        key_col='player_season_key',
+        key_template='{player_id}_{season_id}_{game_type}',
     )
 
 Version: 29.0
@@ -28,8 +41,10 @@ Date: January 13, 2026
 ================================================================================
 """
 
+import string
+import numpy as np
 import pandas as pd
-from typing import Callable, Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
 # =============================================================================
@@ -149,16 +164,11 @@ def aggregate_with_game_type(
     
     all_results = []
     
-    # Get unique combinations of group columns
-    unique_groups = df[group_cols].drop_duplicates()
-    
-    for _, group_row in unique_groups.iterrows():
-        # Build filter for this group
-        mask = pd.Series(True, index=df.index)
-        for col in group_cols:
-            mask &= (df[col] == group_row[col])
-        
-        group_df = df[mask]
+    # One pass over the groups (no per-group full-frame mask)
+    for group_values, group_df in df.groupby(group_cols, sort=False, observed=True):
+        if not isinstance(group_values, tuple):
+            group_values = (group_values,)
+        key_values = dict(zip(group_cols, group_values))
         
         for game_type in GAME_TYPE_SPLITS:
             # Filter by game_type
@@ -175,20 +185,188 @@ def aggregate_with_game_type(
             stats = agg_func(filtered_df)
             
             # Add group columns and game_type
-            for col in group_cols:
-                stats[col] = group_row[col]
+            stats.update(key_values)
             stats['game_type'] = game_type
             
             # Build key
-            key_values = {col: group_row[col] for col in group_cols}
-            key_values['game_type'] = game_type
-            stats[key_col] = key_template.format(**key_values)
+            stats[key_col] = key_template.format(**key_values, game_type=game_type)
             
             all_results.append(stats)
     
     return pd.DataFrame(all_results)
 
 
+# =============================================================================
+# DECLARATIVE GROUPING-SETS AGGREGATION
+# =============================================================================
+
+# Aggregations computed directly by groupby
+GROUPBY_FUNCS = ('sum', 'mean', 'nunique', 'count', 'size', 'first', 'last', 'min', 'max')
+
+
+class Ratio(NamedTuple):
+    """Post-aggregation ratio of two output columns (see ratio())."""
+    numerator: str
+    denominator: str
+    scale: float = 1.0
+    decimals: Optional[int] = None
+    fill: float = 0.0
+
+
+def ratio(
+    numerator: str,
+    denominator: str,
+    scale: float = 1.0,
+    decimals: Optional[int] = None,
+    fill: float = 0.0
+) -> Ratio:
+    """
+    Declare a ratio column computed after aggregation.
+    
+    numerator / denominator * scale, rounded to `decimals`, with `fill`
+    where the denominator is 0 or missing. Both names refer to output
+    columns declared earlier in the same aggregations dict.
+    """
+    return Ratio(numerator, denominator, scale, decimals, fill)
+
+
+AggSpec = Union[Tuple[str, str], Ratio]
+
+
+def aggregate_game_type_splits(
+    df: pd.DataFrame,
+    group_cols: List[str],
+    aggregations: Dict[str, AggSpec],
+    key_col: Optional[str] = None,
+    key_template: Optional[str] = None,
+    schedule: Optional[pd.DataFrame] = None,
+    game_id_col: str = 'game_id',
+    splits: List[str] = GAME_TYPE_SPLITS,
+    precomputed_splits: bool = False
+) -> pd.DataFrame:
+    """
+    Aggregate with game_type splits as grouping sets, fully vectorized.
+    
+    Equivalent to aggregate_with_game_type, but aggregations are declared
+    instead of computed by a Python callback: one groupby over
+    group_cols + game_type (Regular/Playoffs) and one over group_cols ('All'),
+    concatenated. Rows come out in first-appearance order of the groups,
+    then GAME_TYPE_SPLITS order; empty splits produce no row.
+    
+    Parameters:
+        df: Source DataFrame with game-level data
+        group_cols: Columns to group by (e.g., ['player_id', 'season_id'])
+        aggregations: Output column -> (source column, func) with func in
+            GROUPBY_FUNCS, or ratio(...) over earlier output columns.
+            Aggregations whose source columns are missing are skipped.
+        key_col: Name of the primary key column to create (optional)
+        key_template: Template for key like '{player_id}_{season_id}_{game_type}'
+        schedule: Optional pre-loaded schedule
+        game_id_col: Name of game_id column
+        splits: game_type values to produce
+        precomputed_splits: df already carries 'All' rows (e.g. season tables
+            rolled up to career); group by game_type directly instead of
+            adding the 'All' grouping set
+    
+    Returns:
+        DataFrame: [key_col], group_cols, game_type, then aggregations in order
+    """
+    if 'game_type' not in df.columns:
+        df = add_game_type_to_df(df, schedule, game_id_col)
+    
+    named = {}
+    ratios = {}
+    for out_col, spec in aggregations.items():
+        if isinstance(spec, Ratio):
+            ratios[out_col] = spec
+            continue
+        source, func = spec
+        if func not in GROUPBY_FUNCS:
+            raise ValueError(f"Unsupported aggregation '{func}' for {out_col}; use one of {GROUPBY_FUNCS}")
+        if func == 'size':
+            source = group_cols[0]
+        if source in df.columns:
+            named[out_col] = pd.NamedAgg(column=source, aggfunc=func)
+    
+    out_cols = group_cols + ['game_type'] + list(named)
+    if len(df) == 0 or not named:
+        result = pd.DataFrame(columns=out_cols)
+    else:
+        parts = []
+        type_splits = list(splits) if precomputed_splits else [g for g in splits if g != 'All']
+        if type_splits:
+            typed = df[df['game_type'].isin(type_splits)]
+            if len(typed) > 0:
+                parts.append(_group_agg(typed, group_cols + ['game_type'], named))
+        if 'All' in splits and not precomputed_splits:
+            all_rows = _group_agg(df, group_cols, named)
+            all_rows.insert(len(group_cols), 'game_type', 'All')
+            parts.append(all_rows)
+        result = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=out_cols)
+        result = _order_like_groups(result[out_cols], df, group_cols, splits)
+    
+    for out_col, spec in ratios.items():
+        if spec.numerator in result.columns and spec.denominator in result.columns:
+            result[out_col] = _ratio_column(result[spec.numerator], result[spec.denominator], spec)
+    
+    if key_col is not None:
+        result.insert(0, key_col, format_key_column(result, key_template))
+    
+    return result
+
+
+def _group_agg(df: pd.DataFrame, by: List[str], named: Dict[str, pd.NamedAgg]) -> pd.DataFrame:
+    """Single groupby with named aggregations, keys returned as columns."""
+    return df.groupby(by, sort=False, observed=True).agg(**named).reset_index()
+
+
+def _order_like_groups(
+    result: pd.DataFrame,
+    df: pd.DataFrame,
+    group_cols: List[str],
+    splits: List[str]
+) -> pd.DataFrame:
+    """Sort grouping-set rows by group first appearance in df, then split order."""
+    groups = pd.MultiIndex.from_frame(df[group_cols].dropna().drop_duplicates())
+    group_rank = groups.get_indexer(pd.MultiIndex.from_frame(result[group_cols]))
+    split_rank = pd.Categorical(result['game_type'], categories=splits).codes
+    order = np.lexsort((split_rank, group_rank))
+    return result.iloc[order].reset_index(drop=True)
+
+
+def _ratio_column(numerator: pd.Series, denominator: pd.Series, spec: Ratio) -> pd.Series:
+    """numerator / denominator * scale, with spec.fill for zero/missing denominators."""
+    num = pd.to_numeric(numerator, errors='coerce').astype(float)
+    den = pd.to_numeric(denominator, errors='coerce').astype(float)
+    valid = den.notna() & (den != 0)
+    values = (num / den.where(valid)) * spec.scale
+    if spec.decimals is not None:
+        values = values.round(spec.decimals)
+    return values.where(valid, spec.fill)
+
+
+def format_key_column(df: pd.DataFrame, key_template: str) -> pd.Series:
+    """
+    Build a key column from a template like '{player_id}_{season_id}_{game_type}'.
+    
+    Plain {field} placeholders are joined with vectorized string ops;
+    the result matches key_template.format(**row) for each row.
+    """
+    parts = list(string.Formatter().parse(key_template))
+    if any(spec or conv for _, field, spec, conv in parts if field is not None):
+        # Format specs/conversions need Python formatting
+        return pd.Series([key_template.format(**row) for row in df.to_dict('records')],
+                         index=df.index, dtype=object)
+    
+    key = pd.Series('', index=df.index, dtype=object)
+    for literal, field, _, _ in parts:
+        if literal:
+            key = key + literal
+        if field is not None:
+            key = key + df[field].astype(str).astype(object)
+    return key
+
+
 def get_team_record_from_schedule(
     schedule: pd.DataFrame,
     team_id: str,
@@ -281,28 +459,88 @@ def get_goalie_record_from_games(
     Returns:
         Dict with wins, losses, ties
     """
-    wins, losses, ties = 0, 0, 0
+    results = goalie_game_results(games, team_name_col)
+    return {col: int(results[col].sum()) for col in ['wins', 'losses', 'ties']}
+
+
+def goalie_game_results(
+    games: pd.DataFrame,
+    team_name_col: str = 'team_name'
+) -> pd.DataFrame:
+    """
+    Per-row goalie result flags (vectorized), aligned to games.index.
     
-    for _, g in games.iterrows():
-        team = g[team_name_col]
-        
-        if team == g.get('home_team_name'):
-            if g['home_total_goals'] > g['away_total_goals']:
-                wins += 1
-            elif g['home_total_goals'] < g['away_total_goals']:
-                losses += 1
-            elif pd.notna(g.get('home_team_t')) and g['home_team_t'] > 0:
-                ties += 1
-            else:
-                losses += 1
-        elif team == g.get('away_team_name'):
-            if g['away_total_goals'] > g['home_total_goals']:
-                wins += 1
-            elif g['away_total_goals'] < g['home_total_goals']:
-                losses += 1
-            elif pd.notna(g.get('away_team_t')) and g['away_team_t'] > 0:
-                ties += 1
-            else:
-                losses += 1
+    A goalie on the team with more goals gets a win, fewer goals a loss.
+    Level scores count as a tie only when the schedule tie column (home_team_t /
+    away_team_t) is > 0, otherwise as a loss. Rows whose team is neither home
+    nor away count as nothing.
+    
+    Returns:
+        DataFrame with int columns wins, losses, ties (0/1 per row)
+    """
+    def col(name):
+        if name in games.columns:
+            return games[name]
+        return pd.Series(np.nan, index=games.index)
+    
+    team = games[team_name_col]
+    home_goals, away_goals = col('home_total_goals'), col('away_total_goals')
+    is_home = (team == col('home_team_name')).to_numpy()
+    is_away = (team == col('away_team_name')).to_numpy() & ~is_home
+    
+    own = np.where(is_home, home_goals, away_goals).astype(float)
+    opp = np.where(is_home, away_goals, home_goals).astype(float)
+    tie_flag = pd.to_numeric(pd.Series(np.where(is_home, col('home_team_t'), col('away_team_t')),
+                                       index=games.index), errors='coerce')
+    
+    played = is_home | is_away
+    wins = played & (own > opp)
+    losses = played & (own < opp)
+    ties = played & ~wins & ~losses & (tie_flag.fillna(0).to_numpy() > 0)
+    losses |= played & ~wins & ~losses & ~ties
+    
+    return pd.DataFrame({
+        'wins': wins.astype(int),
+        'losses': losses.astype(int),
+        'ties': ties.astype(int),
+    }, index=games.index)
+
+
+def team_game_results(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Long team-game frame (one row per team per Past game) from dim_schedule.
+    
+    Vectorized basis for team records: same rules as
+    get_team_record_from_schedule (win = more goals, ties from the schedule
+    tie columns, losses = the rest). IDs are returned as strings.
+    
+    Returns:
+        DataFrame with game_id, team_id, season_id, game_type, goals_for,
+        goals_against, wins, ties
+    """
+    if 'schedule_type' in schedule.columns:
+        schedule = schedule[schedule['schedule_type'] == 'Past']
+    
+    def num(name):
+        if name in schedule.columns:
+            return pd.to_numeric(schedule[name], errors='coerce').fillna(0)
+        return pd.Series(0, index=schedule.index)
     
-    return {'wins': wins, 'losses': losses, 'ties': ties}
+    home_goals, away_goals = num('home_total_goals'), num('away_total_goals')
+    game_type = schedule[GAME_TYPE_COLUMN] if GAME_TYPE_COLUMN in schedule.columns else DEFAULT_GAME_TYPE
+    sides = []
+    for team_col, gf, ga, tie_col in [
+        ('home_team_id', home_goals, away_goals, 'home_team_t'),
+        ('away_team_id', away_goals, home_goals, 'away_team_t'),
+    ]:
+        sides.append(pd.DataFrame({
+            'game_id': schedule['game_id'] if 'game_id' in schedule.columns else schedule.index,
+            'team_id': schedule[team_col].astype(str),
+            'season_id': schedule['season_id'].astype(str),
+            'game_type': game_type,
+            'goals_for': gf,
+            'goals_against': ga,
+            'wins': (gf > ga).astype(int),
+            'ties': num(tie_col),
+        }))
+    return pd.concat(sides, ignore_index=True)
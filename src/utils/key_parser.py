@@ -21,6 +21,8 @@ Key Formats:
 import logging
 from typing import Optional, Tuple, NamedTuple
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,6 +82,25 @@ def parse_shift_key(shift_key: str) -> Optional[ShiftKeyParts]:
         return None
 
 
+def parse_shift_keys(shift_keys: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized parse_shift_key for a whole column.
+    
+    Args:
+        shift_keys: Series of shift keys (non-strings / malformed keys -> NaN)
+    
+    Returns:
+        DataFrame aligned to shift_keys.index with nullable Int64 columns
+        game_id and shift_index
+    """
+    keys = shift_keys.where(shift_keys.map(type) == str)
+    parts = keys.str.strip().str.extract(r'^SH(\d{5})(\d+)$')
+    return pd.DataFrame({
+        'game_id': pd.to_numeric(parts[0], errors='coerce').astype('Int64'),
+        'shift_index': pd.to_numeric(parts[1], errors='coerce').astype('Int64'),
+    }, index=shift_keys.index)
+
+
 def parse_event_key(event_key: str) -> Optional[EventKeyParts]:
     """
     Parse an event key into its components.
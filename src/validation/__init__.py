@@ -13,6 +13,8 @@ from .pre_etl_check import (
     validate_game,
     validate_all_games,
     clean_game,
+    load_validation_dims,
+    ValidationCache,
 )
 
 __all__ = [
@@ -28,4 +30,6 @@ __all__ = [
     'validate_game',
     'validate_all_games',
     'clean_game',
+    'load_validation_dims',
+    'ValidationCache',
 ]
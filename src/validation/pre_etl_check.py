@@ -13,6 +13,10 @@ Usage:
         for error in result.errors:
             print(error)
 
+    # All games: dims loaded once, games fanned out over a process pool,
+    # unchanged workbooks answered from data/.pre_etl_cache.json
+    results = validate_all_games(max_workers=4)
+
 Validation Categories:
     1. Required Fields - Core columns must be present and non-null
     2. Valid Values - Values must exist in dimension tables
@@ -42,15 +46,30 @@ Related Issues:
     - #122: Duplicate player slots
 """
 
+import hashlib
+import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, Tuple
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger('pre_etl_check')
 
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Tables read by the checks - loaded once per run and shared with every validator
+VALIDATION_DIM_TABLES = ['dim_event_type', 'dim_event_detail', 'fact_gameroster']
+
+# Bump when checks change so cached results are re-validated
+VALIDATION_CACHE_VERSION = 1
+
+DEFAULT_CACHE_PATH = PROJECT_ROOT / 'data' / '.pre_etl_cache.json'
+
 
 class CheckLevel(Enum):
     """Severity levels for validation checks."""
@@ -72,6 +91,25 @@ class CheckResult:
         status = '✓' if self.passed else ('✗' if self.level != CheckLevel.WARNING else '⚠')
         return f"{status} [{self.level.value.upper()}] {self.check_name}: {self.message}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'check_name': self.check_name,
+            'passed': self.passed,
+            'level': self.level.value,
+            'message': self.message,
+            'details': self.details,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CheckResult':
+        return cls(
+            check_name=data['check_name'],
+            passed=data['passed'],
+            level=CheckLevel(data['level']),
+            message=data['message'],
+            details=data.get('details'),
+        )
+
 
 @dataclass
 class CleanResult:
@@ -159,6 +197,16 @@ class ValidationResult:
     def add(self, result: CheckResult):
         self.checks.append(result)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {'game_id': self.game_id, 'checks': [c.to_dict() for c in self.checks]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationResult':
+        return cls(
+            game_id=data['game_id'],
+            checks=[CheckResult.from_dict(c) for c in data['checks']],
+        )
+
     def summary(self) -> str:
         """Generate a summary report."""
         lines = [
@@ -185,6 +233,80 @@ class ValidationResult:
         return "\n".join(lines)
 
 
+def _first_present(columns, candidates: List[str]) -> Optional[str]:
+    """Return the first candidate column present in columns."""
+    for col in candidates:
+        if col in columns:
+            return col
+    return None
+
+
+class _EventFrame:
+    """
+    Shared lookups over one events frame.
+
+    Column resolution, the no-player mask, the per-event rows and the player
+    team assignment are each computed once (lazily) and reused by every check,
+    instead of each check re-deriving them with its own pass over the frame.
+    """
+
+    DETAIL_COLUMNS = ['event_detail_code', 'event_detail_', 'event_detail']
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+
+    @cached_property
+    def et_col(self) -> Optional[str]:
+        return _first_present(self.df.columns, PreETLValidator.EVENT_TYPE_COLUMNS)
+
+    @cached_property
+    def ed_col(self) -> Optional[str]:
+        return _first_present(self.df.columns, self.DETAIL_COLUMNS)
+
+    @cached_property
+    def time_col(self) -> Optional[str]:
+        return _first_present(self.df.columns, PreETLValidator.TIME_COLUMNS)
+
+    @cached_property
+    def no_player(self) -> pd.Series:
+        """Rows of event types that legitimately have no players."""
+        if self.et_col is None:
+            return pd.Series(False, index=self.df.index)
+        return self.df[self.et_col].isin(PreETLValidator.NO_PLAYER_EVENT_TYPES)
+
+    @cached_property
+    def unique_events(self) -> pd.DataFrame:
+        """First row per event_index (one row per logical event)."""
+        return self.df.drop_duplicates(subset=['event_index'])
+
+    @cached_property
+    def is_event_role(self) -> pd.Series:
+        return self.df['player_role'].str.startswith('event_', na=False)
+
+    @cached_property
+    def role_team(self) -> pd.Series:
+        """'event' / 'opp' from the player_role prefix (None without a role)."""
+        role_team = np.where(self.is_event_role, 'event', 'opp').astype(object)
+        role_team[self.df['player_role'].isna().to_numpy()] = None
+        return pd.Series(role_team, index=self.df.index, name='_role_team')
+
+    @cached_property
+    def actual_team(self) -> pd.Series:
+        """Player's actual team: event_player_* = event team, opp_player_* = the other."""
+        df = self.df
+        has_valid_data = df['player_role'].notna() & df['team_'].notna()
+        is_home_event = has_valid_data & (df['team_'] == 'h')
+        is_away_event = has_valid_data & (df['team_'] == 'a')
+        is_event_player = self.is_event_role
+        team = np.select(
+            [is_home_event & is_event_player, is_home_event & ~is_event_player,
+             is_away_event & is_event_player, is_away_event & ~is_event_player],
+            ['home', 'away', 'away', 'home'],
+            default=None
+        )
+        return pd.Series(team, index=df.index)
+
+
 class PreETLValidator:
     """
     Pre-ETL validation for raw tracker data.
@@ -233,6 +355,7 @@ class PreETLValidator:
         game_id: int,
         raw_dir: Optional[Path] = None,
         output_dir: Optional[Path] = None,
+        dims: Optional[Dict[str, pd.DataFrame]] = None,
     ):
         """
         Initialize the validator.
@@ -241,17 +364,27 @@ class PreETLValidator:
             game_id: Game ID to validate
             raw_dir: Path to raw game data (default: data/raw/games/{game_id})
             output_dir: Path to ETL output for dim tables (default: data/output)
+            dims: Preloaded dimension tables (see load_validation_dims) shared
+                across validators instead of re-reading the CSVs per game
         """
         self.game_id = game_id
-        self.project_root = Path(__file__).parent.parent.parent
+        self.project_root = PROJECT_ROOT
         self.raw_dir = raw_dir or self.project_root / 'data' / 'raw' / 'games' / str(game_id)
         self.output_dir = output_dir or self.project_root / 'data' / 'output'
 
         self._events_df: Optional[pd.DataFrame] = None
         self._shifts_df: Optional[pd.DataFrame] = None
         self._metadata_df: Optional[pd.DataFrame] = None
-        self._dim_cache: Dict[str, pd.DataFrame] = {}
+        self._dim_cache: Dict[str, pd.DataFrame] = dict(dims) if dims else {}
         self._is_partial: bool = False  # True if video-only (no events/shifts)
+        self._event_frame: Optional[_EventFrame] = None
+
+    @property
+    def _frame(self) -> _EventFrame:
+        """Shared lookups for the current events frame (rebuilt when it is replaced)."""
+        if self._event_frame is None or self._event_frame.df is not self._events_df:
+            self._event_frame = _EventFrame(self._events_df)
+        return self._event_frame
 
     def _load_tracker_data(self) -> Tuple[bool, str]:
         """
@@ -481,18 +614,8 @@ class PreETLValidator:
             issues.append(f"event_index: {null_index} null values")
 
         # For player fields, exclude events that don't have players
-        # Find event type column
-        et_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in df.columns:
-                et_col = col
-                break
-
-        # Filter to events that SHOULD have players
-        if et_col:
-            player_events = df[~df[et_col].isin(self.NO_PLAYER_EVENT_TYPES)]
-        else:
-            player_events = df  # Can't filter, check all
+        # (no-player mask is all False without an event type column - check all)
+        player_events = df[~self._frame.no_player]
 
         # Check player_game_number - should not be null for player events
         null_jersey = player_events['player_game_number'].isna().sum()
@@ -540,13 +663,7 @@ class PreETLValidator:
 
         valid_types = set(dim_et['event_type_code'].dropna().unique())
 
-        # Find the event type column
-        et_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in df.columns:
-                et_col = col
-                break
-
+        et_col = self._frame.et_col
         if et_col is None:
             return results
 
@@ -592,12 +709,9 @@ class PreETLValidator:
 
         valid_details = set(dim_ed['event_detail_code'].dropna().unique())
 
-        # Check multiple possible columns
-        detail_cols = ['event_detail_code', 'event_detail_', 'event_detail']
-        for col in detail_cols:
-            if col not in df.columns:
-                continue
-
+        # Only check first found column
+        col = self._frame.ed_col
+        if col is not None:
             data_details = set(df[col].dropna().unique())
             invalid = data_details - valid_details
 
@@ -616,7 +730,6 @@ class PreETLValidator:
                     level=CheckLevel.ERROR,
                     message=f"All event details in {col} valid ({len(data_details)} values)"
                 ))
-            break  # Only check first found column
 
         return results
 
@@ -673,18 +786,13 @@ class PreETLValidator:
                 message="Events data not loaded"
             )
 
-        df = self._events_df.copy()
-
-        # Determine role_team: 'event' or 'opp' based on player_role prefix (vectorized)
-        df['_role_team'] = None
-        has_role = df['player_role'].notna()
-        is_event_role = df['player_role'].str.startswith('event_', na=False)
-        df.loc[has_role & is_event_role, '_role_team'] = 'event'
-        df.loc[has_role & ~is_event_role, '_role_team'] = 'opp'
+        df = self._events_df
 
-        # Group by event_index, player_game_number, AND role_team
-        # Only flag duplicates within the same team context
-        duplicates = df.groupby(['event_index', 'player_game_number', '_role_team']).size().reset_index(name='count')
+        # Group by event_index, player_game_number, AND role_team ('event'/'opp' from
+        # the player_role prefix) - only flag duplicates within the same team context
+        duplicates = df.groupby(
+            [df['event_index'], df['player_game_number'], self._frame.role_team]
+        ).size().reset_index(name='count')
         dup_events = duplicates[duplicates['count'] > 1]
 
         if len(dup_events) > 0:
@@ -726,15 +834,7 @@ class PreETLValidator:
                 message="Events data not loaded"
             )
 
-        df = self._events_df
-
-        # Find time column
-        time_col = None
-        for col in ['event_start_min', 'event_start_min_']:
-            if col in df.columns:
-                time_col = col
-                break
-
+        time_col = self._frame.time_col
         if time_col is None:
             return CheckResult(
                 check_name='time_consistency',
@@ -743,37 +843,31 @@ class PreETLValidator:
                 message="No time column found - skipping time check"
             )
 
-        # Get unique events (one row per event)
-        events_unique = df.drop_duplicates(subset=['event_index']).copy()
+        # Get unique events (one row per event), ordered by period (first appearance)
+        # then event_index, so all periods are checked in a single pass
+        events_unique = self._frame.unique_events
+        events_unique = events_unique[events_unique['period'].notna()]
+        period_order = pd.Series(pd.factorize(events_unique['period'])[0], index=events_unique.index)
+        timed = (
+            events_unique[['period', 'event_index', time_col]]
+            .assign(_period_order=period_order)
+            .sort_values(['_period_order', 'event_index'], kind='mergesort')
+        )
+        timed = timed[timed[time_col].notna()]
 
-        # Vectorized time consistency check using .shift()
+        # Vectorized time consistency check using groupby().shift()
         # Clock counts DOWN in hockey (18:00 -> 0:00), so time should decrease or stay same
-        issues = []
-        for period in events_unique['period'].dropna().unique():
-            period_events = events_unique[events_unique['period'] == period].sort_values('event_index').copy()
-            period_events = period_events[period_events[time_col].notna()]
-
-            if len(period_events) < 2:
-                continue
-
-            # Compare current time to previous time using shift
-            period_events['_prev_time'] = period_events[time_col].shift(1)
-            # Time went UP = current > previous (wrong direction)
-            time_jumps = period_events[
-                period_events['_prev_time'].notna() &
-                (period_events[time_col] > period_events['_prev_time'])
-            ]
-
-            # Format issues vectorized
-            if len(time_jumps) > 0:
-                jump_strs = (
-                    "P" + str(int(period)) + " event " +
-                    time_jumps['event_index'].astype(str) +
-                    ": time jumped from " +
-                    time_jumps['_prev_time'].astype(str) +
-                    " to " + time_jumps[time_col].astype(str)
-                ).tolist()
-                issues.extend(jump_strs)
+        timed['_prev_time'] = timed.groupby('_period_order')[time_col].shift(1)
+        # Time went UP = current > previous (wrong direction)
+        time_jumps = timed[timed['_prev_time'].notna() & (timed[time_col] > timed['_prev_time'])]
+
+        issues = (
+            "P" + time_jumps['period'].map(lambda p: str(int(p))) + " event " +
+            time_jumps['event_index'].astype(str) +
+            ": time jumped from " +
+            time_jumps['_prev_time'].astype(str) +
+            " to " + time_jumps[time_col].astype(str)
+        ).tolist()
 
         if issues:
             return CheckResult(
@@ -834,20 +928,10 @@ class PreETLValidator:
             return results
 
         # Vectorized team assignment: event_player_* = same team as event, opp_player_* = opposite
-        df_with_team = df.copy()
-        is_event_player = df_with_team['player_role'].str.startswith('event_', na=False)
-        is_home_event = df_with_team['team_'] == 'h'
-        is_away_event = df_with_team['team_'] == 'a'
-        has_valid_data = df_with_team['player_role'].notna() & df_with_team['team_'].notna()
-
-        df_with_team['actual_team'] = None
-        df_with_team.loc[has_valid_data & is_home_event & is_event_player, 'actual_team'] = 'home'
-        df_with_team.loc[has_valid_data & is_home_event & ~is_event_player, 'actual_team'] = 'away'
-        df_with_team.loc[has_valid_data & is_away_event & is_event_player, 'actual_team'] = 'away'
-        df_with_team.loc[has_valid_data & is_away_event & ~is_event_player, 'actual_team'] = 'home'
+        actual_team = self._frame.actual_team
 
         # Check home team jerseys
-        home_players = df_with_team[df_with_team['actual_team'] == 'home']
+        home_players = df[actual_team == 'home']
         home_event_jerseys = set(home_players['player_game_number'].dropna().astype(int).unique())
         unknown_home = home_event_jerseys - home_jerseys
 
@@ -868,7 +952,7 @@ class PreETLValidator:
             ))
 
         # Check away team jerseys
-        away_players = df_with_team[df_with_team['actual_team'] == 'away']
+        away_players = df[actual_team == 'away']
         away_event_jerseys = set(away_players['player_game_number'].dropna().astype(int).unique())
         unknown_away = away_event_jerseys - away_jerseys
 
@@ -956,13 +1040,6 @@ class PreETLValidator:
 
         df = self._events_df
 
-        # Find event type column
-        et_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in df.columns:
-                et_col = col
-                break
-
         # Get all unique event indices
         all_events = set(df['event_index'].dropna().unique())
 
@@ -971,11 +1048,8 @@ class PreETLValidator:
         events_with_ep1 = set(has_ep1['event_index'].dropna().unique())
 
         # Get no-player events (these don't need event_player_1)
-        if et_col:
-            no_player_events = df[df[et_col].isin(self.NO_PLAYER_EVENT_TYPES)]
-            no_player_event_indices = set(no_player_events['event_index'].dropna().unique())
-        else:
-            no_player_event_indices = set()
+        no_player_events = df[self._frame.no_player]
+        no_player_event_indices = set(no_player_events['event_index'].dropna().unique())
 
         # Events that should have event_player_1 but don't
         missing_ep1 = all_events - events_with_ep1 - no_player_event_indices
@@ -1012,12 +1086,10 @@ class PreETLValidator:
                 message="Events data not loaded"
             )
 
-        df = self._events_df
-
         # Get unique events (should be one event_index per logical event)
         # Note: Each event has multiple rows (one per player), so we check uniqueness
         # by looking at the first row per event_index
-        event_indices = df.drop_duplicates(subset=['event_index'])['event_index']
+        event_indices = self._frame.unique_events['event_index']
 
         # Check for duplicates in the original event_index column
         # This would indicate the same event_index appears in different logical events
@@ -1181,41 +1253,15 @@ class PreETLValidator:
                     pass
 
         # Find time columns
-        start_min_col = None
-        start_sec_col = None
-        end_min_col = None
-        end_sec_col = None
-
-        for col in ['event_start_min', 'event_start_min_']:
-            if col in df.columns:
-                start_min_col = col
-                break
-        for col in ['event_start_sec', 'event_start_sec_']:
-            if col in df.columns:
-                start_sec_col = col
-                break
-        for col in ['event_end_min', 'event_end_min_']:
-            if col in df.columns:
-                end_min_col = col
-                break
-        for col in ['event_end_sec', 'event_end_sec_']:
-            if col in df.columns:
-                end_sec_col = col
-                break
-
-        # Get unique events for checking
-        events = df.drop_duplicates(subset=['event_index']).copy()
+        start_min_col = _first_present(df.columns, ['event_start_min', 'event_start_min_'])
+        start_sec_col = _first_present(df.columns, ['event_start_sec', 'event_start_sec_'])
+        end_min_col = _first_present(df.columns, ['event_end_min', 'event_end_min_'])
+        end_sec_col = _first_present(df.columns, ['event_end_sec', 'event_end_sec_'])
 
-        # Find event type column to exclude no-player events (which use running time, not game clock)
-        et_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in events.columns:
-                et_col = col
-                break
-
-        # Filter to player events only (no-player events like Intermission use different timing)
-        if et_col:
-            events = events[~events[et_col].isin(self.NO_PLAYER_EVENT_TYPES)]
+        # Unique events, player events only (no-player events like Intermission use
+        # running time, not game clock)
+        events = self._frame.unique_events
+        events = events[~self._frame.no_player.loc[events.index]]
 
         # Check minutes bounds (allow up to period_length + small buffer for tracking variance)
         # Some games have slightly longer periods or timing discrepancies
@@ -1291,20 +1337,10 @@ class PreETLValidator:
                 message="Events data not loaded"
             )
 
-        df = self._events_df
         issues = []
 
-        # Find event type and detail columns
-        et_col = None
-        ed_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in df.columns:
-                et_col = col
-                break
-        for col in ['event_detail_code', 'event_detail_', 'event_detail']:
-            if col in df.columns:
-                ed_col = col
-                break
+        et_col = self._frame.et_col
+        ed_col = self._frame.ed_col
 
         if et_col is None or ed_col is None:
             return CheckResult(
@@ -1315,7 +1351,7 @@ class PreETLValidator:
             )
 
         # Get unique events
-        events = df.drop_duplicates(subset=['event_index'])
+        events = self._frame.unique_events
 
         # Find goals (event_type == 'Goal')
         goals = events[events[et_col] == 'Goal']
@@ -1378,13 +1414,7 @@ class PreETLValidator:
 
         df = self._events_df
 
-        # Find event type column
-        et_col = None
-        for col in self.EVENT_TYPE_COLUMNS:
-            if col in df.columns:
-                et_col = col
-                break
-
+        et_col = self._frame.et_col
         if et_col is None:
             return CheckResult(
                 check_name='faceoff_structure',
@@ -1407,18 +1437,14 @@ class PreETLValidator:
         # Get unique faceoff event indices
         faceoff_indices = faceoffs['event_index'].unique()
 
+        # Roles across ALL rows of each faceoff event, resolved in one pass
         issues = []
-        missing_winner = []
-        missing_loser = []
-
-        for fo_idx in faceoff_indices:
-            fo_rows = df[df['event_index'] == fo_idx]
-            roles = set(fo_rows['player_role'].dropna().unique())
-
-            if 'event_player_1' not in roles:
-                missing_winner.append(fo_idx)
-            if 'opp_player_1' not in roles:
-                missing_loser.append(fo_idx)
+        faceoff_keys = pd.Series(faceoff_indices)
+        known = faceoff_keys.notna()
+        winners = df.loc[df['player_role'] == 'event_player_1', 'event_index']
+        losers = df.loc[df['player_role'] == 'opp_player_1', 'event_index']
+        missing_winner = list(faceoff_indices[~(known & faceoff_keys.isin(winners)).to_numpy()])
+        missing_loser = list(faceoff_indices[~(known & faceoff_keys.isin(losers)).to_numpy()])
 
         if missing_winner:
             issues.append(f"Faceoffs missing winner (event_player_1): {missing_winner[:5]}")
@@ -1764,23 +1790,152 @@ def clean_game(game_id: int, verbose: bool = False) -> CleanResult:
     return result
 
 
-def validate_all_games(raw_dir: Optional[Path] = None, verbose: bool = False) -> Dict[int, ValidationResult]:
+def load_validation_dims(output_dir: Optional[Path] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Load the dimension tables the checks read (VALIDATION_DIM_TABLES) once.
+
+    Args:
+        output_dir: Path to ETL output (default: data/output)
+
+    Returns:
+        Dict of table name -> DataFrame (missing tables omitted)
+    """
+    loader = PreETLValidator(game_id=0, output_dir=output_dir)
+    dims = {}
+    for table_name in VALIDATION_DIM_TABLES:
+        df = loader._get_dim_table(table_name)
+        if df is not None:
+            dims[table_name] = df
+    return dims
+
+
+def _dims_fingerprint(dims: Dict[str, pd.DataFrame]) -> str:
+    """Content hash of the shared dimension tables."""
+    hasher = hashlib.md5()
+    for table_name in sorted(dims):
+        hasher.update(table_name.encode())
+        hasher.update(pd.util.hash_pandas_object(dims[table_name], index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def _file_hash(filepath: Path) -> str:
+    """MD5 hash of a file's content."""
+    hasher = hashlib.md5()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoder for numpy scalars / sets found in check details."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class ValidationCache:
+    """
+    Per-game validation results keyed by workbook content.
+
+    An entry is reused only when the tracking workbook hash, the dimension
+    table fingerprint and VALIDATION_CACHE_VERSION all match, so editing a
+    workbook, re-running the dim ETL or changing the checks re-validates.
+    Stored as JSON (default: data/.pre_etl_cache.json).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable validation cache {self.path}: {e}")
+
+    @staticmethod
+    def key(tracking_file: Path, dims_fingerprint: str) -> Optional[str]:
+        """Cache key for a game, or None when there is no workbook to hash."""
+        if not tracking_file.exists():
+            return None
+        return f"v{VALIDATION_CACHE_VERSION}:{_file_hash(tracking_file)}:{dims_fingerprint}"
+
+    def get(self, game_id: int, key: Optional[str]) -> Optional[ValidationResult]:
+        entry = self._entries.get(str(game_id))
+        if key is None or entry is None or entry.get('key') != key:
+            return None
+        return ValidationResult.from_dict(entry['result'])
+
+    def put(self, game_id: int, key: Optional[str], result: ValidationResult):
+        if key is not None:
+            self._entries[str(game_id)] = {'key': key, 'result': result.to_dict()}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self._entries, f, indent=2, default=_json_default)
+
+
+# Dimension tables shared with pool workers (set once per worker process)
+_worker_dims: Dict[str, pd.DataFrame] = {}
+
+
+def _init_validation_worker(dims: Dict[str, pd.DataFrame]):
+    global _worker_dims
+    _worker_dims = dims
+
+
+def _validate_game_dir(
+    game_id: int,
+    game_dir: Path,
+    output_dir: Optional[Path],
+    dims: Optional[Dict[str, pd.DataFrame]] = None
+) -> ValidationResult:
+    """Validate one game directory (runs in a pool worker when dims is None)."""
+    validator = PreETLValidator(
+        game_id=game_id,
+        raw_dir=game_dir,
+        output_dir=output_dir,
+        dims=_worker_dims if dims is None else dims,
+    )
+    return validator.validate()
+
+
+def validate_all_games(
+    raw_dir: Optional[Path] = None,
+    verbose: bool = False,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    cache_path: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+) -> Dict[int, ValidationResult]:
     """
     Validate all games in the raw data directory.
 
+    Dimension tables are loaded once and shared with every worker. Games whose
+    tracking workbook (and dims) are unchanged since the last run are answered
+    from the ValidationCache; the rest are validated over a process pool.
+
     Args:
         raw_dir: Path to raw games directory (default: data/raw/games)
         verbose: If True, print progress
+        max_workers: Process pool size (default: OPTIMAL_WORKERS; 1 = serial)
+        use_cache: Reuse / store results keyed by workbook content hash
+        cache_path: Cache file (default: data/.pre_etl_cache.json)
+        output_dir: Path to ETL output for dim tables (default: data/output)
 
     Returns:
         Dict mapping game_id to ValidationResult
     """
-    if raw_dir is None:
-        project_root = Path(__file__).parent.parent.parent
-        raw_dir = project_root / 'data' / 'raw' / 'games'
+    from src.utils.parallel_processing import OPTIMAL_WORKERS
 
-    results = {}
+    if raw_dir is None:
+        raw_dir = PROJECT_ROOT / 'data' / 'raw' / 'games'
 
+    game_dirs: Dict[int, Path] = {}
     for game_dir in raw_dir.iterdir():
         if not game_dir.is_dir():
             continue
@@ -1790,17 +1945,59 @@ def validate_all_games(raw_dir: Optional[Path] = None, verbose: bool = False) ->
         except ValueError:
             continue
 
-        if verbose:
-            print(f"Validating game {game_id}...")
+        game_dirs[game_id] = game_dir
+
+    dims = load_validation_dims(output_dir)
+    dims_fingerprint = _dims_fingerprint(dims)
+    cache = ValidationCache(cache_path) if use_cache else None
+
+    results: Dict[int, ValidationResult] = {}
+    keys: Dict[int, Optional[str]] = {}
+    for game_id, game_dir in game_dirs.items():
+        if cache is None:
+            continue
+        keys[game_id] = ValidationCache.key(game_dir / f"{game_id}_tracking.xlsx", dims_fingerprint)
+        cached = cache.get(game_id, keys[game_id])
+        if cached is not None:
+            results[game_id] = cached
 
-        result = validate_game(game_id, verbose=False)
-        results[game_id] = result
+    pending = [game_id for game_id in game_dirs if game_id not in results]
+    workers = min(max_workers or OPTIMAL_WORKERS, len(pending))
 
-        if verbose:
+    if verbose:
+        print(f"Validating {len(pending)} games ({len(results)} unchanged, cached) with {max(workers, 1)} workers...")
+
+    # For small numbers of games, sequential is faster than spinning up a pool
+    if workers <= 1 or len(pending) <= 2:
+        for game_id in pending:
+            results[game_id] = _validate_game_dir(game_id, game_dirs[game_id], output_dir, dims)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker,
+            initargs=(dims,)
+        ) as executor:
+            futures = {
+                game_id: executor.submit(_validate_game_dir, game_id, game_dirs[game_id], output_dir)
+                for game_id in pending
+            }
+            for game_id, future in futures.items():
+                results[game_id] = future.result()
+
+    if cache is not None:
+        for game_id in pending:
+            cache.put(game_id, keys.get(game_id), results[game_id])
+        cache.save()
+
+    ordered = {game_id: results[game_id] for game_id in game_dirs}
+
+    if verbose:
+        for game_id, result in ordered.items():
             status = 'PASSED' if result.passed else 'FAILED'
-            print(f"  {status} ({result.passed_count}/{len(result.checks)} checks passed)")
+            note = '' if game_id in pending else ', cached'
+            print(f"  Game {game_id}: {status} ({result.passed_count}/{len(result.checks)} checks passed{note})")
 
-    return results
+    return ordered
 
 
 def main():
@@ -1815,6 +2012,10 @@ def main():
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--fail-on-warning', action='store_true',
                        help='Exit with error code on warnings too')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                       help='Worker processes for --all validation (default: CPU count, max 8)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-validate every game, ignoring cached results for unchanged workbooks')
 
     args = parser.parse_args()
 
@@ -1862,7 +2063,11 @@ def main():
 
         else:
             # Validate all games
-            results = validate_all_games(verbose=args.verbose)
+            results = validate_all_games(
+                verbose=args.verbose,
+                max_workers=args.workers,
+                use_cache=not args.no_cache,
+            )
 
             passed = sum(1 for r in results.values() if r.passed)
             total = len(results)
@@ -17,6 +17,11 @@ Verification Levels:
     CRITICAL - Table existence, PK uniqueness (stops ETL)
     ERROR - Schema mismatch, FK violations (fails validation)
     WARNING - Low row counts (logs only)
+
+Schema, row count, PK and FK checks read per-table statistics recorded by
+save_output_table (src/core/table_stats.py): column lists, row counts, PK
+duplicate counts and distinct key values. FK integrity is set algebra over
+those summaries; only tables without fresh stats are read from CSV (once).
 """
 
 import json
@@ -27,6 +32,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 import pandas as pd
 
+from src.core.table_stats import get_table_stats, key_set, key_spec_from_manifest
+
 logger = logging.getLogger('table_verifier')
 
 
@@ -147,7 +154,9 @@ class TableVerifier:
         self.output_dir = output_dir or self.project_root / 'data' / 'output'
         self.manifest_path = manifest_path or self.project_root / 'config' / 'table_manifest.json'
         self.manifest = self._load_manifest()
+        self.key_spec = key_spec_from_manifest(self.manifest)
         self._table_cache: Dict[str, pd.DataFrame] = {}
+        self._stats_cache: Dict[str, Optional[Dict[str, Any]]] = {}
 
     def _load_manifest(self) -> Dict:
         """Load the table manifest."""
@@ -175,6 +184,15 @@ class TableVerifier:
             logger.warning(f"Error reading {table_name}: {e}")
             return None
 
+    def _get_stats(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Table statistics (stored at write time, else profiled from CSV once)."""
+        if table_name not in self._stats_cache:
+            self._stats_cache[table_name] = get_table_stats(
+                table_name, self.output_dir, self.key_spec,
+                df=self._table_cache.get(table_name)
+            )
+        return self._stats_cache[table_name]
+
     def verify_all(self) -> VerificationResult:
         """Run all verification checks."""
         result = VerificationResult()
@@ -244,12 +262,12 @@ class TableVerifier:
                 # Table has no expected schema (empty/placeholder)
                 continue
 
-            df = self._get_table(table_name)
-            if df is None:
+            stats = self._get_stats(table_name)
+            if stats is None:
                 # Table doesn't exist - handled by existence check
                 continue
 
-            actual_columns = set(df.columns)
+            actual_columns = set(stats['columns'])
             expected_set = set(expected_columns)
 
             missing_cols = expected_set - actual_columns
@@ -280,8 +298,8 @@ class TableVerifier:
             min_rows = table_spec.get('min_rows', 0)
             allow_empty = table_spec.get('allow_empty', False)
 
-            df = self._get_table(table_name)
-            actual_rows = len(df) if df is not None else 0
+            stats = self._get_stats(table_name)
+            actual_rows = stats['rows'] if stats is not None else 0
 
             if actual_rows < min_rows and not allow_empty:
                 results.append(CheckResult(
@@ -312,20 +330,19 @@ class TableVerifier:
                 continue
 
             pk = pk.lower()
-            df = self._get_table(table_name)
-            if df is None or len(df) == 0:
+            stats = self._get_stats(table_name)
+            if stats is None or stats['rows'] == 0:
                 continue
 
-            if pk not in df.columns:
+            if pk not in stats['columns']:
                 # Schema issue - handled elsewhere
                 continue
 
-            # Check for duplicates
-            duplicates = df[pk].duplicated().sum()
+            # Duplicates counted over hashed keys at write time
+            duplicates = stats['pk']['duplicates']
 
             if duplicates > 0:
-                # Get sample of duplicate values
-                dup_values = df[df[pk].duplicated(keep=False)][pk].unique()[:5]
+                dup_values = stats['pk']['sample_values']
                 results.append(CheckResult(
                     check_name=f'pk_unique_{table_name}',
                     passed=False,
@@ -338,7 +355,7 @@ class TableVerifier:
                     check_name=f'pk_unique_{table_name}',
                     passed=True,
                     level=CheckLevel.CRITICAL,
-                    message=f"{table_name}.{pk}: unique ({len(df)} rows)"
+                    message=f"{table_name}.{pk}: unique ({stats['rows']} rows)"
                 ))
 
         return results
@@ -352,14 +369,14 @@ class TableVerifier:
             if not fks:
                 continue
 
-            df = self._get_table(table_name)
-            if df is None or len(df) == 0:
+            stats = self._get_stats(table_name)
+            if stats is None or stats['rows'] == 0:
                 continue
 
             for fk_col, ref in fks.items():
                 fk_col = fk_col.lower()
 
-                if fk_col not in df.columns:
+                if fk_col not in stats['columns']:
                     continue
 
                 # Parse reference: "parent_table.column"
@@ -369,9 +386,9 @@ class TableVerifier:
 
                 parent_table, parent_col = parts
                 parent_col = parent_col.lower()
-                parent_df = self._get_table(parent_table)
+                parent_stats = self._get_stats(parent_table)
 
-                if parent_df is None:
+                if parent_stats is None:
                     results.append(CheckResult(
                         check_name=f'fk_{table_name}_{fk_col}',
                         passed=False,
@@ -380,7 +397,7 @@ class TableVerifier:
                     ))
                     continue
 
-                if parent_col not in parent_df.columns:
+                if parent_col not in parent_stats['columns']:
                     results.append(CheckResult(
                         check_name=f'fk_{table_name}_{fk_col}',
                         passed=False,
@@ -389,20 +406,16 @@ class TableVerifier:
                     ))
                     continue
 
-                # Get valid parent values
-                valid_values = set(parent_df[parent_col].dropna().unique())
-
-                # Get child values (excluding nulls and common null markers)
-                child_values = df[fk_col].dropna()
-                null_markers = {0, -1, '', 'null', 'none', 'nan'}
-                child_set = set(v for v in child_values.unique()
-                               if str(v).lower() not in [str(m) for m in null_markers])
+                # Valid parent values vs child values (excluding common null markers),
+                # both as canonical keys from the table stats
+                valid_values = key_set(parent_stats, parent_col)
+                child_set = key_set(stats, fk_col, drop_null_markers=True)
 
                 # Find orphans
                 orphans = child_set - valid_values
 
                 if orphans:
-                    orphan_sample = list(orphans)[:5]
+                    orphan_sample = sorted(orphans)[:5]
                     results.append(CheckResult(
                         check_name=f'fk_{table_name}_{fk_col}',
                         passed=False,
@@ -298,6 +298,73 @@ class TestTeamStatsBuilder:
         assert team_row['goals'] == 3  # 2 + 1
         assert team_row['assists'] == 3  # 1 + 2
         assert team_row['corsi_for'] == 18  # 10 + 8
+    
+    @patch('src.builders.team_stats.load_table')
+    def test_build_with_categorical_keys(self, mock_load_table, temp_output_dir):
+        """Test build on dtype-optimized inputs (categorical team_id) as stored by the ETL."""
+        from src.utils.data_type_optimizer import optimize_dataframe_dtypes
+        
+        player_stats = pd.DataFrame({
+            'game_id': [18969] * 4 + [18970] * 4,
+            'team_id': ['T1', 'T1', 'T2', 'T2', 'T1', 'T1', 'T3', 'T3'],
+            'assists': [1, 2, 0, 1, 1, 1, 2, 0],
+            'corsi_for': [1, 2, 3, 4, 5, 6, 7, 8],
+        })
+        events = pd.DataFrame({
+            'game_id': [18969, 18969, 18970],
+            'event_id': ['E1', 'E2', 'E3'],
+            'event_type': ['Shot', 'Goal', 'Hit'],
+            'event_detail': ['Shot_OnNet', 'Goal_Scored', 'Hit'],
+            'period': [1, 2, 3],
+            'event_team_id': ['T1', 'T2', 'T3'],
+        })
+        tables = {
+            'fact_player_game_stats': optimize_dataframe_dtypes(player_stats),
+            'fact_events': optimize_dataframe_dtypes(events),
+        }
+        assert isinstance(tables['fact_player_game_stats']['team_id'].dtype, pd.CategoricalDtype)
+        mock_load_table.side_effect = lambda name: tables.get(name, pd.DataFrame())
+        
+        builder = TeamStatsBuilder(output_dir=temp_output_dir)
+        result = builder.build(save=False)
+        
+        assert list(zip(result['game_id'], result['team_id'])) == [
+            (18969, 'T1'), (18969, 'T2'), (18970, 'T1'), (18970, 'T3')]
+        assert result['assists'].tolist() == [3, 1, 2, 2]
+        assert result['corsi_for'].tolist() == [3, 7, 11, 15]
+        assert result['shots'].tolist() == [1, 0, 0, 0]
+        assert result['goals'].tolist() == [0, 1, 0, 0]
+        assert result['hits'].tolist() == [0, 0, 0, 1]
+    
+    def test_event_stats_by_team(self, temp_output_dir):
+        """Test event-owned team stats and period splits for all teams at once."""
+        events = pd.DataFrame({
+            'game_id': [18969] * 5,
+            'event_id': ['E1', 'E2', 'E3', 'E4', 'E5'],
+            'event_type': ['Shot', 'Shot', 'Goal', 'Turnover', 'Hit'],
+            'event_detail': ['Shot_OnNetSaved', 'Shot_Missed', 'Goal_Scored', 'Turnover_Giveaway', 'Hit'],
+            'period': [1, 2, 2, 1, 3],
+        })
+        event_players = pd.DataFrame({
+            'game_id': [18969] * 7,
+            'event_id': ['E1', 'E2', 'E3', 'E4', 'E5', 'E2', 'E1'],
+            'player_role': ['event_player_1'] * 5 + ['opp_player_1', 'opp_player_1'],
+            'player_team_id': ['T1', 'T1', 'T1', 'T2', 'T2', 'T2', 'T2'],
+            'play_detail1': [None] * 5 + ['BlockedShot', 'BlockedShot'],
+            'linked_event_key': [None] * 5 + ['L1', 'L1'],
+        })
+        teams = pd.DataFrame({'game_id': [18969, 18969], 'team_id': ['T1', 'T2']})
+        
+        builder = TeamStatsBuilder(output_dir=temp_output_dir)
+        stats = builder.event_stats_by_team(teams, events, event_players, pd.DataFrame())
+        
+        t1, t2 = stats.iloc[0], stats.iloc[1]
+        assert (t1['shots'], t1['sog'], t1['goals']) == (2, 1, 1)
+        assert (t1['p1_shots'], t1['p2_shots'], t1['p2_goals']) == (1, 1, 1)
+        assert (t2['giveaways'], t2['hits'], t2['p3_hits']) == (1, 1, 1)
+        assert t2['blocks'] == 1  # Linked blocks count once
+        assert builder.calculate_team_stats_from_events(
+            18969, 'T3', events, event_players, pd.DataFrame()) == {}
 
 
 # =============================================================================
@@ -312,23 +379,69 @@ class TestGoalieStatsBuilder:
         builder = GoalieStatsBuilder(output_dir=temp_output_dir)
         assert builder.output_dir == temp_output_dir
     
-    @patch('src.builders.goalie_stats._create_fact_goalie_game_stats_original')
+    @patch('src.builders.goalie_stats.load_table')
     @patch('src.builders.goalie_stats.save_output_table')
-    def test_build_delegates_to_original(self, mock_save, mock_original, temp_output_dir):
-        """Test that build delegates to original function."""
-        mock_df = pd.DataFrame({
-            'goalie_game_key': ['GK1'],
-            'game_id': [18969],
-            'player_id': ['P100001'],
-        })
-        mock_original.return_value = mock_df
+    def test_build_loads_tables(self, mock_save, mock_load, temp_output_dir):
+        """Test that build computes stats from the loaded tables."""
+        tables = {
+            'fact_events': pd.DataFrame({
+                'game_id': [18969, 18969], 'event_type': ['Save', 'Goal'],
+                'event_detail': ['Save_Freeze', 'Goal_Scored'], 'team_venue': ['h', 'a'],
+                'home_team_id': ['T1', 'T1'], 'period': [1, 2],
+            }),
+            'fact_gameroster': pd.DataFrame({
+                'game_id': [18969], 'player_id': ['P100001'], 'team_id': ['T1'],
+                'team_name': ['Team 1'], 'player_position': ['Goalie'],
+            }),
+            'dim_player': pd.DataFrame({'player_id': ['P100001'], 'player_full_name': ['Test Goalie']}),
+            'fact_saves': pd.DataFrame(),
+        }
+        mock_load.side_effect = lambda name: tables[name]
         
         builder = GoalieStatsBuilder(output_dir=temp_output_dir)
         result = builder.build(save=False)
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 1
-        mock_original.assert_called_once()
+        assert result.loc[0, 'goalie_game_key'] == 'GK18969P100001'
+        mock_save.assert_not_called()
+    
+    def test_goalie_game_stats(self, temp_output_dir):
+        """Test events are tagged with the goalie facing them."""
+        events = pd.DataFrame({
+            'game_id': [18969] * 6 + [18970],
+            'event_id': ['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7'],
+            'event_type': ['Save', 'Rebound', 'Save', 'Goal', 'Save', 'Shot', 'Save'],
+            'event_detail': ['Save_Rebound', 'Rebound_OppTeamRecovered', 'Save_Freeze',
+                             'Goal_Scored', 'Save_Freeze', 'Shot_OnNetSaved', 'Save_Freeze'],
+            'event_detail_2': ['Save_Glove', None, 'Save_LeftPad', None, 'Save_Blocker', None, None],
+            'team_venue': ['h', 'a', 'h', 'a', 'a', 'a', 'h'],
+            'home_team_id': ['T1'] * 6 + ['T3'],
+            'period': [1, 1, 2, 3, 1, 3, 1],
+            'prev_event_id': [None, 'E1', None, None, None, None, None],
+            'danger_level': ['low', None, 'low', 'High', 'low', 'high', 'low'],
+        })
+        roster = pd.DataFrame({
+            'game_id': [18969, 18969, 18969, 18970],
+            'player_id': ['P1', 'P2', 'P3', 'P4'],
+            'team_id': ['T1', 'T2', 'T1', None],
+            'player_position': ['Goalie', 'Goalie', 'Forward', 'Goalie'],
+        })
+        
+        builder = GoalieStatsBuilder(output_dir=temp_output_dir)
+        stats = builder.goalie_game_stats(events, roster, pd.DataFrame())
+        home, away, unknown = stats.iloc[0], stats.iloc[1], stats.iloc[2]
+        
+        assert list(stats['player_id']) == ['P1', 'P2', 'P4']
+        assert (home['saves'], home['goals_against'], home['save_pct']) == (2, 1, 66.7)
+        assert (home['hd_shots_against'], home['hd_goals_against']) == (2, 1)
+        assert (home['saves_freeze'], home['glove_side_saves'], home['rebounds_opp_recovered']) == (1, 2, 1)
+        assert (home['best_period'], home['worst_period']) == (1, 3)
+        assert (away['saves'], away['goals_against'], away['saves_blocker']) == (1, 0, 1)
+        assert away['rebounds_opp_recovered'] == 0
+        # Unknown venue falls back to halved game totals
+        assert unknown['is_home'] is None
+        assert (unknown['saves'], unknown['clutch_rating']) == (0, 50.0)
 
 
 # =============================================================================
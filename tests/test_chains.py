@@ -0,0 +1,99 @@
+"""
+Unit tests for event chain materialization (src/chains).
+
+Tests:
+- Slice lookup per game with inclusive key ranges
+- Bulk chain strings, counts and distinct touches
+- Zone entry -> shot linking (as-of join) and fact_shot_chains, including
+  dtype-optimized fact_events from the table store
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.core import table_store
+from src.chains.chain_materializer import EventChainIndex
+from src.chains.shot_chain_builder import build_shot_chains
+from src.utils.data_type_optimizer import optimize_dataframe_dtypes
+
+
+EVENTS = pd.DataFrame({
+    'game_id': [2, 1, 1, 1, 2, 1, 2],
+    'event_index': [1, 3, 1, 2, 2, 4, 3],
+    'event_type': ['Faceoff', 'Shot', 'Faceoff', 'Pass', 'Pass', None, 'Goal'],
+    'event_player_ids': ['P9', 'P2', 'P1,P2', 'P1,P3', 'P8,P9', np.nan, 'P8'],
+})
+
+
+class TestEventChainIndex:
+    """Tests for the range-indexed chain materializer."""
+
+    def test_locate_slices_per_game(self):
+        index = EventChainIndex(EVENTS, key='event_index')
+        lo, hi = index.locate([1, 2, 1, 3, 1], [1, 2, 3, 1, np.nan], [3, 3, 2, 5, 4])
+
+        assert (hi - lo).tolist() == [3, 2, 0, 0, 0]
+        assert index.values('event_type').iloc[lo[1]:hi[1]].tolist() == ['Pass', 'Goal']
+
+    def test_bulk_chain_columns(self):
+        index = EventChainIndex(EVENTS, key='event_index')
+        lo, hi = index.locate([1, 1, 2, 1], [1, 3, 1, 9], [4, 4, 3, 9])
+
+        assert index.join('event_type', lo, hi).tolist() == [
+            'Faceoff > Pass > Shot', 'Shot', 'Faceoff > Pass > Goal', None
+        ]
+        assert index.count(index.values('event_type') == 'Pass', lo, hi).tolist() == [1, 0, 1, 0]
+        assert index.distinct_count('event_player_ids', lo, hi).tolist() == [3, 1, 2, 0]
+
+
+def _game_events():
+    """Two zone entries in game 7; the second has no shot within the window."""
+    rows = [
+        (1, 10.0, 'Zone_Entry_Exit', 'Zone_Entry', 'P1'),
+        (2, 14.0, 'Pass', 'Pass_Completed', 'P1,P2'),
+        (3, 20.0, 'Shot', 'Shot_OnNetSaved', 'P2'),
+        (4, 20.0, 'Goal', 'Goal_Scored', 'P3'),
+        (5, 30.0, 'Zone_Entry_Exit', 'Zone_EntryFailed', 'P4'),
+        (6, 100.0, 'Zone_Entry_Exit', 'Zone_Entry', 'P5'),
+        (7, 175.0, 'Shot', 'Shot_Missed', 'P5'),
+    ]
+    df = pd.DataFrame(rows, columns=['event_index', 'event_running_start', 'event_type',
+                                     'event_detail', 'event_player_ids'])
+    return df.assign(
+        game_id=7, event_id=[f'E{i}' for i in df['event_index']],
+        is_sog=df['event_type'].eq('Shot').astype(int), is_goal=df['event_type'].eq('Goal').astype(int),
+    )
+
+
+class TestShotChains:
+    """Tests for fact_shot_chains."""
+
+    def test_entry_links_to_first_shot_in_window(self, tmp_path):
+        chains = build_shot_chains(_game_events(), output_dir=tmp_path)
+
+        assert len(chains) == 1
+        chain = chains.iloc[0]
+        assert (chain['entry_event_key'], chain['shot_event_key']) == ('E1', 'E3')
+        assert chain['time_to_shot'] == 10.0
+        assert (chain['events_to_shot'], chain['pass_count'], chain['touch_count']) == (4, 1, 3)
+        assert chain['event_types_chain'] == 'Zone_Entry_Exit > Pass > Shot > Goal'
+        assert (tmp_path / 'fact_shot_chains.csv').exists()
+
+    def test_window_is_configurable(self, tmp_path):
+        chains = build_shot_chains(_game_events(), output_dir=tmp_path, window=90)
+        assert chains['shot_event_key'].tolist() == ['E3', 'E7']
+
+    def test_stored_events_with_categorical_columns(self, tmp_path):
+        events = _game_events().assign(event_detail_2=None)
+        events.loc[0, 'event_detail_2'] = 'ZoneEntry-Rush'
+        table_store.clear_store()
+        table_store.store_table('fact_events', optimize_dataframe_dtypes(events))
+        try:
+            assert isinstance(table_store.get_table('fact_events')['event_detail'].dtype, pd.CategoricalDtype)
+            chains = build_shot_chains(output_dir=tmp_path, window=90)
+        finally:
+            table_store.clear_store()
+
+        assert chains['entry_type'].tolist() == ['ZoneEntry-Rush', 'Zone_Entry']
+        assert chains['shot_result'].tolist() == ['Shot_OnNetSaved', 'Shot_Missed']
+        assert chains['event_types_chain'].iloc[0] == 'Zone_Entry_Exit > Pass > Shot > Goal'
@@ -0,0 +1,513 @@
+"""
+Unit tests for precomputed ML artifacts (src/ml).
+
+Tests:
+- Player similarity index build / load / query
+- Standings tiebreak order used by the season simulator
+- API model registry: lazy loading, warm-up and the /api/ml/health stats
+- API batch predictions and their cached feature frames
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import tempfile
+import shutil
+
+from src.core import table_store
+from src.ml.similarity_index import (
+    PlayerSimilarityIndex,
+    build_player_similarity_index,
+    SIMILARITY_FEATURES,
+)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def temp_output_dir():
+    """Create a temporary output directory for tests."""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def season_stats():
+    """Store a small fact_player_season_stats + dim_player in the table store."""
+    table_store.clear_store()
+    stats = pd.DataFrame({
+        'player_id': ['P1', 'P2', 'P3', 'P4', 'P1'],
+        'season_id': ['S2025', 'S2025', 'S2025', 'S2025', 'S2024'],
+        'game_type': ['All'] * 5,
+        'games_played': [10, 10, 10, 10, 8],
+        'goals': [10, 9, 1, 0, 8],
+        'assists': [5, 6, 2, 1, 4],
+        'shots': [50, 48, 10, 5, 40],
+        'hits': [2, 3, 20, 25, 2],
+        'corsi_for': [100, 95, 60, 50, 80],
+        'corsi_against': [60, 62, 90, 95, 50],
+    })
+    players = pd.DataFrame({
+        'player_id': ['P1', 'P2', 'P3', 'P4'],
+        'player_primary_position': ['Forward', 'Forward', 'Defense', 'Defense'],
+        'player_full_name': ['One', 'Two', 'Three', 'Four'],
+    })
+    table_store.store_table('fact_player_season_stats', stats)
+    table_store.store_table('dim_player', players)
+    yield stats
+    table_store.clear_store()
+
+
+# =============================================================================
+# SIMILARITY INDEX
+# =============================================================================
+
+class TestPlayerSimilarityIndex:
+    """Tests for the player similarity vector index."""
+
+    def test_build_writes_unit_vectors(self, season_stats, temp_output_dir):
+        result = build_player_similarity_index(temp_output_dir)
+        assert result == {'rows': 5, 'features': len(SIMILARITY_FEATURES)}
+
+        index = PlayerSimilarityIndex.load(temp_output_dir)
+        assert index.vectors.dtype == np.float32
+        norms = np.linalg.norm(np.asarray(index.vectors), axis=1)
+        assert np.allclose(norms, 1.0, atol=1e-5)
+
+    def test_query_excludes_self_and_ranks(self, season_stats, temp_output_dir):
+        build_player_similarity_index(temp_output_dir)
+        index = PlayerSimilarityIndex.load(temp_output_dir)
+
+        results = index.query('P1', 'S2025', k=2)
+        assert all(r['player_id'] != 'P1' for r in results)
+        assert results[0]['player_id'] == 'P2'
+        assert results[0]['cosine'] >= results[1]['cosine']
+
+    def test_position_and_season_filter(self, season_stats, temp_output_dir):
+        build_player_similarity_index(temp_output_dir)
+        index = PlayerSimilarityIndex.load(temp_output_dir)
+
+        results = index.query('P1', 'S2025', k=5, position='defense', candidate_season_id='S2025')
+        assert {r['player_id'] for r in results} == {'P3', 'P4'}
+
+    def test_multi_season_player_counted_once(self, season_stats, temp_output_dir):
+        build_player_similarity_index(temp_output_dir)
+        index = PlayerSimilarityIndex.load(temp_output_dir)
+
+        # P1 has S2025 and S2024 rows; only its closer season is returned
+        results = index.query('P2', 'S2025', k=3)
+        assert sorted(r['player_id'] for r in results) == ['P1', 'P3', 'P4']
+
+        row = index.row_for('P2', 'S2025')
+        p1_rows = [index.row_for('P1', s) for s in ('S2025', 'S2024')]
+        best_p1 = max(p1_rows, key=lambda r: float(np.dot(index.vectors[r], index.vectors[row])))
+        assert results[0]['season_id'] == index.season_ids[best_p1]
+
+    def test_top_k_widens_past_duplicate_rows(self, monkeypatch):
+        import src.ml.similarity_index as similarity_module
+        monkeypatch.setattr(similarity_module, 'CANDIDATE_OVERFETCH', 1)
+
+        # Player A's three seasons outrank B and C, filling the first k=3 rows
+        vectors = np.array([[1, 0], [1, .1], [1, .2], [1, .3], [1, .6], [1, .9]], dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index = PlayerSimilarityIndex(vectors, {
+            'features': ['a', 'b'],
+            'player_id': ['Q', 'A', 'A', 'A', 'B', 'C'],
+            'season_id': ['S1', 'S1', 'S2', 'S3', 'S1', 'S1'],
+            'position': ['forward'] * 6,
+            'player_name': ['q', 'a', 'a', 'a', 'b', 'c'],
+        })
+        (neighbours,) = index.top_k([0], k=3)
+        assert [(index.player_ids[r], index.season_ids[r]) for r, _ in neighbours] == \
+            [('A', 'S1'), ('B', 'S1'), ('C', 'S1')]
+
+    def test_unknown_player_returns_none(self, season_stats, temp_output_dir):
+        build_player_similarity_index(temp_output_dir)
+        index = PlayerSimilarityIndex.load(temp_output_dir)
+        assert index.query('P999', 'S2025') is None
+
+    def test_load_missing_index(self, temp_output_dir):
+        assert PlayerSimilarityIndex.load(temp_output_dir) is None
+
+
+# =============================================================================
+# SEASON SIMULATOR
+# =============================================================================
+
+@pytest.fixture
+def season_schedule():
+    """Four-team season: 6 completed games, 6 remaining."""
+    teams = ['T1', 'T2', 'T3', 'T4']
+    pairs = [(h, a) for h in teams for a in teams if h != a]
+    rows = []
+    for i, (home, away) in enumerate(pairs):
+        done = i < 6
+        rows.append({
+            'game_id': 1000 + i,
+            'season_id': 'S2025',
+            'game_type': 'Regular',
+            'home_team_id': home,
+            'away_team_id': away,
+            'home_total_goals': (5 if home == 'T1' else 2) if done else np.nan,
+            'away_total_goals': (5 if away == 'T1' else 1) if done else np.nan,
+        })
+    return pd.DataFrame(rows)
+
+
+class TestSeasonSimulator:
+    """Tests for the Monte Carlo playoff simulator."""
+
+    def test_probabilities_are_consistent(self, season_schedule):
+        from src.ml.season_simulator import simulate_season
+
+        result = simulate_season(season_schedule, pd.DataFrame(), 'S2025',
+                                 n_sims=5000, playoff_spots=2, seed=1)
+        teams = result['teams']
+        assert result['remaining_games'] == 6
+        assert sum(t['championship_probability'] for t in teams.values()) == pytest.approx(1.0)
+        assert sum(t['playoff_probability'] for t in teams.values()) == pytest.approx(2.0)
+        for t in teams.values():
+            assert sum(t['seed_probabilities'].values()) == pytest.approx(t['playoff_probability'])
+
+    def test_dominant_team_favoured(self, season_schedule):
+        from src.ml.season_simulator import simulate_season
+
+        result = simulate_season(season_schedule, pd.DataFrame(), 'S2025',
+                                 n_sims=5000, playoff_spots=2, seed=1)
+        teams = result['teams']
+        assert teams['T1']['playoff_probability'] == max(t['playoff_probability'] for t in teams.values())
+        assert teams['T1']['current_points'] == 8.0
+
+    def test_cache_reuses_result(self, season_schedule):
+        from src.ml.season_simulator import SeasonSimulatorCache
+
+        cache = SeasonSimulatorCache()
+        first = cache.get(season_schedule, pd.DataFrame(), 'S2025', n_sims=1000)
+        assert cache.get(season_schedule, pd.DataFrame(), 'S2025', n_sims=1000) is first
+
+        updated = season_schedule.copy()
+        updated.loc[6, ['home_total_goals', 'away_total_goals']] = [3, 0]
+        assert cache.get(updated, pd.DataFrame(), 'S2025', n_sims=1000) is not first
+
+    def test_cache_tracks_team_stats_and_evicts_lru(self, season_schedule):
+        from src.ml.season_simulator import SeasonSimulatorCache
+
+        cache = SeasonSimulatorCache(max_entries=2)
+        stats = pd.DataFrame({'game_id': [1000, 1000], 'team_id': ['T1', 'T2'], 'goals': [4, 1]})
+        first = cache.get(season_schedule, stats, 'S2025', n_sims=500)
+        changed = stats.assign(goals=[1, 4])
+        assert cache.get(season_schedule, changed, 'S2025', n_sims=500) is not first
+
+        # first is most recently used, so the changed-stats entry is evicted
+        assert cache.get(season_schedule, stats, 'S2025', n_sims=500) is first
+        cache.get(season_schedule, stats, 'S2025', n_sims=100)
+        assert cache.get(season_schedule, stats, 'S2025', n_sims=500) is first
+
+    def test_other_seasons_do_not_affect_strengths(self, season_schedule):
+        from src.ml.season_simulator import simulate_season
+
+        other_season = pd.DataFrame({'game_id': [5000, 5000], 'team_id': ['T4', 'T1'], 'goals': [15, 0]})
+        base = simulate_season(season_schedule, pd.DataFrame(), 'S2025', n_sims=2000, playoff_spots=2, seed=3)
+        mixed = simulate_season(season_schedule, other_season, 'S2025', n_sims=2000, playoff_spots=2, seed=3)
+        assert mixed['teams'] == base['teams']
+        assert mixed['standings_hash'] == base['standings_hash']
+
+
+class TestStandingsOrder:
+    """Tests for the shared standings tiebreak order (src/calculations/standings.py)."""
+
+    def test_tiebreakers(self):
+        """Points, then wins, then goal differential, then goals for; ties keep table order."""
+        from src.calculations.standings import standings_order
+
+        teams = np.array(['A', 'B', 'C', 'D', 'E'])
+        order = standings_order({
+            'points': np.array([10, 8, 8, 8, 8]),
+            'wins': np.array([3, 4, 4, 4, 4]),
+            'goal_diff': np.array([5, 10, 10, 12, 12]),
+            'goals_for': np.array([10, 20, 25, 22, 22]),
+        })
+        assert teams[order].tolist() == ['A', 'D', 'E', 'C', 'B']
+
+    def test_order_of_simulated_tables(self):
+        """Columns of a [teams x sims] matrix are ordered independently; ties follow tie_break."""
+        from src.calculations.standings import standings_order
+
+        points = np.array([[2, 4], [4, 4], [0, 0]])
+        wins = np.array([[1, 2], [2, 1], [0, 0]])
+        assert standings_order({'points': points, 'wins': wins}).tolist() == [[1, 0], [0, 1], [2, 2]]
+
+        tied = standings_order({'points': np.zeros((2, 1))}, tie_break=np.array([[0.9], [0.1]]))
+        assert tied[:, 0].tolist() == [1, 0]
+
+
+# =============================================================================
+# LINEUP OPTIMIZER
+# =============================================================================
+
+@pytest.fixture
+def line_history():
+    """Six forwards and four defense for T1; F1-F2-F3 and D1-D2 dominate."""
+    def combo(game_id, combo_type, ids, cf, ca):
+        return {
+            'game_id': game_id, 'season_id': 'S2025', 'venue': 'home',
+            'home_team_id': 'T1', 'away_team_id': 'T2', 'combo_type': combo_type,
+            'forward_combo': ','.join(ids) if combo_type == 'forward' else None,
+            'defense_combo': ','.join(ids) if combo_type == 'defense' else None,
+            'corsi_for': cf, 'corsi_against': ca,
+        }
+    line_combos = pd.DataFrame([
+        combo(1, 'forward', ['F1', 'F2', 'F3'], 60, 20),
+        combo(1, 'forward', ['F4', 'F5', 'F6'], 30, 30),
+        combo(2, 'forward', ['F1', 'F4', 'F5'], 20, 25),
+        combo(1, 'defense', ['D1', 'D2'], 50, 10),
+        combo(1, 'defense', ['D3', 'D4'], 20, 30),
+    ])
+    return line_combos, pd.DataFrame(), pd.DataFrame()
+
+
+class TestLineupOptimizer:
+    """Tests for the line-combo lineup optimizer."""
+
+    def test_best_lines_selected(self, line_history):
+        from src.ml.lineup_optimizer import LineupModel
+
+        model = LineupModel.build(*line_history, team_id='T1', season_id='S2025')
+        result = model.optimize()
+        top_line = result['forward_lines'][0]
+        assert {top_line['player1'], top_line['player2'], top_line['player3']} == {'F1', 'F2', 'F3'}
+        assert len(result['forward_lines']) == 2
+        top_pair = result['defense_pairs'][0]
+        assert {top_pair['player1'], top_pair['player2']} == {'D1', 'D2'}
+
+    def test_lines_are_disjoint_and_respect_exclusions(self, line_history):
+        from src.ml.lineup_optimizer import LineupModel
+
+        model = LineupModel.build(*line_history, team_id='T1', season_id='S2025')
+        result = model.optimize(excluded_player_ids=['F2'], n_forward_lines=1)
+        players = [p for line in result['forward_lines'] for p in line.values() if isinstance(p, str)]
+        assert 'F2' not in players
+        assert len(players) == len(set(players)) == 3
+
+    def test_unsupported_metric(self, line_history):
+        from src.ml.lineup_optimizer import LineupModel
+
+        with pytest.raises(ValueError):
+            LineupModel.build(*line_history, team_id='T1', metric='xgf_pct')
+
+
+# =============================================================================
+# MODEL REGISTRY (api/services/ml_service.py)
+# =============================================================================
+
+@pytest.fixture
+def model_dir(temp_output_dir):
+    """Two pickled models and one corrupt pickle."""
+    import joblib
+    joblib.dump({'coef': np.arange(1000.0), 'names': ['a', 'b']}, temp_output_dir / 'goals.pkl')
+    joblib.dump({'coef': np.ones(10)}, temp_output_dir / 'assists.pkl')
+    (temp_output_dir / 'broken.pkl').write_bytes(b'not a pickle')
+    return temp_output_dir
+
+
+def make_registry(model_dir):
+    from api.services.ml_service import ModelRegistry
+    files = {'goals': 'goals.pkl', 'assists': 'assists.pkl', 'broken': 'broken.pkl', 'missing': 'missing.pkl'}
+    return ModelRegistry(model_dir, files)
+
+
+class TestModelRegistry:
+    """Tests for lazily loaded, memory-mapped API models."""
+
+    def test_lazy_load_and_stats(self, model_dir):
+        import tracemalloc
+
+        registry = make_registry(model_dir)
+        assert registry.available() == ['goals', 'assists', 'broken']
+        assert registry.loaded() == []
+
+        model = registry.get('goals')
+        assert isinstance(model['coef'], np.memmap)
+        assert registry.get('goals') is model
+        assert registry.loaded() == ['goals']
+        assert not tracemalloc.is_tracing()
+
+        stats = registry.stats()['goals']
+        assert stats['mmap_bytes'] == 8000 and stats['heap_bytes'] == 0
+        assert stats['file_bytes'] == (model_dir / 'goals.pkl').stat().st_size
+
+    def test_failed_and_missing_models(self, model_dir):
+        registry = make_registry(model_dir)
+        assert registry.get('broken') is None
+        assert 'error' in registry.stats()['broken']
+        assert registry.get('missing') is None and 'missing' not in registry
+        assert registry.loaded() == []
+
+    def test_warm_loads_requested_models(self, model_dir):
+        registry = make_registry(model_dir)
+        registry.warm(['assists'])
+        assert registry.loaded() == ['assists']
+        registry.warm()
+        assert sorted(registry.loaded()) == ['assists', 'goals']
+
+    def test_array_bytes_split(self):
+        from api.services.ml_service import _array_bytes
+
+        class Model:
+            def __init__(self):
+                self.weights = np.zeros((10, 10))
+                self.layers = [{'bias': np.zeros(5, dtype=np.float32)}]
+                self.alias = self.weights
+
+        assert _array_bytes(Model()) == (820, 0)
+
+    def test_array_bytes_of_extension_state(self):
+        """Arrays held outside __dict__ (like sklearn's Tree) are counted via __getstate__."""
+        from api.services.ml_service import _array_bytes
+
+        class Tree:
+            __slots__ = ('_nodes', '_values')
+
+            def __init__(self):
+                self._nodes = np.zeros(100, dtype=np.float64)
+                self._values = np.zeros((100, 1), dtype=np.float64)
+
+            def __getstate__(self):
+                return {'node_count': 100, 'nodes': self._nodes.copy(), 'values': self._values.copy()}
+
+        class Estimator:
+            def __init__(self):
+                self.tree_ = Tree()
+
+        assert _array_bytes([Estimator(), Estimator()]) == (3200, 0)
+
+    def test_health_endpoint_reports_model_stats(self, model_dir, monkeypatch):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from api.routes import ml as ml_routes
+
+        monkeypatch.setattr(ml_routes.ml_service, '_models', make_registry(model_dir))
+        app = FastAPI()
+        app.include_router(ml_routes.router)
+        client = TestClient(app)
+
+        health = client.get('/api/ml/health').json()
+        assert health['loaded_models'] == [] and health['model_stats'] == {}
+
+        ml_routes.ml_service._models.get('goals')
+        health = client.get('/api/ml/health').json()
+        assert health['models_loaded'] == 1
+        assert health['model_stats']['goals']['mmap_bytes'] == 8000
+
+
+# =============================================================================
+# BATCH PREDICTIONS (api/services/ml_service.py)
+# =============================================================================
+
+class SumModel:
+    """Stand-in model: prediction = weighted row sum, so features drive the output."""
+
+    def __init__(self, scale):
+        self.scale = scale
+
+    def predict(self, features):
+        return np.asarray(features).sum(axis=1) * self.scale
+
+
+@pytest.fixture
+def ml_data(temp_output_dir, monkeypatch):
+    """ETL tables on disk and an MLService reading them with stand-in models."""
+    from types import SimpleNamespace
+    from api.services import ml_service as ml_module
+
+    pd.DataFrame({
+        'player_id': ['P1', 'P2', 'P1', 'P3'],
+        'season_id': ['S2025', 'S2025', 'S2024', 'S2024'],
+        'game_type': ['All'] * 4,
+        'games_played': [10, 5, 8, 4],
+        'goals': [10, 2, 4, 1],
+        'assists': [5, 6, 2, 3],
+        'war': [1.5, 0.5, 0.8, 0.1],
+    }).to_csv(temp_output_dir / 'fact_player_season_stats.csv', index=False)
+    pd.DataFrame({
+        'game_id': [1, 1, 2, 2, 3, 3],
+        'team_id': ['T1', 'T2', 'T1', 'T3', 'T2', 'T3'],
+        'goals': [4, 2, 1, 3, 5, 0],
+        'sog': [30, 20, 25, 28, 33, 18],
+    }).to_csv(temp_output_dir / 'fact_team_game_stats.csv', index=False)
+    pd.DataFrame({
+        'game_id': [1, 2, 3], 'season_id': ['S2025', 'S2025', 'S2024'],
+    }).to_csv(temp_output_dir / 'dim_schedule.csv', index=False)
+
+    monkeypatch.setattr(ml_module, 'ML_DATA_DIR', temp_output_dir)
+    service = ml_module.MLService()
+    models = {'player_goals': SumModel(2.0), 'player_assists': SumModel(3.0),
+              'game_outcome': SumModel(0.01), 'game_score': SumModel(0.1)}
+    service._models = SimpleNamespace(get=models.get)
+    return service
+
+
+class TestBatchPredictions:
+    """Batch endpoints must match the single-item predictions."""
+
+    def test_player_batch_matches_single(self, ml_data):
+        ids = ['P1', 'P2', 'P3', 'UNKNOWN']
+        batch = ml_data.predict_player_stats_batch(ids, 'S2025', games_remaining=12)
+        single = [ml_data.predict_player_stats(p, 'S2025', games_remaining=12) for p in ids]
+        assert batch == single
+        assert batch[0]['predicted_goals'] > batch[3]['predicted_goals']
+        # player_war has no model here: default for every player
+        assert {p['predicted_war'] for p in batch} == {2.0}
+
+    def test_game_batch_matches_single(self, ml_data):
+        games = [
+            {'home_team_id': 'T1', 'away_team_id': 'T2', 'season_id': 'S2025'},
+            {'home_team_id': 'T3', 'away_team_id': 'T1', 'season_id': 'S2025'},
+            {'home_team_id': 'T2', 'away_team_id': 'T3', 'season_id': 'S2024'},
+        ]
+        batch = ml_data.predict_game_outcome_batch(games)
+        single = [ml_data.predict_game_outcome(g['home_team_id'], g['away_team_id'], g['season_id']) for g in games]
+        assert batch == single
+        assert len({g['predicted_home_goals'] for g in batch}) == 3
+
+    def test_game_batch_scores_in_one_model_pass(self, ml_data):
+        from types import SimpleNamespace
+
+        calls = []
+        score_model = SumModel(0.1)
+        models = {'game_score': SimpleNamespace(predict=lambda x: calls.append(len(x)) or score_model.predict(x))}
+        ml_data._models = SimpleNamespace(get=models.get)
+
+        games = [{'home_team_id': 'T1', 'away_team_id': 'T2', 'season_id': 'S2025'},
+                 {'home_team_id': 'T3', 'away_team_id': 'T1', 'season_id': 'S2025'}]
+        batch = ml_data.predict_game_outcome_batch(games)
+        assert calls == [4]
+        swapped = ml_data._get_team_features_batch(['T2', 'T1'], ['T1', 'T3'], ['S2025', 'S2025'])
+        assert [g['predicted_away_goals'] for g in batch] == pytest.approx(score_model.predict(swapped).tolist())
+
+        ml_data._models = SimpleNamespace(get={}.get)
+        fallback = ml_data.predict_game_outcome_batch(games)
+        assert [(g['predicted_home_goals'], g['predicted_away_goals']) for g in fallback] == [(3.2, 2.8)] * 2
+
+    def test_team_frame_follows_schedule_changes(self, ml_data, temp_output_dir):
+        import os
+
+        before = ml_data._get_feature_frame('fact_team_game_stats', 'S2025')
+        assert sorted(before.index) == ['T1', 'T2', 'T3']
+
+        # Game 3 moves into S2025: the cached frame must be rebuilt
+        path = temp_output_dir / 'dim_schedule.csv'
+        pd.DataFrame({'game_id': [1, 2, 3], 'season_id': ['S2025'] * 3}).to_csv(path, index=False)
+        os.utime(path, (path.stat().st_atime + 10, path.stat().st_mtime + 10))
+        after = ml_data._get_feature_frame('fact_team_game_stats', 'S2025')
+        assert after.loc['T2', 'goals'] == pytest.approx(3.5)
+
+    def test_player_frame_without_season_column(self, ml_data, temp_output_dir):
+        pd.DataFrame({'player_id': ['P9'], 'games_played': [2], 'goals': [4]}).to_csv(
+            temp_output_dir / 'fact_player_season_stats.csv', index=False)
+        frame = ml_data._build_player_feature_frame(ml_data._get_table('fact_player_season_stats'), 'S2025')
+        assert frame.loc['P9', 'goals'] == pytest.approx(2.0)
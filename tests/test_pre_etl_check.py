@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the Pre-ETL Validation Framework.
+
+Tests cover:
+- Event checks over a shared events frame (time consistency, faceoff structure)
+- Shared dimension tables across validators
+- validate_all_games result cache keyed by workbook content
+
+Usage:
+    pytest tests/test_pre_etl_check.py -v
+"""
+
+import pandas as pd
+import pytest
+
+from src.validation.pre_etl_check import (
+    PreETLValidator,
+    validate_all_games,
+)
+
+
+SHIFTS = pd.DataFrame({'shift_index': [1], 'period': [1], 'shift_start_min': [18], 'shift_start_sec': [0]})
+
+
+def _events(game_id: int, faceoff_loser: bool = True) -> pd.DataFrame:
+    """Three events: a faceoff, a shot and a pass where the clock jumps up in P1."""
+    rows = [
+        (1, 1, 'Faceoff', 'Faceoff_Win', 12, 'event_player_1', 'h', 18),
+        (2, 1, 'Shot', 'Shot_OnNet', 9, 'event_player_1', 'a', 15),
+        (3, 1, 'Pass', 'Pass_Completed', 12, 'event_player_1', 'h', 16),
+    ]
+    if faceoff_loser:
+        rows.append((1, 1, 'Faceoff', 'Faceoff_Win', 9, 'opp_player_1', 'h', 18))
+    return pd.DataFrame(rows, columns=[
+        'event_index', 'period', 'event_type_', 'event_detail_', 'player_game_number',
+        'player_role', 'team_', 'event_start_min'
+    ]).assign(game_id=game_id)
+
+
+@pytest.fixture
+def games_dir(tmp_path):
+    """Two tracked games plus dim tables in a temporary data directory."""
+    output_dir = tmp_path / 'output'
+    output_dir.mkdir()
+    pd.DataFrame({'event_type_code': ['Faceoff', 'Shot', 'Pass']}).to_csv(
+        output_dir / 'dim_event_type.csv', index=False)
+    pd.DataFrame({
+        'game_id': [1, 1, 2, 2],
+        'team_venue': ['home', 'away', 'home', 'away'],
+        'player_game_number': [12, 9, 12, 9],
+    }).to_csv(output_dir / 'fact_gameroster.csv', index=False)
+
+    raw_dir = tmp_path / 'games'
+    for game_id, faceoff_loser in [(1, True), (2, False)]:
+        game_dir = raw_dir / str(game_id)
+        game_dir.mkdir(parents=True)
+        with pd.ExcelWriter(game_dir / f'{game_id}_tracking.xlsx') as writer:
+            _events(game_id, faceoff_loser).to_excel(writer, sheet_name='events', index=False)
+            SHIFTS.to_excel(writer, sheet_name='shifts', index=False)
+    return raw_dir, output_dir
+
+
+class TestEventChecks:
+    """Event checks over the shared events frame."""
+
+    def test_time_jump_and_faceoff_loser(self, games_dir):
+        raw_dir, output_dir = games_dir
+        validator = PreETLValidator(2, raw_dir=raw_dir / '2', output_dir=output_dir)
+        checks = {c.check_name: c for c in validator.validate().checks}
+
+        assert checks['time_consistency'].details['issues'] == [
+            'P1 event 3: time jumped from 15.0 to 16'
+        ]
+        assert checks['faceoff_structure'].details['missing_loser_count'] == 1
+        assert checks['faceoff_structure'].details['missing_winner_count'] == 0
+        assert checks['roster_coverage_home'].passed
+
+    def test_shared_dims_skip_csv_reads(self, games_dir):
+        raw_dir, output_dir = games_dir
+        dims = {'dim_event_type': pd.DataFrame({'event_type_code': ['Faceoff']})}
+        validator = PreETLValidator(1, raw_dir=raw_dir / '1', output_dir=output_dir, dims=dims)
+        checks = {c.check_name: c for c in validator.validate().checks}
+
+        assert checks['valid_event_types'].details['invalid'] == ['Pass', 'Shot']
+
+
+class TestValidateAllGames:
+    """Cached, pooled validation across game directories."""
+
+    def test_unchanged_games_come_from_cache(self, games_dir, tmp_path, monkeypatch):
+        from src.validation import pre_etl_check
+
+        raw_dir, output_dir = games_dir
+        cache_path = tmp_path / 'cache.json'
+
+        first = validate_all_games(raw_dir, max_workers=1, cache_path=cache_path, output_dir=output_dir)
+        assert sorted(first) == [1, 2]
+        assert first[1].passed and not first[2].passed
+
+        # Second run is answered from the cache without validating anything
+        def fail(*args, **kwargs):
+            raise AssertionError('unchanged game was re-validated')
+        with monkeypatch.context() as patch:
+            patch.setattr(pre_etl_check, '_validate_game_dir', fail)
+            second = validate_all_games(raw_dir, max_workers=1, cache_path=cache_path, output_dir=output_dir)
+        assert [c.message for c in second[2].checks] == [c.message for c in first[2].checks]
+        assert not second[2].passed
+
+        # Editing a workbook invalidates only that game's entry
+        with pd.ExcelWriter(raw_dir / '2' / '2_tracking.xlsx') as writer:
+            _events(2, faceoff_loser=True).to_excel(writer, sheet_name='events', index=False)
+            SHIFTS.to_excel(writer, sheet_name='shifts', index=False)
+        third = validate_all_games(raw_dir, max_workers=1, cache_path=cache_path, output_dir=output_dir)
+        assert third[2].passed
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
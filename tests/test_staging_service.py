@@ -0,0 +1,109 @@
+"""
+Tests for bulk staging uploads (api/services/staging_service.py,
+api/services/blb_upload_service.py).
+
+Tests cover:
+- Vectorized record cleaning (NaN / inf -> null, game_id stamping)
+- Concurrent batched inserts with per-table throughput and batch errors
+- BLB uploads straight from an Excel sheet
+
+Runs against an in-memory stand-in for the Supabase client.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from api.services import blb_upload_service, staging_service as staging
+from api.services.staging_service import StagingService, clean_records
+
+
+class FakeClient:
+    """Records inserted batches per table; fails batches containing a 'bad' row."""
+
+    def __init__(self):
+        self.inserted = {}
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        client = self
+
+        class Insert:
+            def __init__(self, rows):
+                self.rows = rows
+
+            def execute(self):
+                if any(r.get('bad') for r in self.rows):
+                    raise ValueError('invalid input syntax')
+                with client.lock:
+                    client.inserted.setdefault(name, []).extend(self.rows)
+                return SimpleNamespace(data=self.rows)
+
+        return SimpleNamespace(insert=Insert)
+
+
+def make_service():
+    service = StagingService.__new__(StagingService)
+    service.manager = SimpleNamespace(client=FakeClient())
+    return service
+
+
+class TestCleanRecords:
+    """Column-wise cleaning before insert."""
+
+    def test_nan_and_inf_become_null(self):
+        records = clean_records([{'a': 1.5, 'b': None}, {'a': np.inf, 'b': 'x'}, {'a': np.nan, 'b': np.nan}],
+                                game_id=18969)
+        assert records == [
+            {'a': 1.5, 'b': None, 'game_id': '18969'},
+            {'a': None, 'b': 'x', 'game_id': '18969'},
+            {'a': None, 'b': None, 'game_id': '18969'},
+        ]
+
+    def test_excel_frame_passes_through(self):
+        df = pd.DataFrame({'player_id': ['P1', None]}, dtype=str)
+        assert clean_records(df) == [{'player_id': 'P1'}, {'player_id': None}]
+        assert clean_records([]) == []
+
+
+class TestBulkUpload:
+    """Concurrent batched inserts."""
+
+    def test_tracking_upload_reports_throughput(self, monkeypatch):
+        monkeypatch.setattr(staging, 'UPLOAD_BATCH_SIZE', 100)
+        service = make_service()
+        events = pd.DataFrame({'event_index': range(1050), 'period': 1})
+        result = service.upload_tracking_data(18969, events=events, shifts=[{'shift_index': 1}])
+
+        inserted = service.manager.client.inserted
+        assert result['events_uploaded'] == 1050 and result['shifts_uploaded'] == 1
+        assert sorted(r['event_index'] for r in inserted['stage_events_tracking']) == list(range(1050))
+        assert {r['game_id'] for r in inserted['stage_events_tracking']} == {'18969'}
+        assert set(result['throughput']) == {'stage_events_tracking', 'stage_shifts_tracking'}
+        assert result['errors'] == []
+
+    def test_failed_batches_are_reported(self, monkeypatch):
+        monkeypatch.setattr(staging, 'UPLOAD_BATCH_SIZE', 10)
+        service = make_service()
+        rows = [{'player_id': f'P{i}', 'bad': i == 25} for i in range(40)]
+        result = service.upload_blb_table('dim_player', rows)
+
+        assert result['rows_uploaded'] == 30
+        assert result['rows_failed'] == 10
+        assert result['errors'] == ['Batch 20: invalid input syntax']
+
+    def test_blb_upload_from_excel(self, tmp_path, monkeypatch):
+        service = make_service()
+        monkeypatch.setattr(blb_upload_service, 'staging_service', service)
+        excel_path = tmp_path / 'BLB_Tables.xlsx'
+        pd.DataFrame({'player_id': ['P1', 'P2', 'P3'], 'jersey': [7, None, 12]}).to_excel(
+            excel_path, sheet_name='dim_player', index=False)
+
+        result = blb_upload_service.upload_blb_table_from_excel('dim_player', excel_path)
+
+        assert result['rows_uploaded'] == 3 and result['errors'] == []
+        inserted = service.manager.client.inserted[result['staging_table']]
+        assert [r['player_id'] for r in inserted] == ['P1', 'P2', 'P3']
+        assert [r['jersey'] for r in inserted] == ['7', None, '12']
@@ -0,0 +1,185 @@
+"""
+Tests for the Supabase staging reader (src/ingestion/supabase_source.py).
+
+Tests cover:
+- Concurrent keyset pagination over integer keys
+- Ordered range pages for text-keyed and keyless tables
+- Page retries and failure instead of silent truncation
+- Text decoding of pages (matches the Excel loaders)
+- Projected, game-batched tracking loads with the per-game version cache
+
+Runs against an in-memory stand-in for the PostgREST query builder.
+"""
+
+import random
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.ingestion.supabase_source import SupabaseSource, SupabaseReadError, decode_page
+
+
+class FakeQuery:
+    """Minimal PostgREST builder over a list of row dicts."""
+
+    def __init__(self, client, rows):
+        self.client = client
+        self.rows = rows
+        self.columns = '*'
+        self.count = None
+        self.window = None
+        self.orders = []
+
+    def select(self, columns, count=None):
+        self.columns = columns
+        self.count = count
+        return self
+
+    def eq(self, col, val):
+        self.rows = [r for r in self.rows if r[col] == val]
+        return self
+
+    def in_(self, col, vals):
+        self.rows = [r for r in self.rows if r[col] in vals]
+        return self
+
+    def gt(self, col, val):
+        self.rows = [r for r in self.rows if r[col] > val]
+        return self
+
+    def lte(self, col, val):
+        self.rows = [r for r in self.rows if r[col] <= val]
+        return self
+
+    def order(self, col, desc=False):
+        # Repeated calls add lower-priority sort keys, like PostgREST
+        self.orders.append((col, desc))
+        for c, d in reversed(self.orders):
+            self.rows = sorted(self.rows, key=lambda r: r[c], reverse=d)
+        return self
+
+    def limit(self, n):
+        self.window = (0, n)
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end + 1)
+        return self
+
+    def execute(self):
+        with self.client.lock:
+            self.client.calls += 1
+            if self.client.failures > 0:
+                self.client.failures -= 1
+                raise ConnectionError('connection reset')
+        if self.client.shuffle_unordered and not self.orders:
+            # Postgres gives no row order without ORDER BY
+            self.rows = random.Random(self.client.calls).sample(self.rows, len(self.rows))
+        rows = self.rows[slice(*self.window)] if self.window else self.rows
+        if self.columns != '*':
+            rows = [{c: r[c] for c in self.columns.split(',')} for r in rows]
+        return SimpleNamespace(data=rows, count=len(self.rows) if self.count else None)
+
+
+class FakeClient:
+    def __init__(self, tables, failures=0):
+        self.tables = tables
+        self.failures = failures
+        self.calls = 0
+        self.shuffle_unordered = False
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        return FakeQuery(self, list(self.tables[name]))
+
+
+def make_source(tables, failures=0, cache_dir=None):
+    source = SupabaseSource.__new__(SupabaseSource)
+    source.client = FakeClient(tables, failures)
+    source.cache_dir = cache_dir
+    source.RETRY_BACKOFF = 0
+    return source
+
+
+EVENTS = [
+    {'id': i, 'game_id': str(18969 + i % 2), 'period': i % 3 + 1, 'event_detail': None if i % 5 else 'Shot',
+     'created_at': '2026-01-10T00:00:00', 'updated_at': '2026-01-10T00:00:00'}
+    for i in range(3, 2503)
+]
+
+
+class TestPaginatedRead:
+    """Concurrent pagination over the staging tables."""
+
+    def test_keyset_read_returns_every_row_in_key_order(self):
+        source = make_source({'stage_events_tracking': EVENTS})
+        df = source._read_table_paginated('stage_events_tracking', filters={'game_id': '18969'},
+                                          page_size=100)
+        expected = [r['id'] for r in EVENTS if r['game_id'] == '18969']
+        assert df['id'].tolist() == expected
+
+    def test_ordered_pages_for_text_keys(self):
+        players = [{'player_id': f'P{i:04d}', 'player_full_name': f'Player {i}'} for i in range(250, 0, -1)]
+        source = make_source({'stage_dim_player': players})
+        df = source._read_table_paginated('stage_dim_player', page_size=40, text=True)
+        assert df['player_id'].tolist() == sorted(r['player_id'] for r in players)
+
+    def test_keyless_pages_are_ordered_by_every_column(self):
+        zones = [{'zone': z, 'x': x, 'y': y} for z in 'OND' for x in range(10) for y in range(5)]
+        source = make_source({'stage_dim_rink_zone': zones})
+        source.client.shuffle_unordered = True
+        df = source._read_table_paginated('stage_dim_rink_zone', page_size=20)
+        rows = list(df.itertuples(index=False, name=None))
+        assert rows == sorted((r['zone'], r['x'], r['y']) for r in zones)
+
+    def test_failed_pages_are_retried(self):
+        source = make_source({'stage_events_tracking': EVENTS}, failures=2)
+        df = source._read_table_paginated('stage_events_tracking', page_size=500)
+        assert len(df) == len(EVENTS)
+
+    def test_exhausted_retries_raise(self):
+        source = make_source({'stage_events_tracking': EVENTS}, failures=100)
+        with pytest.raises(SupabaseReadError):
+            source._read_table_paginated('stage_events_tracking', page_size=500)
+
+
+class TestTrackingLoads:
+    """Projected tracking loads and the per-game cache."""
+
+    def test_unchanged_games_come_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(SupabaseSource, 'EVENTS_COLUMNS', ['game_id', 'period', 'event_detail'])
+        tables = {'stage_events_tracking': EVENTS}
+        source = make_source(tables, cache_dir=tmp_path)
+
+        first = source._load_tracking_table('stage_events_tracking', source.EVENTS_COLUMNS,
+                                            ['18969', '18970', '99999'])
+        assert list(first.columns) == ['game_id', 'period', 'event_detail']
+        assert len(first) == len(EVENTS)
+        assert first['period'].iloc[0] == '2'
+
+        # Second load: only version queries, no row pages
+        source = make_source(tables, cache_dir=tmp_path)
+        again = source._load_tracking_table('stage_events_tracking', source.EVENTS_COLUMNS,
+                                            ['18969', '18970', '99999'])
+        pd.testing.assert_frame_equal(again, first)
+        assert source.client.calls == 1 + 3
+
+        # A re-staged game is downloaded again
+        changed = EVENTS + [dict(EVENTS[0], id=9999, updated_at='2026-02-01T00:00:00')]
+        source = make_source({'stage_events_tracking': changed}, cache_dir=tmp_path)
+        updated = source._load_tracking_table('stage_events_tracking', source.EVENTS_COLUMNS,
+                                              ['18969', '18970'])
+        assert len(updated) == len(EVENTS) + 1
+
+
+class TestDecodePage:
+    """Page decoding."""
+
+    def test_text_decoding_matches_excel_loaders(self):
+        rows = [{'a': 5, 'b': None, 'c': 'None'}, {'a': 1.5, 'b': True, 'c': 'x'}]
+        df = decode_page(rows, text=True)
+        assert df['a'].tolist() == ['5', '1.5']
+        assert pd.isna(df.loc[0, 'b']) and df.loc[1, 'b'] == 'True'
+        assert pd.isna(df.loc[0, 'c'])
@@ -9,6 +9,9 @@ Tests cover:
 - Primary key uniqueness
 - Foreign key integrity
 - Goal counting verification
+- Write-time table statistics (src/core/table_stats.py)
+- Deferred write-once materialization (src/core/table_writer.py)
+- Stats-driven, incremental HTML table docs (src/advanced/v11_enhancements.py)
 
 Usage:
     pytest tests/test_table_verification.py -v
@@ -371,5 +374,121 @@ class TestGoalCounting:
         assert "not found" in result.message
 
 
+class TestTableStats:
+    """Tests for stats-driven verification."""
+
+    def test_stats_reused_until_csv_changes(self, temp_output_dir, temp_manifest):
+        from src.core.table_stats import load_table_stats
+
+        pd.DataFrame({"player_id": [1, 2], "player_name": ["A", "B"], "team_id": [1, 2]}).to_csv(
+            temp_output_dir / "dim_player.csv", index=False
+        )
+        verifier = TableVerifier(temp_output_dir, temp_manifest)
+        assert all(r.passed for r in verifier.check_primary_keys())
+        assert load_table_stats("dim_player", temp_output_dir)["rows"] == 2
+
+        # Rewriting the CSV outside save_output_table makes the stored stats stale
+        pd.DataFrame({"player_id": [1, 1, 2], "player_name": ["A", "B", "C"], "team_id": [1, 1, 2]}).to_csv(
+            temp_output_dir / "dim_player.csv", index=False
+        )
+        assert load_table_stats("dim_player", temp_output_dir) is None
+        results = TableVerifier(temp_output_dir, temp_manifest).check_primary_keys()
+        player_result = [r for r in results if "dim_player" in r.check_name][0]
+        assert not player_result.passed
+        assert player_result.details["sample_values"] == ["1"]
+
+    def test_fk_keys_compare_canonically(self, temp_output_dir, temp_manifest):
+        pd.DataFrame({"player_id": ["1", "2"], "player_name": ["A", "B"], "team_id": [1, 2]}).to_csv(
+            temp_output_dir / "dim_player.csv", index=False
+        )
+        pd.DataFrame({"team_id": [1, 2], "team_name": ["Team A", "Team B"]}).to_csv(
+            temp_output_dir / "dim_team.csv", index=False
+        )
+        # NaN forces float team_id (1.0, 0.0): same keys as 1 / null marker 0
+        pd.DataFrame({"goal_id": [1, 2, 3], "player_id": [1, 2, 2], "team_id": [1.0, 0.0, None],
+                      "game_id": [100] * 3}).to_csv(temp_output_dir / "fact_goals.csv", index=False)
+
+        verifier = TableVerifier(temp_output_dir, temp_manifest)
+        assert all(r.passed for r in verifier.check_foreign_keys())
+
+
+class TestDeferredWrites:
+    """Tests for write-once materialization of multi-phase tables."""
+
+    def test_rewrites_are_materialized_once(self, temp_output_dir, tmp_path, monkeypatch):
+        from src.core import table_store, table_writer
+        from src.utils import data_type_optimizer
+
+        monkeypatch.setattr(data_type_optimizer, "_default_schema",
+                            data_type_optimizer.DtypeSchema(tmp_path / "dtype_schema.json"))
+        table_writer.reset_write_report()
+        events = pd.DataFrame({"event_id": ["E1", "E2"], "game_id": [100, 100]})
+        try:
+            with table_writer.deferred_writes():
+                table_writer.save_output_table(events, "fact_events", temp_output_dir)
+                assert not (temp_output_dir / "fact_events.csv").exists()
+
+                # A later phase reads the pending table and adds a column
+                events = table_writer.read_output_table("fact_events", temp_output_dir)
+                events["is_goal"] = [0, 1]
+                table_writer.save_output_table(events, "fact_events", temp_output_dir)
+                # Non-deferred tables are still written immediately
+                table_writer.save_output_table(events[["game_id"]], "fact_shots", temp_output_dir)
+                assert (temp_output_dir / "fact_shots.csv").exists()
+        finally:
+            table_store.clear_store()
+
+        written = pd.read_csv(temp_output_dir / "fact_events.csv")
+        assert list(written.columns) == ["event_id", "game_id", "is_goal"]
+        report = table_writer.get_write_report()
+        assert report["saves"] == 3 and report["writes"] == 2
+        assert report["avoided_by_table"] == {"fact_events": 1}
+
+
+class TestHtmlDocs:
+    """Tests for the stats-driven HTML table pages."""
+
+    def test_only_changed_tables_are_rendered(self, temp_output_dir, tmp_path, monkeypatch):
+        from src.advanced import v11_enhancements as v11
+
+        html_dir = tmp_path / "html"
+        monkeypatch.setattr(v11, "OUTPUT_DIR", temp_output_dir)
+        monkeypatch.setattr(v11, "DOCS_DIR", tmp_path)
+        monkeypatch.setattr(v11, "HTML_DIR", html_dir)
+        monkeypatch.setattr(v11, "HTML_TABLES_DIR", html_dir / "tables")
+        monkeypatch.setattr(v11, "PAGE_HASHES_PATH", html_dir / "tables" / ".page_hashes.json")
+        monkeypatch.setattr(v11, "PREVIEW_ROWS", 3)
+
+        pd.DataFrame({"game_id": [100, 101, 102, 103], "goals": [1, None, 2, 0]}).to_csv(
+            temp_output_dir / "fact_goals.csv", index=False
+        )
+        pd.DataFrame({"team_id": [1, 2], "team_name": ["A", "B"]}).to_csv(
+            temp_output_dir / "dim_team.csv", index=False
+        )
+        pd.DataFrame({"game_id": [101.0, 101.0, 999.0], "resolved": [False, False, True]}).to_csv(
+            temp_output_dir / "qa_suspicious_stats.csv", index=False
+        )
+
+        rendered = []
+        original = v11._generate_table_html
+        monkeypatch.setattr(v11, "_generate_table_html",
+                            lambda csv_file, *args: rendered.append(csv_file.stem) or original(csv_file, *args))
+
+        v11.generate_html_documentation()
+        assert sorted(rendered) == ["dim_team", "fact_goals", "qa_suspicious_stats"]
+        page = (html_dir / "tables" / "fact_goals.html").read_text()
+        assert "<strong>Rows:</strong> 4" in page
+        assert "2 suspicious stat entries" in page
+        assert "<td>103</td>" not in page
+
+        rendered.clear()
+        v11.generate_html_documentation()
+        assert rendered == []
+
+        pd.DataFrame({"team_id": [1], "team_name": ["A"]}).to_csv(temp_output_dir / "dim_team.csv", index=False)
+        v11.generate_html_documentation()
+        assert rendered == ["dim_team"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,6 +11,15 @@ Tests for:
 - src/utils/table_manager.py
 - src/utils/shared_lookups.py
 - src/utils/error_handler.py
+- src/utils/game_type_aggregator.py
+- src/core/code_resolver.py
+- src/core/etl_phases/event_enhancers.py (shift assignment)
+- src/core/etl_phases/game_context.py (time bucket, strength, score state)
+- src/utils/data_type_optimizer.py (learned dtype schema)
+- src/core/etl_phases/derived_columns.py (nearest-opponent pressure)
+- src/tables/remaining_facts.py, src/tables/event_analytics.py (momentum, possession time)
+- src/qa/build_qa_facts.py (suspicious stats rules)
+- src/advanced/event_success.py, src/advanced/play_detail_automation.py (event/play-detail success)
 =============================================================================
 """
 
@@ -76,6 +85,20 @@ class TestKeyParser:
         assert result.game_id == 18969
         assert result.shift_index == 42
     
+    def test_parse_shift_keys_vectorized(self):
+        """Column parse should agree with parse_shift_key row by row."""
+        from src.utils.key_parser import parse_shift_keys, parse_shift_key
+        
+        keys = pd.Series(["SH1896900001", "SH18969123", None, "EV1896900001", "SH123"])
+        parsed = parse_shift_keys(keys)
+        for i, key in enumerate(keys):
+            expected = parse_shift_key(key)
+            if expected is None:
+                assert pd.isna(parsed['game_id'].iloc[i])
+            else:
+                assert parsed['game_id'].iloc[i] == expected.game_id
+                assert parsed['shift_index'].iloc[i] == expected.shift_index
+    
     def test_parse_event_key_valid(self):
         """Valid event keys should parse correctly."""
         from src.utils.key_parser import parse_event_key
@@ -375,5 +398,386 @@ class TestSharedLookups:
         assert ratings1 is not ratings2
 
 
+
+class TestGameTypeAggregator:
+    """Tests for src/utils/game_type_aggregator.py"""
+    
+    @pytest.fixture
+    def games(self):
+        return pd.DataFrame({
+            'player_id': ['P2', 'P1', 'P1', 'P1', 'P2'],
+            'season_id': ['S1', 'S1', 'S1', 'S1', 'S1'],
+            'game_type': ['Regular', 'Regular', 'Playoffs', 'Regular', 'Regular'],
+            'game_id': [1, 1, 2, 3, 3],
+            'goals': [1, 2, 0, 1, 0],
+        })
+    
+    def test_grouping_sets_match_callable(self, games):
+        """Declarative splits should equal the per-group callable version."""
+        from src.utils.game_type_aggregator import (
+            aggregate_game_type_splits, aggregate_with_game_type, ratio
+        )
+        
+        declarative = aggregate_game_type_splits(
+            games, ['player_id', 'season_id'],
+            {'games_played': ('game_id', 'nunique'), 'goals': ('goals', 'sum'),
+             'goals_per_game': ratio('goals', 'games_played', decimals=2)},
+            key_col='key', key_template='{player_id}_{season_id}_{game_type}',
+        )
+        callable_version = aggregate_with_game_type(
+            games, ['player_id', 'season_id'],
+            lambda g: {'games_played': g['game_id'].nunique(), 'goals': g['goals'].sum()},
+            key_col='key', key_template='{player_id}_{season_id}_{game_type}',
+        )
+        
+        assert list(declarative['key']) == list(callable_version['key'])
+        assert list(declarative['key']) == [
+            'P2_S1_Regular', 'P2_S1_All',
+            'P1_S1_Regular', 'P1_S1_Playoffs', 'P1_S1_All',
+        ]
+        assert list(declarative['games_played']) == list(callable_version['games_played'])
+        assert list(declarative['goals']) == list(callable_version['goals'])
+        assert declarative.loc[declarative['key'] == 'P1_S1_All', 'goals_per_game'].iloc[0] == 1.0
+    
+    def test_precomputed_splits(self, games):
+        """Tables that already carry 'All' rows are grouped by game_type as-is."""
+        from src.utils.game_type_aggregator import aggregate_game_type_splits
+        
+        season = games.assign(game_type=['Regular', 'Regular', 'Playoffs', 'All', 'All'])
+        result = aggregate_game_type_splits(
+            season, ['player_id'], {'goals': ('goals', 'sum')}, precomputed_splits=True
+        )
+        all_rows = result[result['game_type'] == 'All'].set_index('player_id')['goals']
+        assert all_rows.to_dict() == {'P2': 0, 'P1': 1}
+    
+    def test_goalie_results_vectorized(self):
+        """Level scores count as ties only when the schedule tie flag is set."""
+        from src.utils.game_type_aggregator import get_goalie_record_from_games
+        
+        games = pd.DataFrame({
+            'team_name': ['A', 'A', 'A', 'A', 'C'],
+            'home_team_name': ['A', 'B', 'A', 'A', 'A'],
+            'away_team_name': ['B', 'A', 'B', 'B', 'B'],
+            'home_total_goals': [3, 3, 2, 2, 5],
+            'away_total_goals': [1, 1, 2, 2, 0],
+            'home_team_t': [0, 0, 1, 0, 0],
+            'away_team_t': [0, 0, 1, 0, 0],
+        })
+        assert get_goalie_record_from_games(games) == {'wins': 1, 'losses': 2, 'ties': 1}
+
+
+class TestCodeResolver:
+    """Tests for src/core/code_resolver.py"""
+    
+    def test_prefix_match_uses_first_code_and_aliases(self):
+        """Prefix codes resolve in dim order; Rush/Carried aliases resolve to the same ID."""
+        from src.core.code_resolver import CodeResolver
+        
+        dim = pd.DataFrame({
+            'zone_entry_type_id': ['ZE01', 'ZE02', 'ZE03'],
+            'zone_entry_type_code': ['ZoneEntry_Rush', 'ZoneEntry_Pass', 'ZoneEntry_PassMiss'],
+        })
+        resolver = CodeResolver.from_dim(dim, 'zone_entry_type_code', 'zone_entry_type_id',
+                                         aliases=[('Rush', 'Carried')], match='prefix')
+        values = pd.Series(['ZoneEntry_Carried', 'ZoneEntry_PassMiss', 'ZoneEntry_Chip', None])
+        assert list(resolver.resolve(values)) == ['ZE01', 'ZE02', None, None]
+    
+    def test_exact_match_with_strip_and_fallback(self):
+        """Prefixes are stripped once; unmatched values retry lower-cased."""
+        from src.core.code_resolver import CodeResolver
+        
+        dim = pd.DataFrame({'shot_type_id': ['ST1', 'ST2'], 'shot_type_code': ['Wrist', 'One-Timer']})
+        resolver = CodeResolver.from_dim(dim, 'shot_type_code', 'shot_type_id', replace=[('-', '_')],
+                                         lower=True, strip_prefixes=('Shot_', 'Goal_'), fallbacks=(str.lower,))
+        values = pd.Series(['Shot_Wrist', 'Goal_ONE_TIMER', 'Shot_Goal_Wrist', 'Slap'])
+        where = pd.Series([True, True, True, True])
+        assert list(resolver.resolve(values, where=where)) == ['ST1', 'ST2', None, None]
+        assert list(resolver.resolve(values, where=~where)) == [None] * 4
+
+
+
+class TestShiftAssignment:
+    """Tests for event -> shift interval lookup in event_enhancers"""
+    
+    def test_boundary_and_missing_keys(self):
+        """Events on a shift change get the earlier shift; unmatched keys get None."""
+        from src.core.etl_phases.event_enhancers import _assign_shift_ids
+        
+        shifts = pd.DataFrame({
+            'game_id': [1, 1, 1, 1],
+            'period': [1, 1, 1, 2],
+            'shift_id': ['SH0000100001', 'SH0000100002', 'SH0000100003', 'SH0000100004'],
+            'shift_start_total_seconds': [1200, 1150, 1100, 1200],
+            'shift_end_total_seconds': [1150, 1100, 1000, 1100],
+        })
+        tracking = pd.DataFrame({
+            'game_id': [1, 1, 1, 1, 2],
+            'period': [1, 1, np.nan, 2, 1],
+            'time_start_total_seconds': [10, 50, np.nan, 150, 10],
+            'event_total_seconds': [np.nan, np.nan, 120, np.nan, np.nan],
+        })
+        events = tracking.iloc[[1, 3]]
+        
+        tracking_ids, event_ids = _assign_shift_ids([tracking, events], shifts)
+        assert list(tracking_ids) == ['SH0000100001', 'SH0000100001', 'SH0000100003', None, None]
+        assert list(event_ids) == ['SH0000100001', None]
+        assert list(event_ids.index) == [1, 3]
+
+
+class TestGameContext:
+    """Tests for shared game-context rules in src/core/etl_phases/game_context.py"""
+    
+    def test_time_bucket_and_strength_ids(self):
+        """Buckets by clock minute; strength IDs are dim_strength IDs."""
+        from src.core.etl_phases.game_context import (
+            time_bucket_ids, parse_strength, strength_ids, count_skaters
+        )
+        from src.tables.dimension_tables import create_dim_strength
+        
+        buckets = time_bucket_ids([1, 2, 3, 4, np.nan, 1], [19.5, 12, 1, 3, 10, np.nan])
+        assert list(buckets) == ['TB01', 'TB02', 'TB05', 'TB06', None, None]
+        
+        ids = strength_ids(*parse_strength(['5v5', '4v5 PP', '6v5', 'ENH', None, '2v5']))
+        assert list(ids) == ['STR01', 'STR03', 'STR10', None, None, None]
+        assert set(ids[:3]) <= set(create_dim_strength()['strength_id'])
+        
+        shifts = pd.DataFrame({'home_forward_1': [7, 7], 'home_defense_1': [4, None], 'away_forward_1': [9, 9]})
+        counts = (count_skaters(shifts, 'home'), count_skaters(shifts, 'away'))
+        assert list(strength_ids(*counts, default='STR01')) == ['STR01', 'STR01']
+    
+    def test_score_state_across_periods(self):
+        """Goals count from earlier periods and earlier (higher) clock times only."""
+        from src.core.etl_phases.game_context import score_state
+        
+        goals = pd.DataFrame({
+            'game_id': [1, 1, 2],
+            'period': [1, 2, 1],
+            'event_total_seconds': [100.0, 500.0, 900.0],
+            'is_home_goal': [True, False, False],
+        })
+        state = score_state([1, 1, 1, 2, 2], [1, 2, 2, 1, 1], [500, 900, 100, 900, np.nan], goals)
+        assert state['score_differential'].tolist() == [0, 1, 0, 0, 0]
+        assert state['game_state'].tolist() == ['tied', 'home_leading', 'tied', 'tied', 'tied']
+    
+    def test_score_state_mixed_game_id_dtypes(self):
+        """int64 event game_ids match object/float goal game_ids of the same game."""
+        from src.core.etl_phases.game_context import score_state
+        
+        goals = pd.DataFrame({
+            'game_id': pd.Series(['18969', 18970.0], dtype=object),
+            'period': [1, 1],
+            'event_total_seconds': [900.0, 900.0],
+            'is_home_goal': [True, False],
+        })
+        game_ids = pd.Series([18969, 18970, 18971], dtype='int64')
+        state = score_state(game_ids, [1, 1, 1], [100, 100, 100], goals)
+        assert state['score_differential'].tolist() == [1, -1, 0]
+
+
+class TestDtypeSchema:
+    """Tests for learned per-table dtypes in data_type_optimizer"""
+    
+    def test_learned_schema_matches_inference(self, tmp_path):
+        """Applying a learned schema gives the inferred dtypes and widens on new values."""
+        from src.utils.data_type_optimizer import DtypeSchema, optimize_dataframe_dtypes
+        
+        df = pd.DataFrame({
+            'game_id': [18969, 18969, 18970, 18970, 18971, 18971],
+            'period': [1, 2, 3, 1, 2, 3],
+            'event_type': ['Shot', 'Pass', 'Shot', 'Pass', 'Shot', None],
+            'xg': [0.1, 0.2, 0.05, 0.3, 0.0, np.nan],
+        })
+        expected = optimize_dataframe_dtypes(df)
+        
+        schema = DtypeSchema(tmp_path / 'dtype_schema.json')
+        optimize_dataframe_dtypes(df, table_name='fact_events', schema=schema)
+        reloaded = DtypeSchema(tmp_path / 'dtype_schema.json')
+        assert reloaded.get('fact_events')['event_type']['categories'] == ['Pass', 'Shot']
+        
+        result = optimize_dataframe_dtypes(df, table_name='fact_events', schema=reloaded)
+        pd.testing.assert_frame_equal(result, expected)
+        assert df['event_type'].dtype == object
+        
+        # Unseen category and out-of-range int: re-inferred, schema widened
+        df.loc[0, ['event_type', 'period']] = ['Goal', 300]
+        result = optimize_dataframe_dtypes(df, table_name='fact_events', schema=reloaded, inplace=True)
+        assert result is df
+        assert list(df['event_type'].cat.categories) == ['Goal', 'Pass', 'Shot']
+        assert df['period'].dtype == np.int16
+        assert reloaded.get('fact_events')['period']['target'] == 'int16'
+
+
+class TestPressureDetection:
+    """Tests for nearest-opponent pressure detection in derived_columns"""
+    
+    def test_closest_opponent_within_threshold(self):
+        """Closest opponent in range wins; ties keep table order."""
+        from src.core.etl_phases.derived_columns import find_nearest_opponents
+        
+        df = pd.DataFrame({
+            'event_id': ['E1', 'E1', 'E1', 'E1', 'E2', 'E2', 'E3', 'E3'],
+            'side_of_puck': ['event_team', 'opp_team', 'opp_team', 'opp_team',
+                             'event_team', 'opp_team', 'event_team', 'opp_team'],
+            'player_x': [0, 6, 3, 0, 0, 0, 0, 0],
+            'player_y': [0, 0, 4, 5, 0, 11, 0, np.nan],
+            'player_game_number': [10, 21, 22, 23, 30, 31, 40, 41],
+        }, index=[100, 101, 102, 103, 104, 105, 106, 107])
+        
+        nearest = find_nearest_opponents(
+            df, 'event_id', 'player_x', 'player_y',
+            df['side_of_puck'] == 'event_team', df['side_of_puck'] == 'opp_team'
+        )
+        assert nearest.to_dict() == {100: 22}
+
+
+class TestMomentumTables:
+    """Tests for grouped period momentum and possession time tables"""
+    
+    EVENTS = pd.DataFrame({
+        'game_id': [1, 1, 1, 1, 1, 1],
+        'event_id': ['E1', 'E2', 'E3', 'E4', 'E5', 'E6'],
+        'period': [1, 1, 1, 1, 2, 2],
+        'event_type': ['Shot', 'Goal', 'Pass', 'Shot', 'Pass', 'Shot'],
+        'event_detail': ['Shot_OnNet', 'Goal_Scored', 'Pass_Completed', 'Shot_Missed', 'Pass_Completed', 'Shot_OnNet'],
+        'event_team_id': ['T1', 'T1', 'T2', 'T2', 'T1', None],
+        'home_team_id': ['T1'] * 6,
+        'away_team_id': ['T2'] * 6,
+        'time_start_total_seconds': [10, 50, 200, 250, 30, 40],
+    })
+    
+    def test_period_momentum_pairs(self, monkeypatch):
+        """Each complete home/away pair splits momentum to 100."""
+        from src.tables import remaining_facts
+        
+        tables = {'fact_events': self.EVENTS, 'fact_event_players': pd.DataFrame(), 'dim_schedule': pd.DataFrame()}
+        monkeypatch.setattr(remaining_facts, 'load_table', lambda name, required=False: tables[name])
+        
+        df = remaining_facts.create_fact_period_momentum()
+        assert df['momentum_key'].tolist() == ['MOM_1_P1_T1', 'MOM_1_P1_T2', 'MOM_1_P2_T1']
+        assert df['goals'].tolist() == [1, 0, 0]
+        assert df['momentum_pct'].iloc[:2].sum() == pytest.approx(100)
+        assert np.isnan(df['momentum_pct'].iloc[2])
+        
+        windows = remaining_facts.create_fact_time_period_momentum()
+        assert windows['time_window_label'].tolist() == ['0:00-3:00', '3:00-4:10', '0:00-0:40']
+        assert windows['score_at_window_start'].tolist() == [0, 0, 0]
+    
+    def test_possession_time_venue_fallback(self, monkeypatch):
+        """Venue comes from the most frequent event value, else the roster."""
+        from src.tables import event_analytics
+        
+        event_players = pd.DataFrame({
+            'game_id': [1, 1, 1, 1, 99999],
+            'player_id': ['P1', 'P1', 'P1', 'P2', 'P1'],
+            'player_role': ['event_player_1'] * 5,
+            'team_venue': ['a', 'h', 'h', None, 'h'],
+            'event_type': ['Pass', 'Zone_Entry_Exit', 'Shot', 'Pass', 'Pass'],
+            'event_detail': ['Pass_Completed', 'Zone_Entry_Rush', 'Shot_OnNet', 'Pass_Completed', 'x'],
+        })
+        roster = pd.DataFrame({'game_id': [1], 'player_id': ['P2'], 'team_venue': ['away'], 'team_id': ['T2']})
+        tables = {'fact_event_players': event_players, 'dim_schedule': pd.DataFrame(), 'fact_gameroster': roster}
+        monkeypatch.setattr(event_analytics, 'load_table', lambda name, required=False: tables[name])
+        
+        df = event_analytics.create_fact_possession_time()
+        assert df['player_id'].tolist() == ['P1', 'P2']
+        assert df['venue'].tolist() == ['home', 'away']
+        assert df['venue_id'].tolist() == ['VEN001', 'VEN002']
+        assert df['team_id'].tolist() == [None, 'T2']
+        assert df['zone_entries'].tolist() == [1, 0]
+        assert df['possession_events'].tolist() == [2, 1]
+
+
+class TestSuspiciousStats:
+    """Tests for rule-based suspicious stats detection"""
+    
+    STATS = pd.DataFrame({
+        'game_id': [1, 1, 2, 2],
+        'player_id': ['P1', 'G1', 'P1', 'P2'],
+        'player_name': ['Skater', 'Goalie', 'Skater', None],
+        'goals': [6, 0, 1, 0],
+        'assists': [0, 0, 7, 1],
+        'toi_seconds': [3000, 3000, 30, np.nan],
+        'plus_minus_ev': [-7, 0, 2, 0],
+    })
+    PLAYERS = pd.DataFrame({'player_id': ['P1', 'G1'], 'player_primary_position': ['Forward', 'Goalie']})
+    
+    def test_config_rules(self):
+        """Config rules flag per stats row, with goalie TOI limits."""
+        from src.qa.build_qa_facts import find_suspicious_stats, SUSPICIOUS_COLUMNS
+        
+        df = find_suspicious_stats(self.STATS, self.PLAYERS)
+        assert list(df.columns) == SUSPICIOUS_COLUMNS
+        assert df['stat_name'].tolist() == ['goals', 'toi_seconds', 'plus_minus_ev', 'assists', 'toi_seconds']
+        assert df['threshold_direction'].tolist() == ['>', '>', '±', '>', '<']
+        assert df['note'].iloc[0] == 'goals=6 exceeds >5'
+        assert df['note'].iloc[2] == 'Extreme +/- of -7'
+        assert set(df['position']) == {'Forward'}
+    
+    def test_outlier_methods(self):
+        """Z-score and robust outliers, and an empty result keeps the schema."""
+        from src.qa.build_qa_facts import find_suspicious_stats, SUSPICIOUS_COLUMNS
+        
+        stats = pd.DataFrame({'game_id': range(12), 'shots': [2] * 6 + [3] * 5 + [30]})
+        rules = {'thresholds': [], 'outliers': {'threshold': 3, 'min_rows': 10, 'stats': ['shots']}}
+        
+        df = find_suspicious_stats(stats, pd.DataFrame(), rules)
+        assert df['game_id'].tolist() == [11]
+        assert df['note'].iloc[0].startswith('Z-score=3.1')
+        assert df['player_name'].iloc[0] == 'Unknown'
+        
+        rules['outliers']['method'] = 'robust'
+        assert find_suspicious_stats(stats, pd.DataFrame(), rules)['game_id'].tolist() == [11]
+        
+        empty = find_suspicious_stats(stats.iloc[:11], pd.DataFrame(), rules)
+        assert empty.empty and list(empty.columns) == SUSPICIOUS_COLUMNS
+
+
+class TestEventSuccess:
+    """Tests for whole-frame event success and play_detail derivation"""
+    
+    def test_context_success_per_game(self):
+        """Next primary event decides success, within the same game and period."""
+        from src.advanced.event_success import derive_event_success
+        
+        df = pd.DataFrame({
+            'game_id': [1, 1, 1, 1, 2, 2],
+            'period': [1, 1, 1, 2, 1, 1],
+            'event_index': [1, 2, 3, 4, 2, 3],
+            'player_role': ['event_player_1'] * 6,
+            'event_type': ['Pass', 'Zone', 'Turnover', 'Zone', 'Zone', 'Shot'],
+            'event_detail': ['Pass_Completed', 'Zone_Entry', 'Turnover_Giveaway', 'Zone_Exit',
+                             'Zone_Entry', 'Shot_OnNet'],
+            'team_': ['A', 'A', 'A', 'B', 'B', 'A'],
+            'event_successful': [None, None, None, None, 'TRUE', None],
+        })
+        out = derive_event_success(df)
+        # Pass -> same-team zone entry; entry -> turnover; exit has no next event in its period
+        assert out['event_successful'].tolist()[:3] == ['s', 'u', 'u']
+        assert pd.isna(out['event_successful'].iloc[3])
+        assert out['event_successful'].iloc[4] == 's'
+    
+    def test_ceded_zone_fills_empty_slot(self):
+        """Derived play_details take the first empty slot of the right game's event."""
+        from src.advanced.play_detail_automation import derive_ceded_zone
+        
+        df = pd.DataFrame({
+            'game_id': [1, 1, 2, 2],
+            'event_index': [5, 5, 5, 5],
+            'event_detail': ['Zone_Entry', 'Zone_Entry', 'Shot_OnNet', 'Shot_OnNet'],
+            'player_role': ['event_player_1', 'opp_player_1'] * 2,
+            'puck_x_start': [0.0, 0.0, 0.0, 0.0],
+            'puck_y_start': [0.0, 0.0, 0.0, 0.0],
+            'opp_player_1_x': [np.nan, 30.0, np.nan, 30.0],
+            'opp_player_1_y': [np.nan, 0.0, np.nan, 0.0],
+            'play_detail1': [None, 'StickCheck', None, None],
+            'play_detail2': [None, None, None, None],
+            'play_detail2_s': [None, None, None, None],
+        })
+        out = derive_ceded_zone(df)
+        assert out.loc[1, 'play_detail2'] == 'CededZoneEntry'
+        assert out.loc[1, 'play_detail2_s'] == 'u'
+        assert out.loc[[0, 2, 3], ['play_detail1', 'play_detail2']].isna().all().all()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])